@@ -0,0 +1,129 @@
+"""add analytics rollup tables
+
+Revision ID: k6f7g8h9i0j1
+Revises: 3dc01c5ade6b
+Create Date: 2026-10-16 00:00:00.000000
+
+Adds per-year pre-aggregated analytics tables read by the MLGOO, municipal
+and external dashboards:
+- analytics_year_rollups: assessment counts per year and status
+- analytics_area_rollups: barangay pass/fail counts per year, status and area
+- analytics_indicator_rollups: response counts per year, status and indicator
+- analytics_assessment_contributions: per-assessment ledger used for incremental refresh
+
+The tables are backfilled from existing assessments during the upgrade, so
+the dashboards reading them are correct as soon as the migration finishes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+
+# revision identifiers, used by Alembic.
+revision: str = "k6f7g8h9i0j1"
+down_revision: Union[str, Sequence[str], None] = "3dc01c5ade6b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _count_column(name: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+
+
+def upgrade() -> None:
+    """Create analytics rollup tables."""
+    op.create_table(
+        "analytics_year_rollups",
+        sa.Column("assessment_year", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        _count_column("assessment_count"),
+        _count_column("passed_count"),
+        _count_column("failed_count"),
+        _count_column("validated_count"),
+        _count_column("rework_count"),
+        _count_column("calibration_count"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("assessment_year", "status"),
+    )
+
+    op.create_table(
+        "analytics_area_rollups",
+        sa.Column("assessment_year", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("governance_area_id", sa.Integer(), nullable=False),
+        _count_column("passed_count"),
+        _count_column("failed_count"),
+        _count_column("result_passed_count"),
+        _count_column("result_failed_count"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["governance_area_id"], ["governance_areas.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("assessment_year", "status", "governance_area_id"),
+    )
+
+    op.create_table(
+        "analytics_indicator_rollups",
+        sa.Column("assessment_year", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("indicator_id", sa.Integer(), nullable=False),
+        _count_column("assessed_count"),
+        _count_column("met_count"),
+        _count_column("fail_count"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["indicator_id"], ["indicators.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("assessment_year", "status", "indicator_id"),
+    )
+
+    op.create_table(
+        "analytics_assessment_contributions",
+        sa.Column("assessment_id", sa.Integer(), nullable=False),
+        sa.Column("assessment_year", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("contribution", postgresql.JSON(astext_type=sa.Text()), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("assessment_id"),
+    )
+    op.create_index(
+        op.f("ix_analytics_assessment_contributions_assessment_year"),
+        "analytics_assessment_contributions",
+        ["assessment_year"],
+        unique=False,
+    )
+
+    _backfill_rollups()
+
+
+def _backfill_rollups() -> None:
+    """Build the rollups of every assessment year that already has assessments."""
+    # Import here to avoid circular imports
+    from app.services.analytics_rollup_service import analytics_rollup_service
+
+    session = Session(bind=op.get_bind())
+    years = session.execute(
+        sa.text(
+            "SELECT DISTINCT assessment_year FROM assessments "
+            "WHERE assessment_year IS NOT NULL ORDER BY assessment_year"
+        )
+    ).scalars()
+    for year in list(years):
+        count = analytics_rollup_service.rebuild_year(session, year)
+        print(f"Backfilled analytics rollups for {year}: {count} assessments")
+    # Written in the migration's transaction; Alembic commits it
+    session.flush()
+
+
+def downgrade() -> None:
+    """Drop analytics rollup tables."""
+    op.drop_index(
+        op.f("ix_analytics_assessment_contributions_assessment_year"),
+        table_name="analytics_assessment_contributions",
+    )
+    op.drop_table("analytics_assessment_contributions")
+    op.drop_table("analytics_indicator_rollups")
+    op.drop_table("analytics_area_rollups")
+    op.drop_table("analytics_year_rollups")
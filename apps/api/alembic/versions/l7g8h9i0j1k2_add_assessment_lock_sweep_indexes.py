@@ -0,0 +1,51 @@
+"""add assessment lock sweep indexes
+
+Revision ID: l7g8h9i0j1k2
+Revises: k6f7g8h9i0j1
+Create Date: 2026-10-16 00:00:00.000000
+
+Adds partial indexes on unlocked assessments used by the hourly
+deadline.process_assessment_locks sweep:
+- ix_assessments_unlocked_grace_period: reopened assessments by grace period expiry
+- ix_assessments_unlocked_without_grace_period: never-reopened assessments by year
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "l7g8h9i0j1k2"
+down_revision: Union[str, Sequence[str], None] = "k6f7g8h9i0j1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create partial indexes for the lock sweep."""
+    op.create_index(
+        "ix_assessments_unlocked_grace_period",
+        "assessments",
+        ["grace_period_expires_at"],
+        unique=False,
+        postgresql_where=sa.text(
+            "is_locked_for_deadline = false AND grace_period_expires_at IS NOT NULL"
+        ),
+    )
+    op.create_index(
+        "ix_assessments_unlocked_without_grace_period",
+        "assessments",
+        ["assessment_year"],
+        unique=False,
+        postgresql_where=sa.text(
+            "is_locked_for_deadline = false AND grace_period_expires_at IS NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop lock sweep indexes."""
+    op.drop_index("ix_assessments_unlocked_without_grace_period", table_name="assessments")
+    op.drop_index("ix_assessments_unlocked_grace_period", table_name="assessments")
@@ -5,13 +5,17 @@ import logging
 from collections.abc import Generator
 
 from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from supabase import Client
 
+from app.core.principal_cache import REVOKED_PRINCIPAL, Principal, principal_cache
 from app.core.security import is_token_blacklisted, verify_token
+from app.db.base import get_async_db, get_supabase, get_supabase_admin
 from app.db.base import get_db as get_db_session
-from app.db.base import get_supabase, get_supabase_admin
 from app.db.enums import UserRole
 from app.db.models.user import User
 
@@ -29,7 +33,70 @@ def get_db() -> Generator[Session]:
     yield from get_db_session()
 
 
-async def get_current_user(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _revoked_token_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token has been revoked",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _decode_user_id(token: str) -> tuple[int, dict]:
+    """Verify a token and return its user ID and claims; raises 401 if invalid."""
+    try:
+        payload = verify_token(token)
+        # asyncpg does not coerce strings for integer parameters
+        return int(payload["sub"]), payload
+    except Exception:
+        raise _credentials_exception()
+
+
+def _authenticate(token: str, db: Session) -> User:
+    """
+    Resolve a bearer token to its user through the principal cache.
+
+    PERFORMANCE: On a hit, the blacklist check, JWT decode and user query are all
+    skipped; the cached user snapshot is attached to the session without a query.
+
+    Raises:
+        HTTPException: 401 if the token is invalid, blacklisted, or user not found
+    """
+    principal = principal_cache.get(token)
+    if principal is not None:
+        if principal.revoked:
+            raise _revoked_token_exception()
+        return db.merge(principal.build_user(), load=False)
+
+    version = principal_cache.version
+
+    # Check if token is blacklisted (logged out)
+    if is_token_blacklisted(token):
+        logger.warning("Attempt to use blacklisted token")
+        principal_cache.set(token, REVOKED_PRINCIPAL, version)
+        raise _revoked_token_exception()
+
+    user_id, payload = _decode_user_id(token)
+
+    # Get user from database
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        raise _credentials_exception()
+
+    principal_cache.set(token, Principal.for_user(user, payload), version)
+    return user
+
+
+# PERFORMANCE: Dependencies that query through the synchronous Session are plain `def`
+# so FastAPI runs them in the threadpool instead of blocking the event loop.
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
@@ -46,40 +113,58 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid, blacklisted, or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    return _authenticate(credentials.credentials, db)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """
+    Async variant of get_current_user for endpoints on the async database path.
 
+    Use together with @native_async endpoints that take their session from
+    get_async_db; the user is loaded without blocking the event loop.
+
+    Raises:
+        HTTPException: If token is invalid, blacklisted, or user not found
+    """
     token = credentials.credentials
 
-    # Check if token is blacklisted (logged out)
-    if is_token_blacklisted(token):
+    principal = principal_cache.get(token)
+    if principal is not None:
+        if principal.revoked:
+            raise _revoked_token_exception()
+        return await db.merge(principal.build_user(), load=False)
+
+    version = principal_cache.version
+
+    # The blacklist lives in Redis and uses the blocking client
+    if await run_in_threadpool(is_token_blacklisted, token):
         logger.warning("Attempt to use blacklisted token")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has been revoked",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        principal_cache.set(token, REVOKED_PRINCIPAL, version)
+        raise _revoked_token_exception()
 
-    try:
-        # Verify and decode the JWT token
-        payload = verify_token(token)
-        user_id: str | None = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except Exception:
-        raise credentials_exception
+    user_id, payload = _decode_user_id(token)
 
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
+    principal_cache.set(token, Principal.for_user(user, payload), version)
     return user
 
 
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """Async variant of get_current_active_user (see get_current_user_async)."""
+    if not getattr(current_user, "is_active"):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
+    return current_user
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -176,9 +261,8 @@ async def get_current_validator_user(
     return current_user
 
 
-async def get_current_assessor_user(
+def get_current_assessor_user(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
 ) -> User:
     """
     Get the current authenticated Assessor user with governance area loaded.
@@ -188,41 +272,28 @@ async def get_current_assessor_user(
 
     - Requires role to be ASSESSOR
     - Ensures an assigned assessor_area exists
-    - Returns the user with assessor_area eagerly loaded
+    - Returns the user with assessor_area loaded
 
     Raises:
         HTTPException: 403 if role is not ASSESSOR or governance area missing
     """
-    user_with_area = (
-        db.query(User)
-        .options(joinedload(User.assessor_area))
-        .filter(User.id == current_user.id)
-        .first()
-    )
-
-    if not user_with_area:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    if getattr(user_with_area, "role", None) is None or user_with_area.role != UserRole.ASSESSOR:
+    if getattr(current_user, "role", None) is None or current_user.role != UserRole.ASSESSOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions. Assessor access required.",
         )
 
-    if user_with_area.assessor_area is None:
+    # Lazy-loads the area by primary key; the user itself is not queried again
+    if current_user.assessor_area is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Assessor must be assigned to a governance area.",
         )
 
-    return user_with_area
+    return current_user
 
 
-async def get_current_validator_user_http(
+def get_current_validator_user_http(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
@@ -232,31 +303,9 @@ async def get_current_validator_user_http(
     After workflow restructuring, VALIDATORs are system-wide (no area required).
     Returns 401 for any invalid credentials to align with tests.
     """
-    # Verify and decode JWT
-    try:
-        payload = verify_token(credentials.credentials)
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # Load user
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None or not getattr(user, "is_active", False):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    user = _authenticate(credentials.credentials, db)
+    if not getattr(user, "is_active", False):
+        raise _credentials_exception()
 
     # Enforce validator role (system-wide, no area required)
     if getattr(user, "role", None) != UserRole.VALIDATOR:
@@ -269,7 +318,7 @@ async def get_current_validator_user_http(
     return user
 
 
-async def get_current_assessor_user_http(
+def get_current_assessor_user_http(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
@@ -279,31 +328,9 @@ async def get_current_assessor_user_http(
     After workflow restructuring, ASSESSORs are area-specific (require assessor_area).
     Returns 401 for any invalid credentials or missing assessor context.
     """
-    # Verify and decode JWT
-    try:
-        payload = verify_token(credentials.credentials)
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # Load user
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None or not getattr(user, "is_active", False):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    user = _authenticate(credentials.credentials, db)
+    if not getattr(user, "is_active", False):
+        raise _credentials_exception()
 
     # Enforce assessor role
     if getattr(user, "role", None) != UserRole.ASSESSOR:
@@ -314,22 +341,14 @@ async def get_current_assessor_user_http(
         )
 
     # Assessor must have assigned governance area
-    user_with_area = (
-        db.query(User).options(joinedload(User.assessor_area)).filter(User.id == user.id).first()
-    )
-    if user_with_area is None or user_with_area.assessor_area is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    if user.assessor_area is None:
+        raise _credentials_exception()
 
-    return user_with_area
+    return user
 
 
-async def get_current_assessor_or_validator(
+def get_current_assessor_or_validator(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
 ) -> User:
     """
     Dependency that accepts both ASSESSOR and VALIDATOR roles.
@@ -353,19 +372,11 @@ async def get_current_assessor_or_validator(
         )
 
     # ASSESSOR must have assessor_area_id assigned (area-specific)
-    if current_user.role == UserRole.ASSESSOR:
-        user_with_area = (
-            db.query(User)
-            .options(joinedload(User.assessor_area))
-            .filter(User.id == current_user.id)
-            .first()
+    if current_user.role == UserRole.ASSESSOR and current_user.assessor_area is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Assessor must be assigned to a governance area.",
         )
-        if user_with_area is None or user_with_area.assessor_area is None:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Assessor must be assigned to a governance area.",
-            )
-        return user_with_area
 
     # VALIDATOR is system-wide (no area required)
     return current_user
@@ -0,0 +1,96 @@
+# ⚡ API Responses
+# orjson-rendered JSON responses for endpoints with large payloads
+# PERFORMANCE: Returning a FastJSONResponse skips FastAPI's response_model
+# re-validation and jsonable_encoder walk; the payload is encoded once by orjson.
+# cached_json_response also keeps the gzipped body next to the cached value.
+
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from app.core.cache import cache
+from app.middleware.compression import (
+    COMPRESSION_MINIMUM_SIZE,
+    accepts_gzip,
+    gzip_compress,
+    gzip_decompress,
+)
+
+# Integer dict keys (e.g. per-area maps keyed by governance area ID) become strings,
+# as they do with jsonable_encoder
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _encode_fallback(value: Any) -> Any:
+    """Convert values orjson cannot serialize natively (called by orjson)."""
+    if isinstance(value, BaseModel):
+        # Same shape FastAPI's response_model serialization produces
+        return value.model_dump(by_alias=True)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Opt-in per endpoint for large payloads: declare ``response_class=FastJSONResponse``
+    on the route (keeps the OpenAPI media type) and return ``FastJSONResponse(data)``
+    from the endpoint. ``data`` may be plain dicts/lists (datetimes, enums and UUIDs
+    included) or a pydantic model that has already been validated. The route's
+    response_model is then used for documentation only, so the payload must
+    already match it.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_encode_fallback, option=_ORJSON_OPTIONS)
+
+
+def cached_json_response(request: Request, cache_key: str, load: Callable[[], Any]) -> Response:
+    """
+    JSON response for a payload cached under cache_key, served precompressed.
+
+    The gzipped body is stored next to the cached value (RedisCache.set_rendered)
+    and dropped whenever the value is rewritten or invalidated. It is only stored
+    when the value was already cached before load() and is unchanged after it.
+    A hit sends the stored bytes as is, skipping serialization and compression
+    (clients that do not accept gzip get them decompressed).
+
+    Args:
+        request: Current request (for Accept-Encoding)
+        cache_key: Key the service caches the payload under
+        load: Returns the payload, normally through the service's own cached
+            lookup; it must already match the route's response_model
+
+    Returns:
+        Response with the JSON body, gzip-encoded when the client accepts it
+    """
+    gzip_accepted = accepts_gzip(request.headers.get("accept-encoding", ""))
+    compressed = cache.get_rendered(cache_key)
+
+    if compressed is None:
+        source = cache.rendered_source(cache_key)
+        body = FastJSONResponse(load()).body
+        if len(body) < COMPRESSION_MINIMUM_SIZE:
+            return Response(body, media_type="application/json")
+        compressed = gzip_compress(body)
+        if source is not None:
+            cache.set_rendered(cache_key, compressed, source)
+        if not gzip_accepted:
+            return Response(body, media_type="application/json")
+
+    if not gzip_accepted:
+        return Response(gzip_decompress(compressed), media_type="application/json")
+    return Response(
+        compressed,
+        media_type="application/json",
+        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+    )
@@ -0,0 +1,79 @@
+# 🧵 API Routing
+# Route class that keeps blocking handlers off the event loop
+
+import asyncio
+import inspect
+import threading
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi.routing import APIRoute
+
+# Attribute set by @native_async on endpoints that are safe to run on the event loop
+NATIVE_ASYNC_ATTR = "__sinag_native_async__"
+
+# Each threadpool worker keeps one private event loop for running offloaded coroutines
+_thread_state = threading.local()
+
+
+def native_async(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Mark an async endpoint as fully non-blocking.
+
+    Only use this for endpoints whose I/O is awaited (AsyncSession via get_async_db,
+    async HTTP clients, streaming request bodies). Unmarked async endpoints are run in
+    the threadpool by OffloadedRoute because they call the synchronous Session.
+    """
+    setattr(endpoint, NATIVE_ASYNC_ATTR, True)
+    return endpoint
+
+
+def is_native_async(endpoint: Callable[..., Any]) -> bool:
+    """Return True if the endpoint was marked with @native_async."""
+    return getattr(endpoint, NATIVE_ASYNC_ATTR, False)
+
+
+def _run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on the current worker thread's event loop."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+    return loop.run_until_complete(coro)
+
+
+def offload_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap an async endpoint in a sync function so FastAPI runs it in the threadpool.
+
+    The wrapper exposes the endpoint's signature (parameters, dependencies and return
+    annotation) but deliberately has no __wrapped__, otherwise FastAPI would unwrap it
+    and treat it as a coroutine again.
+    """
+
+    def run_in_worker_thread(*args: Any, **kwargs: Any) -> Any:
+        return _run_coroutine(endpoint(*args, **kwargs))
+
+    for attr in ("__module__", "__name__", "__qualname__", "__doc__"):
+        setattr(run_in_worker_thread, attr, getattr(endpoint, attr))
+    run_in_worker_thread.__signature__ = inspect.signature(endpoint)  # type: ignore[attr-defined]
+    run_in_worker_thread.__sinag_offloaded__ = endpoint  # type: ignore[attr-defined]
+    return run_in_worker_thread
+
+
+class OffloadedRoute(APIRoute):
+    """
+    APIRoute that runs unmigrated async endpoints in the bounded threadpool.
+
+    PERFORMANCE: Most handlers are declared `async def` but query the database through
+    the synchronous SQLAlchemy Session. Run on the event loop, one slow query stalls
+    every other request on the worker. This route class runs such handlers in the
+    threadpool (sized by THREADPOOL_MAX_WORKERS) instead. Endpoints migrated to the
+    async database path opt out with @native_async. Sync `def` endpoints are already
+    run in the threadpool by FastAPI and are left untouched.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        if inspect.iscoroutinefunction(endpoint) and not is_native_async(endpoint):
+            endpoint = offload_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_mlgoo_dilg
+from app.api.routing import OffloadedRoute
 from app.core.year_resolver import get_year_resolver
 from app.db.models.user import User
 from app.schemas.admin import (
@@ -29,7 +30,7 @@ from app.services.assessment_lock_service import assessment_lock_service
 from app.services.audit_service import audit_service
 from app.services.deadline_service import deadline_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 # ============================================================================
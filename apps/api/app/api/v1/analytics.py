@@ -10,6 +10,7 @@ from fastapi import status as http_status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.routing import OffloadedRoute
 from app.core.cache import cache
 from app.db.enums import UserRole
 from app.db.models.user import User
@@ -22,7 +23,7 @@ from app.services.analytics_service import ReportsFilters, analytics_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 async def get_current_mlgoo_dilg_user(
@@ -257,9 +258,8 @@ async def refresh_dashboard_analysis(
 
             year = assessment_year_service.get_active_year_number(db)
 
-        # Invalidate ALL dashboard cache keys (pattern match for consistency with worker)
-        # This ensures we clear all cached data including year_all, year_2025, etc.
-        cache_invalidated_count = cache.delete_pattern("dashboard_kpis:*")
+        # Invalidate cached data for this year (and all-years entries that include it)
+        cache_invalidated_count = cache.invalidate_assessment_year(year)
 
         logger.info(
             f"♻️  Dashboard analysis refresh requested by user {current_user.id} "
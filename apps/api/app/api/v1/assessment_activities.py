@@ -12,6 +12,7 @@ from openpyxl.utils import get_column_letter
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_mlgoo_dilg
+from app.api.routing import OffloadedRoute
 from app.db.models.user import User
 from app.schemas.assessment_activity import (
     ActivityByActionCount,
@@ -24,7 +25,7 @@ from app.schemas.assessment_activity import (
 )
 from app.services.assessment_activity_service import assessment_activity_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 # ============================================================================
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user, get_db, require_mlgoo_dilg
+from app.api.routing import OffloadedRoute
 from app.db.models.user import User
 from app.schemas.assessment_year import (
     AccessibleYearsResponse,
@@ -18,7 +19,7 @@ from app.schemas.assessment_year import (
 )
 from app.services.assessment_year_service import assessment_year_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 # =============================================================================
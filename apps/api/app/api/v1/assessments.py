@@ -5,10 +5,13 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.responses import FastJSONResponse
+from app.api.routing import OffloadedRoute
+from app.core.etag import conditional_get
 from app.db.enums import AssessmentStatus, UserRole
 
 logger = logging.getLogger(__name__)
@@ -41,7 +44,7 @@ from app.services.assessment_lock_service import assessment_lock_service
 from app.services.assessment_service import assessment_service
 from app.services.submission_validation_service import submission_validation_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 def _extract_validator_owned_data(response_data: dict | None) -> dict:
@@ -136,7 +139,12 @@ async def get_assessment_dashboard(
         ) from e
 
 
-@router.get("/my-assessment", response_model=dict[str, Any], tags=["assessments"])
+@router.get(
+    "/my-assessment",
+    response_model=dict[str, Any],
+    response_class=FastJSONResponse,
+    tags=["assessments"],
+)
 async def get_my_assessment(
     year: int | None = Query(
         None,
@@ -176,7 +184,8 @@ async def get_my_assessment(
                 detail="Failed to retrieve assessment data",
             )
 
-        return assessment_data
+        # PERFORMANCE: Large nested payload, encoded once with orjson
+        return FastJSONResponse(assessment_data)
 
     except Exception as e:
         raise HTTPException(
@@ -501,6 +510,8 @@ async def get_current_admin_user(
 
 @router.get("/list", response_model=list[dict[str, Any]], tags=["assessments"])
 async def get_all_validated_assessments(
+    request: Request,
+    response: Response,
     assessment_status: AssessmentStatus | None = Query(
         None, description="Filter by assessment status (returns all if not specified)"
     ),
@@ -526,9 +537,17 @@ async def get_all_validated_assessments(
         current_user: Current admin/MLGOO user
 
     Returns:
-        List of assessment dictionaries with compliance data
+        List of assessment dictionaries with compliance data (304 if the client's
+        ETag is current)
     """
     try:
+        # PERFORMANCE: Unchanged polls get a 304 before the assessments are loaded
+        not_modified = conditional_get(
+            request, response, assessment_service.get_assessments_version(db, year)
+        )
+        if not_modified:
+            return not_modified
+
         assessments = assessment_service.get_all_validated_assessments(
             db, status=assessment_status, assessment_year=year
         )
@@ -2,10 +2,23 @@
 # Endpoints for assessor-specific functionality (secure queue, validation actions)
 
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.responses import FastJSONResponse
+from app.api.routing import OffloadedRoute
+from app.core.etag import conditional_get
 from app.db.enums import UserRole
 from app.db.models.user import User
 from app.schemas import (
@@ -27,13 +40,20 @@ from app.schemas.assessor import (
     ReviewHistoryResponse,
 )
 from app.schemas.municipal_insights import MunicipalOverviewDashboard
-from app.services import annotation_service, assessor_service, intelligence_service
+from app.services import (
+    annotation_service,
+    assessment_service,
+    assessor_service,
+    intelligence_service,
+)
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 @router.get("/queue", response_model=list[AssessorQueueItem], tags=["assessor"])
 async def get_assessor_queue(
+    request: Request,
+    response: Response,
     year: int | None = Query(
         None,
         description="Filter by assessment year (e.g., 2024, 2025). Defaults to active year.",
@@ -47,8 +67,20 @@ async def get_assessor_queue(
     Get the assessor's secure submissions queue.
 
     Returns a list of submissions filtered by the assessor's governance area
-    and optionally by assessment year.
+    and optionally by assessment year. Polls with a current ETag get a 304.
     """
+    # PERFORMANCE: Unchanged polls get a 304 before the queue is built
+    not_modified = conditional_get(
+        request,
+        response,
+        assessment_service.get_assessments_version(db, year),
+        current_assessor.id,
+        current_assessor.role,
+        current_assessor.assessor_area_id,
+    )
+    if not_modified:
+        return not_modified
+
     return assessor_service.get_assessor_queue(
         db=db, assessor=current_assessor, assessment_year=year
     )
@@ -221,6 +253,7 @@ async def upload_mov_file_for_assessor(
 @router.get(
     "/assessments/{assessment_id}",
     response_model=AssessmentDetailsResponse,
+    response_class=FastJSONResponse,
     tags=["assessor"],
 )
 async def get_assessment_details(
@@ -255,7 +288,8 @@ async def get_assessment_details(
             raise HTTPException(status_code=403, detail=result["message"])
         raise HTTPException(status_code=400, detail=result.get("message", "Unknown error"))
 
-    return AssessmentDetailsResponse(**result)
+    # PERFORMANCE: Large nested payload, validated once and encoded with orjson
+    return FastJSONResponse(AssessmentDetailsResponse(**result))
 
 
 @router.post(
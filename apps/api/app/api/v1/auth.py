@@ -9,6 +9,8 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_client_ip, get_current_active_user, get_db
+from app.api.routing import OffloadedRoute
+from app.core.principal_cache import principal_cache
 from app.core.security import (
     MAX_FAILED_ATTEMPTS,
     blacklist_token,
@@ -26,7 +28,7 @@ from app.schemas.token import AuthToken, ChangePasswordRequest, LoginRequest
 from app.services.audit_service import audit_service
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 security = HTTPBearer()
 
 
@@ -209,6 +211,7 @@ async def change_password(
 
     # Save changes to database
     db.commit()
+    principal_cache.invalidate_user(current_user.id)
     db.refresh(current_user)
 
     # Log successful password change
@@ -267,6 +270,9 @@ async def logout(
         # Log but don't fail - still return success to user
         logger.error(f"Failed to blacklist token: {e}")
 
+    # Stop serving the token from the principal cache on every replica
+    principal_cache.invalidate_token(token)
+
     # Log logout event
     try:
         audit_service.log_audit_event(
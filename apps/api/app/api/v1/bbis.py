@@ -5,11 +5,13 @@
 import math
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session, joinedload
 
 from app.api import deps
+from app.api.responses import FastJSONResponse, cached_json_response
+from app.api.routing import OffloadedRoute
 from app.db.enums import BBIStatus, UserRole
 from app.db.models.assessment import Assessment
 from app.db.models.barangay import Barangay
@@ -31,7 +33,7 @@ from app.schemas.bbi import (
 )
 from app.services.bbi_service import bbi_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 # ============================================================================
@@ -652,9 +654,11 @@ async def get_barangay_bbi_compliance(
 @router.get(
     "/analytics/municipality",
     response_model=MunicipalityBBIAnalyticsResponse,
+    response_class=FastJSONResponse,
     tags=["bbis"],
 )
 async def get_municipality_bbi_analytics(
+    request: Request,
     year: int = Query(..., description="Assessment year"),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
@@ -679,5 +683,11 @@ async def get_municipality_bbi_analytics(
             detail="Not enough permissions. MLGOO or analytics access required.",
         )
 
-    analytics = bbi_service.get_municipality_bbi_analytics(db, year)
-    return analytics
+    # PERFORMANCE: Served from a precompressed body stored next to the cached analytics
+    return cached_json_response(
+        request,
+        bbi_service.municipality_analytics_cache_key(year),
+        lambda: MunicipalityBBIAnalyticsResponse.model_validate(
+            bbi_service.get_municipality_bbi_analytics(db, year)
+        ),
+    )
@@ -18,6 +18,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.api import deps
+from app.api.routing import OffloadedRoute
 from app.db.enums import AssessmentStatus, UserRole
 from app.db.models.assessment import Assessment, AssessmentResponse
 from app.db.models.governance_area import GovernanceArea, Indicator
@@ -31,7 +32,7 @@ from app.schemas.blgu_dashboard import (
 )
 from app.services.assessment_lock_service import assessment_lock_service
 
-router = APIRouter(tags=["blgu-dashboard"])
+router = APIRouter(tags=["blgu-dashboard"], route_class=OffloadedRoute)
 
 
 def _calculate_deadline_urgency(
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import get_current_active_user, get_current_admin_user, get_db
+from app.api.routing import OffloadedRoute
 from app.db.enums import AssessmentStatus, UserRole
 from app.db.models.assessment import Assessment
 from app.db.models.user import User
@@ -20,7 +21,7 @@ from app.services.intelligence_service import intelligence_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/capdev", tags=["capdev"])
+router = APIRouter(prefix="/capdev", tags=["capdev"], route_class=OffloadedRoute)
 
 
 # ============================================================================
@@ -9,12 +9,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.routing import OffloadedRoute
 from app.db.enums import UserRole
 from app.db.models.user import User
 from app.schemas.compliance import ComplianceOverviewResponse
 from app.services.compliance_service import compliance_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 @router.get(
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.routing import OffloadedRoute
 from app.db.enums import UserRole
 from app.db.models.user import User
 from app.schemas.deadline_extension import (
@@ -14,7 +15,7 @@ from app.schemas.deadline_extension import (
 )
 from app.services.deadline_extension_service import deadline_extension_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 @router.post(
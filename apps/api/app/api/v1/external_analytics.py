@@ -4,11 +4,13 @@
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_external_user, get_db
+from app.api.responses import FastJSONResponse, cached_json_response
+from app.api.routing import OffloadedRoute
 from app.db.models.user import User
 from app.schemas.external_analytics import (
     AnonymizedAIInsightsResponse,
@@ -23,7 +25,11 @@ from app.services.external_analytics_service import external_analytics_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/external/analytics", tags=["external-analytics"])
+router = APIRouter(
+    prefix="/external/analytics",
+    tags=["external-analytics"],
+    route_class=OffloadedRoute,
+)
 
 
 @router.get(
@@ -221,10 +227,12 @@ async def get_ai_insights_summary(
 @router.get(
     "/dashboard",
     response_model=ExternalAnalyticsDashboardResponse,
+    response_class=FastJSONResponse,
     summary="Get Complete Dashboard Data",
     description="Returns all dashboard sections in a single response (overall compliance, governance areas, top failing indicators, AI insights). Optimized for dashboard loading.",
 )
 async def get_complete_dashboard(
+    request: Request,
     assessment_cycle: str | None = Query(None, description="Assessment cycle filter"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_external_user),
@@ -256,9 +264,12 @@ async def get_complete_dashboard(
             f"requesting complete dashboard (cycle: {assessment_cycle or 'latest'})"
         )
 
-        result = external_analytics_service.get_complete_dashboard(db, assessment_cycle)
-
-        return result
+        # PERFORMANCE: Served from a precompressed body stored next to the cached dashboard
+        return cached_json_response(
+            request,
+            external_analytics_service.dashboard_cache_key(assessment_cycle),
+            lambda: external_analytics_service.get_complete_dashboard(db, assessment_cycle),
+        )
 
     except ValueError as e:
         # Insufficient data for anonymization
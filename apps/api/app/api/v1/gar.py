@@ -7,11 +7,13 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.responses import FastJSONResponse
+from app.api.routing import OffloadedRoute
 from app.db.models.user import User
 from app.schemas.gar import GARAssessmentListResponse, GARResponse
 from app.services.gar_service import gar_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 @router.get(
@@ -42,6 +44,7 @@ async def get_gar_assessments(
 @router.get(
     "/{assessment_id}",
     response_model=GARResponse,
+    response_class=FastJSONResponse,
     tags=["gar"],
 )
 async def get_gar_report(
@@ -70,10 +73,13 @@ async def get_gar_report(
     Only accessible by MLGOO_DILG users.
     """
     try:
-        return gar_service.get_gar_data(
-            db=db,
-            assessment_id=assessment_id,
-            governance_area_id=governance_area_id,
+        # PERFORMANCE: Large nested payload, encoded once with orjson
+        return FastJSONResponse(
+            gar_service.get_gar_data(
+                db=db,
+                assessment_id=assessment_id,
+                governance_area_id=governance_area_id,
+            )
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
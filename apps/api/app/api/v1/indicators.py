@@ -1,10 +1,12 @@
 # 📊 Indicator API Endpoints
 # CRUD operations for indicator management with versioning support
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.routing import OffloadedRoute
+from app.core.etag import conditional_get
 from app.core.year_resolver import get_year_resolver
 from app.db.models.user import User
 from app.schemas.calculation_schema import CalculationSchema
@@ -18,11 +20,12 @@ from app.schemas.indicator import (
     IndicatorUpdate,
     SimplifiedIndicatorResponse,
 )
+from app.services.assessment_year_service import assessment_year_service
 from app.services.form_schema_validator import generate_validation_errors
 from app.services.indicator_service import indicator_service
 from app.services.intelligence_service import intelligence_service
 
-router = APIRouter(tags=["indicators"])
+router = APIRouter(tags=["indicators"], route_class=OffloadedRoute)
 
 
 @router.post(
@@ -72,6 +75,8 @@ def create_indicator(
 )
 def list_indicators(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user),
     governance_area_id: int | None = Query(None, description="Filter by governance area"),
@@ -79,7 +84,7 @@ def list_indicators(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
     year: int | None = Query(None, description="Assessment year for placeholder resolution"),
-) -> list[IndicatorResponse]:
+) -> list[IndicatorResponse] | Response:
     """
     List indicators with optional filtering.
 
@@ -93,7 +98,20 @@ def list_indicators(
     - year: Assessment year for placeholder resolution (optional, uses active year if not provided)
 
     **Returns**: List of indicators matching filters with resolved year placeholders
+    (304 if the client's ETag is current)
     """
+    # PERFORMANCE: Unchanged polls get a 304 before indicators are loaded.
+    # Placeholders resolve against the active year when none is requested.
+    active_year = None if year is not None else assessment_year_service.get_active_year(db)
+    not_modified = conditional_get(
+        request,
+        response,
+        indicator_service.get_indicators_version(db),
+        active_year.year if active_year else None,
+    )
+    if not_modified:
+        return not_modified
+
     indicators = indicator_service.list_indicators(
         db=db,
         governance_area_id=governance_area_id,
@@ -3,16 +3,21 @@
 # governance areas, barangays, and user roles.
 
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.responses import FastJSONResponse, cached_json_response
+from app.api.routing import OffloadedRoute
 from app.db.enums import UserRole
 from app.schemas import lookups as lookup_schema
 from app.services.barangay_service import barangay_service
-from app.services.governance_area_service import governance_area_service
+from app.services.governance_area_service import (
+    GOVERNANCE_AREAS_CACHE_KEY,
+    governance_area_service,
+)
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 # Human-readable labels and descriptions for user roles
 USER_ROLE_OPTIONS = [
@@ -47,15 +52,25 @@ USER_ROLE_OPTIONS = [
 @router.get(
     "/governance-areas",
     response_model=list[lookup_schema.GovernanceArea],
+    response_class=FastJSONResponse,
 )
 def get_all_governance_areas(
+    request: Request,
     db: Session = Depends(deps.get_db),
 ):
     """
     Retrieve all governance areas.
     Accessible by all authenticated users.
     """
-    return governance_area_service.get_all_governance_areas(db)
+    # PERFORMANCE: Served from a precompressed body stored next to the cached areas
+    return cached_json_response(
+        request,
+        GOVERNANCE_AREAS_CACHE_KEY,
+        lambda: [
+            lookup_schema.GovernanceArea.model_validate(area)
+            for area in governance_area_service.get_all_governance_areas(db)
+        ],
+    )
 
 
 @router.get(
@@ -7,6 +7,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.responses import FastJSONResponse
+from app.api.routing import OffloadedRoute
 from app.db.models.user import User
 from app.schemas.mlgoo import (
     ApprovalQueueItem,
@@ -33,7 +35,7 @@ from app.schemas.mlgoo import (
 from app.services.mlgoo_service import mlgoo_service
 from app.services.notification_service import notification_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 # ==================== Approval Queue ====================
@@ -88,6 +90,7 @@ async def get_approval_queue(
 @router.get(
     "/assessments/{assessment_id}",
     response_model=AssessmentDetailResponse,
+    response_class=FastJSONResponse,
     summary="Get Assessment Details for MLGOO Review",
     description=(
         "Get detailed assessment information for MLGOO review.\n\n"
@@ -119,7 +122,8 @@ async def get_assessment_details(
             assessment_id=assessment_id,
             mlgoo_user=current_user,
         )
-        return AssessmentDetailResponse(**details)
+        # PERFORMANCE: Large nested payload, validated once and encoded with orjson
+        return FastJSONResponse(AssessmentDetailResponse(**details))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -4,10 +4,13 @@ MOV File Management API Endpoints (Epic 4.0)
 Provides endpoints for uploading, listing, and deleting MOV (Means of Verification) files.
 """
 
+import logging
+
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from sqlalchemy.orm import Session, joinedload
 
 from app.api import deps
+from app.api.routing import OffloadedRoute
 from app.db.enums import AssessmentStatus, UserRole
 from app.db.models.assessment import (
     MOV_UPLOAD_ORIGIN_BLGU,
@@ -18,12 +21,20 @@ from app.db.models.assessment import (
 )
 from app.db.models.governance_area import Indicator
 from app.db.models.user import User
-from app.schemas.assessment import MOVFileListResponse, MOVFileResponse, SignedUrlResponse
+from app.schemas.assessment import (
+    MOVFileListResponse,
+    MOVFileResponse,
+    SignedUrlBatchRequest,
+    SignedUrlBatchResponse,
+    SignedUrlResponse,
+)
 from app.services.assessment_lock_service import assessment_lock_service
 from app.services.file_validation_service import file_validation_service
 from app.services.storage_service import storage_service
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=OffloadedRoute)
 
 
 @router.post(
@@ -277,10 +288,6 @@ def get_signed_url(
         HTTPException 404: File not found
         HTTPException 500: Failed to generate signed URL
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     try:
         signed_url = storage_service.get_signed_url_for_file(
             db=db,
@@ -304,6 +311,64 @@ def get_signed_url(
         )
 
 
+@router.post(
+    "/files/signed-urls",
+    response_model=SignedUrlBatchResponse,
+    status_code=status.HTTP_200_OK,
+    tags=["movs"],
+    summary="Get signed URLs for several MOV files",
+    description="""
+    Generate time-limited signed URLs for a list of MOV files in one request.
+
+    - **Permission check**: Validates user has access to every file
+    - **Batched**: All files are signed with at most one storage round-trip
+    - **Cached**: URLs are reused until shortly before they expire
+
+    Returns a signed URL per file ID (null for deleted or missing files).
+    """,
+)
+def get_signed_urls(
+    payload: SignedUrlBatchRequest,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+) -> SignedUrlBatchResponse:
+    """
+    Get signed URLs for several MOV files.
+
+    Args:
+        payload: IDs of the MOV files
+        db: Database session
+        current_user: Currently authenticated user
+
+    Returns:
+        SignedUrlBatchResponse mapping file IDs to signed URLs
+
+    Raises:
+        HTTPException 403: Permission denied for one of the files
+        HTTPException 500: Failed to generate signed URLs
+    """
+    try:
+        signed_urls = storage_service.get_signed_urls_for_files(
+            db=db,
+            file_ids=payload.file_ids,
+            user_id=current_user.id,
+            expires_in=3600,  # 1 hour
+        )
+
+        return SignedUrlBatchResponse(signed_urls=signed_urls)
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        # Log the full error server-side but return a generic message to clients
+        logger.error(f"Failed to generate signed URLs for files {payload.file_ids}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate signed URLs. Please try again.",
+        )
+
+
 @router.delete(
     "/files/{file_id}",
     response_model=MOVFileResponse,
@@ -8,6 +8,7 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_mlgoo_dilg
+from app.api.routing import OffloadedRoute
 from app.db.models.user import User
 from app.schemas.municipal_export import (
     AvailableCycle,
@@ -19,7 +20,7 @@ from app.schemas.municipal_export import (
 )
 from app.services.municipal_export_service import municipal_export_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 # ============================================================================
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.routing import OffloadedRoute
 from app.db.models.user import User
 from app.schemas.municipal_office import (
     MunicipalOfficeCreate,
@@ -18,7 +19,7 @@ from app.schemas.municipal_office import (
 )
 from app.services.municipal_office_service import municipal_office_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 # ============================================================================
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_admin_user, get_db
+from app.api.routing import OffloadedRoute
 from app.db.models.user import User
 from app.schemas.municipal_insights import (
     AggregatedCapDevSummary,
@@ -20,7 +21,11 @@ from app.services.municipal_analytics_service import municipal_analytics_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/municipal-overview", tags=["municipal-overview"])
+router = APIRouter(
+    prefix="/municipal-overview",
+    tags=["municipal-overview"],
+    route_class=OffloadedRoute,
+)
 
 
 # ============================================================================
@@ -2,10 +2,16 @@
 # Endpoints for notification management
 
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.routing import OffloadedRoute, native_async
+from app.core.notification_stream import format_sse, notification_stream
 from app.db.models.user import User
 from app.schemas.notification import (
     MarkReadRequest,
@@ -16,7 +22,7 @@ from app.schemas.notification import (
 )
 from app.services.notification_service import notification_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 @router.get(
@@ -59,9 +65,10 @@ async def get_notifications(
     tags=["notifications"],
     summary="Get unread notification count",
 )
+@native_async
 async def get_notification_count(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_user),
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user_async),
 ):
     """
     Get unread notification count for the current user.
@@ -69,8 +76,7 @@ async def get_notification_count(
     Optimized endpoint for polling - returns minimal payload.
     Use this for updating the notification badge without fetching full list.
     """
-    unread_count = notification_service.get_unread_count(db, current_user.id)
-    total = notification_service.get_total_count(db, current_user.id)
+    unread_count, total = await notification_service.get_counts_async(db, current_user.id)
 
     return NotificationCountResponse(
         unread_count=unread_count,
@@ -78,6 +84,57 @@ async def get_notification_count(
     )
 
 
+@router.get(
+    "/stream",
+    tags=["notifications"],
+    summary="Stream notification events",
+    response_class=StreamingResponse,
+)
+@native_async
+async def stream_notifications(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_active_user_async),
+):
+    """
+    Stream notification events for the current user as Server-Sent Events.
+
+    Replaces polling /count: the stream opens with a `counts` event, then sends a
+    `created` event when notifications arrive and a `read` event when they are
+    marked as read (both carry the new unread_count and total when known).
+    Comment lines are sent as keepalives while idle.
+
+    PERFORMANCE: The database session is released before streaming starts, so an
+    open dashboard holds a Redis subscription but no database connection.
+    Returns 503 when push delivery is unavailable; clients then fall back to polling.
+    """
+    if not notification_stream.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Notification streaming is unavailable",
+        )
+
+    user_id = current_user.id
+    unread_count, total = await notification_service.get_counts_async(db, user_id)
+    await db.close()
+
+    async def events() -> AsyncIterator[str]:
+        yield format_sse("counts", {"unread_count": unread_count, "total": total})
+        async for event in notification_stream.subscribe(user_id):
+            if await request.is_disconnected():
+                break
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield format_sse(event.get("type", "message"), event)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post(
     "/mark-read",
     response_model=MarkReadResponse,
@@ -5,6 +5,7 @@ from datetime import datetime
 
 from fastapi import APIRouter
 
+from app.api.routing import OffloadedRoute
 from app.db.base import (
     check_all_connections,
     check_database_connection,
@@ -12,7 +13,7 @@ from app.db.base import (
 )
 from app.schemas.system import ApiResponse, HealthCheck
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 @router.get("/", response_model=ApiResponse, tags=["system"])
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.routing import OffloadedRoute
 from app.db.models.user import User
 from app.schemas.user_preferences import (
     TourName,
@@ -13,7 +14,7 @@ from app.schemas.user_preferences import (
 )
 from app.services.user_preferences_service import user_preferences_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 @router.get("/me/preferences", response_model=UserPreferencesResponse, tags=["user-preferences"])
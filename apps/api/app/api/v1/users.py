@@ -7,6 +7,8 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile,
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.routing import OffloadedRoute
+from app.core.principal_cache import principal_cache
 from app.db.models.user import User
 from app.schemas.user import (
     PasswordResetRequest,
@@ -18,7 +20,7 @@ from app.schemas.user import (
 from app.schemas.user import User as UserSchema
 from app.services.user_service import user_service
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 @router.get("/me", response_model=UserSchema, tags=["users"])
@@ -77,6 +79,7 @@ async def update_language_preference(
     """
     current_user.preferred_language = language
     db.commit()
+    principal_cache.invalidate_user(current_user.id)
     db.refresh(current_user)
     return current_user
 
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user, get_db, require_mlgoo_dilg
+from app.api.routing import OffloadedRoute
 from app.core.year_resolver import YearPlaceholderResolver
 from app.db.models.user import User
 from app.schemas.year_config import (
@@ -27,7 +28,7 @@ from app.services.year_config_service import (
     year_config_service,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=OffloadedRoute)
 
 
 # =============================================================================
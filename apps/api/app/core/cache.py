@@ -5,16 +5,23 @@
 import hashlib
 import json
 import logging
+import math
+import os
+import random
 import time
-from collections.abc import Callable
-from dataclasses import dataclass
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from fnmatch import fnmatchcase
 from functools import wraps
 from threading import Lock
-from typing import Any
+from typing import Any, cast
 
 import redis
 from redis.exceptions import RedisError
 
+from app.core import cache_codec
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -26,6 +33,151 @@ CACHE_TTL_DASHBOARD = 1800  # 30 minutes for dashboard data
 CACHE_TTL_LOOKUP = 3600  # 1 hour for lookup/reference data
 CACHE_TTL_SHORT = 300  # 5 minutes for frequently changing data
 
+# L1 (in-process) cache configuration
+# PERFORMANCE: Hot keys are served from process memory without a Redis round-trip
+# or JSON decode. Entries are capped per key prefix (the part before the first ":")
+# so large analytics payloads cannot evict small reference data.
+L1_DEFAULT_MAX_ENTRIES = 128
+L1_MAX_ENTRIES_BY_PREFIX: dict[str, int] = {
+    "lookup": 256,
+    "dashboard_kpis": 64,
+    "external_dashboard": 16,
+    "bbi_municipality_analytics": 16,
+}
+# Upper bound on L1 entry lifetime, limiting staleness if an invalidation message is lost
+L1_MAX_TTL = 60
+
+# Pub/sub channel used to evict L1 entries on every API replica
+CACHE_INVALIDATION_CHANNEL = "sinag:cache:invalidate"
+
+# Redis sets listing the keys stored under each tag (see RedisCache.invalidate_tags)
+CACHE_TAG_KEY_PREFIX = "cache_tag:"
+# Keys deleted per DEL command when invalidating a tag
+CACHE_TAG_DELETE_BATCH_SIZE = 500
+
+# Suffix of the key holding a value's pre-rendered HTTP response body (see set_rendered)
+RENDERED_KEY_SUFFIX = ":rendered"
+
+_MISSING = object()
+
+# Marks values stored by RedisCache.get_or_compute together with their freshness
+_ENTRY_MARKER = "__cache_entry__"
+
+# Compare-and-delete so a worker only releases the recomputation lock it holds
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Digest of a stored value, identifying the version a rendered body is built from
+_VALUE_DIGEST_SCRIPT = """
+local value = redis.call("get", KEYS[1])
+if not value then
+    return false
+end
+return redis.sha1hex(value)
+"""
+
+# Store a rendered body only while the value still has the digest it was rendered
+# from; the body expires with the value, or ARGV[3] ms earlier (see set_rendered)
+_SET_RENDERED_SCRIPT = """
+local value = redis.call("get", KEYS[1])
+if not value or redis.sha1hex(value) ~= ARGV[1] then
+    return 0
+end
+local ttl = redis.call("pttl", KEYS[1]) - tonumber(ARGV[3])
+if ttl <= 0 then
+    return 0
+end
+redis.call("set", KEYS[2], ARGV[2], "PX", ttl)
+return 1
+"""
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Stampede protection settings for a cache key prefix.
+
+    Attributes:
+        single_flight: On a miss only one worker computes (holding a Redis lock);
+            the others wait for its result instead of all hitting the database
+        stale_ttl: Seconds an expired value is still served while one worker refreshes it
+        early_expiration_beta: Probabilistic early expiration (XFetch); values are
+            refreshed shortly before expiry, earlier the slower they are to compute.
+            0 disables, 1.0 is the usual setting
+        lock_ttl: Seconds before an abandoned recomputation lock expires
+        lock_wait: Seconds a waiting worker polls for the result before computing itself
+    """
+
+    single_flight: bool = False
+    stale_ttl: int = 0
+    early_expiration_beta: float = 0.0
+    lock_ttl: int = 60
+    lock_wait: float = 10.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any protection is active (values are then stored with freshness data)."""
+        return self.single_flight or self.stale_ttl > 0 or self.early_expiration_beta > 0
+
+
+DEFAULT_CACHE_POLICY = CachePolicy()
+
+# Per-prefix stampede protection (prefix = key segment before the first ":")
+CACHE_POLICIES: dict[str, CachePolicy] = {
+    # Whole external dashboard: expensive, 1-hour TTL, requested concurrently
+    "external_dashboard": CachePolicy(
+        single_flight=True,
+        stale_ttl=300,
+        early_expiration_beta=1.0,
+        lock_ttl=120,
+        lock_wait=15.0,
+    ),
+}
+
+
+def get_cache_policy(key_or_prefix: str) -> CachePolicy:
+    """Return the stampede protection policy for a key or key prefix."""
+    return CACHE_POLICIES.get(key_or_prefix.split(":", 1)[0], DEFAULT_CACHE_POLICY)
+
+
+@dataclass
+class PrefixCacheMetrics:
+    """Stampede protection and payload counters for one key prefix."""
+
+    recomputations: int = 0  # Values computed and stored by get_or_compute
+    early_refreshes: int = 0  # Recomputed before expiry (probabilistic early expiration)
+    stale_hits: int = 0  # Expired values served while another worker refreshed them
+    lock_waits: int = 0  # Misses answered by waiting for another worker's result
+    lock_timeouts: int = 0  # Waits that gave up and computed anyway
+    # Payload sizes written (JSON vs. stored after compression) and Redis-read decode cost
+    writes: int = 0
+    total_raw_bytes: int = 0
+    total_stored_bytes: int = 0
+    decodes: int = 0
+    total_decoded_bytes: int = 0
+    total_decode_time_ms: float = 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """JSON size divided by stored size (1.0 means no savings)."""
+        return (self.total_raw_bytes / self.total_stored_bytes) if self.total_stored_bytes else 1.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {
+            **asdict(self),
+            "total_decode_time_ms": round(self.total_decode_time_ms, 3),
+            "avg_stored_bytes": round(self.total_stored_bytes / self.writes) if self.writes else 0,
+            "avg_decode_time_ms": (
+                round(self.total_decode_time_ms / self.decodes, 3) if self.decodes else 0.0
+            ),
+            "compression_ratio": round(self.compression_ratio, 2),
+        }
+
 
 @dataclass
 class CacheMetrics:
@@ -36,6 +188,12 @@ class CacheMetrics:
     errors: int = 0
     total_hit_time_ms: float = 0.0
     total_miss_time_ms: float = 0.0
+    # Per-tier lookups: L1 is process memory, L2 is Redis (only consulted on L1 miss)
+    l1_hits: int = 0
+    l1_misses: int = 0
+    l2_hits: int = 0
+    l2_misses: int = 0
+    prefixes: dict[str, PrefixCacheMetrics] = field(default_factory=dict)
 
     @property
     def hit_rate(self) -> float:
@@ -43,6 +201,18 @@ class CacheMetrics:
         total = self.hits + self.misses
         return (self.hits / total * 100) if total > 0 else 0.0
 
+    @property
+    def l1_hit_rate(self) -> float:
+        """Percentage of lookups served from process memory."""
+        total = self.l1_hits + self.l1_misses
+        return (self.l1_hits / total * 100) if total > 0 else 0.0
+
+    @property
+    def l2_hit_rate(self) -> float:
+        """Percentage of L1 misses served from Redis."""
+        total = self.l2_hits + self.l2_misses
+        return (self.l2_hits / total * 100) if total > 0 else 0.0
+
     @property
     def avg_hit_time_ms(self) -> float:
         """Average time for cache hits."""
@@ -62,9 +232,104 @@ class CacheMetrics:
             "hit_rate": round(self.hit_rate, 2),
             "avg_hit_time_ms": round(self.avg_hit_time_ms, 2),
             "avg_miss_time_ms": round(self.avg_miss_time_ms, 2),
+            "l1_hits": self.l1_hits,
+            "l1_misses": self.l1_misses,
+            "l1_hit_rate": round(self.l1_hit_rate, 2),
+            "l2_hits": self.l2_hits,
+            "l2_misses": self.l2_misses,
+            "l2_hit_rate": round(self.l2_hit_rate, 2),
+            "prefixes": {
+                prefix: metrics.to_dict() for prefix, metrics in sorted(self.prefixes.items())
+            },
         }
 
 
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-entry TTL (the L1 tier of RedisCache).
+
+    Entries are partitioned by key prefix; each partition evicts its least
+    recently used entry once it exceeds its size limit. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        default_max_entries: int = L1_DEFAULT_MAX_ENTRIES,
+        max_entries_by_prefix: dict[str, int] | None = None,
+    ):
+        self._default_max_entries = default_max_entries
+        self._max_entries_by_prefix = (
+            L1_MAX_ENTRIES_BY_PREFIX if max_entries_by_prefix is None else max_entries_by_prefix
+        )
+        self._partitions: dict[str, OrderedDict[str, tuple[float, Any]]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _prefix(key: str) -> str:
+        return key.split(":", 1)[0]
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or the _MISSING sentinel if absent or expired."""
+        with self._lock:
+            partition = self._partitions.get(self._prefix(key))
+            if partition is None:
+                return _MISSING
+            entry = partition.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del partition[key]
+                return _MISSING
+            partition.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds, evicting the partition's LRU entries if full."""
+        prefix = self._prefix(key)
+        max_entries = self._max_entries_by_prefix.get(prefix, self._default_max_entries)
+        if max_entries <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            partition = self._partitions.setdefault(prefix, OrderedDict())
+            partition[key] = (time.monotonic() + ttl, value)
+            partition.move_to_end(key)
+            while len(partition) > max_entries:
+                partition.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            partition = self._partitions.get(self._prefix(key))
+            if partition is not None:
+                partition.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Remove keys matching a Redis-style glob pattern; returns the number removed."""
+        prefix = self._prefix(pattern)
+        with self._lock:
+            if any(char in prefix for char in "*?["):
+                partitions = list(self._partitions.values())
+            else:
+                # Literal prefix: only that partition can contain matches
+                partitions = [self._partitions.get(prefix, OrderedDict())]
+            removed = 0
+            for partition in partitions:
+                for key in [key for key in partition if fnmatchcase(key, pattern)]:
+                    del partition[key]
+                    removed += 1
+            return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._partitions.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(partition) for partition in self._partitions.values())
+
+
 class RedisCache:
     """
     Redis cache manager for SINAG application.
@@ -72,6 +337,14 @@ class RedisCache:
     Provides caching functionality with automatic serialization/deserialization,
     TTL management, error handling, and metrics tracking.
 
+    Two tiers:
+    - L1: bounded in-process LocalCache holding decoded values (at most L1_MAX_TTL)
+    - L2: Redis, shared by all API replicas and Celery workers
+
+    Writes and deletes are broadcast on CACHE_INVALIDATION_CHANNEL so every
+    replica evicts its L1 copy. Values returned from L1 are shared between
+    callers and must not be mutated.
+
     PERFORMANCE: Uses dedicated Redis instance (REDIS_CACHE_URL) separate from Celery.
     """
 
@@ -81,6 +354,11 @@ class RedisCache:
         self._is_available = False
         self._metrics = CacheMetrics()
         self._metrics_lock = Lock()  # Thread safety for metrics updates
+        self._l1: LocalCache | None = LocalCache() if settings.CACHE_L1_ENABLED else None
+        self._instance_id = uuid.uuid4().hex
+        self._subscriber: Any = None
+        self._subscriber_pid: int | None = None
+        self._subscriber_lock = Lock()
         self._initialize_connection()
 
     def _initialize_connection(self) -> None:
@@ -102,7 +380,8 @@ class RedisCache:
                     host=host,
                     port=port,
                     db=db,
-                    decode_responses=True,  # Auto-decode bytes to strings
+                    # Values are binary (see cache_codec); keys are decoded where needed
+                    decode_responses=False,
                     socket_connect_timeout=5,
                     socket_timeout=5,
                     retry_on_timeout=True,  # PERFORMANCE: Retry on timeout
@@ -129,6 +408,12 @@ class RedisCache:
         """Check if Redis is available."""
         return self._is_available and self._client is not None
 
+    @property
+    def _redis(self) -> redis.Redis:
+        """The Redis client; only use after checking is_available."""
+        assert self._client is not None
+        return self._client
+
     @property
     def metrics(self) -> CacheMetrics:
         """Get cache metrics for monitoring."""
@@ -161,6 +446,91 @@ class RedisCache:
         with self._metrics_lock:
             self._metrics.errors += 1
 
+    def _record_lookup(self, field: str) -> None:
+        """Increment a per-tier lookup counter (thread-safe)."""
+        with self._metrics_lock:
+            setattr(self._metrics, field, getattr(self._metrics, field) + 1)
+
+    def _record_prefix(self, key: str, field: str) -> None:
+        """Increment a per-prefix stampede protection counter (thread-safe)."""
+        prefix = key.split(":", 1)[0]
+        with self._metrics_lock:
+            metrics = self._metrics.prefixes.setdefault(prefix, PrefixCacheMetrics())
+            setattr(metrics, field, getattr(metrics, field) + 1)
+
+    def _record_encode(self, key: str, raw_bytes: int, stored_bytes: int) -> None:
+        """Record the JSON and stored size of a write for the key's prefix (thread-safe)."""
+        prefix = key.split(":", 1)[0]
+        with self._metrics_lock:
+            metrics = self._metrics.prefixes.setdefault(prefix, PrefixCacheMetrics())
+            metrics.writes += 1
+            metrics.total_raw_bytes += raw_bytes
+            metrics.total_stored_bytes += stored_bytes
+
+    def _record_decode(self, key: str, stored_bytes: int, elapsed_ms: float) -> None:
+        """Record the size and decode time of a Redis read for the key's prefix (thread-safe)."""
+        prefix = key.split(":", 1)[0]
+        with self._metrics_lock:
+            metrics = self._metrics.prefixes.setdefault(prefix, PrefixCacheMetrics())
+            metrics.decodes += 1
+            metrics.total_decoded_bytes += stored_bytes
+            metrics.total_decode_time_ms += elapsed_ms
+
+    # ==================== L1 INVALIDATION ====================
+
+    def _ensure_subscriber(self) -> None:
+        """
+        Subscribe this process to L1 invalidations before it first stores an L1 entry.
+
+        The subscription is re-created after a fork, since threads do not survive it.
+        """
+        if self._subscriber is not None and self._subscriber_pid == os.getpid():
+            return
+        with self._subscriber_lock:
+            if self._subscriber is not None and self._subscriber_pid == os.getpid():
+                return
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{CACHE_INVALIDATION_CHANNEL: self._handle_invalidation})
+            self._subscriber = pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=self._handle_subscriber_error,
+            )
+            self._subscriber_pid = os.getpid()
+
+    def _handle_invalidation(self, message: dict[str, Any]) -> None:
+        """Evict L1 entries named in an invalidation message from another process."""
+        try:
+            payload = json.loads(message["data"])
+        except (KeyError, TypeError, json.JSONDecodeError):
+            logger.warning(f"⚠️  Ignoring malformed cache invalidation message: {message!r}")
+            return
+        if payload.get("origin") == self._instance_id or self._l1 is None:
+            return
+        for key in payload.get("keys", []):
+            self._l1.delete(key)
+        for pattern in payload.get("patterns", []):
+            self._l1.delete_pattern(pattern)
+
+    def _handle_subscriber_error(self, error: BaseException, pubsub: Any, thread: Any) -> None:
+        """Drop all L1 entries when invalidations may have been missed, then keep listening."""
+        logger.warning(f"⚠️  Cache invalidation subscriber error, clearing L1: {error}")
+        if self._l1 is not None:
+            self._l1.clear()
+        time.sleep(1.0)
+
+    def _broadcast_invalidation(
+        self, keys: Iterable[str] = (), patterns: Iterable[str] = ()
+    ) -> None:
+        """Tell other processes to evict the given keys/patterns from their L1."""
+        if self._l1 is None:
+            return
+        payload = {"origin": self._instance_id, "keys": list(keys), "patterns": list(patterns)}
+        try:
+            self._redis.publish(CACHE_INVALIDATION_CHANNEL, json.dumps(payload))
+        except RedisError as e:
+            logger.warning(f"⚠️  Cache invalidation broadcast failed: {e}")
+
     def _generate_cache_key(self, prefix: str, **kwargs) -> str:
         """
         Generate a deterministic cache key from parameters.
@@ -193,29 +563,55 @@ class RedisCache:
         if not self.is_available:
             return None
 
+        if self._l1 is not None:
+            value = self._l1.get(key)
+            if value is not _MISSING:
+                self._record_lookup("l1_hits")
+                logger.debug(f"🎯 Cache L1 HIT: {key}")
+                return value
+            self._record_lookup("l1_misses")
+
         try:
-            cached_value = self._client.get(key)
+            if self._l1 is not None:
+                # Fetch the remaining TTL in the same round-trip so L1 never outlives L2
+                pipeline = self._redis.pipeline(transaction=False)
+                pipeline.get(key)
+                pipeline.pttl(key)
+                cached_value, remaining_ms = pipeline.execute()
+            else:
+                cached_value, remaining_ms = self._redis.get(key), None
             if cached_value:
                 logger.debug(f"🎯 Cache HIT: {key}")
-                return json.loads(cached_value)
+                self._record_lookup("l2_hits")
+                decode_start = time.perf_counter()
+                value = cache_codec.decode(cached_value)
+                self._record_decode(
+                    key, len(cached_value), (time.perf_counter() - decode_start) * 1000
+                )
+                if self._l1 is not None and remaining_ms and remaining_ms > 0:
+                    self._ensure_subscriber()
+                    self._l1.set(key, value, ttl=min(remaining_ms / 1000, L1_MAX_TTL))
+                return value
             else:
                 logger.debug(f"❌ Cache MISS: {key}")
+                self._record_lookup("l2_misses")
                 return None
         except RedisError as e:
             logger.warning(f"⚠️  Cache GET error for {key}: {e}")
             return None
-        except json.JSONDecodeError as e:
+        except cache_codec.CacheCodecError as e:
             logger.error(f"❌ Cache deserialization error for {key}: {e}")
             return None
 
-    def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
+    def set(self, key: str, value: Any, ttl: int = 3600, tags: Iterable[str] | None = None) -> bool:
         """
         Set value in cache with TTL.
 
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
+            value: Value to cache (JSON serializable; stored via cache_codec)
             ttl: Time to live in seconds
+            tags: Optional tags (see cache_tag) used to invalidate the key later
 
         Returns:
             True if successful, False otherwise
@@ -224,14 +620,121 @@ class RedisCache:
             return False
 
         try:
-            serialized_value = json.dumps(value)
-            self._client.setex(key, ttl, serialized_value)
+            raw_value = cache_codec.dumps(value)
+            serialized_value = cache_codec.pack(raw_value)
+            self._record_encode(key, len(raw_value), len(serialized_value))
+            # Drop the previous value's rendered response and register the key in
+            # each tag set in the same round-trip. A tag set lives at least as long
+            # as its longest-lived key.
+            pipeline = self._redis.pipeline(transaction=False)
+            pipeline.setex(key, ttl, serialized_value)
+            pipeline.delete(_rendered_key(key))
+            for tag in tags or ():
+                tag_key = f"{CACHE_TAG_KEY_PREFIX}{tag}"
+                pipeline.sadd(tag_key, key)
+                pipeline.expire(tag_key, ttl, nx=True)
+                pipeline.expire(tag_key, ttl, gt=True)
+            pipeline.execute()
             logger.debug(f"💾 Cache SET: {key} (TTL: {ttl}s)")
+            if self._l1 is not None:
+                self._broadcast_invalidation(keys=[key])
+                self._ensure_subscriber()
+                # Store the decoded form so L1 hits return exactly what an L2 hit would
+                self._l1.set(key, cache_codec.loads(raw_value), ttl=min(ttl, L1_MAX_TTL))
             return True
         except (RedisError, TypeError, ValueError) as e:
             logger.warning(f"⚠️  Cache SET error for {key}: {e}")
             return False
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Get several values in one round-trip (MGET).
+
+        L1 copies are used where present; L2 hits are not copied into L1, since
+        MGET does not return their remaining TTL.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of the keys that were found to their values
+        """
+        if not self.is_available:
+            return {}
+
+        found: dict[str, Any] = {}
+        remote_keys: list[str] = []
+        for key in dict.fromkeys(keys):
+            if self._l1 is not None:
+                value = self._l1.get(key)
+                if value is not _MISSING:
+                    self._record_lookup("l1_hits")
+                    found[key] = value
+                    continue
+                self._record_lookup("l1_misses")
+            remote_keys.append(key)
+
+        if not remote_keys:
+            return found
+
+        try:
+            cached_values = cast(list[Any], self._redis.mget(remote_keys))
+        except RedisError as e:
+            logger.warning(f"⚠️  Cache MGET error for {len(remote_keys)} keys: {e}")
+            return found
+
+        for key, cached_value in zip(remote_keys, cached_values, strict=True):
+            if not cached_value:
+                self._record_lookup("l2_misses")
+                continue
+            self._record_lookup("l2_hits")
+            try:
+                decode_start = time.perf_counter()
+                found[key] = cache_codec.decode(cached_value)
+                self._record_decode(
+                    key, len(cached_value), (time.perf_counter() - decode_start) * 1000
+                )
+            except cache_codec.CacheCodecError as e:
+                logger.error(f"❌ Cache deserialization error for {key}: {e}")
+        logger.debug(f"🎯 Cache MGET: {len(found)}/{len(remote_keys)} keys from Redis")
+        return found
+
+    def set_many(self, values: dict[str, Any], ttl: int = 3600) -> bool:
+        """
+        Set several values with the same TTL in one pipelined round-trip.
+
+        Args:
+            values: Cache keys to values (JSON serializable; stored via cache_codec)
+            ttl: Time to live in seconds
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.is_available or not values:
+            return False
+
+        try:
+            pipeline = self._redis.pipeline(transaction=False)
+            raw_values: dict[str, bytes] = {}
+            for key, value in values.items():
+                raw_value = cache_codec.dumps(value)
+                serialized_value = cache_codec.pack(raw_value)
+                self._record_encode(key, len(raw_value), len(serialized_value))
+                pipeline.setex(key, ttl, serialized_value)
+                pipeline.delete(_rendered_key(key))
+                raw_values[key] = raw_value
+            pipeline.execute()
+            logger.debug(f"💾 Cache SET: {len(values)} keys (TTL: {ttl}s)")
+            if self._l1 is not None:
+                self._broadcast_invalidation(keys=list(values))
+                self._ensure_subscriber()
+                for key, raw_value in raw_values.items():
+                    self._l1.set(key, cache_codec.loads(raw_value), ttl=min(ttl, L1_MAX_TTL))
+            return True
+        except (RedisError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️  Cache SET error for {len(values)} keys: {e}")
+            return False
+
     def delete(self, key: str) -> bool:
         """
         Delete key from cache.
@@ -245,8 +748,11 @@ class RedisCache:
         if not self.is_available:
             return False
 
+        if self._l1 is not None:
+            self._l1.delete(key)
         try:
-            self._client.delete(key)
+            self._redis.delete(key, _rendered_key(key))
+            self._broadcast_invalidation(keys=[key])
             logger.debug(f"🗑️  Cache DELETE: {key}")
             return True
         except RedisError as e:
@@ -268,16 +774,19 @@ class RedisCache:
         if not self.is_available:
             return 0
 
+        if self._l1 is not None:
+            self._l1.delete_pattern(pattern)
         try:
             deleted = 0
             cursor = 0
             # Use SCAN iterator instead of KEYS (KEYS is O(n) and blocks Redis)
             while True:
-                cursor, keys = self._client.scan(cursor, match=pattern, count=100)
+                cursor, keys = self._redis.scan(cursor, match=pattern, count=100)
                 if keys:
-                    deleted += self._client.delete(*keys)
+                    deleted += self._redis.delete(*keys)
                 if cursor == 0:
                     break
+            self._broadcast_invalidation(patterns=[pattern])
 
             if deleted > 0:
                 logger.info(f"[CACHE] Invalidated {deleted} keys matching '{pattern}'")
@@ -286,6 +795,290 @@ class RedisCache:
             logger.warning(f"[CACHE] Pattern DELETE error for {pattern}: {e}")
             return 0
 
+    # ==================== PRE-RENDERED RESPONSES ====================
+
+    def get_rendered(self, key: str) -> bytes | None:
+        """
+        Get the response body stored for key's current value by set_rendered.
+
+        Read from Redis only (no L1), so every replica sees the same body.
+
+        Returns:
+            The stored bytes, or None if absent
+        """
+        if not self.is_available:
+            return None
+        try:
+            return cast(bytes | None, self._redis.get(_rendered_key(key)))
+        except RedisError as e:
+            logger.warning(f"⚠️  Cache GET error for {_rendered_key(key)}: {e}")
+            return None
+
+    def rendered_source(self, key: str) -> str | None:
+        """
+        Identify the stored value of key that a rendered body is about to be built from.
+
+        Also evicts this process's L1 copy, so the next get() of key returns
+        exactly the value identified here (unless it changes in between, which
+        set_rendered detects).
+
+        Returns:
+            Digest of the value to pass to set_rendered, or None if there is no value
+        """
+        if not self.is_available:
+            return None
+        if self._l1 is not None:
+            self._l1.delete(key)
+        try:
+            digest = cast(bytes | str | None, self._redis.eval(_VALUE_DIGEST_SCRIPT, 1, key))
+        except RedisError as e:
+            logger.warning(f"⚠️  Cache GET error for {key}: {e}")
+            return None
+        return digest.decode() if isinstance(digest, bytes) else digest
+
+    def set_rendered(self, key: str, body: bytes, source: str) -> bool:
+        """
+        Store a rendered (e.g. compressed JSON) response body next to key's value.
+
+        The body is stored only if key still holds the value identified by source
+        (see rendered_source), so a body rendered from a value that was replaced
+        or invalidated meanwhile is never served. It expires with the value, or
+        when the value stops being fresh for prefixes with a stale_ttl policy, so
+        stale-while-revalidate still refreshes it. It is dropped whenever key is
+        set, deleted or invalidated by tag.
+
+        Args:
+            key: Cache key of the value the body was rendered from
+            body: Response body bytes
+            source: rendered_source(key), taken before the value was loaded
+
+        Returns:
+            True if stored, False if the value changed or is gone, or the cache is unavailable
+        """
+        if not self.is_available:
+            return False
+        try:
+            stored = self._redis.eval(
+                _SET_RENDERED_SCRIPT,
+                2,
+                key,
+                _rendered_key(key),
+                source,
+                body,
+                get_cache_policy(key).stale_ttl * 1000,
+            )
+            return bool(stored)
+        except RedisError as e:
+            logger.warning(f"⚠️  Cache SET error for {_rendered_key(key)}: {e}")
+            return False
+
+    # ==================== STAMPEDE PROTECTION ====================
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        tags: Iterable[str] | None = None,
+        policy: CachePolicy | None = None,
+        skip_none: bool = True,
+    ) -> Any:
+        """
+        Return the cached value for key, computing and storing it when needed.
+
+        Applies the key prefix's CachePolicy (see CACHE_POLICIES):
+        - fresh value: returned (unless chosen for probabilistic early refresh)
+        - early refresh or expired-but-stale value: the worker that takes the
+          lock recomputes; everyone else keeps getting the cached value
+        - miss with single_flight: one worker computes, the rest wait for it
+
+        Args:
+            key: Cache key
+            compute: Zero-argument function producing the value
+            ttl: Seconds the value is fresh
+            tags: Optional tags (see cache_tag)
+            policy: Overrides the prefix policy
+            skip_none: If True, don't cache None results
+
+        Returns:
+            Cached or freshly computed value
+        """
+        if not self.is_available:
+            return compute()
+
+        policy = policy or get_cache_policy(key)
+        start_time = time.time()
+        entry = self._get_entry(key)
+
+        if entry is not None:
+            now = time.time()
+            expires_early = self._expires_early(entry, policy, now)
+            if now < entry["fresh_until"] and not expires_early:
+                self.record_hit((time.time() - start_time) * 1000)
+                return entry["value"]
+
+            lock_token = self._acquire_lock(key, policy)
+            if lock_token is None:
+                # Another worker is refreshing; keep serving the cached value
+                if now >= entry["fresh_until"]:
+                    self._record_prefix(key, "stale_hits")
+                self.record_hit((time.time() - start_time) * 1000)
+                return entry["value"]
+            if now < entry["fresh_until"]:
+                self._record_prefix(key, "early_refreshes")
+            return self._compute_and_store(
+                key, compute, ttl, tags, policy, skip_none, lock_token, start_time
+            )
+
+        lock_token = ""
+        if policy.single_flight:
+            lock_token = self._acquire_lock(key, policy)
+            if lock_token is None:
+                entry = self._wait_for_entry(key, policy)
+                if entry is not None:
+                    self._record_prefix(key, "lock_waits")
+                    self.record_hit((time.time() - start_time) * 1000)
+                    return entry["value"]
+                self._record_prefix(key, "lock_timeouts")
+                lock_token = ""
+        return self._compute_and_store(
+            key, compute, ttl, tags, policy, skip_none, lock_token, start_time
+        )
+
+    def _get_entry(self, key: str) -> dict[str, Any] | None:
+        """Read a value stored by get_or_compute (plain values count as a miss)."""
+        entry = self.get(key)
+        if isinstance(entry, dict) and entry.get(_ENTRY_MARKER):
+            return entry
+        return None
+
+    @staticmethod
+    def _expires_early(entry: dict[str, Any], policy: CachePolicy, now: float) -> bool:
+        """XFetch: expire early with a probability growing as expiry approaches."""
+        if policy.early_expiration_beta <= 0:
+            return False
+        # 1 - random() is in (0, 1], so the log is finite and <= 0
+        jitter = entry["delta"] * policy.early_expiration_beta * -math.log(1 - random.random())
+        return now + jitter >= entry["fresh_until"]
+
+    def _acquire_lock(self, key: str, policy: CachePolicy) -> str | None:
+        """Try to take the recomputation lock; returns its token, or None if held elsewhere."""
+        token = uuid.uuid4().hex
+        try:
+            if self._redis.set(f"lock:{key}", token, nx=True, ex=policy.lock_ttl):
+                return token
+            return None
+        except RedisError as e:
+            # Without a working lock every worker computes, as without the policy
+            logger.warning(f"⚠️  Cache lock error for {key}: {e}")
+            return ""
+
+    def _release_lock(self, key: str, token: str) -> None:
+        if not token:
+            return
+        try:
+            self._redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+        except RedisError as e:
+            logger.warning(f"⚠️  Cache lock release error for {key}: {e}")
+
+    def _wait_for_entry(self, key: str, policy: CachePolicy) -> dict[str, Any] | None:
+        """Poll for the value another worker is computing, up to policy.lock_wait seconds."""
+        deadline = time.monotonic() + policy.lock_wait
+        delay = 0.05
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            entry = self._get_entry(key)
+            if entry is not None:
+                return entry
+            delay = min(delay * 2, 0.5)
+        return None
+
+    def _compute_and_store(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        tags: Iterable[str] | None,
+        policy: CachePolicy,
+        skip_none: bool,
+        lock_token: str,
+        start_time: float,
+    ) -> Any:
+        try:
+            compute_start = time.time()
+            value = compute()
+            now = time.time()
+            self.record_miss((now - start_time) * 1000)
+            self._record_prefix(key, "recomputations")
+            if value is not None or not skip_none:
+                entry = {
+                    _ENTRY_MARKER: 1,
+                    "value": value,
+                    "fresh_until": now + ttl,
+                    "delta": now - compute_start,
+                }
+                # Keep the value past its fresh TTL so it can be served stale
+                self.set(key, entry, ttl=ttl + policy.stale_ttl, tags=tags)
+            return value
+        finally:
+            self._release_lock(key, lock_token)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every key stored with any of the given tags.
+
+        Reads and drops the tag sets atomically, then deletes exactly the
+        tagged keys: O(affected keys) instead of scanning the keyspace.
+
+        Args:
+            *tags: Tags passed to set() (see cache_tag)
+
+        Returns:
+            Number of keys deleted
+        """
+        if not self.is_available or not tags:
+            return 0
+
+        tag_keys = [f"{CACHE_TAG_KEY_PREFIX}{tag}" for tag in tags]
+        try:
+            pipeline = self._redis.pipeline(transaction=True)
+            for tag_key in tag_keys:
+                pipeline.smembers(tag_key)
+            pipeline.delete(*tag_keys)
+            *members, _ = pipeline.execute()
+            keys = sorted(
+                {key.decode() if isinstance(key, bytes) else key for key in set().union(*members)}
+            )
+
+            deleted = 0
+            for i in range(0, len(keys), CACHE_TAG_DELETE_BATCH_SIZE):
+                batch = keys[i : i + CACHE_TAG_DELETE_BATCH_SIZE]
+                deleted += cast(int, self._redis.delete(*batch))
+                self._redis.unlink(*[_rendered_key(key) for key in batch])
+            if keys and self._l1 is not None:
+                for key in keys:
+                    self._l1.delete(key)
+                self._broadcast_invalidation(keys=keys)
+
+            if deleted > 0:
+                logger.info(f"[CACHE] Invalidated {deleted} keys tagged {', '.join(tags)}")
+            return deleted
+        except RedisError as e:
+            logger.warning(f"[CACHE] Tag invalidation error for {', '.join(tags)}: {e}")
+            return 0
+
+    def invalidate_assessment_year(self, year: int | None) -> int:
+        """
+        Invalidate caches derived from an assessment year's data.
+
+        Also invalidates all-years entries, which include that year.
+
+        Returns:
+            Number of keys invalidated
+        """
+        tags = {assessment_year_tag(year), assessment_year_tag(None)}
+        return self.invalidate_tags(*sorted(tags))
+
     def invalidate_external_analytics(self) -> int:
         """
         Invalidate all external analytics caches.
@@ -311,11 +1104,27 @@ class RedisCache:
         return total_deleted
 
 
+def _rendered_key(key: str) -> str:
+    return f"{key}{RENDERED_KEY_SUFFIX}"
+
+
+def cache_tag(name: str, value: Any) -> str:
+    """Build a cache tag, e.g. cache_tag("barangay_id", 12) -> "barangay_id:12"."""
+    return f"{name}:{value}"
+
+
+def assessment_year_tag(year: int | None) -> str:
+    """Tag for entries computed from one assessment year (None: all years)."""
+    return cache_tag("assessment_year", "all" if year is None else year)
+
+
 def cached(
     prefix: str,
     ttl: int = CACHE_TTL_EXTERNAL_ANALYTICS,
     key_builder: Callable | None = None,
     skip_none: bool = True,
+    tags: Callable[..., Iterable[str]] | None = None,
+    policy: CachePolicy | None = None,
 ):
     """
     Decorator for caching function results with metrics tracking.
@@ -325,6 +1134,8 @@ def cached(
         ttl: Time to live in seconds
         key_builder: Optional custom key builder function
         skip_none: If True, don't cache None results (default True)
+        tags: Optional function of the call arguments returning tags for the entry
+        policy: Stampede protection (defaults to CACHE_POLICIES for the prefix)
 
     Example:
         @cached(prefix="external_analytics", ttl=3600)
@@ -334,8 +1145,14 @@ def cached(
         @cached(prefix="dashboard", ttl=CACHE_TTL_DASHBOARD)
         def get_dashboard_stats(db, user_id: int):
             return compute_stats(db, user_id)
+
+        @cached(prefix="bbi", tags=lambda db, year=None: [assessment_year_tag(year)])
+        def get_bbi_summary(db, year=None):
+            return compute_summary(db, year)
     """
 
+    resolved_policy = policy or get_cache_policy(prefix)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -352,6 +1169,16 @@ def cached(
                 # Default key builder: use function name and kwargs
                 cache_key = cache._generate_cache_key(prefix=f"{prefix}:{func.__name__}", **kwargs)
 
+            if resolved_policy.enabled:
+                return cache.get_or_compute(
+                    cache_key,
+                    lambda: func(*args, **kwargs),
+                    ttl=ttl,
+                    tags=tags(*args, **kwargs) if tags is not None else None,
+                    policy=resolved_policy,
+                    skip_none=skip_none,
+                )
+
             # Try to get from cache
             cached_result = cache.get(cache_key)
             if cached_result is not None:
@@ -369,20 +1196,29 @@ def cached(
 
             # Store in cache (skip None if configured)
             if result is not None or not skip_none:
-                cache.set(cache_key, result, ttl=ttl)
+                if tags is None:
+                    cache.set(cache_key, result, ttl=ttl)
+                else:
+                    cache.set(cache_key, result, ttl=ttl, tags=tags(*args, **kwargs))
 
             return result
 
         # Add metadata to wrapper for introspection
         wrapper._cache_prefix = prefix
         wrapper._cache_ttl = ttl
+        wrapper._cache_policy = resolved_policy  # type: ignore[attr-defined]
 
         return wrapper
 
     return decorator
 
 
-def cache_query_result(ttl: int = CACHE_TTL_DASHBOARD, key_prefix: str = "query"):
+def cache_query_result(
+    ttl: int = CACHE_TTL_DASHBOARD,
+    key_prefix: str = "query",
+    tags: Callable[..., Iterable[str]] | None = None,
+    policy: CachePolicy | None = None,
+):
     """
     Decorator for caching database query results.
 
@@ -392,6 +1228,8 @@ def cache_query_result(ttl: int = CACHE_TTL_DASHBOARD, key_prefix: str = "query"
     Args:
         ttl: Time to live in seconds (default: 30 minutes)
         key_prefix: Prefix for cache keys
+        tags: Optional function of the call arguments returning tags for the entry
+        policy: Stampede protection (defaults to CACHE_POLICIES for the prefix)
 
     Example:
         @cache_query_result(ttl=900, key_prefix="dashboard")
@@ -402,7 +1240,7 @@ def cache_query_result(ttl: int = CACHE_TTL_DASHBOARD, key_prefix: str = "query"
         def get_governance_areas(self, db):
             return db.query(GovernanceArea).all()
     """
-    return cached(prefix=key_prefix, ttl=ttl, skip_none=True)
+    return cached(prefix=key_prefix, ttl=ttl, skip_none=True, tags=tags, policy=policy)
 
 
 # Global cache instance
@@ -422,6 +1260,19 @@ def invalidate_cache_pattern(pattern: str) -> int:
     return cache.delete_pattern(pattern)
 
 
+def invalidate_cache_tags(*tags: str) -> int:
+    """
+    Invalidate all cache keys stored with any of the given tags.
+
+    Args:
+        *tags: Tags such as assessment_year_tag(2025) or cache_tag("barangay_id", 12)
+
+    Returns:
+        Number of keys invalidated
+    """
+    return cache.invalidate_tags(*tags)
+
+
 def get_cache_stats() -> dict[str, Any]:
     """
     Get cache statistics for monitoring endpoints.
@@ -5,6 +5,7 @@ from celery import Celery  # type: ignore
 from celery.schedules import crontab  # type: ignore
 
 from app.core.config import settings
+from app.core.metrics import instrument_celery
 
 # Create Celery app instance
 celery_app = Celery(
@@ -33,8 +34,13 @@ celery_app.conf.update(
     worker_max_tasks_per_child=1000,
 )
 
+# Task timings and worker metrics endpoint (see app.core.metrics)
+instrument_celery()
+
 # Configure task routing
 celery_app.conf.task_routes = {
+    # Bulk email batches get their own queue so they never delay in-app notification tasks
+    "notifications.send_notification_emails": {"queue": "email"},
     "notifications.*": {"queue": "notifications"},
     "classification.*": {"queue": "classification"},
     "intelligence.*": {"queue": "intelligence"},
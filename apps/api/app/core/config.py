@@ -132,6 +132,10 @@ class Settings(BaseSettings):
 
         return None
 
+    # Threads for blocking work in async endpoints (sync DB queries, file I/O).
+    # Keep below the sync engine's pool_size + max_overflow.
+    THREADPOOL_MAX_WORKERS: int = 40
+
     # Connection Requirements
     REQUIRE_ALL_CONNECTIONS: bool = (
         True  # If False, server can start with at least one working connection
@@ -158,6 +162,21 @@ class Settings(BaseSettings):
 
     # Application Cache (separate from Celery for performance isolation)
     REDIS_CACHE_URL: str = "redis://localhost:6380/0"
+    CACHE_L1_ENABLED: bool = True  # In-process cache tier in front of Redis
+
+    # Requests running more SQL statements than this are logged as possible N+1 (0 disables)
+    SQL_QUERY_COUNT_WARNING_THRESHOLD: int = 50
+    # Port Celery workers serve Prometheus metrics on (unset: not served)
+    CELERY_METRICS_PORT: int | None = None
+
+    # Share rate limit counters across workers through Redis (CELERY_BROKER_URL)
+    RATE_LIMIT_REDIS_ENABLED: bool = True
+
+    # Push notification events and keep notification counts in Redis (CELERY_BROKER_URL)
+    NOTIFICATION_PUSH_ENABLED: bool = True
+
+    # Resolved bearer tokens cached per process by get_current_user (0 disables)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
 
     # Gemini AI Configuration
     GEMINI_API_KEY: str | None = None
@@ -0,0 +1,300 @@
+# 📈 Application Metrics
+# One Prometheus registry for HTTP, SQL, connection pool, cache and Celery metrics
+# PERFORMANCE: Hot paths only touch prometheus_client children (per-metric locks);
+# pool and cache statistics are read at scrape time by custom collectors
+
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Route label for requests that matched no route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "<unmatched>"
+
+# ========================================
+# HTTP
+# ========================================
+
+http_request_duration_seconds = Histogram(
+    "sinag_http_request_duration_seconds",
+    "HTTP request duration in seconds, including streamed bodies",
+    ["method", "route"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+)
+
+http_requests_total = Counter(
+    "sinag_http_requests_total",
+    "HTTP requests by response status",
+    ["method", "route", "status"],
+)
+
+# Names kept from the hand-rolled exporter this registry replaced, so dashboards still work
+http_requests_in_progress = Gauge(
+    "sinag_active_requests",
+    "HTTP requests currently being served",
+)
+
+_process_start_time = time.time()
+uptime_seconds = Gauge("sinag_uptime_seconds", "Time since application start")
+uptime_seconds.set_function(lambda: time.time() - _process_start_time)
+
+# ========================================
+# SQL
+# ========================================
+
+db_query_duration_seconds = Histogram(
+    "sinag_db_query_duration_seconds",
+    "SQL statement execution time in seconds",
+    ["operation"],
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5, 30],
+)
+
+db_queries_per_request = Histogram(
+    "sinag_db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    ["route"],
+    buckets=[0, 1, 2, 5, 10, 20, 50, 100, 200, 500],
+)
+
+db_query_seconds_per_request = Histogram(
+    "sinag_db_query_seconds_per_request",
+    "Total SQL execution time per HTTP request in seconds",
+    ["route"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10],
+)
+
+db_query_budget_exceeded_total = Counter(
+    "sinag_db_query_budget_exceeded_total",
+    "HTTP requests that ran more than SQL_QUERY_COUNT_WARNING_THRESHOLD statements",
+    ["method", "route"],
+)
+
+db_pool_wait_seconds = Histogram(
+    "sinag_db_pool_wait_seconds",
+    "Time spent waiting for a connection from the pool (including connecting)",
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30],
+)
+
+# ========================================
+# CELERY
+# ========================================
+
+celery_task_duration_seconds = Histogram(
+    "sinag_celery_task_duration_seconds",
+    "Celery task run time in seconds",
+    ["task", "state"],
+    buckets=[0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 1800],
+)
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """SQL statements executed while serving one request."""
+
+    count: int = 0
+    duration: float = 0.0
+
+
+# Set by MetricsMiddleware for the duration of a request; copied into threadpool workers
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def _statement_operation(statement: str) -> str:
+    """First keyword of a statement (SELECT, INSERT, ...), for a bounded label."""
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return operation if operation in {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"} else "OTHER"
+
+
+# The start time lives on the statement's execution context, so a statement that fails
+# (after_cursor_execute never fires) leaves nothing behind on the pooled connection
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context._query_start_time = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start_time = getattr(context, "_query_start_time", None)
+    if start_time is None:
+        return
+    elapsed = time.perf_counter() - start_time
+    db_query_duration_seconds.labels(_statement_operation(statement)).observe(elapsed)
+
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection."""
+
+    def connect(self):  # type: ignore[override]
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            db_pool_wait_seconds.observe(time.perf_counter() - start)
+
+
+def route_label(scope: dict[str, Any]) -> str:
+    """Route template of a served request (e.g. /api/v1/assessments/{assessment_id})."""
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def record_http_request(
+    method: str, route: str, status_code: int, duration: float, query_stats: QueryStats
+) -> None:
+    """Record a served request and flag it if it ran too many SQL statements."""
+    http_request_duration_seconds.labels(method, route).observe(duration)
+    http_requests_total.labels(method, route, str(status_code)).inc()
+    db_queries_per_request.labels(route).observe(query_stats.count)
+    db_query_seconds_per_request.labels(route).observe(query_stats.duration)
+
+    threshold = settings.SQL_QUERY_COUNT_WARNING_THRESHOLD
+    if threshold and query_stats.count > threshold:
+        db_query_budget_exceeded_total.labels(method, route).inc()
+        logger.warning(
+            f"⚠️  {method} {route} ran {query_stats.count} SQL statements "
+            f"({query_stats.duration * 1000:.1f} ms, threshold {threshold}); possible N+1 query"
+        )
+
+
+# ========================================
+# SCRAPE-TIME COLLECTORS
+# ========================================
+# describe() returns nothing so registering a collector does not call collect(): this
+# module is imported by app.db.base, which collect() itself imports
+
+
+class DatabasePoolCollector(Collector):
+    """Connection pool occupancy from get_db_pool_stats."""
+
+    def describe(self) -> list[GaugeMetricFamily]:
+        return []
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        from app.db.base import get_db_pool_stats
+
+        stats = get_db_pool_stats()
+        if not stats.get("available"):
+            return
+        gauge = GaugeMetricFamily(
+            "sinag_db_pool_connections", "Database pool connections by state", labels=["state"]
+        )
+        for state in ("checked_in", "checked_out", "overflow"):
+            gauge.add_metric([state], stats[state])
+        yield gauge
+        yield GaugeMetricFamily(
+            "sinag_db_pool_size", "Configured database pool size", value=stats["pool_size"]
+        )
+
+
+class CacheCollector(Collector):
+    """Application cache hit/miss counters from RedisCache.metrics."""
+
+    def describe(self) -> list[CounterMetricFamily]:
+        return []
+
+    def collect(self) -> Iterator[CounterMetricFamily]:
+        from app.core.cache import cache
+
+        metrics = cache.get_metrics()
+        lookups = CounterMetricFamily(
+            "sinag_cache_lookups", "Cache lookups by result", labels=["result"]
+        )
+        for result in ("hits", "misses", "errors"):
+            lookups.add_metric([result], metrics[result])
+        yield lookups
+
+        tiers = CounterMetricFamily(
+            "sinag_cache_tier_lookups", "Cache lookups per tier", labels=["tier", "result"]
+        )
+        for tier in ("l1", "l2"):
+            tiers.add_metric([tier, "hit"], metrics[f"{tier}_hits"])
+            tiers.add_metric([tier, "miss"], metrics[f"{tier}_misses"])
+        yield tiers
+
+        events = CounterMetricFamily(
+            "sinag_cache_prefix_events",
+            "Stampede protection events per key prefix",
+            labels=["prefix", "event"],
+        )
+        for prefix, prefix_metrics in metrics["prefixes"].items():
+            for name in ("recomputations", "early_refreshes", "stale_hits", "lock_waits"):
+                events.add_metric([prefix, name], prefix_metrics[name])
+        yield events
+
+
+REGISTRY.register(DatabasePoolCollector())
+REGISTRY.register(CacheCollector())
+
+
+def generate_metrics() -> bytes:
+    """Render every registered metric in the Prometheus text format."""
+    return generate_latest(REGISTRY)
+
+
+# ========================================
+# CELERY INSTRUMENTATION
+# ========================================
+
+
+def instrument_celery() -> None:
+    """
+    Time every Celery task and serve metrics from workers.
+
+    Workers expose the registry on CELERY_METRICS_PORT when it is set. With the
+    prefork pool, set PROMETHEUS_MULTIPROC_DIR so child processes are aggregated.
+    """
+    from celery import signals  # type: ignore
+
+    task_start_times: dict[str, float] = {}
+
+    @signals.task_prerun.connect(weak=False)
+    def _task_prerun(task_id: str, **kwargs: Any) -> None:
+        task_start_times[task_id] = time.perf_counter()
+
+    @signals.task_postrun.connect(weak=False)
+    def _task_postrun(task_id: str, task: Any, state: str | None = None, **kwargs: Any) -> None:
+        start = task_start_times.pop(task_id, None)
+        if start is not None:
+            celery_task_duration_seconds.labels(task.name, state or "UNKNOWN").observe(
+                time.perf_counter() - start
+            )
+
+    @signals.worker_ready.connect(weak=False)
+    def _start_metrics_server(**kwargs: Any) -> None:
+        if not settings.CELERY_METRICS_PORT:
+            return
+        registry: CollectorRegistry = REGISTRY
+        if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        start_http_server(settings.CELERY_METRICS_PORT, registry=registry)
+        logger.info(f"Celery metrics served on port {settings.CELERY_METRICS_PORT}")
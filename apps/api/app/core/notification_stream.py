@@ -0,0 +1,281 @@
+# 📣 Notification Push Stream
+# Per-user notification events over Redis pub/sub, plus Redis-held notification counts
+# PERFORMANCE: Open dashboards wait on a Server-Sent Events stream instead of polling
+# /notifications/count, and the badge counts are read from Redis, so an idle
+# dashboard puts no load on Postgres
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import redis
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Pub/sub channel per recipient; events are JSON objects with a "type" field
+NOTIFICATION_CHANNEL_PREFIX = "sinag:notifications:user:"
+
+# Hash per recipient with "unread" and "total" fields
+NOTIFICATION_COUNTS_KEY_PREFIX = "notification_counts:"
+
+# Counts are reseeded from Postgres at least this often, bounding any drift
+# (e.g. a notification committed while its recipient's counts were being seeded)
+NOTIFICATION_COUNTS_TTL = 600
+
+# Idle streams send an SSE comment this often so proxies keep the connection open
+STREAM_KEEPALIVE_SECONDS = 15.0
+
+# How long to skip Redis after an error before trying it again
+REDIS_RETRY_SECONDS = 30.0
+
+# Counts only change while the hash exists; a missing hash is seeded from Postgres
+# on the next read, so increments never create partial counts
+_ADJUST_COUNTS_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return nil
+end
+local unread = redis.call("hincrby", KEYS[1], "unread", ARGV[1])
+if unread < 0 then
+    unread = 0
+    redis.call("hset", KEYS[1], "unread", 0)
+end
+local total = redis.call("hincrby", KEYS[1], "total", ARGV[2])
+return {unread, total}
+"""
+
+_CLEAR_UNREAD_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return nil
+end
+redis.call("hset", KEYS[1], "unread", 0)
+return {0, redis.call("hget", KEYS[1], "total")}
+"""
+
+_SEED_COUNTS_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 1 then
+    return 0
+end
+redis.call("hset", KEYS[1], "unread", ARGV[1], "total", ARGV[2])
+redis.call("expire", KEYS[1], ARGV[3])
+return 1
+"""
+
+
+def notification_channel(user_id: int) -> str:
+    """Pub/sub channel for a user's notification events."""
+    return f"{NOTIFICATION_CHANNEL_PREFIX}{user_id}"
+
+
+def notification_counts_key(user_id: int) -> str:
+    """Redis hash holding a user's unread and total notification counts."""
+    return f"{NOTIFICATION_COUNTS_KEY_PREFIX}{user_id}"
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    """Render one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+class NotificationStream:
+    """
+    Publishes notification events and keeps per-user notification counts in Redis.
+
+    The synchronous side (publish_*) runs wherever notifications are written: request
+    threads and Celery workers. The asynchronous side (get_counts_async, seed_counts_async,
+    subscribe) serves the /notifications/count and /notifications/stream endpoints.
+    Redis is optional: after an error, calls become no-ops (and reads return None, so
+    callers use Postgres) for REDIS_RETRY_SECONDS.
+    """
+
+    def __init__(self, redis_url: str | None = None, enabled: bool | None = None):
+        self._redis_url = redis_url or settings.CELERY_BROKER_URL
+        self._enabled = settings.NOTIFICATION_PUSH_ENABLED if enabled is None else enabled
+        self._client: redis.Redis | None = None
+        self._adjust_counts: Any = None
+        self._clear_unread: Any = None
+        self._async_client: aioredis.Redis | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+        self._retry_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether Redis should be used right now (configured and not backing off)."""
+        return self._enabled and bool(self._redis_url) and time.monotonic() >= self._retry_at
+
+    def _get_client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.from_url(
+                self._redis_url,
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+            self._adjust_counts = self._client.register_script(_ADJUST_COUNTS_SCRIPT)
+            self._clear_unread = self._client.register_script(_CLEAR_UNREAD_SCRIPT)
+        return self._client
+
+    def _get_async_client(self) -> aioredis.Redis:
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            # redis.asyncio connections belong to the loop that opened them
+            self._async_client = aioredis.from_url(
+                self._redis_url,
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _backoff(self, error: Exception) -> None:
+        logger.warning(f"⚠️  Notification push Redis unavailable: {error}")
+        self._retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+    # ==================== PUBLISHING ====================
+
+    def publish_created(self, notification_ids_by_user: dict[int, list[int]]) -> None:
+        """
+        Count and announce committed notifications, one pipeline for all recipients.
+
+        Args:
+            notification_ids_by_user: New notification IDs keyed by recipient user ID
+        """
+        if not notification_ids_by_user or not self.enabled:
+            return
+        try:
+            client = self._get_client()
+            pipe = client.pipeline(transaction=False)
+            for user_id, notification_ids in notification_ids_by_user.items():
+                count = len(notification_ids)
+                self._adjust_counts(
+                    keys=[notification_counts_key(user_id)], args=[count, count], client=pipe
+                )
+            counts = pipe.execute()
+
+            pipe = client.pipeline(transaction=False)
+            for (user_id, notification_ids), user_counts in zip(
+                notification_ids_by_user.items(), counts
+            ):
+                pipe.publish(
+                    notification_channel(user_id),
+                    json.dumps(
+                        {
+                            "type": "created",
+                            "notification_ids": notification_ids,
+                            **self._counts_payload(user_counts),
+                        }
+                    ),
+                )
+            pipe.execute()
+        except (RedisError, OSError) as e:
+            self._backoff(e)
+
+    def publish_read(self, user_id: int, marked_count: int, all_read: bool = False) -> None:
+        """
+        Count and announce notifications marked as read.
+
+        Args:
+            user_id: Recipient whose notifications were marked
+            marked_count: Number of notifications that changed to read
+            all_read: True when every notification of the user is now read
+        """
+        if (not marked_count and not all_read) or not self.enabled:
+            return
+        try:
+            client = self._get_client()
+            key = notification_counts_key(user_id)
+            if all_read:
+                # Exact regardless of drift: nothing is unread any more
+                counts = self._clear_unread(keys=[key])
+            else:
+                counts = self._adjust_counts(keys=[key], args=[-marked_count, 0])
+            client.publish(
+                notification_channel(user_id),
+                json.dumps({"type": "read", **self._counts_payload(counts)}),
+            )
+        except (RedisError, OSError) as e:
+            self._backoff(e)
+
+    @staticmethod
+    def _counts_payload(counts: Any) -> dict[str, int]:
+        """Counts for an event, omitted when Redis does not hold them."""
+        if not counts or counts[0] is None:
+            return {}
+        return {"unread_count": int(counts[0]), "total": int(counts[1])}
+
+    # ==================== READING ====================
+
+    async def get_counts_async(self, user_id: int) -> tuple[int, int] | None:
+        """
+        Get (unread count, total count) from Redis.
+
+        Returns:
+            The counts, or None when they are not in Redis (seed them from Postgres)
+        """
+        if not self.enabled:
+            return None
+        try:
+            unread, total = await self._get_async_client().hmget(
+                notification_counts_key(user_id), "unread", "total"
+            )
+        except (RedisError, OSError) as e:
+            self._backoff(e)
+            return None
+        if unread is None or total is None:
+            return None
+        return int(unread), int(total)
+
+    async def seed_counts_async(self, user_id: int, unread: int, total: int) -> None:
+        """Store counts read from Postgres, unless another request already did."""
+        if not self.enabled:
+            return
+        try:
+            client = self._get_async_client()
+            await client.eval(
+                _SEED_COUNTS_SCRIPT,
+                1,
+                notification_counts_key(user_id),
+                unread,
+                total,
+                NOTIFICATION_COUNTS_TTL,
+            )
+        except (RedisError, OSError) as e:
+            self._backoff(e)
+
+    async def subscribe(self, user_id: int) -> AsyncIterator[dict[str, Any] | None]:
+        """
+        Yield a user's notification events as they are published.
+
+        Yields None every STREAM_KEEPALIVE_SECONDS without an event, so the caller
+        can send a keepalive and notice disconnected clients. Ends if Redis fails.
+        """
+        if not self.enabled:
+            return
+        pubsub = self._get_async_client().pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(notification_channel(user_id))
+            while True:
+                message = await pubsub.get_message(timeout=STREAM_KEEPALIVE_SECONDS)
+                if message is None:
+                    yield None
+                    continue
+                try:
+                    yield json.loads(message["data"])
+                except (TypeError, ValueError):
+                    logger.warning(f"Ignoring malformed notification event: {message!r}")
+        except (RedisError, OSError) as e:
+            self._backoff(e)
+        finally:
+            try:
+                await pubsub.aclose()
+            except (RedisError, OSError):
+                pass
+
+
+notification_stream = NotificationStream()
@@ -0,0 +1,265 @@
+# 🪪 Authenticated Principal Cache
+# Short-lived in-process cache of resolved bearer tokens for get_current_user
+# PERFORMANCE: A hit skips the Redis blacklist check, the JWT decode and the user query
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.db.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on cached tokens per process (least recently used are evicted first)
+PRINCIPAL_CACHE_MAX_ENTRIES = 10_000
+
+# Pub/sub channel used to evict principals on every API replica
+PRINCIPAL_INVALIDATION_CHANNEL = "sinag:auth:invalidate"
+
+
+def hash_token(token: str) -> str:
+    """Hash a bearer token (same digest as the Redis token blacklist)."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    A resolved bearer token.
+
+    Attributes:
+        user_id: ID of the authenticated user (None for revoked tokens)
+        claims: Decoded JWT claims
+        user_state: Column values of the user when the token was resolved
+        revoked: True if the token is blacklisted
+    """
+
+    user_id: int | None
+    claims: dict[str, Any] = field(default_factory=dict)
+    user_state: dict[str, Any] = field(default_factory=dict)
+    revoked: bool = False
+
+    @classmethod
+    def for_user(cls, user: User, claims: dict[str, Any]) -> "Principal":
+        """Snapshot a freshly loaded user."""
+        state = {attr.key: getattr(user, attr.key) for attr in sa_inspect(User).column_attrs}
+        return cls(user_id=user.id, claims=claims, user_state=state)
+
+    def build_user(self) -> User:
+        """
+        Rebuild the user as a detached instance.
+
+        Attach it with session.merge(user, load=False): no query is issued and
+        relationships (barangay, assessor_area, ...) lazy-load as usual.
+        """
+        user = User(
+            **{
+                key: copy.deepcopy(value) if isinstance(value, dict | list) else value
+                for key, value in self.user_state.items()
+            }
+        )
+        make_transient_to_detached(user)
+        return user
+
+
+REVOKED_PRINCIPAL = Principal(user_id=None, revoked=True)
+
+
+class PrincipalCache:
+    """
+    Bounded in-process LRU cache of Principals keyed by token hash.
+
+    Entries live for PRINCIPAL_CACHE_TTL_SECONDS at most (never past the token's
+    expiry). Logout, role changes and deactivation evict them immediately on every
+    replica through PRINCIPAL_INVALIDATION_CHANNEL. Nothing is cached while that
+    channel cannot be subscribed to, so a replica never serves a principal whose
+    invalidation it could have missed. Thread-safe.
+    """
+
+    def __init__(self, ttl: float | None = None, max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES):
+        self._ttl = settings.PRINCIPAL_CACHE_TTL_SECONDS if ttl is None else ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self._tokens_by_user: dict[int, set[str]] = {}
+        # Bumped by every invalidation; see set()
+        self._version = 0
+        self._lock = Lock()
+        self._instance_id = uuid.uuid4().hex
+        self._subscriber: Any = None
+        self._subscriber_pid: int | None = None
+        self._subscriber_lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._max_entries > 0
+
+    @property
+    def version(self) -> int:
+        """Invalidation counter; read it before resolving a token and pass it to set()."""
+        return self._version
+
+    def get(self, token: str) -> Principal | None:
+        """Return the cached principal for a token, or None if absent or expired."""
+        if not self.enabled:
+            return None
+        key = hash_token(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def set(self, token: str, principal: Principal, version: int) -> None:
+        """
+        Cache a resolved token.
+
+        Dropped if any invalidation happened since `version` was read, since the
+        principal may have been resolved from data that is now stale.
+        """
+        if not self.enabled or not self._ensure_subscriber():
+            return
+        ttl = self._ttl
+        expires = principal.claims.get("exp")
+        if isinstance(expires, int | float):
+            ttl = min(ttl, expires - time.time())
+        if ttl <= 0:
+            return
+
+        key = hash_token(token)
+        with self._lock:
+            if version != self._version:
+                return
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, principal)
+            if principal.user_id is not None:
+                self._tokens_by_user.setdefault(principal.user_id, set()).add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_token(self, token: str) -> None:
+        """Evict a token on every replica (e.g. after logout)."""
+        key = hash_token(token)
+        self._evict(token_hashes=[key])
+        self._broadcast_invalidation(token_hashes=[key])
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Evict all tokens of a user on every replica (role change, deactivation, ...)."""
+        self._evict(user_ids=[user_id])
+        self._broadcast_invalidation(user_ids=[user_id])
+
+    def clear(self) -> None:
+        """Remove all entries in this process."""
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+            self._version += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its user index (caller holds the lock)."""
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[1].user_id is None:
+            return
+        keys = self._tokens_by_user.get(entry[1].user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._tokens_by_user[entry[1].user_id]
+
+    def _evict(self, token_hashes: Iterable[str] = (), user_ids: Iterable[int] = ()) -> None:
+        with self._lock:
+            self._version += 1
+            for key in token_hashes:
+                self._remove(key)
+            for user_id in user_ids:
+                for key in list(self._tokens_by_user.get(user_id, ())):
+                    self._remove(key)
+
+    # ==================== CROSS-REPLICA INVALIDATION ====================
+
+    def _ensure_subscriber(self) -> bool:
+        """
+        Subscribe this process to invalidations; returns False if Redis is unavailable.
+
+        The subscription is re-created after a fork, since threads do not survive it.
+        """
+        if self._subscriber is not None and self._subscriber_pid == os.getpid():
+            return True
+        with self._subscriber_lock:
+            if self._subscriber is not None and self._subscriber_pid == os.getpid():
+                return True
+            from app.db.base import get_redis_client
+
+            try:
+                pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{PRINCIPAL_INVALIDATION_CHANNEL: self._handle_invalidation})
+                self._subscriber = pubsub.run_in_thread(
+                    sleep_time=1.0,
+                    daemon=True,
+                    exception_handler=self._handle_subscriber_error,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️  Principal cache disabled, cannot subscribe: {e}")
+                return False
+            self._subscriber_pid = os.getpid()
+            return True
+
+    def _handle_invalidation(self, message: dict[str, Any]) -> None:
+        """Evict principals named in an invalidation message from another process."""
+        try:
+            payload = json.loads(message["data"])
+        except (KeyError, TypeError, json.JSONDecodeError):
+            logger.warning(f"⚠️  Ignoring malformed principal invalidation message: {message!r}")
+            return
+        if payload.get("origin") == self._instance_id:
+            return
+        self._evict(token_hashes=payload.get("tokens", []), user_ids=payload.get("users", []))
+
+    def _handle_subscriber_error(self, error: BaseException, pubsub: Any, thread: Any) -> None:
+        """Drop all principals when invalidations may have been missed, then keep listening."""
+        logger.warning(f"⚠️  Principal invalidation subscriber error, clearing cache: {error}")
+        self.clear()
+        time.sleep(1.0)
+
+    def _broadcast_invalidation(
+        self, token_hashes: Iterable[str] = (), user_ids: Iterable[int] = ()
+    ) -> None:
+        """Tell other processes to evict the given tokens/users."""
+        if not self.enabled:
+            return
+        from app.db.base import get_redis_client
+
+        payload = {
+            "origin": self._instance_id,
+            "tokens": list(token_hashes),
+            "users": list(user_ids),
+        }
+        try:
+            get_redis_client().publish(PRINCIPAL_INVALIDATION_CHANNEL, json.dumps(payload))
+        except Exception as e:
+            logger.warning(f"⚠️  Principal invalidation broadcast failed: {e}")
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache()
@@ -2,15 +2,22 @@
 # Supabase client, SQLAlchemy engine, session management, and base models
 
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 import redis
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from supabase import Client, create_client
 
 from app.core.config import settings
+from app.core.metrics import TimedQueuePool
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -60,6 +67,7 @@ if settings.DATABASE_URL:
     # PERFORMANCE: Tuned for high concurrency with connection reuse
     engine = create_engine(
         settings.DATABASE_URL,
+        poolclass=TimedQueuePool,  # Records pool wait time (app.core.metrics)
         pool_pre_ping=True,  # Validates connections before use (prevents stale connections)
         pool_recycle=300,  # Recycles connections every 5 min (prevents idle timeout issues)
         pool_size=30,  # INCREASED: Base number of connections to keep in pool
@@ -78,6 +86,48 @@ if settings.DATABASE_URL:
         expire_on_commit=False,  # PERFORMANCE: Don't expire objects after commit (reduces queries)
     )
 
+# Async engine (asyncpg) for endpoints migrated off the synchronous Session
+# PERFORMANCE: Queries are awaited, so a slow query no longer blocks the event loop
+async_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+if settings.DATABASE_URL and make_url(settings.DATABASE_URL).get_backend_name() == "postgresql":
+    try:
+        async_connect_args: dict[str, Any] = {
+            "server_settings": {
+                "timezone": "utc",
+                "statement_timeout": "120000",
+                "application_name": "sinag-api-async",
+            },
+            "timeout": 10,
+            # Supabase's pooler (PgBouncer, transaction mode) does not support
+            # asyncpg's prepared statement cache
+            "statement_cache_size": 0,
+        }
+        if not is_local_db:
+            async_connect_args["ssl"] = "require"
+
+        async_engine = create_async_engine(
+            make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg"),
+            pool_pre_ping=True,
+            pool_recycle=300,
+            pool_size=10,  # Async sessions multiplex many requests per connection
+            max_overflow=20,
+            pool_timeout=30,
+            pool_use_lifo=True,
+            echo_pool=settings.DEBUG,
+            connect_args=async_connect_args,
+        )
+        AsyncSessionLocal = async_sessionmaker(
+            bind=async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    except Exception as e:
+        logger.error(f"Failed to initialize async database engine: {str(e)}")
+        async_engine = None
+        AsyncSessionLocal = None
+
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
@@ -102,6 +152,23 @@ def get_db() -> Generator[Session]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession]:
+    """
+    Async database session generator for endpoints on the async database path.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    if not AsyncSessionLocal:
+        raise RuntimeError(
+            "Async database not configured. Please set a PostgreSQL DATABASE_URL "
+            "and install asyncpg."
+        )
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def get_supabase() -> Client:
     """
     Get Supabase client for real-time operations, auth, and storage.
@@ -391,6 +458,15 @@ def get_db_pool_stats() -> dict[str, Any]:
                 "max_overflow": getattr(pool, "_max_overflow", 70),
                 "timeout": getattr(pool, "_timeout", 30),
             },
+            "async_pool": (
+                {
+                    "checked_in": async_engine.pool.checkedin(),
+                    "checked_out": async_engine.pool.checkedout(),
+                    "overflow": async_engine.pool.overflow(),
+                }
+                if async_engine
+                else None
+            ),
         }
     except Exception as e:
         logger.error(f"Failed to get pool stats: {str(e)}")
@@ -4,6 +4,12 @@
 # Import Base for migrations and table creation
 from ..base import Base
 from .admin import AssessmentCycle, AuditLog, DeadlineOverride
+from .analytics_rollup import (
+    AnalyticsAreaRollup,
+    AnalyticsAssessmentContribution,
+    AnalyticsIndicatorRollup,
+    AnalyticsYearRollup,
+)
 from .assessment import MOV, Assessment, AssessmentResponse, FeedbackComment, MOVFile
 from .assessment_activity import AssessmentActivity
 from .barangay import Barangay
@@ -36,4 +42,8 @@ __all__ = [
     "AssessmentYear",
     "AssessmentYearConfig",
     "AssessmentIndicatorSnapshot",
+    "AnalyticsYearRollup",
+    "AnalyticsAreaRollup",
+    "AnalyticsIndicatorRollup",
+    "AnalyticsAssessmentContribution",
 ]
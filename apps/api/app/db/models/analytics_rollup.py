@@ -0,0 +1,124 @@
+# 📈 Analytics Rollup Database Models
+# Per-year pre-aggregated counts backing the analytics dashboards
+
+from datetime import UTC, datetime
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AnalyticsYearRollup(Base):
+    """
+    Assessment counts per assessment year and workflow status.
+
+    Backs overall compliance, completion status, status distribution and
+    rework/calibration statistics. Maintained incrementally by
+    analytics_rollup_service whenever an assessment changes.
+    """
+
+    __tablename__ = "analytics_year_rollups"
+
+    assessment_year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    assessment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # final_compliance_status breakdown
+    passed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    validated_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Assessments with rework_count > 0 / calibration_count > 0
+    rework_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    calibration_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+
+class AnalyticsAreaRollup(Base):
+    """
+    Barangay pass/fail counts per assessment year, status and governance area.
+
+    Only finalized assessments (COMPLETED, legacy VALIDATED) contribute.
+    Two outcomes are tracked per area:
+    - passed_count / failed_count: GAR rule, all validated indicators are Pass/Conditional
+    - result_passed_count / result_failed_count: stored SGLGB ``area_results`` classification
+    """
+
+    __tablename__ = "analytics_area_rollups"
+
+    assessment_year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[str] = mapped_column(String(50), primary_key=True)
+    governance_area_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("governance_areas.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    passed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    result_passed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    result_failed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+
+class AnalyticsIndicatorRollup(Base):
+    """
+    Response counts per assessment year, status and indicator.
+
+    Only finalized assessments (COMPLETED, legacy VALIDATED) contribute.
+    """
+
+    __tablename__ = "analytics_indicator_rollups"
+
+    assessment_year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[str] = mapped_column(String(50), primary_key=True)
+    indicator_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("indicators.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Responses recorded / Pass or Conditional / Fail
+    assessed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    met_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    fail_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+
+class AnalyticsAssessmentContribution(Base):
+    """
+    Ledger of what each assessment currently contributes to the rollups.
+
+    Refreshing an assessment subtracts the stored contribution and adds the
+    new one, so updates touch only that assessment's rollup rows.
+    assessment_id intentionally has no foreign key: the ledger row must
+    outlive a deleted assessment until its contribution is subtracted.
+    """
+
+    __tablename__ = "analytics_assessment_contributions"
+
+    assessment_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    assessment_year: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    contribution: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
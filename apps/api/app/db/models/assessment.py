@@ -15,10 +15,12 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
@@ -269,6 +271,22 @@ class Assessment(Base):
     __table_args__ = (
         # Each BLGU can only have one assessment per year
         UniqueConstraint("blgu_user_id", "assessment_year", name="uq_assessment_blgu_year"),
+        # PERFORMANCE: Partial indexes for the hourly lock sweep, which only looks at
+        # assessments that are still unlocked
+        Index(
+            "ix_assessments_unlocked_grace_period",
+            "grace_period_expires_at",
+            postgresql_where=text(
+                "is_locked_for_deadline = false AND grace_period_expires_at IS NOT NULL"
+            ),
+        ),
+        Index(
+            "ix_assessments_unlocked_without_grace_period",
+            "assessment_year",
+            postgresql_where=text(
+                "is_locked_for_deadline = false AND grace_period_expires_at IS NULL"
+            ),
+        ),
     )
 
     # Validation methods (Epic 5.0)
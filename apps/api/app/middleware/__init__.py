@@ -2,6 +2,7 @@
 # Security, caching, metrics, and request processing middleware
 
 from app.middleware.cache_headers import CacheHeadersMiddleware
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.metrics import (
     MetricsMiddleware,
     get_metrics_summary,
@@ -18,6 +19,7 @@ __all__ = [
     "RateLimitMiddleware",
     "RequestLoggingMiddleware",
     "CacheHeadersMiddleware",
+    "CompressionMiddleware",
     "MetricsMiddleware",
     "get_prometheus_metrics",
     "get_metrics_summary",
@@ -1,17 +1,18 @@
 # 🚀 Cache Headers Middleware
 # Adds appropriate HTTP cache headers to API responses for improved performance
+# PERFORMANCE: ETags + If-None-Match let unchanged polls return an empty 304
 
-import hashlib
 import logging
-from collections.abc import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.etag import body_etag, etag_matches
 
 logger = logging.getLogger(__name__)
 
 
-class CacheHeadersMiddleware(BaseHTTPMiddleware):
+class CacheHeadersMiddleware:
     """
     Middleware to add HTTP cache headers to API responses.
 
@@ -22,6 +23,11 @@ class CacheHeadersMiddleware(BaseHTTPMiddleware):
     - No cache: Auth endpoints, user-specific data, mutations
     - Short cache (5-15 min): Dashboards, frequently changing data
     - Long cache (1 hour): External analytics, lookup tables
+
+    Successful GET responses that may be stored get a strong ETag: the one the
+    endpoint set (see app.core.etag.conditional_get), or a hash of the body for
+    single-chunk responses. Streamed responses are passed through untagged.
+    A matching If-None-Match turns the response into a bodyless 304.
     """
 
     # Cache rules for different API paths
@@ -53,35 +59,124 @@ class CacheHeadersMiddleware(BaseHTTPMiddleware):
     # Methods that should never be cached
     NON_CACHEABLE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
+    # Representation headers dropped from 304 responses (RFC 9110 15.4.5)
+    NOT_MODIFIED_DROPPED_HEADERS = {
+        "content-length",
+        "content-type",
+        "content-encoding",
+        "transfer-encoding",
+    }
 
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        if_none_match = Headers(scope=scope).get("if-none-match") if method == "GET" else None
+
+        # Start message held back until the body shows whether it can be hashed
+        pending_start: Message | None = None
+        not_modified = False
+
+        async def send_with_cache_headers(message: Message) -> None:
+            nonlocal pending_start, not_modified
+
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                self._add_cache_headers(method, path, message["status"], headers)
+                if not self._is_taggable(method, message["status"], headers):
+                    await send(message)
+                elif "etag" in headers:
+                    not_modified = etag_matches(if_none_match, headers["etag"])
+                    await send(self._not_modified(message) if not_modified else message)
+                else:
+                    pending_start = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if not_modified:
+                # Swallow the body the endpoint rendered anyway
+                if not message.get("more_body", False):
+                    await send({"type": "http.response.body", "body": b""})
+                return
+
+            if pending_start is not None:
+                start, pending_start = pending_start, None
+                if message.get("more_body", False):
+                    # Streamed body: never buffer it just to compute an ETag
+                    await send(start)
+                    await send(message)
+                    return
+
+                etag = body_etag(message.get("body", b""))
+                MutableHeaders(scope=start)["ETag"] = etag
+                if etag_matches(if_none_match, etag):
+                    await send(self._not_modified(start))
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+                await send(start)
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_headers)
+
+    def _is_taggable(self, method: str, status_code: int, headers: MutableHeaders) -> bool:
+        """Whether a response should carry an ETag (a successful, storable GET)."""
+        return (
+            method == "GET"
+            and status_code == 200
+            and "no-store" not in headers.get("cache-control", "")
+        )
+
+    def _not_modified(self, start: Message) -> Message:
+        """Turn a response start message into a 304 with the same validators."""
+        return {
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [
+                (name, value)
+                for name, value in start["headers"]
+                if name.decode("latin-1").lower() not in self.NOT_MODIFIED_DROPPED_HEADERS
+            ],
+        }
+
+    def _add_cache_headers(
+        self, method: str, path: str, status_code: int, headers: MutableHeaders
+    ) -> None:
+        """Set Cache-Control (and Vary) on a response's headers."""
         # Only add cache headers to successful GET/HEAD requests
-        if request.method in self.NON_CACHEABLE_METHODS:
-            response.headers["Cache-Control"] = "no-store"
-            return response
+        if method in self.NON_CACHEABLE_METHODS:
+            headers["Cache-Control"] = "no-store"
+            return
 
-        if request.method not in {"GET", "HEAD"}:
-            return response
+        if method not in {"GET", "HEAD"}:
+            return
 
-        if response.status_code >= 400:
+        if status_code >= 400:
             # Don't cache error responses long
-            response.headers["Cache-Control"] = "no-cache, max-age=0"
-            return response
+            headers["Cache-Control"] = "no-cache, max-age=0"
+            return
 
         # Find matching cache rule
-        path = request.url.path
         cache_rule = self._get_cache_rule(path)
 
         if cache_rule is None:
             # Default: no cache for unspecified endpoints
-            response.headers["Cache-Control"] = "no-cache"
-            return response
+            headers["Cache-Control"] = "no-cache"
+            return
 
         if cache_rule.get("cache") is False:
             # Explicitly no-cache
-            response.headers["Cache-Control"] = "no-store, private"
-            return response
+            headers["Cache-Control"] = "no-store, private"
+            return
 
         # Build Cache-Control header
         max_age = cache_rule.get("max_age", 0)
@@ -94,26 +189,13 @@ class CacheHeadersMiddleware(BaseHTTPMiddleware):
         if swr > 0:
             cache_control_parts.append(f"stale-while-revalidate={swr}")
 
-        response.headers["Cache-Control"] = ", ".join(cache_control_parts)
-
-        # Add ETag for cache validation (based on response body hash)
-        # Note: This requires buffering the response body
-        if not response.headers.get("ETag") and hasattr(response, "body"):
-            try:
-                body = response.body
-                if body:
-                    etag = hashlib.md5(body).hexdigest()[:16]
-                    response.headers["ETag"] = f'W/"{etag}"'
-            except Exception:
-                pass  # Skip ETag if body not accessible
+        headers["Cache-Control"] = ", ".join(cache_control_parts)
 
         # Add Vary header to ensure proper cache key differentiation
         vary_headers = ["Accept", "Accept-Encoding"]
         if not public:
             vary_headers.append("Authorization")
-        response.headers["Vary"] = ", ".join(vary_headers)
-
-        return response
+        headers["Vary"] = ", ".join(vary_headers)
 
     def _get_cache_rule(self, path: str) -> dict | None:
         """Get cache rule for a given path."""
@@ -1,17 +1,24 @@
 # 📊 Prometheus Metrics Middleware
 # Collects request metrics for monitoring and observability
-# PERFORMANCE: Enables tracking of request latency, throughput, and errors
+# PERFORMANCE: Enables tracking of request latency, throughput, SQL statements and errors
 
 import logging
 import re
 import time
 from collections import defaultdict
-from collections.abc import Callable
 from dataclasses import dataclass, field
 from threading import Lock
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    QueryStats,
+    current_query_stats,
+    generate_metrics,
+    http_requests_in_progress,
+    record_http_request,
+    route_label,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +51,9 @@ class EndpointMetrics:
 
 class MetricsCollector:
     """
-    Collects and exposes Prometheus-compatible metrics.
+    Collects the per-endpoint request summary served by /api/v1/system/metrics.
+
+    Prometheus metrics live in the shared registry (app.core.metrics).
 
     Tracks:
     - Request count by endpoint and status
@@ -105,71 +114,6 @@ class MetricsCollector:
                 return f"le_{bucket}"
         return "le_inf"
 
-    def get_prometheus_metrics(self) -> str:
-        """Generate Prometheus-compatible metrics output."""
-        lines = []
-        uptime = time.time() - self._start_time
-
-        # Uptime gauge
-        lines.append("# HELP sinag_uptime_seconds Time since application start")
-        lines.append("# TYPE sinag_uptime_seconds gauge")
-        lines.append(f"sinag_uptime_seconds {uptime:.2f}")
-
-        # Active requests gauge
-        lines.append("")
-        lines.append("# HELP sinag_active_requests Current number of active requests")
-        lines.append("# TYPE sinag_active_requests gauge")
-        lines.append(f"sinag_active_requests {self._active_requests}")
-
-        # Request count counter
-        lines.append("")
-        lines.append("# HELP sinag_http_requests_total Total HTTP requests")
-        lines.append("# TYPE sinag_http_requests_total counter")
-
-        # Error count counter
-        lines.append("")
-        lines.append("# HELP sinag_http_errors_total Total HTTP errors (4xx, 5xx)")
-        lines.append("# TYPE sinag_http_errors_total counter")
-
-        # Latency histogram
-        lines.append("")
-        lines.append("# HELP sinag_http_request_duration_ms Request duration in milliseconds")
-        lines.append("# TYPE sinag_http_request_duration_ms histogram")
-
-        with self._lock:
-            for method, endpoints in self._metrics.items():
-                for endpoint, metrics in endpoints.items():
-                    labels = f'method="{method}",endpoint="{endpoint}"'
-
-                    # Request count
-                    lines.append(f"sinag_http_requests_total{{{labels}}} {metrics.request_count}")
-
-                    # Error count
-                    if metrics.error_count > 0:
-                        lines.append(f"sinag_http_errors_total{{{labels}}} {metrics.error_count}")
-
-                    # Latency histogram buckets
-                    cumulative = 0
-                    for bucket in self.LATENCY_BUCKETS:
-                        bucket_key = f"le_{bucket}"
-                        cumulative += metrics.latency_buckets.get(bucket_key, 0)
-                        lines.append(
-                            f'sinag_http_request_duration_ms_bucket{{{labels},le="{bucket}"}} {cumulative}'
-                        )
-                    # +Inf bucket
-                    cumulative += metrics.latency_buckets.get("le_inf", 0)
-                    lines.append(
-                        f'sinag_http_request_duration_ms_bucket{{{labels},le="+Inf"}} {cumulative}'
-                    )
-                    lines.append(
-                        f"sinag_http_request_duration_ms_sum{{{labels}}} {metrics.total_latency_ms:.2f}"
-                    )
-                    lines.append(
-                        f"sinag_http_request_duration_ms_count{{{labels}}} {metrics.request_count}"
-                    )
-
-        return "\n".join(lines)
-
     def get_summary(self) -> dict:
         """Get metrics summary as dictionary."""
         summary = {
@@ -215,50 +159,70 @@ class MetricsCollector:
 metrics_collector = MetricsCollector()
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+class MetricsMiddleware:
     """
     Middleware to collect request metrics for Prometheus.
 
-    Tracks request count, latency, and error rates per endpoint.
+    Tracks request count, latency, and error rates per endpoint, plus the SQL
+    statements each request runs (see app.core.metrics). Pure ASGI: latency
+    covers the whole response, including streamed bodies.
     """
 
     # Paths to skip (health checks, metrics endpoint itself)
     SKIP_PATHS = {"/health", "/metrics", "/api/v1/system/metrics"}
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        path = request.url.path
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Skip metrics collection for certain paths
-        if path in self.SKIP_PATHS:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip metrics collection for non-HTTP scopes and certain paths
+        if scope["type"] != "http" or scope["path"] in self.SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-        # Track active requests
+        status_code: int | None = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # Track active requests and the SQL statements run on behalf of this request
         metrics_collector.increment_active()
+        http_requests_in_progress.inc()
+        query_stats = QueryStats()
+        token = current_query_stats.set(query_stats)
         start_time = time.time()
 
         try:
-            response = await call_next(request)
-
-            # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Record metrics
-            metrics_collector.record_request(
-                method=request.method,
-                path=path,
-                status_code=response.status_code,
-                latency_ms=latency_ms,
-            )
-
-            return response
-
+            await self.app(scope, receive, send_with_status)
         finally:
+            current_query_stats.reset(token)
+            http_requests_in_progress.dec()
             metrics_collector.decrement_active()
 
+            # Record metrics (a request that failed before responding is not counted)
+            if status_code is not None:
+                elapsed = time.time() - start_time
+                metrics_collector.record_request(
+                    method=scope["method"],
+                    path=scope["path"],
+                    status_code=status_code,
+                    latency_ms=elapsed * 1000,
+                )
+                record_http_request(
+                    method=scope["method"],
+                    route=route_label(scope),
+                    status_code=status_code,
+                    duration=elapsed,
+                    query_stats=query_stats,
+                )
+
 
 def get_prometheus_metrics() -> str:
-    """Get Prometheus-formatted metrics."""
-    return metrics_collector.get_prometheus_metrics()
+    """Get Prometheus-formatted metrics from the shared registry."""
+    return generate_metrics().decode()
 
 
 def get_metrics_summary() -> dict:
@@ -0,0 +1,212 @@
+# 🚦 Rate Limit Stores
+# Sliding-window request counters shared by all API workers through Redis
+# PERFORMANCE: One atomic Lua call per request; bounded in-process fallback if Redis is down
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on (rule, client) counters kept in process when Redis is unavailable
+LOCAL_RATE_LIMIT_MAX_KEYS = 10_000
+
+# How long to stay on the in-process store after a Redis error before retrying Redis
+REDIS_RETRY_SECONDS = 30.0
+
+RATE_LIMIT_KEY_PREFIX = "ratelimit:"
+
+# Sliding-window counter: the previous window's count, weighted by how much of it still
+# overlaps the sliding window, plus the current window's count.
+# KEYS[1] = current window counter, KEYS[2] = previous window counter
+# ARGV[1] = limit, ARGV[2] = previous window weight, ARGV[3] = counter TTL (seconds)
+# Returns {allowed, current count, previous count}
+_SLIDING_WINDOW_SCRIPT = """
+local current = tonumber(redis.call("GET", KEYS[1]) or "0")
+local previous = tonumber(redis.call("GET", KEYS[2]) or "0")
+if previous * tonumber(ARGV[2]) + current + 1 > tonumber(ARGV[1]) then
+    return {0, current, previous}
+end
+current = redis.call("INCR", KEYS[1])
+if current == 1 then
+    redis.call("EXPIRE", KEYS[1], ARGV[3])
+end
+return {1, current, previous}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    """
+    Outcome of counting one request.
+
+    Attributes:
+        allowed: False if the request exceeds the limit
+        limit: Requests allowed per window
+        remaining: Requests left in the sliding window after this one
+        reset_after: Seconds until the current window ends
+        retry_after: Seconds until a request would be allowed again (0 if allowed)
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: int
+    retry_after: int
+
+
+def _window_position(now: float, window: int) -> tuple[int, float, float]:
+    """Return (window index, seconds into the window, weight of the previous window)."""
+    index = int(now // window)
+    elapsed = now - index * window
+    return index, elapsed, (window - elapsed) / window
+
+
+def _evaluate(
+    allowed: bool, limit: int, window: int, elapsed: float, current: int, previous: int
+) -> RateLimitResult:
+    """Build a RateLimitResult from window counts (current includes this request if allowed)."""
+    weight = (window - elapsed) / window
+    estimated = previous * weight + current
+    reset_after = max(1, math.ceil(window - elapsed))
+
+    if allowed:
+        return RateLimitResult(
+            allowed=True,
+            limit=limit,
+            remaining=max(0, math.floor(limit - estimated)),
+            reset_after=reset_after,
+            retry_after=0,
+        )
+
+    # Find when the weighted count drops to limit - 1 so one more request fits
+    if current + 1 > limit:
+        # Wait for the next window, then for this window's weight to decay enough
+        retry_after = (window - elapsed) + window * (1 - (limit - 1) / current)
+    else:
+        retry_after = window * (1 - (limit - 1 - current) / previous) - elapsed
+    return RateLimitResult(
+        allowed=False,
+        limit=limit,
+        remaining=0,
+        reset_after=reset_after,
+        retry_after=max(1, math.ceil(retry_after)),
+    )
+
+
+class LocalRateLimitStore:
+    """
+    Bounded in-process sliding-window counters (fallback when Redis is down).
+
+    Holds at most max_keys (rule, client) counters; the least recently used are
+    evicted first, so memory stays flat however many clients or paths are seen.
+    Limits are enforced per worker process. Thread-safe.
+    """
+
+    def __init__(self, max_keys: int = LOCAL_RATE_LIMIT_MAX_KEYS):
+        self._max_keys = max_keys
+        # key -> [window index, current count, previous count]
+        self._counters: OrderedDict[str, list[int]] = OrderedDict()
+        self._lock = Lock()
+
+    def hit(self, key: str, limit: int, window: int, now: float | None = None) -> RateLimitResult:
+        """Count a request against key, unless it exceeds the limit."""
+        index, elapsed, weight = _window_position(time.time() if now is None else now, window)
+
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = [index, 0, 0]
+                self._counters[key] = counter
+                while len(self._counters) > self._max_keys:
+                    self._counters.popitem(last=False)
+            else:
+                self._counters.move_to_end(key)
+                if counter[0] != index:
+                    # Roll over: the current window becomes the previous one if adjacent
+                    counter[2] = counter[1] if counter[0] == index - 1 else 0
+                    counter[1] = 0
+                    counter[0] = index
+
+            allowed = counter[2] * weight + counter[1] + 1 <= limit
+            if allowed:
+                counter[1] += 1
+            return _evaluate(allowed, limit, window, elapsed, counter[1], counter[2])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._counters)
+
+
+class RedisRateLimitStore:
+    """
+    Sliding-window counters in Redis, shared by every worker and replica.
+
+    Each request costs one atomic script call. After a Redis error, requests are
+    counted in the local fallback store for REDIS_RETRY_SECONDS before Redis is
+    tried again, so an outage never adds a connection timeout to every request.
+    """
+
+    def __init__(
+        self,
+        fallback: LocalRateLimitStore,
+        redis_url: str | None = None,
+        enabled: bool | None = None,
+    ):
+        self._fallback = fallback
+        self._redis_url = redis_url or settings.CELERY_BROKER_URL
+        self._enabled = settings.RATE_LIMIT_REDIS_ENABLED if enabled is None else enabled
+        self._client: aioredis.Redis | None = None
+        self._script = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._retry_at = 0.0
+
+    def _get_script(self):
+        """Return the registered script for the running event loop's client."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # redis.asyncio connections belong to the loop that opened them
+            self._client = aioredis.from_url(
+                self._redis_url,
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+            self._script = self._client.register_script(_SLIDING_WINDOW_SCRIPT)
+            self._client_loop = loop
+        return self._script
+
+    async def hit(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """Count a request against key in Redis (or the fallback store)."""
+        now = time.time()
+        if not self._enabled or time.monotonic() < self._retry_at:
+            return self._fallback.hit(key, limit, window, now)
+
+        index, elapsed, weight = _window_position(now, window)
+        try:
+            allowed, current, previous = await self._get_script()(
+                keys=[
+                    f"{RATE_LIMIT_KEY_PREFIX}{key}:{index}",
+                    f"{RATE_LIMIT_KEY_PREFIX}{key}:{index - 1}",
+                ],
+                args=[limit, repr(weight), window * 2],
+            )
+        except (RedisError, OSError) as e:
+            logger.warning(f"⚠️  Rate limit Redis unavailable, using in-process limits: {e}")
+            self._retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+            return self._fallback.hit(key, limit, window, now)
+
+        return _evaluate(bool(allowed), limit, window, elapsed, int(current), int(previous))
@@ -1,17 +1,48 @@
 # 🔒 Security Middleware
 # Security headers, rate limiting, and request tracking middleware
+# PERFORMANCE: Pure ASGI middleware (no BaseHTTPMiddleware task/stream wrapping), so
+# StreamingResponse bodies pass through chunk by chunk
 
+import logging
 import time
 import uuid
-from collections import defaultdict
-from collections.abc import Callable
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.rate_limit import LocalRateLimitStore, RedisRateLimitStore
+
+logger = logging.getLogger(__name__)
+
+# Content Security Policy
+# Note: Adjust based on your frontend needs
+CSP_DIRECTIVES = [
+    "default-src 'self'",
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval'",  # Adjust for production
+    "style-src 'self' 'unsafe-inline'",
+    "img-src 'self' data: https:",
+    "font-src 'self' data:",
+    "connect-src 'self'",
+    "frame-ancestors 'none'",
+]
+
+# Headers added to every response (built once, not per request)
+SECURITY_HEADERS: dict[str, str] = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    # HSTS for HTTPS (31536000 seconds = 1 year)
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "Content-Security-Policy": "; ".join(CSP_DIRECTIVES),
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    # Permissions Policy (formerly Feature-Policy)
+    "Permissions-Policy": "geolocation=(), microphone=(), camera=(), payment=()",
+}
+
+
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all responses.
 
@@ -24,67 +55,49 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - X-Request-ID: Unique request identifier for tracking
     """
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-
-        # Process the request
-        response = await call_next(request)
-
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["X-Request-ID"] = request_id
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Add HSTS header for HTTPS (31536000 seconds = 1 year)
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Content Security Policy
-        # Note: Adjust based on your frontend needs
-        csp_directives = [
-            "default-src 'self'",
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval'",  # Adjust for production
-            "style-src 'self' 'unsafe-inline'",
-            "img-src 'self' data: https:",
-            "font-src 'self' data:",
-            "connect-src 'self'",
-            "frame-ancestors 'none'",
-        ]
-        response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
-
-        # Referrer Policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        # Generate unique request ID
+        request_id = str(uuid.uuid4())
+        Request(scope).state.request_id = request_id
 
-        # Permissions Policy (formerly Feature-Policy)
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), microphone=(), camera=(), payment=()"
-        )
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in SECURITY_HEADERS.items():
+                    headers[name] = value
+                headers["X-Request-ID"] = request_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
-    Simple in-memory rate limiting middleware.
+    Distributed sliding-window rate limiting middleware.
 
     Rate limits:
     - 100 requests per minute per IP for general endpoints
     - 20 requests per minute per IP for auth endpoints
     - 1000 requests per minute per IP for health checks
 
-    Note: For production, consider using Redis-based rate limiting
-    for distributed systems.
+    Requests are counted per client IP and per configured path prefix (not per raw
+    path), in Redis so the limit holds across all uvicorn workers and replicas.
+    If Redis is down, a bounded in-process store enforces the limits per worker.
     """
 
-    # Class-level store to allow clearing in tests
-    _rate_limit_store: dict[str, dict[str, list]] = defaultdict(lambda: defaultdict(list))
+    # Class-level fallback store to allow clearing in tests
+    _rate_limit_store = LocalRateLimitStore()
 
-    def __init__(self, app):
-        super().__init__(app)
-        # Use class-level store for easier testing
-        self.rate_limit_store = RateLimitMiddleware._rate_limit_store
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.rate_limit_store = RedisRateLimitStore(fallback=RateLimitMiddleware._rate_limit_store)
 
         # Rate limit configurations
         # SECURITY: Stricter limits for auth endpoints to prevent brute-force
@@ -133,95 +146,84 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return "unknown"
 
-    def _get_rate_limit_config(self, path: str) -> dict[str, int]:
-        """Get rate limit configuration for a given path."""
-        # Check for exact matches first
+    def _get_rate_limit_rule(self, path: str) -> tuple[str, dict[str, int]]:
+        """Get the matching limit prefix ("default" if none) and its configuration."""
         for prefix, config in self.limits.items():
             if prefix != "default" and path.startswith(prefix):
-                return config
-
-        return self.limits["default"]
-
-    def _is_rate_limited(
-        self, client_ip: str, path: str, config: dict[str, int]
-    ) -> tuple[bool, int | None]:
-        """
-        Check if the request should be rate limited.
-
-        Returns:
-            tuple: (is_limited, retry_after_seconds)
-        """
-        now = time.time()
-        window = config["window"]
-        max_requests = config["requests"]
-
-        # Clean up old entries (outside the time window)
-        cutoff_time = now - window
-        if client_ip in self.rate_limit_store and path in self.rate_limit_store[client_ip]:
-            self.rate_limit_store[client_ip][path] = [
-                timestamp
-                for timestamp in self.rate_limit_store[client_ip][path]
-                if timestamp > cutoff_time
-            ]
-
-        # Count requests in the current window
-        request_count = len(self.rate_limit_store[client_ip][path])
-
-        if request_count >= max_requests:
-            # Calculate retry-after time
-            oldest_request = min(self.rate_limit_store[client_ip][path])
-            retry_after = int(window - (now - oldest_request)) + 1
-            return True, retry_after
-
-        # Add current request to store
-        self.rate_limit_store[client_ip][path].append(now)
-        return False, None
-
-    async def dispatch(self, request: Request, call_next: Callable):
-        client_ip = self._get_client_ip(request)
+                return prefix, config
+
+        return "default", self.limits["default"]
+
+    def _get_rate_limit_config(self, path: str) -> dict[str, int]:
+        """Get rate limit configuration for a given path."""
+        return self._get_rate_limit_rule(path)[1]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         path = request.url.path
-        config = self._get_rate_limit_config(path)
+        prefix, config = self._get_rate_limit_rule(path)
+        rate_limit_headers = {
+            "X-RateLimit-Limit": str(config["requests"]),
+            "X-RateLimit-Window": str(config["window"]),
+        }
 
         # Skip rate limit enforcement for health checks (but still add headers)
-        skip_enforcement = request.url.path == "/health"
-
-        # Check rate limit
-        is_limited = False
-        retry_after = None
-
-        if not skip_enforcement:
-            is_limited, retry_after = self._is_rate_limited(client_ip, path, config)
-
-        if is_limited:
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "detail": "Rate limit exceeded. Please try again later.",
-                    "retry_after": retry_after,
-                },
-                headers={"Retry-After": str(retry_after)},
+        if path != "/health":
+            client_ip = self._get_client_ip(request)
+            result = await self.rate_limit_store.hit(
+                f"{prefix}:{client_ip}", config["requests"], config["window"]
             )
+            rate_limit_headers["X-RateLimit-Remaining"] = str(result.remaining)
+            rate_limit_headers["X-RateLimit-Reset"] = str(result.reset_after)
+
+            if not result.allowed:
+                response = JSONResponse(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    content={
+                        "detail": "Rate limit exceeded. Please try again later.",
+                        "retry_after": result.retry_after,
+                    },
+                    headers={"Retry-After": str(result.retry_after), **rate_limit_headers},
+                )
+                await response(scope, receive, send)
+                return
 
         # Add rate limit headers to response
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(config["requests"])
-        response.headers["X-RateLimit-Window"] = str(config["window"])
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in rate_limit_headers.items():
+                    headers[name] = value
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware to log all incoming requests with request ID.
 
     Logs:
     - Request method, path, client IP
-    - Request processing time
+    - Request processing time (until the response headers are sent)
     - Response status code
     - Request ID for correlation
     """
 
-    async def dispatch(self, request: Request, call_next: Callable):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Get request ID (set by SecurityHeadersMiddleware)
         request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
 
@@ -234,28 +236,25 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         start_time = time.time()
 
         # Log request
-        import logging
-
-        logger = logging.getLogger(__name__)
         logger.info(f"[{request_id}] {request.method} {request.url.path} - Client: {client_ip}")
 
-        # Process request
-        try:
-            response = await call_next(request)
-
-            # Calculate processing time
-            process_time = time.time() - start_time
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time
+                process_time = time.time() - start_time
 
-            # Log response
-            logger.info(
-                f"[{request_id}] Status: {response.status_code} - Time: {process_time:.3f}s"
-            )
+                # Log response
+                logger.info(
+                    f"[{request_id}] Status: {message['status']} - Time: {process_time:.3f}s"
+                )
 
-            # Add processing time header
-            response.headers["X-Process-Time"] = f"{process_time:.3f}"
-
-            return response
+                # Add processing time header
+                MutableHeaders(scope=message)["X-Process-Time"] = f"{process_time:.3f}"
+            await send(message)
 
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_timing)
         except Exception as e:
             process_time = time.time() - start_time
             logger.error(
@@ -628,6 +628,28 @@ class SignedUrlResponse(BaseModel):
     signed_url: str
 
 
+# Most MOV files signed in one batch request (a full indicator list fits comfortably)
+MAX_SIGNED_URL_BATCH = 200
+
+
+class SignedUrlBatchRequest(BaseModel):
+    """Request schema for signing several MOV files at once."""
+
+    file_ids: list[int] = Field(..., min_length=1, max_length=MAX_SIGNED_URL_BATCH)
+
+
+class SignedUrlBatchResponse(BaseModel):
+    """
+    Response schema for batch signed URL generation.
+
+    Fields:
+        signed_urls: Signed URL per requested file ID; null when the file does not
+                     exist, has been deleted or is missing from storage.
+    """
+
+    signed_urls: dict[int, str | None]
+
+
 # ============================================================================
 # Submission Workflow Schemas (Epic 5.0)
 # ============================================================================
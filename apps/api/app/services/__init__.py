@@ -1,6 +1,7 @@
 # 🔧 Services Package
 # Business logic layer services
 
+from .analytics_rollup_service import AnalyticsRollupService, analytics_rollup_service
 from .analytics_service import AnalyticsService, analytics_service
 from .annotation_service import AnnotationService, annotation_service
 from .assessment_lock_service import AssessmentLockService, assessment_lock_service
@@ -11,6 +12,8 @@ from .intelligence_service import IntelligenceService, intelligence_service
 from .startup_service import StartupService, startup_service
 
 __all__ = [
+    "analytics_rollup_service",
+    "AnalyticsRollupService",
     "analytics_service",
     "AnalyticsService",
     "annotation_service",
@@ -0,0 +1,493 @@
+# 📈 Analytics Rollup Service
+# Incremental maintenance of the per-year analytics rollup tables
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Integer, bindparam, delete, event, inspect, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.core.cache import cache
+from app.db.enums import AssessmentStatus, ComplianceStatus, ValidationStatus
+from app.db.models import (
+    AnalyticsAreaRollup,
+    AnalyticsAssessmentContribution,
+    AnalyticsIndicatorRollup,
+    AnalyticsYearRollup,
+    Assessment,
+    AssessmentResponse,
+    GovernanceArea,
+    Indicator,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuses whose responses and area results count towards area/indicator rollups
+FINALIZED_STATUSES = (AssessmentStatus.COMPLETED, AssessmentStatus.VALIDATED)
+
+MET_STATUSES = (ValidationStatus.PASS, ValidationStatus.CONDITIONAL)
+
+# Number of assessments refreshed per round-trip during rebuilds
+REFRESH_BATCH_SIZE = 200
+
+# First key of the per-assessment advisory locks held while a contribution is refreshed
+# (the second key is the assessment ID)
+ROLLUP_LOCK_NAMESPACE = 0x524F4C4C
+
+# Locks assessments in ID order (the subquery fixes the order the locks are taken in)
+_LOCK_ASSESSMENTS_SQL = text(
+    "SELECT pg_advisory_xact_lock(:namespace, assessment_id) "
+    "FROM (SELECT unnest(:assessment_ids) AS assessment_id ORDER BY 1) AS locked"
+).bindparams(bindparam("assessment_ids", type_=ARRAY(Integer)))
+
+# Attribute changes that can alter an assessment's rollup contribution
+_TRACKED_ASSESSMENT_ATTRS = (
+    "assessment_year",
+    "status",
+    "final_compliance_status",
+    "area_results",
+    "rework_count",
+    "calibration_count",
+)
+_TRACKED_RESPONSE_ATTRS = ("assessment_id", "indicator_id", "validation_status")
+
+# Session.info key holding assessment ids whose contribution must be refreshed
+_PENDING_KEY = "analytics_rollup_pending"
+# Session.info key holding assessment years whose rollups changed in the transaction
+_CHANGED_YEARS_KEY = "analytics_rollup_changed_years"
+
+_YEAR_COLUMNS = (
+    "assessment_count",
+    "passed_count",
+    "failed_count",
+    "validated_count",
+    "rework_count",
+    "calibration_count",
+)
+_AREA_COLUMNS = ("passed_count", "failed_count", "result_passed_count", "result_failed_count")
+_INDICATOR_COLUMNS = ("assessed_count", "met_count", "fail_count")
+
+
+class AnalyticsRollupService:
+    """
+    Maintains the analytics rollup tables.
+
+    Every assessment has a stored contribution (see AnalyticsAssessmentContribution).
+    Refreshing an assessment recomputes its contribution from the database,
+    applies the difference to the year/area/indicator rollups with
+    ``count = count + delta`` upserts, and stores the new contribution.
+    Dashboards then read O(areas + indicators) rollup rows instead of
+    scanning assessment responses.
+
+    Assessments are refreshed automatically when a session that changed them
+    commits (finalization, MLGOO approval, validation overrides and every
+    other status transition). Bulk writes that bypass the ORM unit of work
+    must call refresh_assessments() themselves.
+
+    Once the transaction commits, cached analytics tagged with an affected
+    assessment year are invalidated (see RedisCache.invalidate_assessment_year).
+    """
+
+    def refresh_assessment(self, db: Session, assessment_id: int) -> None:
+        """Refresh the rollup contribution of a single assessment."""
+        self.refresh_assessments(db, [assessment_id])
+
+    def refresh_assessments(self, db: Session, assessment_ids: Iterable[int]) -> int:
+        """
+        Refresh the rollup contributions of the given assessments.
+
+        Changes are written in the caller's transaction; the caller commits.
+
+        Args:
+            db: Database session
+            assessment_ids: IDs of changed (or deleted) assessments
+
+        Returns:
+            int: Number of assessments whose contribution changed
+        """
+        ids = sorted({assessment_id for assessment_id in assessment_ids if assessment_id})
+        self._lock_assessments(db, ids)
+        changed = 0
+        for i in range(0, len(ids), REFRESH_BATCH_SIZE):
+            changed += self._refresh_batch(db, ids[i : i + REFRESH_BATCH_SIZE])
+        return changed
+
+    def rebuild_year(self, db: Session, year: int) -> int:
+        """
+        Rebuild all rollups of an assessment year from scratch.
+
+        Used to reconcile after writes that bypassed the ORM (e.g. bulk
+        deletes) or when the rollup tables are first populated.
+
+        Returns:
+            int: Number of assessments contributing to the rebuilt rollups
+        """
+        assessment_ids = [
+            row[0]
+            for row in db.query(Assessment.id)
+            .filter(Assessment.assessment_year == year)
+            .order_by(Assessment.id)
+        ]
+        # Wait for in-flight refreshes of these assessments before dropping their ledger rows
+        self._lock_assessments(db, assessment_ids)
+
+        for model in (
+            AnalyticsYearRollup,
+            AnalyticsAreaRollup,
+            AnalyticsIndicatorRollup,
+            AnalyticsAssessmentContribution,
+        ):
+            db.execute(delete(model).where(model.assessment_year == year))
+
+        self.refresh_assessments(db, assessment_ids)
+        logger.info(
+            "Rebuilt analytics rollups for year %s: %d assessments", year, len(assessment_ids)
+        )
+        return len(assessment_ids)
+
+    # ==================== CONTRIBUTIONS ====================
+
+    @staticmethod
+    def _lock_assessments(db: Session, assessment_ids: list[int]) -> None:
+        """
+        Serialize refreshes of the same assessments until the transaction ends.
+
+        Row locks on the ledger cannot do this: an assessment without a ledger row
+        (not refreshed yet, or dropped by rebuild_year) has nothing to lock, and two
+        transactions would both add its full contribution. All locks are taken up
+        front in ID order, before any rollup row is written, so refreshes cannot
+        deadlock. SQLite serializes writing transactions on its own.
+        """
+        if not assessment_ids or db.get_bind().dialect.name != "postgresql":
+            return
+        db.execute(
+            _LOCK_ASSESSMENTS_SQL,
+            {"namespace": ROLLUP_LOCK_NAMESPACE, "assessment_ids": assessment_ids},
+        )
+
+    def _refresh_batch(self, db: Session, assessment_ids: list[int]) -> int:
+        # The caller holds the assessments' advisory locks (see _lock_assessments)
+        previous = {
+            row.assessment_id: row.contribution
+            for row in db.query(
+                AnalyticsAssessmentContribution.assessment_id,
+                AnalyticsAssessmentContribution.contribution,
+            ).filter(AnalyticsAssessmentContribution.assessment_id.in_(assessment_ids))
+        }
+        current = self._compute_contributions(db, assessment_ids)
+
+        deltas: dict[str, dict[tuple, dict[str, int]]] = {
+            "year": defaultdict(lambda: defaultdict(int)),
+            "area": defaultdict(lambda: defaultdict(int)),
+            "indicator": defaultdict(lambda: defaultdict(int)),
+        }
+        now = datetime.now(UTC)
+        ledger_rows: list[dict[str, Any]] = []
+        removed: list[int] = []
+
+        changed_years = db.info.setdefault(_CHANGED_YEARS_KEY, set())
+        for assessment_id in assessment_ids:
+            old = previous.get(assessment_id)
+            new = current.get(assessment_id)
+            if old == new:
+                continue
+            changed_years.update(c["year"] for c in (old, new) if c is not None)
+            if old is not None:
+                self._accumulate(deltas, old, -1)
+            if new is not None:
+                self._accumulate(deltas, new, 1)
+                ledger_rows.append(
+                    {
+                        "assessment_id": assessment_id,
+                        "assessment_year": new["year"],
+                        "status": new["status"],
+                        "contribution": new,
+                        "updated_at": now,
+                    }
+                )
+            else:
+                removed.append(assessment_id)
+
+        self._apply_deltas(
+            db,
+            AnalyticsYearRollup,
+            ("assessment_year", "status"),
+            _YEAR_COLUMNS,
+            deltas["year"],
+            now,
+        )
+        self._apply_deltas(
+            db,
+            AnalyticsAreaRollup,
+            ("assessment_year", "status", "governance_area_id"),
+            _AREA_COLUMNS,
+            deltas["area"],
+            now,
+        )
+        self._apply_deltas(
+            db,
+            AnalyticsIndicatorRollup,
+            ("assessment_year", "status", "indicator_id"),
+            _INDICATOR_COLUMNS,
+            deltas["indicator"],
+            now,
+        )
+
+        if removed:
+            db.execute(
+                delete(AnalyticsAssessmentContribution).where(
+                    AnalyticsAssessmentContribution.assessment_id.in_(removed)
+                )
+            )
+        if ledger_rows:
+            insert = self._insert_for(db)
+            stmt = insert(AnalyticsAssessmentContribution).values(ledger_rows)
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["assessment_id"],
+                    set_={
+                        "assessment_year": stmt.excluded.assessment_year,
+                        "status": stmt.excluded.status,
+                        "contribution": stmt.excluded.contribution,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+            )
+
+        return len(ledger_rows) + len(removed)
+
+    def _compute_contributions(
+        self, db: Session, assessment_ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Compute what each assessment should contribute to the rollups.
+
+        Contributions are JSON-serializable (string keys) so they can be stored
+        in the ledger and compared with the stored version.
+        """
+        assessments = (
+            db.query(
+                Assessment.id,
+                Assessment.assessment_year,
+                Assessment.status,
+                Assessment.final_compliance_status,
+                Assessment.area_results,
+                Assessment.rework_count,
+                Assessment.calibration_count,
+            )
+            .filter(Assessment.id.in_(assessment_ids))
+            .all()
+        )
+
+        contributions: dict[int, dict[str, Any]] = {}
+        finalized_ids: list[int] = []
+        needs_area_names = False
+
+        for row in assessments:
+            if row.assessment_year is None or row.status is None:
+                continue
+            status = row.status.value if hasattr(row.status, "value") else str(row.status)
+            contributions[row.id] = {
+                "year": row.assessment_year,
+                "status": status,
+                "counts": {
+                    "assessment_count": 1,
+                    "passed_count": int(row.final_compliance_status == ComplianceStatus.PASSED),
+                    "failed_count": int(row.final_compliance_status == ComplianceStatus.FAILED),
+                    "validated_count": int(row.final_compliance_status is not None),
+                    "rework_count": int(bool(row.rework_count and row.rework_count > 0)),
+                    "calibration_count": int(
+                        bool(row.calibration_count and row.calibration_count > 0)
+                    ),
+                },
+                "areas": {},
+                "indicators": {},
+            }
+            if row.status in FINALIZED_STATUSES:
+                finalized_ids.append(row.id)
+                needs_area_names = needs_area_names or bool(row.area_results)
+
+        if not finalized_ids:
+            return contributions
+
+        # Indicator counts and per-area GAR outcome (all validated indicators met)
+        area_tallies: dict[int, dict[int, list[int]]] = defaultdict(dict)
+        for assessment_id, indicator_id, area_id, validation_status in (
+            db.query(
+                AssessmentResponse.assessment_id,
+                AssessmentResponse.indicator_id,
+                Indicator.governance_area_id,
+                AssessmentResponse.validation_status,
+            )
+            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+            .filter(AssessmentResponse.assessment_id.in_(finalized_ids))
+        ):
+            met = validation_status in MET_STATUSES
+            indicators = contributions[assessment_id]["indicators"]
+            counts = indicators.setdefault(
+                str(indicator_id), {"assessed_count": 0, "met_count": 0, "fail_count": 0}
+            )
+            counts["assessed_count"] += 1
+            counts["met_count"] += int(met)
+            counts["fail_count"] += int(validation_status == ValidationStatus.FAIL)
+
+            if validation_status is not None:
+                tally = area_tallies[assessment_id].setdefault(area_id, [0, 0])
+                tally[0] += int(met)
+                tally[1] += 1
+
+        for assessment_id, tallies in area_tallies.items():
+            areas = contributions[assessment_id]["areas"]
+            for area_id, (met_count, validated_count) in tallies.items():
+                passed = met_count == validated_count
+                areas[str(area_id)] = self._area_counts(
+                    passed_count=int(passed), failed_count=int(not passed)
+                )
+
+        # Stored SGLGB classification per area (keyed by area name)
+        if needs_area_names:
+            area_ids_by_name = dict(db.query(GovernanceArea.name, GovernanceArea.id).all())
+            for row in assessments:
+                if row.id not in contributions or row.status not in FINALIZED_STATUSES:
+                    continue
+                for area_name, result in (row.area_results or {}).items():
+                    area_id = area_ids_by_name.get(area_name)
+                    if area_id is None or not isinstance(result, str):
+                        continue
+                    counts = contributions[row.id]["areas"].setdefault(
+                        str(area_id), self._area_counts()
+                    )
+                    counts["result_passed_count"] += int(result.lower() == "passed")
+                    counts["result_failed_count"] += int(result.lower() == "failed")
+
+        return contributions
+
+    @staticmethod
+    def _area_counts(**counts: int) -> dict[str, int]:
+        return {column: counts.get(column, 0) for column in _AREA_COLUMNS}
+
+    @staticmethod
+    def _accumulate(
+        deltas: dict[str, dict[tuple, dict[str, int]]],
+        contribution: dict[str, Any],
+        sign: int,
+    ) -> None:
+        year = contribution["year"]
+        status = contribution["status"]
+        for column, value in contribution["counts"].items():
+            deltas["year"][(year, status)][column] += sign * value
+        for area_id, counts in contribution["areas"].items():
+            for column, value in counts.items():
+                deltas["area"][(year, status, int(area_id))][column] += sign * value
+        for indicator_id, counts in contribution["indicators"].items():
+            for column, value in counts.items():
+                deltas["indicator"][(year, status, int(indicator_id))][column] += sign * value
+
+    # ==================== WRITES ====================
+
+    @staticmethod
+    def _insert_for(db: Session):
+        """Dialect-specific INSERT supporting ON CONFLICT DO UPDATE."""
+        if db.get_bind().dialect.name == "postgresql":
+            return postgresql_insert
+        return sqlite_insert
+
+    def _apply_deltas(
+        self,
+        db: Session,
+        model: type,
+        key_columns: tuple[str, ...],
+        count_columns: tuple[str, ...],
+        deltas: dict[tuple, dict[str, int]],
+        now: datetime,
+    ) -> None:
+        """Add deltas to rollup rows with a single multi-row upsert."""
+        rows = []
+        for key, counts in deltas.items():
+            if not any(counts.values()):
+                continue
+            row = dict(zip(key_columns, key, strict=True))
+            row.update({column: counts.get(column, 0) for column in count_columns})
+            row["updated_at"] = now
+            rows.append(row)
+        if not rows:
+            return
+
+        table = model.__table__
+        stmt = self._insert_for(db)(table).values(rows)
+        set_ = {column: table.c[column] + stmt.excluded[column] for column in count_columns}
+        set_["updated_at"] = stmt.excluded.updated_at
+        db.execute(stmt.on_conflict_do_update(index_elements=list(key_columns), set_=set_))
+
+
+analytics_rollup_service = AnalyticsRollupService()
+
+
+# ==================== UNIT OF WORK HOOKS ====================
+
+
+def _has_changes(obj: Any, attrs: tuple[str, ...]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_assessments(session: Session, flush_context: Any) -> None:
+    """Record assessments whose rollup contribution may have changed in this flush."""
+    pending: set[int] = set()
+    for obj in session.new:
+        if isinstance(obj, Assessment):
+            pending.add(obj.id)
+        elif isinstance(obj, AssessmentResponse):
+            pending.add(obj.assessment_id)
+    for obj in session.dirty:
+        if isinstance(obj, Assessment) and _has_changes(obj, _TRACKED_ASSESSMENT_ATTRS):
+            pending.add(obj.id)
+        elif isinstance(obj, AssessmentResponse) and _has_changes(obj, _TRACKED_RESPONSE_ATTRS):
+            pending.add(obj.assessment_id)
+            # A response moved to another assessment also changes the old one
+            pending.update(
+                value for value in inspect(obj).attrs.assessment_id.history.deleted if value
+            )
+    for obj in session.deleted:
+        if isinstance(obj, Assessment):
+            pending.add(obj.id)
+        elif isinstance(obj, AssessmentResponse):
+            pending.add(obj.assessment_id)
+
+    pending.discard(None)
+    if pending:
+        session.info.setdefault(_PENDING_KEY, set()).update(pending)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_changed_assessments(session: Session) -> None:
+    """Apply rollup deltas for changed assessments inside the committing transaction."""
+    has_unflushed = session.new or session.dirty or session.deleted
+    if session.info.get(_PENDING_KEY) is None and not has_unflushed:
+        return
+    # Commit flushes after before_commit; flush first so this commit's changes are included
+    session.flush()
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        analytics_rollup_service.refresh_assessments(session, pending)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_years(session: Session) -> None:
+    """Drop cached analytics for years whose rollups changed in the committed transaction."""
+    changed_years = session.info.pop(_CHANGED_YEARS_KEY, None)
+    for year in sorted(changed_years or ()):
+        cache.invalidate_assessment_year(year)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_assessments(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_CHANGED_YEARS_KEY, None)
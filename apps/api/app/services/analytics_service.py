@@ -17,9 +17,11 @@ from app.db.enums import (
     BBIStatus,
     ComplianceStatus,
     UserRole,
-    ValidationStatus,
 )
 from app.db.models import (
+    AnalyticsAreaRollup,
+    AnalyticsIndicatorRollup,
+    AnalyticsYearRollup,
     Assessment,
     AssessmentResponse,
     Barangay,
@@ -226,17 +228,18 @@ class AnalyticsService:
         Returns:
             ComplianceRate schema with total, passed, failed counts and percentage
         """
-        # Build base query for COMPLETED assessments only
-        query = db.query(Assessment).filter(Assessment.status == AssessmentStatus.COMPLETED)
+        # Read the per-year rollup of COMPLETED assessments
+        query = db.query(
+            func.coalesce(func.sum(AnalyticsYearRollup.assessment_count), 0),
+            func.coalesce(func.sum(AnalyticsYearRollup.passed_count), 0),
+            func.coalesce(func.sum(AnalyticsYearRollup.failed_count), 0),
+        ).filter(AnalyticsYearRollup.status == AssessmentStatus.COMPLETED.value)
 
         # Filter by assessment year
         if assessment_year is not None:
-            query = query.filter(Assessment.assessment_year == assessment_year)
-
-        # Get all assessments with final compliance status
-        assessments = query.all()
+            query = query.filter(AnalyticsYearRollup.assessment_year == assessment_year)
 
-        total_barangays = len(assessments)
+        total_barangays, passed, failed = query.one()
 
         # Handle edge case: no assessments
         if total_barangays == 0:
@@ -247,17 +250,13 @@ class AnalyticsService:
                 pass_percentage=0.0,
             )
 
-        # Count passed and failed
-        passed = sum(1 for a in assessments if a.final_compliance_status == ComplianceStatus.PASSED)
-        failed = sum(1 for a in assessments if a.final_compliance_status == ComplianceStatus.FAILED)
-
         # Calculate percentage (handle division by zero)
         pass_percentage = (passed / total_barangays * 100) if total_barangays > 0 else 0.0
 
         return ComplianceRate(
-            total_barangays=total_barangays,
-            passed=passed,
-            failed=failed,
+            total_barangays=int(total_barangays),
+            passed=int(passed),
+            failed=int(failed),
             pass_percentage=round(pass_percentage, 2),
         )
 
@@ -275,18 +274,18 @@ class AnalyticsService:
             ComplianceRate schema representing completion statistics
         """
         # For completion status, we consider all assessments
-        query = db.query(Assessment)
+        # "Passed" = validated (has final_compliance_status)
+        # "Failed" = in progress (no final_compliance_status yet)
+        query = db.query(
+            func.coalesce(func.sum(AnalyticsYearRollup.assessment_count), 0),
+            func.coalesce(func.sum(AnalyticsYearRollup.validated_count), 0),
+        )
 
         # Filter by assessment year
         if assessment_year is not None:
-            query = query.filter(Assessment.assessment_year == assessment_year)
+            query = query.filter(AnalyticsYearRollup.assessment_year == assessment_year)
 
-        assessments = query.all()
-        total = len(assessments)
-
-        # "Passed" = validated (has final_compliance_status)
-        # "Failed" = in progress (no final_compliance_status yet)
-        validated = sum(1 for a in assessments if a.final_compliance_status is not None)
+        total, validated = (int(value) for value in query.one())
         in_progress = total - validated
 
         completion_percentage = (validated / total * 100) if total > 0 else 0.0
@@ -304,6 +303,9 @@ class AnalyticsService:
         """
         Calculate compliance breakdown by governance area.
 
+        Reads the per-year area rollup, so cost is O(areas) regardless of the
+        number of barangays or responses.
+
         Args:
             db: Database session
             assessment_year: Optional assessment year
@@ -311,103 +313,38 @@ class AnalyticsService:
         Returns:
             List of AreaBreakdown schemas, one per governance area
         """
-        # Get all governance areas with eager loaded indicators
-        # PERFORMANCE FIX: Eager load indicators to prevent N+1 queries
-        governance_areas = (
-            db.query(GovernanceArea).options(selectinload(GovernanceArea.indicators)).all()
-        )
+        governance_areas = db.query(GovernanceArea.id, GovernanceArea.name).all()
 
         if not governance_areas:
             return []
 
-        # Get COMPLETED assessments with eager loaded responses
-        # Only completed assessments count for governance area performance
-        # PERFORMANCE FIX: Eager load responses to prevent N+1 queries
-        assessment_query = (
-            db.query(Assessment)
-            .options(selectinload(Assessment.responses))
-            .filter(Assessment.status == AssessmentStatus.COMPLETED)
-        )
+        # Barangays passing/failing each area (GAR rule: all validated indicators
+        # are Pass/Conditional), pre-aggregated per year from COMPLETED assessments
+        query = db.query(
+            AnalyticsAreaRollup.governance_area_id,
+            func.sum(AnalyticsAreaRollup.passed_count),
+            func.sum(AnalyticsAreaRollup.failed_count),
+        ).filter(AnalyticsAreaRollup.status == AssessmentStatus.COMPLETED.value)
 
         # Filter by assessment year
         if assessment_year is not None:
-            assessment_query = assessment_query.filter(
-                Assessment.assessment_year == assessment_year
-            )
-
-        validated_assessments = assessment_query.all()
+            query = query.filter(AnalyticsAreaRollup.assessment_year == assessment_year)
 
-        if not validated_assessments:
-            # Return areas with zero counts
-            return [
-                AreaBreakdown(
-                    area_code=f"GA-{area.id}",
-                    area_name=area.name,
-                    passed=0,
-                    failed=0,
-                    percentage=0.0,
-                )
-                for area in governance_areas
-            ]
+        counts = {
+            area_id: (int(passed), int(failed))
+            for area_id, passed, failed in query.group_by(AnalyticsAreaRollup.governance_area_id)
+        }
 
         area_breakdown = []
-
-        for area in governance_areas:
-            # Get all indicators for this governance area
-            indicator_ids = [ind.id for ind in area.indicators]
-
-            if not indicator_ids:
-                area_breakdown.append(
-                    AreaBreakdown(
-                        area_code=f"GA-{area.id}",
-                        area_name=area.name,
-                        passed=0,
-                        failed=0,
-                        percentage=0.0,
-                    )
-                )
-                continue
-
-            # For each assessment, check if this governance area passed or failed
-            # based on validation status (aligned with GAR methodology)
-            passed_count = 0
-            failed_count = 0
-
-            for assessment in validated_assessments:
-                # Get responses for this area's indicators
-                area_responses = [
-                    r for r in assessment.responses if r.indicator_id in indicator_ids
-                ]
-
-                if not area_responses:
-                    continue
-
-                # Count indicators by validation status
-                met_count = sum(
-                    1
-                    for r in area_responses
-                    if r.validation_status in (ValidationStatus.PASS, ValidationStatus.CONDITIONAL)
-                )
-                total_validated = sum(1 for r in area_responses if r.validation_status is not None)
-
-                # Skip if no indicators have been validated yet
-                if total_validated == 0:
-                    continue
-
-                # A barangay "passes" this area if ALL validated indicators are met (Pass/Conditional)
-                # This aligns with GAR methodology where all indicators must pass for area compliance
-                if met_count == total_validated:
-                    passed_count += 1
-                else:
-                    failed_count += 1
-
+        for area_id, area_name in governance_areas:
+            passed_count, failed_count = counts.get(area_id, (0, 0))
             total = passed_count + failed_count
             percentage = (passed_count / total * 100) if total > 0 else 0.0
 
             area_breakdown.append(
                 AreaBreakdown(
-                    area_code=f"GA-{area.id}",
-                    area_name=area.name,
+                    area_code=f"GA-{area_id}",
+                    area_name=area_name,
                     passed=passed_count,
                     failed=failed_count,
                     percentage=round(percentage, 2),
@@ -432,26 +369,25 @@ class AnalyticsService:
         Returns:
             List of FailedIndicator schemas (max 5)
         """
-        # Build query for FAILED validation status responses from COMPLETED assessments
+        # Read FAIL counts per indicator from the per-year rollup of COMPLETED assessments
         # Include indicator_code and governance_area for richer data
+        failure_count = func.sum(AnalyticsIndicatorRollup.fail_count)
         query = (
             db.query(
                 Indicator.id,
                 Indicator.name,
                 Indicator.indicator_code,
                 GovernanceArea.name.label("governance_area_name"),
-                func.count(AssessmentResponse.id).label("failure_count"),
+                failure_count.label("failure_count"),
             )
-            .join(AssessmentResponse, AssessmentResponse.indicator_id == Indicator.id)
-            .join(Assessment, AssessmentResponse.assessment_id == Assessment.id)
+            .join(AnalyticsIndicatorRollup, AnalyticsIndicatorRollup.indicator_id == Indicator.id)
             .join(GovernanceArea, Indicator.governance_area_id == GovernanceArea.id)
-            .filter(AssessmentResponse.validation_status == ValidationStatus.FAIL)
-            .filter(Assessment.status == AssessmentStatus.COMPLETED)
+            .filter(AnalyticsIndicatorRollup.status == AssessmentStatus.COMPLETED.value)
         )
 
         # Filter by assessment year
         if assessment_year is not None:
-            query = query.filter(Assessment.assessment_year == assessment_year)
+            query = query.filter(AnalyticsIndicatorRollup.assessment_year == assessment_year)
 
         # Group by indicator and governance area, order by count descending, limit to 5
         results = (
@@ -461,7 +397,8 @@ class AnalyticsService:
                 Indicator.indicator_code,
                 GovernanceArea.name,
             )
-            .order_by(desc("failure_count"))
+            .having(failure_count > 0)
+            .order_by(desc("failure_count"), Indicator.id)
             .limit(5)
             .all()
         )
@@ -587,25 +524,21 @@ class AnalyticsService:
         Returns:
             List of StatusDistributionItem schemas with count and percentage per status
         """
-        # Query all assessments grouped by status
-        query = db.query(Assessment)
+        # Read assessment counts per status from the per-year rollup
+        query = db.query(AnalyticsYearRollup.status, func.sum(AnalyticsYearRollup.assessment_count))
 
         # Filter by assessment year
         if assessment_year is not None:
-            query = query.filter(Assessment.assessment_year == assessment_year)
+            query = query.filter(AnalyticsYearRollup.assessment_year == assessment_year)
 
-        assessments = query.all()
-        total = len(assessments)
+        status_counts = {
+            status: int(count) for status, count in query.group_by(AnalyticsYearRollup.status)
+        }
+        total = sum(status_counts.values())
 
         if total == 0:
             return []
 
-        # Count by status
-        status_counts = {}
-        for assessment in assessments:
-            status = assessment.status.value if assessment.status else "UNKNOWN"
-            status_counts[status] = status_counts.get(status, 0) + 1
-
         # Define display order and friendly names
         status_display = {
             AssessmentStatus.DRAFT.value: "Not Started",
@@ -654,15 +587,20 @@ class AnalyticsService:
         Returns:
             ReworkStats schema with rework and calibration rates
         """
-        # Query all assessments
-        query = db.query(Assessment)
+        # Read totals from the per-year rollup (rework/calibration = count > 0)
+        query = db.query(
+            func.coalesce(func.sum(AnalyticsYearRollup.assessment_count), 0),
+            func.coalesce(func.sum(AnalyticsYearRollup.rework_count), 0),
+            func.coalesce(func.sum(AnalyticsYearRollup.calibration_count), 0),
+        )
 
         # Filter by assessment year
         if assessment_year is not None:
-            query = query.filter(Assessment.assessment_year == assessment_year)
+            query = query.filter(AnalyticsYearRollup.assessment_year == assessment_year)
 
-        assessments = query.all()
-        total = len(assessments)
+        total, assessments_with_rework, assessments_with_calibration = (
+            int(value) for value in query.one()
+        )
 
         if total == 0:
             return ReworkStats(
@@ -673,16 +611,6 @@ class AnalyticsService:
                 calibration_rate=0.0,
             )
 
-        # Count assessments with rework (rework_count > 0)
-        assessments_with_rework = sum(
-            1 for a in assessments if a.rework_count and a.rework_count > 0
-        )
-
-        # Count assessments with calibration (calibration_count > 0)
-        assessments_with_calibration = sum(
-            1 for a in assessments if a.calibration_count and a.calibration_count > 0
-        )
-
         # Calculate rates
         rework_rate = (assessments_with_rework / total * 100) if total > 0 else 0.0
         calibration_rate = (assessments_with_calibration / total * 100) if total > 0 else 0.0
@@ -8,12 +8,15 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from fastapi import HTTPException, status
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from app.db.enums import NotificationType
+from app.db.enums import NotificationType, UserRole
 from app.db.models.assessment import Assessment
+from app.db.models.barangay import Barangay
 from app.db.models.system import AssessmentYear
 from app.db.models.user import User
+from app.schemas.notification import NotificationCreate
 from app.services.notification_service import notification_service
 
 logger = logging.getLogger(__name__)
@@ -208,74 +211,93 @@ class AssessmentLockService:
     def process_expired_assessment_locks(
         self, db: Session, now: datetime | None = None
     ) -> dict[str, int]:
+        """
+        Lock every assessment whose grace period or phase 1 deadline has expired.
+
+        PERFORMANCE: Set-based. Each lock reason is one UPDATE ... RETURNING that
+        only touches the rows that must flip (served by the partial indexes on
+        unlocked assessments), and the notifications for each batch are created
+        together, so the hourly sweep costs O(changed rows) rather than loading
+        every assessment of the active year.
+        """
         resolved_now = self._resolve_now(now)
-        deadline_locked = 0
-        grace_relocked = 0
 
-        active_year = db.query(AssessmentYear).filter(AssessmentYear.is_active == True).first()
-        if active_year:
-            assessments = (
-                db.query(Assessment).filter(Assessment.assessment_year == active_year.year).all()
-            )
-            for assessment in assessments:
-                state = self.get_effective_lock_state(db, assessment, now=resolved_now)
-                if state["is_locked"] and not assessment.is_locked_for_deadline:
-                    self.lock_for_blgu(
-                        db,
-                        assessment,
-                        reason=state["lock_reason"],
-                        locked_at=state["locked_at"],
-                        clear_grace_period=False,
-                    )
-                    self.notify_assessment_locked(
-                        db,
-                        assessment,
-                        reason=state["lock_reason"],
-                        grace_period_expires_at=state["grace_period_expires_at"],
-                    )
-                    if state["lock_reason"] == self.LOCK_REASON_GRACE_PERIOD_EXPIRED:
-                        grace_relocked += 1
-                    elif state["lock_reason"] == self.LOCK_REASON_DEADLINE_EXPIRED:
-                        deadline_locked += 1
-
-        other_grace_assessments = (
-            db.query(Assessment)
-            .filter(
+        # Expired grace periods relock regardless of the assessment year
+        grace_relocked = db.execute(
+            update(Assessment)
+            .where(
                 Assessment.is_locked_for_deadline == False,  # noqa: E712
-                Assessment.grace_period_expires_at.is_not(None),
+                Assessment.grace_period_expires_at <= resolved_now,
             )
-            .all()
-        )
-        for assessment in other_grace_assessments:
-            state = self.get_effective_lock_state(db, assessment, now=resolved_now)
-            if (
-                state["is_locked"]
-                and state["lock_reason"] == self.LOCK_REASON_GRACE_PERIOD_EXPIRED
-                and not assessment.is_locked_for_deadline
-            ):
-                self.lock_for_blgu(
-                    db,
-                    assessment,
-                    reason=self.LOCK_REASON_GRACE_PERIOD_EXPIRED,
-                    locked_at=state["locked_at"],
-                    clear_grace_period=False,
+            .values(
+                is_locked_for_deadline=True,
+                lock_reason=self.LOCK_REASON_GRACE_PERIOD_EXPIRED,
+                locked_at=Assessment.grace_period_expires_at,
+            )
+            .returning(Assessment.id, Assessment.blgu_user_id)
+            .execution_options(synchronize_session="fetch")
+        ).all()
+
+        # Assessments never reopened by MLGOO lock once the active year's deadline passes
+        deadline_locked = []
+        active_year = db.query(AssessmentYear).filter(AssessmentYear.is_active == True).first()
+        phase1_deadline = self._to_naive_utc(active_year.phase1_deadline if active_year else None)
+        if phase1_deadline is not None and resolved_now >= phase1_deadline:
+            deadline_locked = db.execute(
+                update(Assessment)
+                .where(
+                    Assessment.assessment_year == active_year.year,
+                    Assessment.is_locked_for_deadline == False,  # noqa: E712
+                    Assessment.grace_period_expires_at.is_(None),
                 )
-                self.notify_assessment_locked(
-                    db,
-                    assessment,
-                    reason=self.LOCK_REASON_GRACE_PERIOD_EXPIRED,
-                    grace_period_expires_at=state["grace_period_expires_at"],
+                .values(
+                    is_locked_for_deadline=True,
+                    lock_reason=self.LOCK_REASON_DEADLINE_EXPIRED,
+                    locked_at=phase1_deadline,
                 )
-                grace_relocked += 1
+                .returning(Assessment.id, Assessment.blgu_user_id)
+                .execution_options(synchronize_session="fetch")
+            ).all()
+
+        self.notify_assessments_locked(db, grace_relocked, self.LOCK_REASON_GRACE_PERIOD_EXPIRED)
+        self.notify_assessments_locked(db, deadline_locked, self.LOCK_REASON_DEADLINE_EXPIRED)
 
         if deadline_locked or grace_relocked:
             db.commit()
 
         return {
-            "deadline_locked": deadline_locked,
-            "grace_relocked": grace_relocked,
+            "deadline_locked": len(deadline_locked),
+            "grace_relocked": len(grace_relocked),
         }
 
+    def _get_lock_notification_text(self, reason: str) -> tuple[str, str]:
+        """Title and message of the BLGU notification for a lock reason."""
+        if reason == self.LOCK_REASON_GRACE_PERIOD_EXPIRED:
+            return (
+                "Assessment Locked Again",
+                "The grace period for your assessment has expired. "
+                "Your assessment is locked again and can only be reopened by MLGOO.",
+            )
+        if reason == self.LOCK_REASON_MLGOO_MANUAL_LOCK:
+            return (
+                "Assessment Locked by MLGOO",
+                "MLGOO locked your assessment again. "
+                "You can still view your data, but editing and submission actions are disabled.",
+            )
+        return (
+            "Assessment Locked After Deadline",
+            "The assessment deadline has expired. "
+            "Your assessment is now read-only until MLGOO reopens editing.",
+        )
+
+    def _get_mlgoo_lock_notification_text(self, barangay_name: str, reason: str) -> tuple[str, str]:
+        """Title and message of the MLGOO notification for a lock reason."""
+        return (
+            f"Assessment Locked: {barangay_name}",
+            f"{barangay_name}'s assessment is locked for BLGU editing "
+            f"because {reason.replace('_', ' ')}.",
+        )
+
     def notify_assessment_locked(
         self,
         db: Session,
@@ -287,24 +309,7 @@ class AssessmentLockService:
         if assessment.blgu_user and assessment.blgu_user.barangay:
             barangay_name = assessment.blgu_user.barangay.name
 
-        if reason == self.LOCK_REASON_GRACE_PERIOD_EXPIRED:
-            title = "Assessment Locked Again"
-            message = (
-                "The grace period for your assessment has expired. "
-                "Your assessment is locked again and can only be reopened by MLGOO."
-            )
-        elif reason == self.LOCK_REASON_MLGOO_MANUAL_LOCK:
-            title = "Assessment Locked by MLGOO"
-            message = (
-                "MLGOO locked your assessment again. "
-                "You can still view your data, but editing and submission actions are disabled."
-            )
-        else:
-            title = "Assessment Locked After Deadline"
-            message = (
-                "The assessment deadline has expired. "
-                "Your assessment is now read-only until MLGOO reopens editing."
-            )
+        title, message = self._get_lock_notification_text(reason)
 
         if assessment.blgu_user_id:
             notification_service.notify_blgu_user(
@@ -317,17 +322,79 @@ class AssessmentLockService:
             )
 
         if reason != self.LOCK_REASON_MLGOO_MANUAL_LOCK:
+            mlgoo_title, mlgoo_message = self._get_mlgoo_lock_notification_text(
+                barangay_name, reason
+            )
             notification_service.notify_all_mlgoo_users(
                 db=db,
                 notification_type=NotificationType.ASSESSMENT_LOCKED,
-                title=f"Assessment Locked: {barangay_name}",
-                message=(
-                    f"{barangay_name}'s assessment is locked for BLGU editing "
-                    f"because {reason.replace('_', ' ')}."
-                ),
+                title=mlgoo_title,
+                message=mlgoo_message,
                 assessment_id=assessment.id,
             )
 
+    def notify_assessments_locked(
+        self,
+        db: Session,
+        locked: list[tuple[int, int | None]],
+        reason: str,
+    ) -> None:
+        """
+        Batch version of notify_assessment_locked for assessments locked together.
+
+        Args:
+            db: Database session
+            locked: (assessment_id, blgu_user_id) pairs, as returned by the sweep's UPDATE
+            reason: Lock reason shared by all of them
+        """
+        if not locked:
+            return
+
+        title, message = self._get_lock_notification_text(reason)
+        notifications = [
+            NotificationCreate(
+                recipient_id=blgu_user_id,
+                notification_type=NotificationType.ASSESSMENT_LOCKED,
+                title=title,
+                message=message,
+                assessment_id=assessment_id,
+            )
+            for assessment_id, blgu_user_id in locked
+            if blgu_user_id
+        ]
+
+        if reason != self.LOCK_REASON_MLGOO_MANUAL_LOCK:
+            mlgoo_user_ids = [
+                user_id
+                for (user_id,) in db.query(User.id).filter(
+                    User.role == UserRole.MLGOO_DILG,
+                    User.is_active == True,  # noqa: E712
+                )
+            ]
+            barangay_names = dict(
+                db.query(Assessment.id, Barangay.name)
+                .join(User, Assessment.blgu_user_id == User.id)
+                .join(Barangay, User.barangay_id == Barangay.id)
+                .filter(Assessment.id.in_([assessment_id for assessment_id, _ in locked]))
+                .all()
+            )
+            for assessment_id, _ in locked:
+                mlgoo_title, mlgoo_message = self._get_mlgoo_lock_notification_text(
+                    barangay_names.get(assessment_id, "Unknown Barangay"), reason
+                )
+                notifications.extend(
+                    NotificationCreate(
+                        recipient_id=user_id,
+                        notification_type=NotificationType.ASSESSMENT_LOCKED,
+                        title=mlgoo_title,
+                        message=mlgoo_message,
+                        assessment_id=assessment_id,
+                    )
+                    for user_id in mlgoo_user_ids
+                )
+
+        notification_service.create_notifications(db, notifications)
+
     def notify_assessment_unlocked(
         self,
         db: Session,
@@ -6,7 +6,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import HTTPException, status  # type: ignore[reportMissingImports]
-from sqlalchemy import and_, func  # type: ignore[reportMissingImports]
+from sqlalchemy import and_, extract, func  # type: ignore[reportMissingImports]
 from sqlalchemy.orm import Session, joinedload, selectinload  # type: ignore[reportMissingImports]
 from sqlalchemy.orm.attributes import flag_modified  # type: ignore[reportMissingImports]
 
@@ -3639,6 +3639,49 @@ class AssessmentService:
             "responses_requiring_rework": responses_requiring_rework,
         }
 
+    def get_assessments_version(
+        self, db: Session, assessment_year: int | None = None
+    ) -> tuple[Any, ...]:
+        """
+        Get a version stamp for a year's assessments, for ETags on list endpoints.
+
+        The stamp changes whenever an assessment or response of the year is added,
+        updated or deleted, or a user (BLGU user, reviewer) is updated. It costs one
+        aggregate query instead of loading the assessments. Timestamps are summed
+        rather than maxed so an update committed out of order still changes it.
+
+        Args:
+            db: Database session
+            assessment_year: Assessment year (defaults to active year)
+
+        Returns:
+            Tuple of (year, assessment count and timestamp sum, response count and
+            timestamp sum, latest user update)
+        """
+        from app.services.assessment_year_service import assessment_year_service
+
+        if assessment_year is None:
+            assessment_year = assessment_year_service.get_active_year_number(db)
+
+        in_year = Assessment.assessment_year == assessment_year
+        year_responses = (
+            db.query(AssessmentResponse)
+            .join(Assessment, AssessmentResponse.assessment_id == Assessment.id)
+            .filter(in_year)
+        )
+        stamp = db.query(
+            db.query(func.count(Assessment.id)).filter(in_year).scalar_subquery(),
+            db.query(func.sum(extract("epoch", Assessment.updated_at)))
+            .filter(in_year)
+            .scalar_subquery(),
+            year_responses.with_entities(func.count(AssessmentResponse.id)).scalar_subquery(),
+            year_responses.with_entities(
+                func.sum(extract("epoch", AssessmentResponse.updated_at))
+            ).scalar_subquery(),
+            db.query(func.max(User.updated_at)).scalar_subquery(),
+        ).one()
+        return (assessment_year, *stamp)
+
     def get_all_validated_assessments(
         self,
         db: Session,
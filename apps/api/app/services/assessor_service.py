@@ -2178,7 +2178,7 @@ class AssessorService:
         try:
             from app.core.cache import cache
 
-            cache.delete_pattern("dashboard_kpis:*")
+            cache.invalidate_assessment_year(assessment.assessment_year)
             self.logger.info(
                 f"[SEND REWORK] Dashboard cache invalidated for assessment {assessment_id}"
             )
@@ -2475,7 +2475,7 @@ class AssessorService:
         try:
             from app.core.cache import cache
 
-            cache.delete_pattern("dashboard_kpis:*")
+            cache.invalidate_assessment_year(assessment.assessment_year)
             self.logger.info(
                 f"[CALIBRATION] Dashboard cache invalidated for assessment {assessment_id}"
             )
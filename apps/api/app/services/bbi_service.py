@@ -25,7 +25,7 @@ from loguru import logger
 from sqlalchemy import and_
 from sqlalchemy.orm import Session, joinedload
 
-from app.core.cache import CACHE_TTL_INTERNAL_ANALYTICS, cache
+from app.core.cache import CACHE_TTL_INTERNAL_ANALYTICS, assessment_year_tag, cache
 from app.db.enums import AssessmentStatus, BBIStatus
 from app.db.models.assessment import Assessment, AssessmentResponse
 from app.db.models.bbi import BBI, BBIResult
@@ -1180,6 +1180,10 @@ class BBIService:
 
         return summary
 
+    def municipality_analytics_cache_key(self, year: int) -> str:
+        """Cache key of get_municipality_bbi_analytics for a year."""
+        return f"bbi_municipality_analytics:year_{year}"
+
     def get_municipality_bbi_analytics(
         self,
         db: Session,
@@ -1244,7 +1248,7 @@ class BBIService:
             }
         """
         # Check cache first
-        cache_key = f"bbi_municipality_analytics:year_{year}"
+        cache_key = self.municipality_analytics_cache_key(year)
         if cache.is_available:
             cached_data = cache.get(cache_key)
             if cached_data is not None:
@@ -1377,7 +1381,12 @@ class BBIService:
         # Cache the result for 15 minutes
         if cache.is_available:
             try:
-                cache.set(cache_key, result, ttl=CACHE_TTL_INTERNAL_ANALYTICS)
+                cache.set(
+                    cache_key,
+                    result,
+                    ttl=CACHE_TTL_INTERNAL_ANALYTICS,
+                    tags=[assessment_year_tag(year)],
+                )
                 logger.info(f"💾 Cached BBI municipality analytics for {cache_key}")
             except Exception as e:
                 logger.warning(f"⚠️ Failed to cache BBI municipality analytics: {e}")
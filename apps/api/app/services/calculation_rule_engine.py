@@ -0,0 +1,339 @@
+"""
+Calculation Rule Engine
+
+Shared evaluator for calculation schemas, used by both CalculationEngineService
+(auto-calculation of validation status) and IntelligenceService (indicator
+calculation and the schema test endpoint).
+
+A schema is validated by Pydantic once and compiled into nested closures:
+field IDs, operators and thresholds are bound at compile time, so evaluation
+does no parsing and no per-rule type dispatch, and AND/OR nodes short-circuit
+on the first decisive child.
+
+Two evaluation modes cover the two callers:
+- lenient (default): missing, null or malformed field values evaluate to False
+- strict: missing fields and non-numeric / non-countable values raise ValueError
+
+BBI_FUNCTIONALITY_CHECK reads the status from the ``bbi_statuses`` mapping and
+falls back to a ``bbi_<id>_status`` key in the response data.
+
+Usage:
+    from app.services.calculation_rule_engine import compile_calculation_schema
+
+    compiled = compile_calculation_schema(CalculationSchema(**indicator.calculation_schema))
+    status = compiled.execute(response_data, bbi_statuses)
+"""
+
+import hashlib
+import json
+import logging
+import operator
+from collections.abc import Callable
+from typing import Any
+
+from app.db.enums import ValidationStatus
+from app.schemas.calculation_schema import (
+    AndAllRule,
+    BBIFunctionalityCheckRule,
+    CalculationRule,
+    CalculationSchema,
+    ConditionGroup,
+    CountThresholdRule,
+    MatchValueRule,
+    OrAnyRule,
+    PercentageThresholdRule,
+)
+
+logger = logging.getLogger(__name__)
+
+# Comparison operators shared by PERCENTAGE_THRESHOLD and COUNT_THRESHOLD rules
+COMPARATORS: dict[str, Callable[[Any, Any], bool]] = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq,
+}
+
+MATCH_OPERATORS = ("==", "!=", "contains", "not_contains")
+
+# Sentinel distinguishing an absent field from an explicit null value
+_MISSING = object()
+
+# Evaluator signature: (response_data, bbi_statuses) -> bool
+RuleEvaluator = Callable[[dict[str, Any], dict[int, str]], bool]
+
+
+class CompiledCalculationSchema:
+    """
+    A calculation schema compiled into a single evaluator.
+
+    Instances are immutable and safe to share across threads and requests.
+    """
+
+    __slots__ = ("schema_hash", "evaluate", "status_on_pass", "status_on_fail")
+
+    def __init__(
+        self,
+        schema_hash: str,
+        evaluate: RuleEvaluator,
+        status_on_pass: ValidationStatus,
+        status_on_fail: ValidationStatus,
+    ):
+        self.schema_hash = schema_hash
+        self.evaluate = evaluate
+        self.status_on_pass = status_on_pass
+        self.status_on_fail = status_on_fail
+
+    def execute(
+        self,
+        response_data: dict[str, Any] | None,
+        bbi_statuses: dict[int, str] | None = None,
+    ) -> ValidationStatus:
+        """Evaluate the compiled schema against a single response_data dict."""
+        if self.evaluate(response_data or {}, bbi_statuses or {}):
+            return self.status_on_pass
+        return self.status_on_fail
+
+
+def hash_calculation_schema(calculation_schema: dict[str, Any]) -> str:
+    """
+    Return a stable content hash of a calculation schema dict.
+
+    Raises:
+        TypeError/ValueError: If the schema is not JSON-serializable
+    """
+    return hashlib.sha256(
+        json.dumps(calculation_schema, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def compile_calculation_schema(
+    schema: CalculationSchema,
+    schema_hash: str = "",
+    strict: bool = False,
+) -> CompiledCalculationSchema:
+    """
+    Compile a validated calculation schema.
+
+    Top-level condition groups are combined with implicit AND.
+
+    Args:
+        schema: Validated CalculationSchema
+        schema_hash: Optional content hash stored on the compiled schema
+        strict: Raise ValueError for missing/malformed fields instead of evaluating to False
+
+    Returns:
+        CompiledCalculationSchema
+    """
+    return CompiledCalculationSchema(
+        schema_hash=schema_hash,
+        evaluate=_all_of([compile_condition_group(g, strict) for g in schema.condition_groups]),
+        status_on_pass=(
+            ValidationStatus.PASS
+            if schema.output_status_on_pass == "PASS"
+            else ValidationStatus.FAIL
+        ),
+        status_on_fail=(
+            ValidationStatus.FAIL
+            if schema.output_status_on_fail == "FAIL"
+            else ValidationStatus.PASS
+        ),
+    )
+
+
+def compile_condition_group(group: ConditionGroup, strict: bool = False) -> RuleEvaluator:
+    """
+    Compile a condition group (list of rules with AND/OR operator).
+
+    Raises:
+        ValueError: If the group operator is unknown
+    """
+    evaluators = [compile_rule(rule, strict) for rule in group.rules]
+    if group.operator == "AND":
+        return _all_of(evaluators)
+    elif group.operator == "OR":
+        return _any_of(evaluators)
+    raise ValueError(f"Unknown condition group operator: {group.operator}")
+
+
+def compile_rule(rule: CalculationRule, strict: bool = False) -> RuleEvaluator:
+    """
+    Compile a single calculation rule (recursively for AND_ALL / OR_ANY).
+
+    Raises:
+        ValueError: If the rule type or an operator is unknown
+    """
+    if isinstance(rule, AndAllRule):
+        return _all_of([compile_rule(c, strict) for c in rule.conditions])
+    elif isinstance(rule, OrAnyRule):
+        return _any_of([compile_rule(c, strict) for c in rule.conditions])
+    elif isinstance(rule, PercentageThresholdRule):
+        return _compile_percentage_threshold(rule, strict)
+    elif isinstance(rule, CountThresholdRule):
+        return _compile_count_threshold(rule, strict)
+    elif isinstance(rule, MatchValueRule):
+        return _compile_match_value(rule, strict)
+    elif isinstance(rule, BBIFunctionalityCheckRule):
+        return _compile_bbi_functionality_check(rule)
+    raise ValueError(f"Unknown rule type: {type(rule).__name__}")
+
+
+# ==================== COMPILERS ====================
+
+
+def _all_of(evaluators: list[RuleEvaluator]) -> RuleEvaluator:
+    """All evaluators must be true (short-circuits on the first False)."""
+    if len(evaluators) == 1:
+        return evaluators[0]
+    children = tuple(evaluators)
+
+    def evaluate(response_data: dict[str, Any], bbi_statuses: dict[int, str]) -> bool:
+        for child in children:
+            if not child(response_data, bbi_statuses):
+                return False
+        return True
+
+    return evaluate
+
+
+def _any_of(evaluators: list[RuleEvaluator]) -> RuleEvaluator:
+    """At least one evaluator must be true (short-circuits on the first True)."""
+    if len(evaluators) == 1:
+        return evaluators[0]
+    children = tuple(evaluators)
+
+    def evaluate(response_data: dict[str, Any], bbi_statuses: dict[int, str]) -> bool:
+        for child in children:
+            if child(response_data, bbi_statuses):
+                return True
+        return False
+
+    return evaluate
+
+
+def _missing_field(field_id: str, response_data: dict[str, Any], strict: bool) -> bool:
+    """
+    Handle a missing field: raise in strict mode, otherwise evaluate to False.
+
+    In lenient mode an explicit null is treated as missing; in strict mode it is
+    passed on to the rule, which rejects or compares it like any other value.
+    """
+    if strict:
+        raise ValueError(
+            f"Field '{field_id}' not found in assessment data. "
+            f"Available fields: {list(response_data.keys())}"
+        )
+    logger.warning(f"Field '{field_id}' not found in response data or is null")
+    return False
+
+
+def _resolve_comparator(op: str) -> Callable[[Any, Any], bool]:
+    try:
+        return COMPARATORS[op]
+    except KeyError:
+        raise ValueError(f"Unknown operator: {op}")
+
+
+def _compile_percentage_threshold(rule: PercentageThresholdRule, strict: bool) -> RuleEvaluator:
+    """PERCENTAGE_THRESHOLD: numeric field compared against the threshold."""
+    field_id = rule.field_id
+    compare = _resolve_comparator(rule.operator)
+    threshold = rule.threshold
+
+    def evaluate(response_data: dict[str, Any], bbi_statuses: dict[int, str]) -> bool:
+        field_value = response_data.get(field_id, _MISSING)
+        if field_value is _MISSING or (field_value is None and not strict):
+            return _missing_field(field_id, response_data, strict)
+        try:
+            numeric_value = float(field_value)
+        except (TypeError, ValueError):
+            if strict:
+                raise ValueError(f"Field '{field_id}' has non-numeric value: {field_value}")
+            logger.error(f"Field '{field_id}' value '{field_value}' is not numeric")
+            return False
+        return compare(numeric_value, threshold)
+
+    return evaluate
+
+
+def _compile_count_threshold(rule: CountThresholdRule, strict: bool) -> RuleEvaluator:
+    """
+    COUNT_THRESHOLD: number of selected checkboxes compared against the threshold.
+
+    Lists count their items. In lenient mode dicts count their True values and
+    numbers are treated as an existing count; strict mode accepts only lists.
+    """
+    field_id = rule.field_id
+    compare = _resolve_comparator(rule.operator)
+    threshold = rule.threshold
+
+    def evaluate(response_data: dict[str, Any], bbi_statuses: dict[int, str]) -> bool:
+        field_value = response_data.get(field_id, _MISSING)
+        if field_value is _MISSING or (field_value is None and not strict):
+            return _missing_field(field_id, response_data, strict)
+        if isinstance(field_value, list):
+            count = len(field_value)
+        elif isinstance(field_value, dict) and not strict:
+            count = sum(1 for v in field_value.values() if v is True)
+        elif isinstance(field_value, (int, float)) and not strict:
+            count = int(field_value)
+        else:
+            if strict:
+                raise ValueError(
+                    f"Field '{field_id}' expected list for checkbox count, "
+                    f"got {type(field_value).__name__}: {field_value}"
+                )
+            logger.error(f"Field '{field_id}' value is not a valid count type: {type(field_value)}")
+            return False
+        return compare(count, threshold)
+
+    return evaluate
+
+
+def _compile_match_value(rule: MatchValueRule, strict: bool) -> RuleEvaluator:
+    """MATCH_VALUE: ==, !=, contains and not_contains (for strings and lists)."""
+    field_id = rule.field_id
+    expected = rule.expected_value
+    expected_str = str(expected)
+    op = rule.operator
+
+    if op not in MATCH_OPERATORS:
+        raise ValueError(f"Unknown operator: {op}")
+
+    def evaluate(response_data: dict[str, Any], bbi_statuses: dict[int, str]) -> bool:
+        field_value = response_data.get(field_id, _MISSING)
+        if field_value is _MISSING or (field_value is None and not strict):
+            return _missing_field(field_id, response_data, strict)
+        if op == "==":
+            return field_value == expected
+        if op == "!=":
+            return field_value != expected
+        if isinstance(field_value, str):
+            contained = expected_str in field_value
+        elif isinstance(field_value, list):
+            contained = expected in field_value
+        else:
+            # Non-container values never "contain" the expected value
+            return op == "not_contains"
+        return contained if op == "contains" else not contained
+
+    return evaluate
+
+
+def _compile_bbi_functionality_check(rule: BBIFunctionalityCheckRule) -> RuleEvaluator:
+    """BBI_FUNCTIONALITY_CHECK: BBI status must equal the expected status."""
+    bbi_id = rule.bbi_id
+    expected_status = rule.expected_status
+    override_key = f"bbi_{bbi_id}_status"
+
+    def evaluate(response_data: dict[str, Any], bbi_statuses: dict[int, str]) -> bool:
+        bbi_status = bbi_statuses.get(bbi_id)
+        if bbi_status is None:
+            bbi_status = response_data.get(override_key)
+        if bbi_status is None:
+            logger.warning(f"BBI ID {bbi_id} not found in BBI statuses")
+            return False
+        return bbi_status == expected_status
+
+    return evaluate
@@ -134,6 +134,7 @@ class ComplianceValidationService:
                 calculation_schema=indicator.calculation_schema,
                 response_data=response.response_data,
                 bbi_statuses=bbi_statuses or {},
+                indicator_id=indicator.id,
             )
 
             # Generate remark
@@ -367,6 +368,7 @@ class ComplianceValidationService:
                         calculation_schema=indicator.calculation_schema,
                         response_data=response.response_data,
                         bbi_statuses=bbi_statuses or {},
+                        indicator_id=indicator.id,
                     )
 
                     # Generate remark
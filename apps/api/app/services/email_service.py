@@ -3,15 +3,33 @@
 
 import logging
 import smtplib
+import threading
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any
+from typing import Any, NamedTuple
 
 from app.core.config import settings
 from app.db.enums import NotificationType
 
 logger = logging.getLogger(__name__)
 
+# Seconds a pooled SMTP connection may sit idle before it is reopened
+# (most servers drop idle sessions after a few minutes)
+SMTP_IDLE_TIMEOUT = 60
+
+# Socket timeout for SMTP connections, in seconds
+SMTP_TIMEOUT = 30
+
+
+class OutgoingEmail(NamedTuple):
+    """An email to send with EmailService.send_emails."""
+
+    to_email: str
+    subject: str
+    body_html: str
+    body_text: str | None = None
+
 
 class EmailService:
     """
@@ -20,6 +38,7 @@ class EmailService:
     Uses existing SMTP configuration from settings.
     Gracefully handles missing configuration - notifications
     still work via in-app storage even if email is not configured.
+    Keeps one SMTP connection open per worker process and reuses it.
     """
 
     def __init__(self):
@@ -31,6 +50,11 @@ class EmailService:
         self.from_email = settings.EMAILS_FROM_EMAIL
         self.from_name = settings.EMAILS_FROM_NAME or "SINAG Notifications"
 
+        # Pooled SMTP connection, one per worker process (see send_emails)
+        self._connection: smtplib.SMTP | None = None
+        self._connection_used_at = 0.0
+        self._connection_lock = threading.Lock()
+
     def is_configured(self) -> bool:
         """
         Check if SMTP is properly configured.
@@ -67,49 +91,140 @@ class EmailService:
         Returns:
             Dict with success status and optional error message
         """
+        return self.send_emails([OutgoingEmail(to_email, subject, body_html, body_text)])[0]
+
+    def send_emails(self, emails: list[OutgoingEmail]) -> list[dict[str, Any]]:
+        """
+        Send a batch of emails over the worker's pooled SMTP connection.
+
+        PERFORMANCE: The connection (TCP + STARTTLS + login) is opened once per worker
+        process and reused across batches until it has been idle for SMTP_IDLE_TIMEOUT,
+        instead of one handshake per recipient. A connection that drops mid-batch is
+        reopened once and the rest of the batch continues on it.
+
+        Args:
+            emails: Emails to send
+
+        Returns:
+            One result dict per email, in order: {"success": True} or
+            {"success": False, "error": ...}. Failures caused by the SMTP server being
+            unreachable also carry "retryable": True so the caller can retry them later.
+        """
         if not self.is_configured():
             logger.warning("SMTP not configured, skipping email send")
-            return {"success": False, "error": "SMTP not configured", "skipped": True}
+            return [
+                {"success": False, "error": "SMTP not configured", "skipped": True} for _ in emails
+            ]
 
+        results: list[dict[str, Any]] = []
+        with self._connection_lock:
+            reconnected = False
+            # Set when the rest of the batch cannot be sent (server down, bad credentials)
+            batch_failure: dict[str, Any] | None = None
+
+            for email in emails:
+                if batch_failure is not None:
+                    results.append(dict(batch_failure))
+                    continue
+                try:
+                    message = self._build_message(email)
+                except Exception as e:
+                    logger.error(f"Failed to build email to {email.to_email}: {e}")
+                    results.append({"success": False, "error": str(e)})
+                    continue
+
+                while True:
+                    connection_error: Exception | None = None
+                    try:
+                        self._get_connection().sendmail(self.from_email, email.to_email, message)
+                        self._connection_used_at = time.monotonic()
+                        logger.info(f"Email sent successfully to {email.to_email}")
+                        results.append({"success": True})
+                    except smtplib.SMTPAuthenticationError as e:
+                        logger.error(f"SMTP authentication failed: {e}")
+                        self.close()
+                        batch_failure = {"success": False, "error": "SMTP authentication failed"}
+                        results.append(dict(batch_failure))
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError) as e:
+                        # Rejected message: the connection itself is still usable
+                        logger.error(f"SMTP error: {e}")
+                        results.append({"success": False, "error": str(e)})
+                    except smtplib.SMTPServerDisconnected as e:
+                        connection_error = e
+                    except smtplib.SMTPException as e:
+                        logger.error(f"SMTP error: {e}")
+                        self.close()
+                        results.append({"success": False, "error": str(e)})
+                    except OSError as e:
+                        connection_error = e
+
+                    if connection_error is not None:
+                        self.close()
+                        if not reconnected:
+                            reconnected = True
+                            continue
+                        logger.error(f"SMTP server unavailable: {connection_error}")
+                        batch_failure = {
+                            "success": False,
+                            "error": str(connection_error),
+                            "retryable": True,
+                        }
+                        results.append(dict(batch_failure))
+                    break
+
+        return results
+
+    def close(self) -> None:
+        """Close the pooled SMTP connection, if open."""
+        server, self._connection = self._connection, None
+        if server is None:
+            return
         try:
-            # Create message
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = f"{self.from_name} <{self.from_email}>"
-            msg["To"] = to_email
-
-            # Add plain text part (fallback)
-            if body_text:
-                part1 = MIMEText(body_text, "plain")
-                msg.attach(part1)
-
-            # Add HTML part
-            part2 = MIMEText(body_html, "html")
-            msg.attach(part2)
-
-            # Send email
-            if self.smtp_tls:
-                server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-                server.starttls()
-            else:
-                server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port)
-
-            server.login(self.smtp_user, self.smtp_password)
-            server.sendmail(self.from_email, to_email, msg.as_string())
             server.quit()
-
-            logger.info(f"Email sent successfully to {to_email}")
-            return {"success": True}
-
-        except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP authentication failed: {e}")
-            return {"success": False, "error": "SMTP authentication failed"}
-        except smtplib.SMTPException as e:
-            logger.error(f"SMTP error: {e}")
-            return {"success": False, "error": str(e)}
-        except Exception as e:
-            logger.error(f"Failed to send email: {e}")
-            return {"success": False, "error": str(e)}
+        except Exception:
+            server.close()
+
+    def _get_connection(self) -> smtplib.SMTP:
+        """Pooled SMTP connection, (re)opened when missing or idle too long."""
+        if (
+            self._connection is not None
+            and time.monotonic() - self._connection_used_at > SMTP_IDLE_TIMEOUT
+        ):
+            # Servers drop idle sessions; reconnect instead of failing the next send
+            self.close()
+        if self._connection is None:
+            server = self._connect()
+            try:
+                server.login(self.smtp_user, self.smtp_password)
+            except Exception:
+                server.close()
+                raise
+            self._connection = server
+            self._connection_used_at = time.monotonic()
+        return self._connection
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP session (STARTTLS or implicit TLS, per SMTP_TLS)."""
+        if self.smtp_tls:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=SMTP_TIMEOUT)
+            server.starttls()
+            return server
+        return smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=SMTP_TIMEOUT)
+
+    def _build_message(self, email: OutgoingEmail) -> str:
+        """Render an email as a multipart/alternative MIME message."""
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = email.subject
+        msg["From"] = f"{self.from_name} <{self.from_email}>"
+        msg["To"] = email.to_email
+
+        # Add plain text part (fallback)
+        if email.body_text:
+            msg.attach(MIMEText(email.body_text, "plain"))
+
+        # Add HTML part
+        msg.attach(MIMEText(email.body_html, "html"))
+        return msg.as_string()
 
     def build_notification_email(
         self,
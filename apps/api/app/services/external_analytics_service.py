@@ -4,13 +4,18 @@
 
 import logging
 
-from sqlalchemy import case, func
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
-from app.core.cache import CACHE_TTL_EXTERNAL_ANALYTICS, cache
+from app.core.cache import CACHE_TTL_EXTERNAL_ANALYTICS, assessment_year_tag, cache
 from app.core.year_resolver import get_year_resolver
-from app.db.enums import AssessmentStatus, ComplianceStatus, ValidationStatus
-from app.db.models.assessment import Assessment, AssessmentResponse
+from app.db.enums import AssessmentStatus, ComplianceStatus
+from app.db.models.analytics_rollup import (
+    AnalyticsAreaRollup,
+    AnalyticsIndicatorRollup,
+    AnalyticsYearRollup,
+)
+from app.db.models.assessment import Assessment
 from app.db.models.barangay import Barangay
 from app.db.models.bbi import BBI, BBIResult
 from app.db.models.governance_area import GovernanceArea, Indicator
@@ -34,6 +39,9 @@ logger = logging.getLogger(__name__)
 # Minimum number of barangays required for data to be shown (privacy threshold)
 MINIMUM_AGGREGATION_THRESHOLD = 5
 
+# Rollup statuses counted as finalized (COMPLETED is new workflow, VALIDATED is legacy)
+FINALIZED_STATUS_VALUES = [AssessmentStatus.COMPLETED.value, AssessmentStatus.VALIDATED.value]
+
 
 class ExternalAnalyticsService:
     """
@@ -47,6 +55,15 @@ class ExternalAnalyticsService:
     - AI insights are generalized across multiple assessments
     """
 
+    def _parse_cycle_year(self, assessment_cycle: str | None) -> int | None:
+        """Treat assessment_cycle as a year; invalid values mean no year filter."""
+        if not assessment_cycle:
+            return None
+        try:
+            return int(assessment_cycle)
+        except (ValueError, TypeError):
+            return None
+
     def _log_export_audit(
         self,
         export_type: str,
@@ -149,22 +166,18 @@ class ExternalAnalyticsService:
         Raises:
             ValueError: If fewer than minimum threshold barangays assessed
         """
-        # Query for completed assessments (COMPLETED is new workflow, VALIDATED is legacy)
-        query = db.query(Assessment).filter(
-            Assessment.status.in_([AssessmentStatus.COMPLETED, AssessmentStatus.VALIDATED])
-        )
+        # Read finalized assessment counts (COMPLETED is new workflow, VALIDATED is legacy)
+        query = db.query(
+            func.coalesce(func.sum(AnalyticsYearRollup.assessment_count), 0),
+            func.coalesce(func.sum(AnalyticsYearRollup.passed_count), 0),
+        ).filter(AnalyticsYearRollup.status.in_(FINALIZED_STATUS_VALUES))
 
         # Apply year filter if specified (assessment_cycle parameter is treated as year)
-        if assessment_cycle:
-            try:
-                year = int(assessment_cycle)
-                query = query.filter(Assessment.assessment_year == year)
-            except (ValueError, TypeError):
-                pass  # Ignore invalid year filter
-
-        assessments = query.all()
+        year = self._parse_cycle_year(assessment_cycle)
+        if year is not None:
+            query = query.filter(AnalyticsYearRollup.assessment_year == year)
 
-        total_barangays = len(assessments)
+        total_barangays, passed_count = (int(value) for value in query.one())
 
         # Enforce minimum aggregation threshold
         if total_barangays < MINIMUM_AGGREGATION_THRESHOLD:
@@ -173,10 +186,7 @@ class ExternalAnalyticsService:
                 f"only {total_barangays} available."
             )
 
-        # Count passed/failed
-        passed_count = sum(
-            1 for a in assessments if a.final_compliance_status == ComplianceStatus.PASSED
-        )
+        # Count failed (anything not PASSED)
         failed_count = total_barangays - passed_count
 
         pass_percentage = (passed_count / total_barangays * 100) if total_barangays > 0 else 0.0
@@ -208,76 +218,43 @@ class ExternalAnalyticsService:
         Returns:
             GovernanceAreaPerformanceResponse with area-level aggregated data
         """
+        year = self._parse_cycle_year(assessment_cycle)
+
         # Get all governance areas
         governance_areas = db.query(GovernanceArea).all()
 
-        area_performances = []
-
-        for area in governance_areas:
-            # Get all indicators for this governance area
-            indicators_in_area = (
-                db.query(Indicator)
-                .filter(Indicator.governance_area_id == area.id, Indicator.is_active == True)
-                .all()
-            )
-
-            if not indicators_in_area:
-                continue
-
-            # Get all assessment responses for indicators in this area
-            indicator_ids = [ind.id for ind in indicators_in_area]
+        # Active indicators per area
+        active_indicator_counts = dict(
+            db.query(Indicator.governance_area_id, func.count(Indicator.id))
+            .filter(Indicator.is_active == True)
+            .group_by(Indicator.governance_area_id)
+            .all()
+        )
 
-            query = db.query(AssessmentResponse).filter(
-                AssessmentResponse.indicator_id.in_(indicator_ids)
+        # A barangay passes an area if ALL its validated indicators passed,
+        # pre-aggregated per year from finalized assessments
+        area_query = db.query(
+            AnalyticsAreaRollup.governance_area_id,
+            func.sum(AnalyticsAreaRollup.passed_count),
+            func.sum(AnalyticsAreaRollup.failed_count),
+        ).filter(AnalyticsAreaRollup.status.in_(FINALIZED_STATUS_VALUES))
+        if year is not None:
+            area_query = area_query.filter(AnalyticsAreaRollup.assessment_year == year)
+        area_counts = {
+            area_id: (int(passed), int(failed))
+            for area_id, passed, failed in area_query.group_by(
+                AnalyticsAreaRollup.governance_area_id
             )
+        }
 
-            if assessment_cycle:
-                try:
-                    year = int(assessment_cycle)
-                    query = query.join(Assessment).filter(
-                        Assessment.assessment_year == year,
-                        Assessment.status.in_(
-                            [AssessmentStatus.COMPLETED, AssessmentStatus.VALIDATED]
-                        ),
-                    )
-                except (ValueError, TypeError):
-                    query = query.join(Assessment).filter(
-                        Assessment.status.in_(
-                            [AssessmentStatus.COMPLETED, AssessmentStatus.VALIDATED]
-                        )
-                    )
-            else:
-                query = query.join(Assessment).filter(
-                    Assessment.status.in_([AssessmentStatus.COMPLETED, AssessmentStatus.VALIDATED])
-                )
-
-            responses = query.all()
+        area_performances = []
 
-            if not responses:
+        for area in governance_areas:
+            indicator_count = active_indicator_counts.get(area.id, 0)
+            if not indicator_count:
                 continue
 
-            # Group responses by assessment_id to count barangays
-            assessments_responses = {}
-            for r in responses:
-                if r.assessment_id not in assessments_responses:
-                    assessments_responses[r.assessment_id] = []
-                assessments_responses[r.assessment_id].append(r)
-
-            # Count how many barangays passed/failed this governance area
-            passed_count = 0
-            failed_count = 0
-
-            for assessment_id, assessment_responses in assessments_responses.items():
-                # A barangay passes the area if ALL indicators in the area passed
-                all_passed = all(
-                    r.validation_status in [ValidationStatus.PASS, ValidationStatus.CONDITIONAL]
-                    for r in assessment_responses
-                )
-                if all_passed:
-                    passed_count += 1
-                else:
-                    failed_count += 1
-
+            passed_count, failed_count = area_counts.get(area.id, (0, 0))
             total_assessed = passed_count + failed_count
 
             if total_assessed == 0:
@@ -286,13 +263,6 @@ class ExternalAnalyticsService:
             pass_percentage = (passed_count / total_assessed * 100) if total_assessed > 0 else 0.0
             fail_percentage = (failed_count / total_assessed * 100) if total_assessed > 0 else 0.0
 
-            # Get indicator breakdown for this area
-            indicators = (
-                db.query(Indicator)
-                .filter(Indicator.governance_area_id == area.id, Indicator.is_active == True)
-                .all()
-            )
-
             indicator_breakdown = self._get_indicator_breakdown(db, area.id, assessment_cycle)
 
             area_performances.append(
@@ -305,7 +275,7 @@ class ExternalAnalyticsService:
                     failed_count=failed_count,
                     pass_percentage=round(pass_percentage, 2),
                     fail_percentage=round(fail_percentage, 2),
-                    indicator_count=len(indicators),
+                    indicator_count=indicator_count,
                     indicators_breakdown=indicator_breakdown,
                 )
             )
@@ -331,65 +301,38 @@ class ExternalAnalyticsService:
         Returns:
             List of dicts with indicator code and pass percentage
         """
-        indicators = (
-            db.query(Indicator)
+        # Passed = validation_status is PASS or CONDITIONAL
+        passed = func.sum(AnalyticsIndicatorRollup.met_count)
+        total = func.sum(AnalyticsIndicatorRollup.assessed_count)
+        query = (
+            db.query(Indicator.indicator_code, Indicator.name, passed, total)
+            .join(AnalyticsIndicatorRollup, AnalyticsIndicatorRollup.indicator_id == Indicator.id)
             .filter(
                 Indicator.governance_area_id == governance_area_id,
                 Indicator.is_active == True,
+                AnalyticsIndicatorRollup.status.in_(FINALIZED_STATUS_VALUES),
             )
-            .all()
         )
 
-        breakdown = []
-
-        for indicator in indicators:
-            # Query responses for this indicator
-            query = db.query(AssessmentResponse).filter(
-                AssessmentResponse.indicator_id == indicator.id
-            )
-
-            if assessment_cycle:
-                try:
-                    year = int(assessment_cycle)
-                    query = query.join(Assessment).filter(
-                        Assessment.assessment_year == year,
-                        Assessment.status.in_(
-                            [AssessmentStatus.COMPLETED, AssessmentStatus.VALIDATED]
-                        ),
-                    )
-                except (ValueError, TypeError):
-                    query = query.join(Assessment).filter(
-                        Assessment.status.in_(
-                            [AssessmentStatus.COMPLETED, AssessmentStatus.VALIDATED]
-                        )
-                    )
-            else:
-                query = query.join(Assessment).filter(
-                    Assessment.status.in_([AssessmentStatus.COMPLETED, AssessmentStatus.VALIDATED])
-                )
+        year = self._parse_cycle_year(assessment_cycle)
+        if year is not None:
+            query = query.filter(AnalyticsIndicatorRollup.assessment_year == year)
 
-            responses = query.all()
-
-            if len(responses) == 0:
+        breakdown = []
+        for indicator_code, indicator_name, passed_count, total_count in query.group_by(
+            Indicator.id, Indicator.indicator_code, Indicator.name
+        ).order_by(Indicator.id):
+            if not total_count:
                 continue
 
-            # Count passed responses
-            # Passed = validation_status is PASS or CONDITIONAL
-            passed_count = sum(
-                1
-                for r in responses
-                if r.validation_status in (ValidationStatus.PASS, ValidationStatus.CONDITIONAL)
-            )
-
-            total = len(responses)
-            pass_percentage = (passed_count / total * 100) if total > 0 else 0.0
+            pass_percentage = (passed_count / total_count * 100) if total_count > 0 else 0.0
 
             breakdown.append(
                 {
-                    "indicator_code": indicator.indicator_code,
-                    "indicator_name": indicator.name,
+                    "indicator_code": indicator_code,
+                    "indicator_name": indicator_name,
                     "pass_percentage": round(pass_percentage, 2),
-                    "total_assessed": total,
+                    "total_assessed": int(total_count),
                 }
             )
 
@@ -409,36 +352,26 @@ class ExternalAnalyticsService:
         Returns:
             TopFailingIndicatorsResponse with top failing indicators
         """
-        # Build query to count failures per indicator
+        # Read failure counts per indicator from the per-year rollup
+        failure_count = func.sum(AnalyticsIndicatorRollup.fail_count)
+        total_assessed = func.sum(AnalyticsIndicatorRollup.assessed_count)
         query = (
             db.query(
                 Indicator.id,
                 Indicator.indicator_code,
                 Indicator.name,
                 GovernanceArea.code,
-                func.count(AssessmentResponse.id).label("total_assessed"),
-                func.sum(
-                    case(
-                        (
-                            AssessmentResponse.validation_status == ValidationStatus.FAIL,
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("failure_count"),
+                total_assessed.label("total_assessed"),
+                failure_count.label("failure_count"),
             )
-            .join(AssessmentResponse, AssessmentResponse.indicator_id == Indicator.id)
-            .join(Assessment, Assessment.id == AssessmentResponse.assessment_id)
+            .join(AnalyticsIndicatorRollup, AnalyticsIndicatorRollup.indicator_id == Indicator.id)
             .join(GovernanceArea, GovernanceArea.id == Indicator.governance_area_id)
-            .filter(Assessment.status.in_([AssessmentStatus.COMPLETED, AssessmentStatus.VALIDATED]))
+            .filter(AnalyticsIndicatorRollup.status.in_(FINALIZED_STATUS_VALUES))
         )
 
-        if assessment_cycle:
-            try:
-                year = int(assessment_cycle)
-                query = query.filter(Assessment.assessment_year == year)
-            except (ValueError, TypeError):
-                pass  # Ignore invalid year filter
+        year = self._parse_cycle_year(assessment_cycle)
+        if year is not None:
+            query = query.filter(AnalyticsIndicatorRollup.assessment_year == year)
 
         # Group by indicator and order by failure count
         results = (
@@ -448,17 +381,8 @@ class ExternalAnalyticsService:
                 Indicator.name,
                 GovernanceArea.code,
             )
-            .order_by(
-                func.sum(
-                    case(
-                        (
-                            AssessmentResponse.validation_status == ValidationStatus.FAIL,
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).desc()
-            )
+            .having(total_assessed > 0)
+            .order_by(failure_count.desc(), Indicator.id)
             .limit(limit)
             .all()
         )
@@ -821,6 +745,12 @@ class ExternalAnalyticsService:
                 break
         return result
 
+    def dashboard_cache_key(self, assessment_cycle: str | None) -> str:
+        """Cache key of get_complete_dashboard for a cycle."""
+        return cache._generate_cache_key(
+            prefix="external_dashboard", assessment_cycle=assessment_cycle or "latest"
+        )
+
     def get_complete_dashboard(
         self, db: Session, assessment_cycle: str | None = None
     ) -> ExternalAnalyticsDashboardResponse:
@@ -843,20 +773,34 @@ class ExternalAnalyticsService:
             f"Generating external analytics dashboard (cycle: {assessment_cycle or 'latest'})"
         )
 
-        # Build cache key
-        cache_key = cache._generate_cache_key(
-            prefix="external_dashboard", assessment_cycle=assessment_cycle or "latest"
+        cache_key = self.dashboard_cache_key(assessment_cycle)
+
+        # Single-flight recomputation with stale-while-revalidate (see CACHE_POLICIES):
+        # an expiring dashboard is recomputed by one request, not every concurrent one
+        computed: list[ExternalAnalyticsDashboardResponse] = []
+
+        def compute_dashboard() -> dict:
+            dashboard = self._build_complete_dashboard(db, assessment_cycle)
+            computed.append(dashboard)
+            return dashboard.model_dump()
+
+        dashboard_data = cache.get_or_compute(
+            cache_key,
+            compute_dashboard,
+            ttl=CACHE_TTL_EXTERNAL_ANALYTICS,
+            tags=[assessment_year_tag(self._parse_cycle_year(assessment_cycle))],
         )
+        if computed:
+            return computed[0]
 
-        # Try to get from cache
-        if cache.is_available:
-            cached_result = cache.get(cache_key)
-            if cached_result:
-                logger.info("📦 Returning cached dashboard data")
-                # Reconstruct Pydantic model from cached dict
-                return ExternalAnalyticsDashboardResponse(**cached_result)
+        logger.info("📦 Returning cached dashboard data")
+        # Reconstruct Pydantic model from cached dict
+        return ExternalAnalyticsDashboardResponse(**dashboard_data)
 
-        # Cache miss - compute results
+    def _build_complete_dashboard(
+        self, db: Session, assessment_cycle: str | None
+    ) -> ExternalAnalyticsDashboardResponse:
+        """Compute every dashboard section (uncached)."""
         overall_compliance = self.get_overall_compliance(db, assessment_cycle)
         governance_area_performance = self.get_governance_area_performance(db, assessment_cycle)
         top_failing_indicators = self.get_top_failing_indicators(db, assessment_cycle)
@@ -885,11 +829,6 @@ class ExternalAnalyticsService:
             bbi_trends=bbi_trends,
         )
 
-        # Store in cache (convert to dict for JSON serialization)
-        if cache.is_available:
-            cache.set(cache_key, dashboard.model_dump(), ttl=CACHE_TTL_EXTERNAL_ANALYTICS)
-            logger.info(f"💾 Dashboard data cached for {CACHE_TTL_EXTERNAL_ANALYTICS}s")
-
         return dashboard
 
     def generate_csv_export(
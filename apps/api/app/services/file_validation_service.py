@@ -49,6 +49,16 @@ class FileValidationService:
         b"PK\x03\x04",  # ZIP archive (could contain malware, use with caution)
     ]
 
+    # Leading magic bytes of each allowed MIME type
+    MAGIC_SIGNATURES = {
+        "application/pdf": (b"%PDF-",),
+        "image/jpeg": (b"\xff\xd8\xff",),
+        "image/png": (b"\x89PNG\r\n\x1a\n",),
+    }
+
+    # Bytes needed to check every signature above
+    SIGNATURE_SNIFF_SIZE = 16
+
     def __init__(self):
         """Initialize the FileValidationService."""
         pass
@@ -119,6 +129,7 @@ class FileValidationService:
         Checks:
         - File extension matches declared MIME type
         - File does not contain executable signatures
+        - File magic bytes match declared MIME type
 
         Args:
             file: FastAPI UploadFile object
@@ -145,11 +156,31 @@ class FileValidationService:
                     error_code="EXTENSION_MISMATCH",
                 )
 
-        # Read first 8 bytes to check for executable signatures
+        # Sniff the leading bytes only; the rest of the file is never read here
         file.file.seek(0)
-        header = file.file.read(8)
+        header = file.file.read(self.SIGNATURE_SNIFF_SIZE)
         file.file.seek(0)  # Reset to beginning
 
+        return self.validate_file_signature(header, content_type)
+
+    def validate_file_signature(self, header: bytes, content_type: str | None) -> ValidationResult:
+        """
+        Check a file's leading bytes against its declared MIME type.
+
+        Used on the first chunk of a streamed upload, so the check never needs
+        the whole file in memory.
+
+        Checks:
+        - No executable signature
+        - Magic bytes match the declared type (for the types in MAGIC_SIGNATURES)
+
+        Args:
+            header: At least the first SIGNATURE_SNIFF_SIZE bytes of the file
+            content_type: Declared MIME type
+
+        Returns:
+            ValidationResult with success=True if valid, or error details if invalid
+        """
         for signature in self.EXECUTABLE_SIGNATURES:
             if header.startswith(signature):
                 return ValidationResult(
@@ -158,6 +189,14 @@ class FileValidationService:
                     error_code="SUSPICIOUS_CONTENT",
                 )
 
+        expected_signatures = self.MAGIC_SIGNATURES.get(content_type or "")
+        if expected_signatures and not header.startswith(expected_signatures):
+            return ValidationResult(
+                success=False,
+                error_message=f"File content does not match declared type '{content_type}'",
+                error_code="CONTENT_TYPE_MISMATCH",
+            )
+
         return ValidationResult(success=True)
 
     def validate_file(self, file: UploadFile) -> ValidationResult:
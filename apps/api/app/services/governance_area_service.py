@@ -11,6 +11,8 @@ from app.db.models.governance_area import GovernanceArea
 
 logger = logging.getLogger(__name__)
 
+GOVERNANCE_AREAS_CACHE_KEY = "lookup:governance_areas"
+
 
 class GovernanceAreaService:
     """Service for managing governance areas and initial data seeding."""
@@ -76,10 +78,10 @@ class GovernanceAreaService:
         """
         Get all governance areas.
 
-        PERFORMANCE: Results are cached in Redis for 1 hour since governance
+        PERFORMANCE: Results are cached (in-process L1 + Redis) for 1 hour since governance
         areas rarely change.
         """
-        cache_key = "lookup:governance_areas"
+        cache_key = GOVERNANCE_AREAS_CACHE_KEY
 
         # Try to get from cache first
         if cache.is_available:
@@ -20,6 +20,7 @@ from app.core.year_resolver import get_year_resolver
 from app.db.models.governance_area import GovernanceArea, Indicator, IndicatorHistory
 from app.schemas.calculation_schema import CalculationSchema
 from app.schemas.form_schema import FormSchema
+from app.services.calculation_engine_service import calculation_engine_service
 from app.services.form_schema_validator import (
     generate_validation_errors,
     validate_calculation_schema_field_references,
@@ -231,6 +232,27 @@ class IndicatorService:
 
         return indicators
 
+    def get_indicators_version(self, db: Session) -> tuple[Any, ...]:
+        """
+        Get a version stamp for the indicator catalogue, for ETags on list endpoints.
+
+        Changes whenever an indicator is created, updated or deleted, or a
+        governance area is added or removed. Timestamps are summed rather than
+        maxed so an update committed out of order still changes the stamp.
+
+        Returns:
+            Tuple of (indicator count, indicator timestamp sum, governance area count)
+        """
+        from sqlalchemy import extract, func
+
+        return tuple(
+            db.query(
+                db.query(func.count(Indicator.id)).scalar_subquery(),
+                db.query(func.sum(extract("epoch", Indicator.updated_at))).scalar_subquery(),
+                db.query(func.count(GovernanceArea.id)).scalar_subquery(),
+            ).one()
+        )
+
     def get_indicators_for_year(
         self,
         db: Session,
@@ -393,6 +415,10 @@ class IndicatorService:
         db.commit()
         db.refresh(indicator)
 
+        # Drop the compiled calculation schema so the next evaluation uses the edit
+        if "calculation_schema" in data:
+            calculation_engine_service.invalidate_indicator(indicator.id)
+
         logger.info(f"Updated indicator '{indicator.name}' (ID: {indicator.id})")
 
         return indicator
@@ -20,17 +20,12 @@ from app.core.config import settings
 from app.db.enums import ComplianceStatus, ValidationStatus
 from app.db.models.assessment import Assessment, AssessmentResponse
 from app.db.models.governance_area import GovernanceArea, Indicator
-from app.schemas.calculation_schema import (
-    AndAllRule,
-    BBIFunctionalityCheckRule,
-    CalculationRule,
-    CalculationSchema,
-    ConditionGroup,
-    CountThresholdRule,
-    MatchValueRule,
-    OrAnyRule,
-    PercentageThresholdRule,
+from app.schemas.calculation_schema import CalculationRule, CalculationSchema, ConditionGroup
+from app.services.calculation_engine_service import (
+    CalculationEngineError,
+    calculation_engine_service,
 )
+from app.services.calculation_rule_engine import compile_condition_group, compile_rule
 
 # ========================================
 # OBSERVABILITY METRICS (Prometheus)
@@ -764,15 +759,16 @@ class IntelligenceService:
 
     def evaluate_rule(self, rule: CalculationRule, assessment_data: dict[str, Any]) -> bool:
         """
-        Recursively evaluate a calculation rule against assessment data.
+        Evaluate a calculation rule against assessment data.
 
-        This is the core evaluation engine that handles all 6 rule types:
+        Delegates to the shared calculation rule engine in strict mode, which
+        handles all 6 rule types:
         - AND_ALL: All nested conditions must be true
         - OR_ANY: At least one nested condition must be true
         - PERCENTAGE_THRESHOLD: Number field comparison
         - COUNT_THRESHOLD: Checkbox count comparison
         - MATCH_VALUE: Field value matching
-        - BBI_FUNCTIONALITY_CHECK: BBI status check (placeholder)
+        - BBI_FUNCTIONALITY_CHECK: BBI status check (via bbi_<id>_status in assessment_data)
 
         Args:
             rule: The calculation rule to evaluate (discriminated union type)
@@ -785,245 +781,7 @@ class IntelligenceService:
         Raises:
             ValueError: If rule type is unknown or field_id not found in data
         """
-        # Handle AND_ALL rule: all conditions must be true
-        if isinstance(rule, AndAllRule):
-            return self._evaluate_and_all_rule(rule, assessment_data)
-
-        # Handle OR_ANY rule: at least one condition must be true
-        elif isinstance(rule, OrAnyRule):
-            return self._evaluate_or_any_rule(rule, assessment_data)
-
-        # Handle PERCENTAGE_THRESHOLD rule: number field comparison
-        elif isinstance(rule, PercentageThresholdRule):
-            return self._evaluate_percentage_threshold_rule(rule, assessment_data)
-
-        # Handle COUNT_THRESHOLD rule: checkbox count comparison
-        elif isinstance(rule, CountThresholdRule):
-            return self._evaluate_count_threshold_rule(rule, assessment_data)
-
-        # Handle MATCH_VALUE rule: field value matching
-        elif isinstance(rule, MatchValueRule):
-            return self._evaluate_match_value_rule(rule, assessment_data)
-
-        # Handle BBI_FUNCTIONALITY_CHECK rule: BBI status check
-        elif isinstance(rule, BBIFunctionalityCheckRule):
-            return self._evaluate_bbi_functionality_check_rule(rule, assessment_data)
-
-        else:
-            raise ValueError(f"Unknown rule type: {type(rule).__name__}")
-
-    def _evaluate_and_all_rule(self, rule: AndAllRule, assessment_data: dict[str, Any]) -> bool:
-        """
-        Evaluate AND_ALL rule: all nested conditions must be true.
-
-        Args:
-            rule: The AndAllRule instance
-            assessment_data: Dictionary containing assessment response data
-
-        Returns:
-            True if all conditions evaluate to true, False otherwise
-        """
-        for condition in rule.conditions:
-            if not self.evaluate_rule(condition, assessment_data):
-                return False
-        return True
-
-    def _evaluate_or_any_rule(self, rule: OrAnyRule, assessment_data: dict[str, Any]) -> bool:
-        """
-        Evaluate OR_ANY rule: at least one nested condition must be true.
-
-        Args:
-            rule: The OrAnyRule instance
-            assessment_data: Dictionary containing assessment response data
-
-        Returns:
-            True if at least one condition evaluates to true, False otherwise
-        """
-        for condition in rule.conditions:
-            if self.evaluate_rule(condition, assessment_data):
-                return True
-        return False
-
-    def _evaluate_percentage_threshold_rule(
-        self, rule: PercentageThresholdRule, assessment_data: dict[str, Any]
-    ) -> bool:
-        """
-        Evaluate PERCENTAGE_THRESHOLD rule: check if number field meets threshold.
-
-        Args:
-            rule: The PercentageThresholdRule instance
-            assessment_data: Dictionary containing assessment response data
-
-        Returns:
-            True if the field value meets the threshold condition, False otherwise
-
-        Raises:
-            ValueError: If field_id not found in assessment_data or value is not numeric
-        """
-        if rule.field_id not in assessment_data:
-            raise ValueError(
-                f"Field '{rule.field_id}' not found in assessment data. "
-                f"Available fields: {list(assessment_data.keys())}"
-            )
-
-        field_value = assessment_data[rule.field_id]
-
-        # Ensure field value is numeric
-        try:
-            numeric_value = float(field_value)
-        except (TypeError, ValueError):
-            raise ValueError(f"Field '{rule.field_id}' has non-numeric value: {field_value}")
-
-        # Apply the comparison operator
-        if rule.operator == ">=":
-            return numeric_value >= rule.threshold
-        elif rule.operator == ">":
-            return numeric_value > rule.threshold
-        elif rule.operator == "<=":
-            return numeric_value <= rule.threshold
-        elif rule.operator == "<":
-            return numeric_value < rule.threshold
-        elif rule.operator == "==":
-            return numeric_value == rule.threshold
-        else:
-            raise ValueError(f"Unknown operator: {rule.operator}")
-
-    def _evaluate_count_threshold_rule(
-        self, rule: CountThresholdRule, assessment_data: dict[str, Any]
-    ) -> bool:
-        """
-        Evaluate COUNT_THRESHOLD rule: check if checkbox count meets threshold.
-
-        Expects field value to be a list of selected checkbox values.
-
-        Args:
-            rule: The CountThresholdRule instance
-            assessment_data: Dictionary containing assessment response data
-                            Field value should be a list: ["value1", "value2", ...]
-
-        Returns:
-            True if the count of selected checkboxes meets the threshold, False otherwise
-
-        Raises:
-            ValueError: If field_id not found or value is not a list
-        """
-        if rule.field_id not in assessment_data:
-            raise ValueError(
-                f"Field '{rule.field_id}' not found in assessment data. "
-                f"Available fields: {list(assessment_data.keys())}"
-            )
-
-        field_value = assessment_data[rule.field_id]
-
-        # Ensure field value is a list (for checkbox groups)
-        if not isinstance(field_value, list):
-            raise ValueError(
-                f"Field '{rule.field_id}' expected list for checkbox count, "
-                f"got {type(field_value).__name__}: {field_value}"
-            )
-
-        count = len(field_value)
-
-        # Apply the comparison operator
-        if rule.operator == ">=":
-            return count >= rule.threshold
-        elif rule.operator == ">":
-            return count > rule.threshold
-        elif rule.operator == "<=":
-            return count <= rule.threshold
-        elif rule.operator == "<":
-            return count < rule.threshold
-        elif rule.operator == "==":
-            return count == rule.threshold
-        else:
-            raise ValueError(f"Unknown operator: {rule.operator}")
-
-    def _evaluate_match_value_rule(
-        self, rule: MatchValueRule, assessment_data: dict[str, Any]
-    ) -> bool:
-        """
-        Evaluate MATCH_VALUE rule: check if field value matches expected value.
-
-        Supports multiple operators: ==, !=, contains, not_contains
-
-        Args:
-            rule: The MatchValueRule instance
-            assessment_data: Dictionary containing assessment response data
-
-        Returns:
-            True if the field value matches the condition, False otherwise
-
-        Raises:
-            ValueError: If field_id not found in assessment_data
-        """
-        if rule.field_id not in assessment_data:
-            raise ValueError(
-                f"Field '{rule.field_id}' not found in assessment data. "
-                f"Available fields: {list(assessment_data.keys())}"
-            )
-
-        field_value = assessment_data[rule.field_id]
-
-        # Apply the comparison operator
-        if rule.operator == "==":
-            return field_value == rule.expected_value
-        elif rule.operator == "!=":
-            return field_value != rule.expected_value
-        elif rule.operator == "contains":
-            # For string values
-            if isinstance(field_value, str):
-                return str(rule.expected_value) in field_value
-            # For list values (checkbox groups)
-            elif isinstance(field_value, list):
-                return rule.expected_value in field_value
-            else:
-                return False
-        elif rule.operator == "not_contains":
-            # For string values
-            if isinstance(field_value, str):
-                return str(rule.expected_value) not in field_value
-            # For list values (checkbox groups)
-            elif isinstance(field_value, list):
-                return rule.expected_value not in field_value
-            else:
-                return True
-        else:
-            raise ValueError(f"Unknown operator: {rule.operator}")
-
-    def _evaluate_bbi_functionality_check_rule(
-        self, rule: BBIFunctionalityCheckRule, assessment_data: dict[str, Any]
-    ) -> bool:
-        """
-        Evaluate BBI_FUNCTIONALITY_CHECK rule: check if BBI is Functional.
-
-        This is a placeholder for Epic 4 BBI integration.
-        Currently returns False as BBI data is not yet available.
-
-        Args:
-            rule: The BBIFunctionalityCheckRule instance
-            assessment_data: Dictionary containing assessment response data
-
-        Returns:
-            Boolean indicating if BBI meets expected status
-
-        Note:
-            In Epic 4, this will query the BBI database table to check status.
-            For now, it returns False to indicate the feature is not yet implemented.
-        """
-        # TODO: Epic 4 - Implement BBI database query
-        # Expected implementation:
-        # 1. Query BBI table by bbi_id
-        # 2. Check if BBI status matches expected_status
-        # 3. Return comparison result
-
-        # Placeholder: Check if assessment_data has BBI status override
-        bbi_key = f"bbi_{rule.bbi_id}_status"
-        if bbi_key in assessment_data:
-            actual_status = assessment_data[bbi_key]
-            return actual_status == rule.expected_status
-
-        # Default: return False (feature not yet implemented)
-        return False
+        return compile_rule(rule, strict=True)(assessment_data, {})
 
     def evaluate_calculation_schema(
         self,
@@ -1043,11 +801,11 @@ class IntelligenceService:
         Returns:
             True if all condition groups pass (Pass status), False otherwise (Fail status)
         """
-        # Evaluate all condition groups (implicit AND between groups)
-        for group in calculation_schema.condition_groups:
-            if not self._evaluate_condition_group(group, assessment_data):
-                return False
-        return True
+        # Compiled once per distinct schema, in the cache shared with CalculationEngineService
+        compiled = calculation_engine_service.compile_schema(
+            calculation_schema.model_dump(mode="json"), strict=True
+        )
+        return compiled.evaluate(assessment_data, {})
 
     def evaluate_indicator_calculation(
         self,
@@ -1060,7 +818,8 @@ class IntelligenceService:
 
         This is the main entry point for automatic Pass/Fail calculation during
         the assessment workflow. It checks the is_auto_calculable flag and only
-        evaluates if the flag is true.
+        evaluates if the flag is true. The compiled schema is shared with
+        CalculationEngineService and reused until the indicator is edited.
 
         Args:
             db: Database session
@@ -1068,7 +827,7 @@ class IntelligenceService:
             assessment_data: Dictionary containing assessment response data
 
         Returns:
-            "Pass" or "Fail" if is_auto_calculable is True and calculation succeeds,
+            "PASS" or "FAIL" if is_auto_calculable is True and calculation succeeds,
             None if is_auto_calculable is False or calculation_schema is not defined
 
         Raises:
@@ -1092,23 +851,16 @@ class IntelligenceService:
             )
             return None
 
-        # Parse calculation_schema
+        # Parse and compile calculation_schema (cached per indicator)
         try:
-            calculation_schema = CalculationSchema(**indicator.calculation_schema)
-        except Exception as e:
+            compiled = calculation_engine_service.compile_schema(
+                indicator.calculation_schema, indicator_id=indicator_id, strict=True
+            )
+        except CalculationEngineError as e:
             raise ValueError(f"Invalid calculation_schema for indicator {indicator_id}: {str(e)}")
 
-        # Evaluate the schema
-        evaluation_result = self.evaluate_calculation_schema(
-            calculation_schema=calculation_schema,
-            assessment_data=assessment_data,
-        )
-
-        # Return status based on evaluation result
-        if evaluation_result:
-            return calculation_schema.output_status_on_pass
-        else:
-            return calculation_schema.output_status_on_fail
+        # Evaluate the schema and return the configured output status
+        return compiled.execute(assessment_data).value
 
     def calculate_indicator_status(
         self,
@@ -1136,20 +888,7 @@ class IntelligenceService:
         Returns:
             True if the group evaluates to true based on its operator, False otherwise
         """
-        if group.operator == "AND":
-            # All rules in the group must be true
-            for rule in group.rules:
-                if not self.evaluate_rule(rule, assessment_data):
-                    return False
-            return True
-        elif group.operator == "OR":
-            # At least one rule in the group must be true
-            for rule in group.rules:
-                if self.evaluate_rule(rule, assessment_data):
-                    return True
-            return False
-        else:
-            raise ValueError(f"Unknown condition group operator: {group.operator}")
+        return compile_condition_group(group, strict=True)(assessment_data, {})
 
     # ========================================
     # REMARK GENERATION ENGINE
@@ -1275,125 +1014,187 @@ class IntelligenceService:
 
         return area_responses
 
-    def determine_area_compliance(self, db: Session, assessment_id: int, area_name: str) -> bool:
+    def load_area_indicator_tree(
+        self, db: Session, area_names: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
         """
-        Determine if a governance area has passed (all LEAF indicators within that area must pass).
-
-        An area passes if ALL of its LEAF indicators have validation_status = PASS or CONDITIONAL.
-        An area fails if ANY leaf indicator has validation_status = FAIL or is None.
-        SGLGB rule: CONDITIONAL (Considered) counts as passing.
-
-        IMPORTANT: Only leaf indicators (indicators with no children) are checked.
-        Parent/section indicators don't have responses and should be excluded.
+        Load the indicator tree of the governance areas used for classification.
 
-        BBI SPECIAL RULE (4-tier system):
-        For BBI indicators, FAIL only means NON_FUNCTIONAL (0%).
-        LOW_FUNCTIONAL, MODERATELY_FUNCTIONAL, and HIGHLY_FUNCTIONAL all count as PASS.
-        This is based on DILG MC 2024-417 4-tier BBI compliance system.
+        Runs a single query over governance areas joined to their indicators and
+        splits each area's indicators into the sets the 3+1 rule needs. The tree
+        does not depend on the assessment, so callers classifying many
+        assessments can load it once and reuse it.
 
         Args:
             db: Database session
-            assessment_id: ID of the assessment
-            area_name: Name of the governance area to check
+            area_names: Areas to load (defaults to the six SGLGB areas)
 
         Returns:
-            True if all leaf indicators in the area passed, False otherwise
-        """
-        from app.db.enums import BBIStatus
-        from app.db.models.bbi import BBIResult
-
-        # Get all indicators for this governance area
-        area = db.query(GovernanceArea).filter(GovernanceArea.name == area_name).first()
-        if not area:
-            return False
-
-        all_indicators = db.query(Indicator).filter(Indicator.governance_area_id == area.id).all()
+            Dictionary mapping area name to:
+            - leaf_ids: Leaf, non-profiling indicator IDs (all must pass)
+            - bbi_leaf_ids: Subset of leaf_ids that are BBI indicators
+            - parent_ids: Parent/section indicator IDs (an explicit FAIL fails the area)
+            Areas that do not exist in the database are omitted.
+        """
+        names = area_names if area_names is not None else CORE_AREAS + ESSENTIAL_AREAS
+
+        rows = (
+            db.query(
+                GovernanceArea.name,
+                Indicator.id,
+                Indicator.parent_id,
+                Indicator.is_profiling_only,
+                Indicator.is_bbi,
+            )
+            .outerjoin(Indicator, Indicator.governance_area_id == GovernanceArea.id)
+            .filter(GovernanceArea.name.in_(names))
+            .all()
+        )
 
-        if not all_indicators:
-            return False  # No indicators = failed area
+        area_indicators: dict[str, list[tuple[int, int | None, bool, bool]]] = {}
+        for area_name, indicator_id, parent_id, is_profiling_only, is_bbi in rows:
+            indicators = area_indicators.setdefault(area_name, [])
+            if indicator_id is not None:
+                indicators.append((indicator_id, parent_id, is_profiling_only, is_bbi))
+
+        tree: dict[str, dict[str, Any]] = {}
+        for area_name, indicators in area_indicators.items():
+            # Parent IDs are resolved per area, mirroring the area-scoped indicator list
+            parent_ids = {parent_id for _, parent_id, _, _ in indicators if parent_id is not None}
+            leaf_ids: list[int] = []
+            bbi_leaf_ids: set[int] = set()
+            for indicator_id, _, is_profiling_only, is_bbi in indicators:
+                if indicator_id in parent_ids or is_profiling_only:
+                    continue
+                leaf_ids.append(indicator_id)
+                if is_bbi:
+                    bbi_leaf_ids.add(indicator_id)
+
+            tree[area_name] = {
+                "leaf_ids": leaf_ids,
+                "bbi_leaf_ids": bbi_leaf_ids,
+                "parent_ids": {
+                    indicator_id
+                    for indicator_id, _, _, _ in indicators
+                    if indicator_id in parent_ids
+                },
+            }
+
+        return tree
+
+    def load_classification_inputs(
+        self,
+        db: Session,
+        assessment_ids: list[int],
+        tree: dict[str, dict[str, Any]],
+    ) -> dict[int, tuple[dict[int, ValidationStatus | None], dict[int, str]]]:
+        """
+        Load the response statuses and BBI ratings needed to classify assessments.
 
-        # Build a set of parent IDs to identify which indicators have children
-        parent_ids = {ind.parent_id for ind in all_indicators if ind.parent_id is not None}
+        Issues one query for responses and, only when the tree contains BBI
+        indicators, one query for BBI results - regardless of how many
+        assessments are requested.
 
-        # Filter to only leaf indicators (indicators that are NOT parents of other indicators)
-        # ALSO exclude profiling-only indicators - they don't affect pass/fail status
-        leaf_indicators = [
-            ind for ind in all_indicators if ind.id not in parent_ids and not ind.is_profiling_only
-        ]
+        Args:
+            db: Database session
+            assessment_ids: IDs of the assessments to load
+            tree: Indicator tree from load_area_indicator_tree()
 
-        if not leaf_indicators:
-            return False  # No leaf indicators = failed area
+        Returns:
+            Dictionary mapping assessment ID to a tuple of
+            (indicator_id -> validation_status, indicator_id -> BBI compliance_rating)
+        """
+        from app.db.models.bbi import BBIResult
 
-        # OPTIMIZATION: Batch query all responses for leaf indicators at once
-        # This fixes the N+1 query problem by fetching all responses in a single query
-        leaf_indicator_ids = [ind.id for ind in leaf_indicators]
-        responses = (
-            db.query(AssessmentResponse)
-            .filter(
-                AssessmentResponse.assessment_id == assessment_id,
-                AssessmentResponse.indicator_id.in_(leaf_indicator_ids),
+        inputs: dict[int, tuple[dict[int, ValidationStatus | None], dict[int, str]]] = {
+            assessment_id: ({}, {}) for assessment_id in assessment_ids
+        }
+        if not assessment_ids:
+            return inputs
+
+        response_rows = (
+            db.query(
+                AssessmentResponse.assessment_id,
+                AssessmentResponse.indicator_id,
+                AssessmentResponse.validation_status,
             )
+            .filter(AssessmentResponse.assessment_id.in_(assessment_ids))
             .all()
         )
-
-        # Build a map of indicator_id -> response for O(1) lookup
-        response_map = {r.indicator_id: r for r in responses}
-
-        # CRITICAL (SNG-45):
-        # Respect explicit validator/MLGOO decisions on parent/main indicators.
-        # A forced FAIL on a parent indicator must fail the governance area,
-        # even if its leaf children pass.
-        non_leaf_indicator_ids = {ind.id for ind in all_indicators if ind.id in parent_ids}
-        if non_leaf_indicator_ids:
-            non_leaf_responses = (
-                db.query(AssessmentResponse)
+        for assessment_id, indicator_id, validation_status in response_rows:
+            inputs[assessment_id][0][indicator_id] = validation_status
+
+        # Only query BBI results if any area has BBI leaf indicators
+        if any(area["bbi_leaf_ids"] for area in tree.values()):
+            bbi_rows = (
+                db.query(
+                    BBIResult.assessment_id,
+                    BBIResult.indicator_id,
+                    BBIResult.compliance_rating,
+                )
                 .filter(
-                    AssessmentResponse.assessment_id == assessment_id,
-                    AssessmentResponse.indicator_id.in_(list(non_leaf_indicator_ids)),
-                    AssessmentResponse.validation_status.isnot(None),
+                    BBIResult.assessment_id.in_(assessment_ids),
+                    BBIResult.indicator_id.isnot(None),
                 )
                 .all()
             )
-            for non_leaf_response in non_leaf_responses:
-                if non_leaf_response.validation_status == ValidationStatus.FAIL:
-                    return False
-
-        # Get BBI results for this assessment to check BBI 4-tier status
-        # Only query if there are BBI indicators in this area
-        bbi_indicator_ids = [ind.id for ind in leaf_indicators if ind.is_bbi]
-        bbi_results_map = {}
-        if bbi_indicator_ids:
-            bbi_results = db.query(BBIResult).filter(BBIResult.assessment_id == assessment_id).all()
-            # Map by indicator_id for O(1) lookup
-            bbi_results_map = {r.indicator_id: r for r in bbi_results if r.indicator_id}
-
-        # Check all leaf indicators against the response map
-        for indicator in leaf_indicators:
-            response = response_map.get(indicator.id)
+            for assessment_id, indicator_id, compliance_rating in bbi_rows:
+                inputs[assessment_id][1][indicator_id] = compliance_rating
+
+        return inputs
 
+    def evaluate_area_compliance(
+        self,
+        area: dict[str, Any] | None,
+        statuses: dict[int, ValidationStatus | None],
+        bbi_ratings: dict[int, str],
+    ) -> bool:
+        """
+        Evaluate one governance area in memory (all LEAF indicators must pass).
+
+        An area passes if ALL of its LEAF indicators have validation_status = PASS or CONDITIONAL.
+        An area fails if ANY leaf indicator has validation_status = FAIL or is None, if it has
+        no leaf indicators, or if a parent/section indicator was explicitly marked FAIL (SNG-45).
+
+        BBI SPECIAL RULE (4-tier system):
+        For BBI indicators with a BBI result, only NON_FUNCTIONAL (0%) counts as FAIL.
+        LOW_FUNCTIONAL, MODERATELY_FUNCTIONAL, and HIGHLY_FUNCTIONAL all count as PASS.
+        This is based on DILG MC 2024-417 4-tier BBI compliance system.
+
+        Args:
+            area: Area entry from load_area_indicator_tree() (None if the area does not exist)
+            statuses: Mapping of indicator_id -> validation_status for the assessment
+            bbi_ratings: Mapping of indicator_id -> BBI compliance_rating for the assessment
+
+        Returns:
+            True if the area passed, False otherwise
+        """
+        from app.db.enums import BBIStatus
+
+        if not area or not area["leaf_ids"]:
+            return False  # Missing area or no leaf indicators = failed area
+
+        # CRITICAL (SNG-45): a forced FAIL on a parent indicator fails the area
+        for indicator_id in area["parent_ids"]:
+            if statuses.get(indicator_id) == ValidationStatus.FAIL:
+                return False
+
+        bbi_leaf_ids = area["bbi_leaf_ids"]
+        for indicator_id in area["leaf_ids"]:
             # If no response exists, the area fails
-            if not response:
+            if indicator_id not in statuses:
                 return False
 
-            # BBI SPECIAL RULE: For BBI indicators, use 4-tier rule
-            # Only NON_FUNCTIONAL (0%) counts as FAIL
-            # LOW_FUNCTIONAL, MODERATELY_FUNCTIONAL, HIGHLY_FUNCTIONAL all count as PASS
-            if indicator.is_bbi:
-                bbi_result = bbi_results_map.get(indicator.id)
-                if bbi_result:
-                    # BBI exists - check if NON_FUNCTIONAL
-                    if bbi_result.compliance_rating == BBIStatus.NON_FUNCTIONAL.value:
+            if indicator_id in bbi_leaf_ids:
+                rating = bbi_ratings.get(indicator_id)
+                if rating is not None:
+                    if rating == BBIStatus.NON_FUNCTIONAL.value:
                         return False  # Only NON_FUNCTIONAL fails
-                    # Any other BBI status (LOW, MODERATE, HIGHLY) counts as pass
                     continue
-                else:
-                    # No BBI result yet - fall back to validation_status check
-                    pass
+                # No BBI result yet - fall back to validation_status check
 
-            # Standard check for non-BBI indicators (or BBI without result)
             # PASS and CONDITIONAL both count as passing (SGLGB rule: Conditional = Considered = Pass)
-            # Only FAIL status causes the area to fail
-            if response.validation_status not in (
+            if statuses[indicator_id] not in (
                 ValidationStatus.PASS,
                 ValidationStatus.CONDITIONAL,
             ):
@@ -1401,31 +1202,93 @@ class IntelligenceService:
 
         return True
 
-    def get_all_area_results(self, db: Session, assessment_id: int) -> dict[str, str]:
+    def evaluate_area_results(
+        self,
+        tree: dict[str, dict[str, Any]],
+        statuses: dict[int, ValidationStatus | None],
+        bbi_ratings: dict[int, str],
+    ) -> dict[str, str]:
         """
-        Get pass/fail status for all six governance areas.
+        Evaluate all six governance areas in memory.
+
+        Args:
+            tree: Indicator tree from load_area_indicator_tree()
+            statuses: Mapping of indicator_id -> validation_status for the assessment
+            bbi_ratings: Mapping of indicator_id -> BBI compliance_rating for the assessment
 
-        Returns a dictionary mapping area names to their status ('Passed' or 'Failed').
+        Returns:
+            Dictionary mapping area name to 'Passed' or 'Failed'
+        """
+        return {
+            area_name: (
+                "Passed"
+                if self.evaluate_area_compliance(tree.get(area_name), statuses, bbi_ratings)
+                else "Failed"
+            )
+            for area_name in CORE_AREAS + ESSENTIAL_AREAS
+        }
+
+    def apply_three_plus_one_rule(self, area_results: dict[str, str]) -> ComplianceStatus:
+        """
+        Apply the "3+1" SGLGB rule to already-evaluated area results.
+
+        Args:
+            area_results: Dictionary mapping area name to 'Passed' or 'Failed'
+
+        Returns:
+            ComplianceStatus.PASSED if all Core areas and at least one Essential
+            area passed, ComplianceStatus.FAILED otherwise
+        """
+        all_core_passed = all(area_results.get(area) == "Passed" for area in CORE_AREAS)
+        at_least_one_essential_passed = any(
+            area_results.get(area) == "Passed" for area in ESSENTIAL_AREAS
+        )
+
+        if all_core_passed and at_least_one_essential_passed:
+            return ComplianceStatus.PASSED
+        return ComplianceStatus.FAILED
+
+    def determine_area_compliance(self, db: Session, assessment_id: int, area_name: str) -> bool:
+        """
+        Determine if a governance area has passed (all LEAF indicators within that area must pass).
+
+        Parent/section indicators don't have responses and are excluded from the leaf check,
+        but an explicit FAIL on them still fails the area. See evaluate_area_compliance()
+        for the full rule, including the BBI 4-tier special case.
 
         Args:
             db: Database session
             assessment_id: ID of the assessment
+            area_name: Name of the governance area to check
 
         Returns:
-            Dictionary mapping area name to status
+            True if all leaf indicators in the area passed, False otherwise
         """
-        area_results: dict[str, str] = {}
+        tree = self.load_area_indicator_tree(db, [area_name])
+        statuses, bbi_ratings = self.load_classification_inputs(db, [assessment_id], tree)[
+            assessment_id
+        ]
+        return self.evaluate_area_compliance(tree.get(area_name), statuses, bbi_ratings)
 
-        # Check all six areas
-        all_areas = CORE_AREAS + ESSENTIAL_AREAS
+    def get_all_area_results(self, db: Session, assessment_id: int) -> dict[str, str]:
+        """
+        Get pass/fail status for all six governance areas.
 
-        for area_name in all_areas:
-            if self.determine_area_compliance(db, assessment_id, area_name):
-                area_results[area_name] = "Passed"
-            else:
-                area_results[area_name] = "Failed"
+        Loads the indicator tree, responses and BBI results once and evaluates
+        every area in memory.
+
+        Args:
+            db: Database session
+            assessment_id: ID of the assessment
 
-        return area_results
+        Returns:
+            Dictionary mapping area name to status ('Passed' or 'Failed')
+        """
+        tree = self.load_area_indicator_tree(db)
+        statuses, bbi_ratings = self.load_classification_inputs(db, [assessment_id], tree)[
+            assessment_id
+        ]
+        return self.evaluate_area_results(tree, statuses, bbi_ratings)
 
     def check_core_areas_compliance(self, db: Session, assessment_id: int) -> bool:
         """
@@ -1440,10 +1303,8 @@ class IntelligenceService:
         Returns:
             True if all Core areas passed, False otherwise
         """
-        for area_name in CORE_AREAS:
-            if not self.determine_area_compliance(db, assessment_id, area_name):
-                return False
-        return True
+        area_results = self.get_all_area_results(db, assessment_id)
+        return all(area_results[area_name] == "Passed" for area_name in CORE_AREAS)
 
     def check_essential_areas_compliance(self, db: Session, assessment_id: int) -> bool:
         """
@@ -1458,10 +1319,8 @@ class IntelligenceService:
         Returns:
             True if at least one Essential area passed, False otherwise
         """
-        for area_name in ESSENTIAL_AREAS:
-            if self.determine_area_compliance(db, assessment_id, area_name):
-                return True
-        return False
+        area_results = self.get_all_area_results(db, assessment_id)
+        return any(area_results[area_name] == "Passed" for area_name in ESSENTIAL_AREAS)
 
     def determine_compliance_status(self, db: Session, assessment_id: int) -> ComplianceStatus:
         """
@@ -1482,17 +1341,7 @@ class IntelligenceService:
         Returns:
             ComplianceStatus.PASSED or ComplianceStatus.FAILED
         """
-        # Check Core areas compliance
-        all_core_passed = self.check_core_areas_compliance(db, assessment_id)
-
-        # Check Essential areas compliance
-        at_least_one_essential_passed = self.check_essential_areas_compliance(db, assessment_id)
-
-        # Apply "3+1" rule
-        if all_core_passed and at_least_one_essential_passed:
-            return ComplianceStatus.PASSED
-        else:
-            return ComplianceStatus.FAILED
+        return self.apply_three_plus_one_rule(self.get_all_area_results(db, assessment_id))
 
     def classify_assessment(self, db: Session, assessment_id: int) -> dict[str, Any]:
         """
@@ -1503,6 +1352,10 @@ class IntelligenceService:
         2. Applies the "3+1" rule to determine overall compliance status
         3. Stores results in the database
 
+        The indicator tree, responses and BBI results are loaded once and all
+        six areas are evaluated in memory, so the query count does not grow
+        with the number of areas.
+
         Args:
             db: Database session
             assessment_id: ID of the assessment to classify
@@ -1522,7 +1375,7 @@ class IntelligenceService:
         area_results = self.get_all_area_results(db, assessment_id)
 
         # Determine overall compliance status using "3+1" rule
-        compliance_status = self.determine_compliance_status(db, assessment_id)
+        compliance_status = self.apply_three_plus_one_rule(area_results)
 
         # Store results in database
         assessment.final_compliance_status = compliance_status
@@ -6,10 +6,15 @@ import logging
 from collections import Counter
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import and_, case, func
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session, joinedload
 
-from app.db.enums import AreaType, AssessmentStatus, ComplianceStatus, ValidationStatus
+from app.db.enums import AreaType, AssessmentStatus, ValidationStatus
+from app.db.models.analytics_rollup import (
+    AnalyticsAreaRollup,
+    AnalyticsIndicatorRollup,
+    AnalyticsYearRollup,
+)
 from app.db.models.assessment import Assessment, AssessmentResponse
 from app.db.models.barangay import Barangay
 from app.db.models.governance_area import GovernanceArea, Indicator
@@ -71,31 +76,29 @@ class MunicipalAnalyticsService:
         # Count total barangays
         total_barangays = db.query(func.count(Barangay.id)).scalar() or 0
 
-        # Base query for completed assessments
-        base_query = db.query(Assessment).filter(Assessment.status == AssessmentStatus.COMPLETED)
-
-        # Filter by year if provided
+        # Assessment counts per status from the per-year rollup
+        status_query = db.query(
+            AnalyticsYearRollup.status,
+            func.sum(AnalyticsYearRollup.assessment_count),
+            func.sum(AnalyticsYearRollup.passed_count),
+            func.sum(AnalyticsYearRollup.failed_count),
+        )
         if year is not None:
-            base_query = base_query.filter(Assessment.assessment_year == year)
+            status_query = status_query.filter(AnalyticsYearRollup.assessment_year == year)
+        rollup = {
+            status: (int(count), int(passed), int(failed))
+            for status, count, passed, failed in status_query.group_by(AnalyticsYearRollup.status)
+        }
 
-        # Get completed assessments with compliance status
-        completed_assessments = base_query.all()
+        def count_for(status: AssessmentStatus) -> int:
+            return rollup.get(status.value, (0, 0, 0))[0]
 
-        passed_count = sum(
-            1 for a in completed_assessments if a.final_compliance_status == ComplianceStatus.PASSED
-        )
-        failed_count = sum(
-            1 for a in completed_assessments if a.final_compliance_status == ComplianceStatus.FAILED
+        assessed_count, passed_count, failed_count = rollup.get(
+            AssessmentStatus.COMPLETED.value, (0, 0, 0)
         )
-        assessed_count = len(completed_assessments)
 
         # Count pending MLGOO approval
-        pending_mlgoo_query = db.query(func.count(Assessment.id)).filter(
-            Assessment.status == AssessmentStatus.AWAITING_MLGOO_APPROVAL
-        )
-        if year is not None:
-            pending_mlgoo_query = pending_mlgoo_query.filter(Assessment.assessment_year == year)
-        pending_mlgoo = pending_mlgoo_query.scalar() or 0
+        pending_mlgoo = count_for(AssessmentStatus.AWAITING_MLGOO_APPROVAL)
 
         # Count in-progress (draft, submitted, rework, etc.)
         in_progress_statuses = [
@@ -105,12 +108,7 @@ class MunicipalAnalyticsService:
             AssessmentStatus.REWORK,
             AssessmentStatus.AWAITING_FINAL_VALIDATION,
         ]
-        in_progress_query = db.query(func.count(Assessment.id)).filter(
-            Assessment.status.in_(in_progress_statuses)
-        )
-        if year is not None:
-            in_progress_query = in_progress_query.filter(Assessment.assessment_year == year)
-        in_progress = in_progress_query.scalar() or 0
+        in_progress = sum(count_for(status) for status in in_progress_statuses)
 
         # Calculate rates
         compliance_rate = (passed_count / assessed_count * 100) if assessed_count > 0 else 0.0
@@ -120,22 +118,20 @@ class MunicipalAnalyticsService:
         # NEW: Calculate workflow breakdown and enhanced metrics
         # =====================================================================
 
-        # Get all assessments for workflow breakdown
-        all_assessments_query = db.query(Assessment)
-        if year is not None:
-            all_assessments_query = all_assessments_query.filter(Assessment.assessment_year == year)
-        all_assessments = all_assessments_query.all()
-
         # Count assessments by status
         status_counts = {
-            AssessmentStatus.DRAFT: 0,
-            AssessmentStatus.SUBMITTED: 0,
-            AssessmentStatus.IN_REVIEW: 0,
-            AssessmentStatus.REWORK: 0,
-            AssessmentStatus.AWAITING_FINAL_VALIDATION: 0,
-            AssessmentStatus.AWAITING_MLGOO_APPROVAL: 0,
-            AssessmentStatus.COMPLETED: 0,
+            status: count_for(status)
+            for status in [
+                AssessmentStatus.DRAFT,
+                AssessmentStatus.SUBMITTED,
+                AssessmentStatus.IN_REVIEW,
+                AssessmentStatus.REWORK,
+                AssessmentStatus.AWAITING_FINAL_VALIDATION,
+                AssessmentStatus.AWAITING_MLGOO_APPROVAL,
+                AssessmentStatus.COMPLETED,
+            ]
         }
+        total_assessments = sum(count for count, _, _ in rollup.values())
 
         # Weights for weighted progress calculation
         status_weights = {
@@ -147,43 +143,47 @@ class MunicipalAnalyticsService:
             AssessmentStatus.AWAITING_MLGOO_APPROVAL: 70,
             AssessmentStatus.COMPLETED: 100,
         }
+        total_weighted_progress = sum(
+            status_counts[status] * weight for status, weight in status_weights.items()
+        )
+
+        # Stalled and rework counts depend on per-assessment timestamps, so they
+        # are computed from a narrow column query rather than the rollup
+        activity_query = db.query(
+            Assessment.status,
+            Assessment.updated_at,
+            Assessment.created_at,
+            Assessment.rework_count,
+        )
+        if year is not None:
+            activity_query = activity_query.filter(Assessment.assessment_year == year)
 
         # Stalled threshold (14 days) - use naive datetime for comparison with DB
         stalled_threshold = datetime.utcnow() - timedelta(days=14)
         stalled_count = 0
         rework_count = 0
-        total_weighted_progress = 0
-
-        for assessment in all_assessments:
-            if assessment.status in status_counts:
-                status_counts[assessment.status] += 1
 
+        for status, updated_at, created_at, assessment_rework_count in activity_query:
             # Check if stalled (status unchanged for >14 days)
             # Use updated_at or status_updated_at if available, otherwise created_at
-            last_update = assessment.updated_at or assessment.created_at
+            last_update = updated_at or created_at
             if last_update:
                 # Handle both timezone-aware and naive datetimes
                 if last_update.tzinfo is not None:
                     last_update = last_update.replace(tzinfo=None)
                 if last_update < stalled_threshold:
-                    if assessment.status not in [
+                    if status not in [
                         AssessmentStatus.COMPLETED,
                         AssessmentStatus.DRAFT,
                     ]:
                         stalled_count += 1
 
             # Count reworks (assessments that went through REWORK status)
-            if assessment.status == AssessmentStatus.REWORK or (
-                hasattr(assessment, "rework_count")
-                and assessment.rework_count
-                and assessment.rework_count > 0
+            if status == AssessmentStatus.REWORK or (
+                assessment_rework_count and assessment_rework_count > 0
             ):
                 rework_count += 1
 
-            # Calculate weighted progress
-            if assessment.status in status_weights:
-                total_weighted_progress += status_weights[assessment.status]
-
         # Count barangays with no assessment started
         barangays_with_assessments = db.query(
             func.count(func.distinct(Assessment.blgu_user_id))
@@ -208,7 +208,7 @@ class MunicipalAnalyticsService:
         )
 
         # Calculate rework rate (assessments that required rework / total non-draft)
-        total_non_draft = len(all_assessments) - status_counts[AssessmentStatus.DRAFT]
+        total_non_draft = total_assessments - status_counts[AssessmentStatus.DRAFT]
         rework_rate = (rework_count / total_non_draft * 100) if total_non_draft > 0 else 0.0
 
         # Calculate weighted progress (average progress across all barangays)
@@ -255,7 +255,30 @@ class MunicipalAnalyticsService:
         # Get all governance areas
         governance_areas = db.query(GovernanceArea).order_by(GovernanceArea.id).all()
 
-        # Get completed assessments
+        # Indicator totals per area in one grouped query
+        indicator_totals = dict(
+            db.query(Indicator.governance_area_id, func.count(Indicator.id))
+            .group_by(Indicator.governance_area_id)
+            .all()
+        )
+
+        # Pass/fail counts from the stored area_results (populated by
+        # intelligence_service.get_all_area_results()), pre-aggregated per year
+        results_query = db.query(
+            AnalyticsAreaRollup.governance_area_id,
+            func.sum(AnalyticsAreaRollup.result_passed_count),
+            func.sum(AnalyticsAreaRollup.result_failed_count),
+        ).filter(AnalyticsAreaRollup.status == AssessmentStatus.COMPLETED.value)
+        if year is not None:
+            results_query = results_query.filter(AnalyticsAreaRollup.assessment_year == year)
+        area_counts = {
+            area_id: (int(passed), int(failed))
+            for area_id, passed, failed in results_query.group_by(
+                AnalyticsAreaRollup.governance_area_id
+            )
+        }
+
+        # Get completed assessments (CapDev insights feed the common weaknesses)
         completed_query = db.query(Assessment).filter(
             Assessment.status == AssessmentStatus.COMPLETED
         )
@@ -270,10 +293,7 @@ class MunicipalAnalyticsService:
                     id=ga.id,
                     name=ga.name,
                     area_type=ga.area_type.value if ga.area_type else "CORE",
-                    total_indicators=db.query(func.count(Indicator.id))
-                    .filter(Indicator.governance_area_id == ga.id)
-                    .scalar()
-                    or 0,
+                    total_indicators=indicator_totals.get(ga.id, 0),
                     passed_count=0,
                     failed_count=0,
                     pass_rate=0.0,
@@ -292,33 +312,8 @@ class MunicipalAnalyticsService:
         essential_pass_rates = []
 
         for ga in governance_areas:
-            # Get total indicators for this area
-            total_indicators = (
-                db.query(func.count(Indicator.id))
-                .filter(Indicator.governance_area_id == ga.id)
-                .scalar()
-                or 0
-            )
-
-            # Calculate pass/fail counts from area_results in assessments
-            # area_results is stored with area names as keys and "Passed"/"Failed" as values
-            # (populated by intelligence_service.get_all_area_results())
-            passed_count = 0
-            failed_count = 0
-
-            for assessment in completed_assessments:
-                if not assessment.area_results:
-                    continue
-
-                # Match by governance area name (the format used by intelligence_service)
-                area_result = assessment.area_results.get(ga.name)
-
-                if area_result is not None:
-                    # Case-insensitive comparison for defensive coding
-                    if area_result.lower() == "passed":
-                        passed_count += 1
-                    elif area_result.lower() == "failed":
-                        failed_count += 1
+            total_indicators = indicator_totals.get(ga.id, 0)
+            passed_count, failed_count = area_counts.get(ga.id, (0, 0))
 
             total_assessed = passed_count + failed_count
             pass_rate = (passed_count / total_assessed * 100) if total_assessed > 0 else 0.0
@@ -409,62 +404,30 @@ class MunicipalAnalyticsService:
         """
         year = self._resolve_year(db, year)
 
-        # Build base filter conditions
-        filter_conditions = [Assessment.status == AssessmentStatus.COMPLETED]
+        # Fail/total counts per indicator from the per-year rollup
+        filter_conditions = [AnalyticsIndicatorRollup.status == AssessmentStatus.COMPLETED.value]
         if year is not None:
-            filter_conditions.append(Assessment.assessment_year == year)
+            filter_conditions.append(AnalyticsIndicatorRollup.assessment_year == year)
 
-        # Query for fail counts per indicator
+        fail_count_sum = func.sum(AnalyticsIndicatorRollup.fail_count)
         fail_counts = (
             db.query(
-                AssessmentResponse.indicator_id,
-                func.count(
-                    case(
-                        (
-                            AssessmentResponse.validation_status == ValidationStatus.FAIL,
-                            1,
-                        ),
-                        else_=None,
-                    )
-                ).label("fail_count"),
-                func.count(AssessmentResponse.id).label("total_count"),
+                AnalyticsIndicatorRollup.indicator_id,
+                fail_count_sum.label("fail_count"),
+                func.sum(AnalyticsIndicatorRollup.assessed_count).label("total_count"),
             )
-            .join(Assessment, Assessment.id == AssessmentResponse.assessment_id)
             .filter(and_(*filter_conditions))
-            .group_by(AssessmentResponse.indicator_id)
-            .having(
-                func.count(
-                    case(
-                        (
-                            AssessmentResponse.validation_status == ValidationStatus.FAIL,
-                            1,
-                        ),
-                        else_=None,
-                    )
-                )
-                > 0
-            )
-            .order_by(
-                func.count(
-                    case(
-                        (
-                            AssessmentResponse.validation_status == ValidationStatus.FAIL,
-                            1,
-                        ),
-                        else_=None,
-                    )
-                ).desc()
-            )
+            .group_by(AnalyticsIndicatorRollup.indicator_id)
+            .having(fail_count_sum > 0)
+            .order_by(fail_count_sum.desc())
             .limit(limit)
             .all()
         )
 
         failing_indicators = []
-        total_unique_query = (
-            db.query(func.count(func.distinct(AssessmentResponse.indicator_id)))
-            .join(Assessment, Assessment.id == AssessmentResponse.assessment_id)
-            .filter(and_(*filter_conditions))
-        )
+        total_unique_query = db.query(
+            func.count(func.distinct(AnalyticsIndicatorRollup.indicator_id))
+        ).filter(and_(*filter_conditions), AnalyticsIndicatorRollup.assessed_count > 0)
         total_unique_indicators = total_unique_query.scalar() or 0
 
         for indicator_id, fail_count, total_count in fail_counts:
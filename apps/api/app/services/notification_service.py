@@ -5,26 +5,35 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
+from app.core.notification_stream import notification_stream
 from app.db.enums import NotificationType, UserRole
 from app.db.models.assessment import Assessment
+from app.db.models.barangay import Barangay
 from app.db.models.governance_area import GovernanceArea
 from app.db.models.notification import Notification
 from app.db.models.user import User
-from app.schemas.notification import NotificationResponse
-from app.services.email_service import email_service
+from app.schemas.notification import NotificationCreate, NotificationResponse
+from app.services.email_service import OutgoingEmail, email_service
 
 logger = logging.getLogger(__name__)
 
+# Session.info key collecting notification IDs to email once the session commits
+_PENDING_EMAILS_KEY = "pending_notification_emails"
+
+# Session.info key collecting new notification IDs per recipient, pushed once the session commits
+_PENDING_PUSH_KEY = "pending_notification_push"
+
 
 class NotificationService:
     """
     Business logic for notification management.
 
     Follows fat service pattern - handles all notification operations including:
-    - Creating notifications (in-app and email)
+    - Creating notifications (in-app and email), singly or in bulk
     - Bulk notifications to user groups (assessors, validators)
     - Retrieving and paginating notifications
     - Marking notifications as read
@@ -57,7 +66,7 @@ class NotificationService:
             message: Full notification message
             assessment_id: Related assessment ID (optional)
             governance_area_id: Related governance area ID (optional)
-            send_email: Whether to send email notification
+            send_email: Whether to email the recipient (queued when the session commits)
 
         Returns:
             Created Notification object
@@ -77,36 +86,131 @@ class NotificationService:
         db.add(notification)
         db.flush()  # Get ID without committing
 
-        # Send email if requested and configured
-        if send_email and email_service.is_configured():
-            recipient = db.query(User).filter(User.id == recipient_id).first()
-            if recipient and recipient.email:
-                try:
-                    # Build email context
-                    context = self._build_email_context(db, assessment_id, governance_area_id)
-
-                    subject, html_body, text_body = email_service.build_notification_email(
-                        notification_type=notification_type,
-                        recipient_name=recipient.name,
-                        context=context,
-                    )
-
-                    result = email_service.send_email(
-                        to_email=recipient.email,
-                        subject=subject,
-                        body_html=html_body,
-                        body_text=text_body,
-                    )
-
-                    if result.get("success"):
-                        notification.email_sent = True
-                        notification.email_sent_at = datetime.utcnow()
-
-                except Exception as e:
-                    self.logger.error(f"Failed to send notification email: {e}")
+        self._push_after_commit(db, [notification])
+
+        # Email is sent by the email queue once the notification is committed
+        if send_email:
+            self._queue_emails_after_commit(db, [notification.id])
 
         return notification
 
+    def create_notifications(
+        self,
+        db: Session,
+        notifications: list[NotificationCreate],
+        send_email: bool = True,
+    ) -> list[Notification]:
+        """
+        Create many notification records at once and optionally send emails.
+
+        PERFORMANCE: One multi-row INSERT ... RETURNING for the records instead of
+        a flush per notification.
+
+        Args:
+            db: Database session
+            notifications: Notifications to create
+            send_email: Whether to email the recipients (queued when the session commits)
+
+        Returns:
+            Created Notification objects, in input order
+        """
+        if not notifications:
+            return []
+
+        created_at = datetime.utcnow()
+        created = list(
+            db.scalars(
+                insert(Notification).returning(Notification, sort_by_parameter_order=True),
+                [
+                    {
+                        **notification.model_dump(),
+                        "is_read": False,
+                        "email_sent": False,
+                        "created_at": created_at,
+                    }
+                    for notification in notifications
+                ],
+            )
+        )
+
+        self._push_after_commit(db, created)
+
+        if send_email:
+            self._queue_emails_after_commit(db, [notification.id for notification in created])
+
+        return created
+
+    def create_notifications_bulk(
+        self,
+        db: Session,
+        recipient_ids: list[int],
+        notification_type: NotificationType,
+        title: str,
+        message: str,
+        assessment_id: int | None = None,
+        governance_area_id: int | None = None,
+        send_email: bool = True,
+    ) -> list[Notification]:
+        """
+        Send the same notification to many recipients.
+
+        Used by the role fan-outs (assessors, validators, MLGOO users). All rows go
+        in one INSERT and their emails are queued as one batch, which builds the
+        shared email context once.
+
+        Args:
+            db: Database session
+            recipient_ids: User IDs of the recipients
+            notification_type: Type of notification
+            title: Short notification title
+            message: Full notification message
+            assessment_id: Related assessment ID (optional)
+            governance_area_id: Related governance area ID (optional)
+            send_email: Whether to email the recipients (queued when the session commits)
+
+        Returns:
+            Created Notification objects, one per recipient
+        """
+        return self.create_notifications(
+            db,
+            [
+                NotificationCreate(
+                    recipient_id=recipient_id,
+                    notification_type=notification_type,
+                    title=title,
+                    message=message,
+                    assessment_id=assessment_id,
+                    governance_area_id=governance_area_id,
+                )
+                for recipient_id in recipient_ids
+            ],
+            send_email=send_email,
+        )
+
+    def send_notification_emails(self, db: Session, notification_ids: list[int]) -> dict[str, int]:
+        """
+        Send the emails of committed notifications as one SMTP batch.
+
+        Used by the email queue (notifications.send_notification_emails).
+        Notifications whose email was already sent are skipped, so re-running a
+        batch after a retry never emails anyone twice.
+
+        Args:
+            db: Database session
+            notification_ids: Notifications to email
+
+        Returns:
+            Dict with the number of emails sent and the number that failed because
+            the SMTP server was unavailable (worth retrying)
+        """
+        pending = (
+            db.query(Notification)
+            .filter(Notification.id.in_(notification_ids), Notification.email_sent == False)
+            .all()
+        )
+        sent, retryable = self._send_notification_emails(db, pending)
+        return {"sent": len(sent), "retryable": len(retryable)}
+
     def notify_all_active_assessors(
         self,
         db: Session,
@@ -134,7 +238,7 @@ class NotificationService:
             List of created Notification objects
         """
         # Get all active assessors
-        query = db.query(User).filter(
+        query = db.query(User.id).filter(
             User.role == UserRole.ASSESSOR,
             User.is_active == True,
         )
@@ -142,19 +246,14 @@ class NotificationService:
         if exclude_user_id:
             query = query.filter(User.id != exclude_user_id)
 
-        assessors = query.all()
-
-        notifications = []
-        for assessor in assessors:
-            notification = self.create_notification(
-                db=db,
-                recipient_id=assessor.id,
-                notification_type=notification_type,
-                title=title,
-                message=message,
-                assessment_id=assessment_id,
-            )
-            notifications.append(notification)
+        notifications = self.create_notifications_bulk(
+            db=db,
+            recipient_ids=[assessor_id for (assessor_id,) in query],
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            assessment_id=assessment_id,
+        )
 
         self.logger.info(
             f"Created {len(notifications)} notifications for assessors "
@@ -189,8 +288,8 @@ class NotificationService:
             List of created Notification objects
         """
         # Get assessors for this governance area (area-specific after workflow restructuring)
-        assessors = (
-            db.query(User)
+        assessor_ids = (
+            db.query(User.id)
             .filter(
                 User.role == UserRole.ASSESSOR,
                 User.assessor_area_id == governance_area_id,
@@ -199,18 +298,15 @@ class NotificationService:
             .all()
         )
 
-        notifications = []
-        for assessor in assessors:
-            notification = self.create_notification(
-                db=db,
-                recipient_id=assessor.id,
-                notification_type=notification_type,
-                title=title,
-                message=message,
-                assessment_id=assessment_id,
-                governance_area_id=governance_area_id,
-            )
-            notifications.append(notification)
+        notifications = self.create_notifications_bulk(
+            db=db,
+            recipient_ids=[assessor_id for (assessor_id,) in assessor_ids],
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            assessment_id=assessment_id,
+            governance_area_id=governance_area_id,
+        )
 
         self.logger.info(
             f"Created {len(notifications)} notifications for assessors "
@@ -481,8 +577,8 @@ class NotificationService:
             List of created Notification objects
         """
         # Get all active MLGOO users
-        mlgoo_users = (
-            db.query(User)
+        mlgoo_user_ids = (
+            db.query(User.id)
             .filter(
                 User.role == UserRole.MLGOO_DILG,
                 User.is_active == True,
@@ -490,17 +586,14 @@ class NotificationService:
             .all()
         )
 
-        notifications = []
-        for user in mlgoo_users:
-            notification = self.create_notification(
-                db=db,
-                recipient_id=user.id,
-                notification_type=notification_type,
-                title=title,
-                message=message,
-                assessment_id=assessment_id,
-            )
-            notifications.append(notification)
+        notifications = self.create_notifications_bulk(
+            db=db,
+            recipient_ids=[user_id for (user_id,) in mlgoo_user_ids],
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            assessment_id=assessment_id,
+        )
 
         self.logger.info(
             f"Created {len(notifications)} notifications for MLGOO users "
@@ -534,8 +627,8 @@ class NotificationService:
             List of created Notification objects
         """
         # Get all active Validators (system-wide, not area-specific)
-        validators = (
-            db.query(User)
+        validator_ids = (
+            db.query(User.id)
             .filter(
                 User.role == UserRole.VALIDATOR,
                 User.is_active == True,
@@ -543,17 +636,14 @@ class NotificationService:
             .all()
         )
 
-        notifications = []
-        for user in validators:
-            notification = self.create_notification(
-                db=db,
-                recipient_id=user.id,
-                notification_type=notification_type,
-                title=title,
-                message=message,
-                assessment_id=assessment_id,
-            )
-            notifications.append(notification)
+        notifications = self.create_notifications_bulk(
+            db=db,
+            recipient_ids=[user_id for (user_id,) in validator_ids],
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            assessment_id=assessment_id,
+        )
 
         self.logger.info(
             f"Created {len(notifications)} notifications for Validators "
@@ -608,29 +698,35 @@ class NotificationService:
             query.order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
         )
 
-        # Enrich with related data
+        # Enrich with related data (one query per related table for the whole page)
+        assessment_ids = {n.assessment_id for n in notifications if n.assessment_id}
+        barangay_names = (
+            dict(
+                db.query(Assessment.id, Barangay.name)
+                .join(User, Assessment.blgu_user_id == User.id)
+                .join(Barangay, User.barangay_id == Barangay.id)
+                .filter(Assessment.id.in_(assessment_ids))
+                .all()
+            )
+            if assessment_ids
+            else {}
+        )
+        area_ids = {n.governance_area_id for n in notifications if n.governance_area_id}
+        area_names = (
+            dict(
+                db.query(GovernanceArea.id, GovernanceArea.name)
+                .filter(GovernanceArea.id.in_(area_ids))
+                .all()
+            )
+            if area_ids
+            else {}
+        )
+
         enriched = []
         for notification in notifications:
             response = NotificationResponse.model_validate(notification)
-
-            # Add assessment barangay name
-            if notification.assessment_id:
-                assessment = (
-                    db.query(Assessment).filter(Assessment.id == notification.assessment_id).first()
-                )
-                if assessment and assessment.blgu_user and assessment.blgu_user.barangay:
-                    response.assessment_barangay_name = assessment.blgu_user.barangay.name
-
-            # Add governance area name
-            if notification.governance_area_id:
-                area = (
-                    db.query(GovernanceArea)
-                    .filter(GovernanceArea.id == notification.governance_area_id)
-                    .first()
-                )
-                if area:
-                    response.governance_area_name = area.name
-
+            response.assessment_barangay_name = barangay_names.get(notification.assessment_id)
+            response.governance_area_name = area_names.get(notification.governance_area_id)
             enriched.append(response)
 
         return enriched, total, unread_count
@@ -673,6 +769,35 @@ class NotificationService:
             .scalar()
         )
 
+    async def get_counts_async(self, db: AsyncSession, user_id: int) -> tuple[int, int]:
+        """
+        Get unread and total notification counts for a user on the async database path.
+
+        PERFORMANCE: The counts are kept in Redis (see notification_stream) and only
+        read from Postgres, in a single non-blocking query, when Redis does not hold
+        them yet; the result then seeds Redis.
+
+        Args:
+            db: Async database session
+            user_id: User ID
+
+        Returns:
+            Tuple of (unread count, total count)
+        """
+        cached = await notification_stream.get_counts_async(user_id)
+        if cached is not None:
+            return cached
+
+        result = await db.execute(
+            select(
+                func.count(Notification.id).filter(Notification.is_read == False),
+                func.count(Notification.id),
+            ).where(Notification.recipient_id == user_id)
+        )
+        unread_count, total = result.one()
+        await notification_stream.seed_counts_async(user_id, unread_count, total)
+        return unread_count, total
+
     def get_notification_by_id(
         self, db: Session, notification_id: int, user_id: int
     ) -> Notification | None:
@@ -726,6 +851,7 @@ class NotificationService:
             )
         )
         db.commit()
+        notification_stream.publish_read(user_id, result)
         return result
 
     def mark_all_as_read(self, db: Session, user_id: int) -> int:
@@ -754,10 +880,91 @@ class NotificationService:
             )
         )
         db.commit()
+        notification_stream.publish_read(user_id, result, all_read=True)
         return result
 
     # ==================== HELPER METHODS ====================
 
+    def _queue_emails_after_commit(self, db: Session, notification_ids: list[int]) -> None:
+        """
+        Hand notification emails to the email queue once the session commits.
+
+        PERFORMANCE: Request handlers and fan-out loops no longer block on SMTP;
+        the email queue sends batches over a pooled connection and records
+        email_sent_at.
+        """
+        if notification_ids and email_service.is_configured():
+            db.info.setdefault(_PENDING_EMAILS_KEY, []).extend(notification_ids)
+
+    def _push_after_commit(self, db: Session, notifications: list[Notification]) -> None:
+        """Publish new notifications to their recipients' streams once the session commits."""
+        pending = db.info.setdefault(_PENDING_PUSH_KEY, {})
+        for notification in notifications:
+            pending.setdefault(notification.recipient_id, []).append(notification.id)
+
+    def _send_notification_emails(
+        self, db: Session, notifications: list[Notification]
+    ) -> tuple[list[int], list[int]]:
+        """
+        Email notification recipients and mark the sent notifications in one UPDATE.
+
+        Args:
+            db: Database session
+            notifications: Notifications to email
+
+        Returns:
+            Tuple of (IDs emailed, IDs that failed because the SMTP server was unavailable)
+        """
+        if not notifications or not email_service.is_configured():
+            return [], []
+
+        recipient_ids = {notification.recipient_id for notification in notifications}
+        recipients = {
+            user.id: user for user in db.query(User).filter(User.id.in_(recipient_ids)).all()
+        }
+        contexts: dict[tuple[int | None, int | None], dict] = {}
+        batch_ids: list[int] = []
+        batch: list[OutgoingEmail] = []
+
+        for notification in notifications:
+            recipient = recipients.get(notification.recipient_id)
+            if not recipient or not recipient.email:
+                continue
+            try:
+                context_key = (notification.assessment_id, notification.governance_area_id)
+                if context_key not in contexts:
+                    contexts[context_key] = self._build_email_context(db, *context_key)
+
+                subject, html_body, text_body = email_service.build_notification_email(
+                    notification_type=notification.notification_type,
+                    recipient_name=recipient.name,
+                    context=contexts[context_key],
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to build notification email: {e}")
+                continue
+
+            batch_ids.append(notification.id)
+            batch.append(OutgoingEmail(recipient.email, subject, html_body, text_body))
+
+        emailed_ids: list[int] = []
+        retryable_ids: list[int] = []
+        for notification_id, result in zip(batch_ids, email_service.send_emails(batch)):
+            if result.get("success"):
+                emailed_ids.append(notification_id)
+            elif result.get("retryable"):
+                retryable_ids.append(notification_id)
+
+        if emailed_ids:
+            db.execute(
+                update(Notification)
+                .where(Notification.id.in_(emailed_ids))
+                .values(email_sent=True, email_sent_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+
+        return emailed_ids, retryable_ids
+
     def _build_email_context(
         self,
         db: Session,
@@ -796,3 +1003,36 @@ class NotificationService:
 
 # Singleton instance
 notification_service = NotificationService()
+
+
+# ==================== UNIT OF WORK HOOKS ====================
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_committed_notification_emails(session: Session) -> None:
+    """Queue emails for notifications created in the committed transaction."""
+    notification_ids = session.info.pop(_PENDING_EMAILS_KEY, None)
+    if not notification_ids:
+        return
+    # Imported here: the worker module imports this service
+    from app.workers.notifications import queue_notification_emails
+
+    try:
+        queue_notification_emails(notification_ids)
+    except Exception as e:
+        # The in-app notifications are committed; only their emails are lost
+        logger.error(f"Failed to queue {len(notification_ids)} notification email(s): {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_notifications(session: Session) -> None:
+    """Push notifications created in the committed transaction to their recipients."""
+    pending = session.info.pop(_PENDING_PUSH_KEY, None)
+    if pending:
+        notification_stream.publish_created(pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_notification_emails(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_EMAILS_KEY, None)
+    session.info.pop(_PENDING_PUSH_KEY, None)
@@ -1,17 +1,24 @@
 # 📦 Storage Service
 # Handles file uploads to Supabase Storage for MOV files
 
+import base64
+import hashlib
 import logging
 import re
 import time
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
-from urllib.parse import unquote
+from typing import Any, BinaryIO
+from urllib.parse import unquote, urljoin
 from uuid import uuid4
 
+import httpx
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.orm import Session
 from supabase import Client, create_client
 
+from app.core.cache import cache
 from app.core.config import settings
 from app.core.year_resolver import YearPlaceholderResolver
 from app.db.enums import AssessmentStatus, UserRole
@@ -24,6 +31,7 @@ from app.db.models.assessment import (
 )
 from app.db.models.user import User
 from app.services.assessment_lock_service import assessment_lock_service
+from app.services.file_validation_service import file_validation_service
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -31,6 +39,36 @@ logger = logging.getLogger(__name__)
 # Initialize Supabase admin client with service-role key for server-side operations
 _supabase_client: Client | None = None
 
+# PERFORMANCE: Uploads are streamed from the request's spooled temp file one chunk at a
+# time, so an upload holds at most one chunk in memory instead of the whole (up to 50MB) file.
+# Supabase's resumable (TUS) endpoint requires exactly 6MB chunks.
+UPLOAD_CHUNK_SIZE = 6 * 1024 * 1024
+
+# Files larger than one chunk go through the resumable endpoint
+RESUMABLE_UPLOAD_PATH = "/storage/v1/upload/resumable"
+RESUMABLE_UPLOAD_RETRIES = 3  # Consecutive failed chunks before giving up
+RESUMABLE_UPLOAD_TIMEOUT = 60.0  # Seconds per request
+
+
+# PERFORMANCE: Signed URLs are cached in Redis until SIGNED_URL_EXPIRY_MARGIN seconds
+# before they expire, so MOV lists re-render without signing every file again
+SIGNED_URL_CACHE_PREFIX = "mov_signed_url"
+SIGNED_URL_EXPIRY_MARGIN = 300  # A cached URL is never handed out with less validity left
+
+
+def signed_url_cache_key(storage_path: str) -> str:
+    """Cache key of the signed URL for a MOV storage path."""
+    return f"{SIGNED_URL_CACHE_PREFIX}:{storage_path}"
+
+
+@dataclass
+class StreamedUpload:
+    """Size and checksum of a file streamed to storage."""
+
+    size: int
+    sha256: str
+
+
 CANONICAL_DISPLAY_FILENAME_LABEL_TEMPLATES = {
     ("1.6.1", "1_6_1_opt3_a"): (
         "Proof of transfer of the 10% {CURRENT_YEAR} SK funds to the trust fund of the Barangay "
@@ -217,31 +255,24 @@ class StorageService:
         # Format: assessment-{assessment_id}/response-{response_id}/{filename}
         storage_path = f"assessment-{assessment_id}/response-{response_id}/{stored_filename}"
 
-        # Read file contents
-        file_contents = file.file.read()
-        file_size = len(file_contents)
-
-        # Upload to Supabase Storage
+        # Stream to Supabase Storage
         try:
-            result = supabase.storage.from_("movs").upload(
-                path=storage_path,
-                file=file_contents,
-                file_options={"content-type": file.content_type or "application/octet-stream"},
+            upload = self._stream_to_storage(
+                supabase,
+                "movs",
+                storage_path,
+                file,
+                file.content_type or "application/octet-stream",
             )
 
-            # Check for errors (following pattern from assessment_service.py)
-            # The supabase-py client raises on HTTP/storage network error, but check for errors in resp too
-            if isinstance(result, dict) and result.get("error"):
-                raise Exception(f"Supabase upload error: {result['error']}")
-
             logger.info(
                 f"Successfully uploaded MOV file {stored_filename} for response {response_id} "
-                f"to path {storage_path}"
+                f"to path {storage_path} ({upload.size} bytes, sha256 {upload.sha256})"
             )
 
             return {
                 "storage_path": storage_path,
-                "file_size": file_size,
+                "file_size": upload.size,
                 "content_type": file.content_type or "application/octet-stream",
                 "filename": stored_filename,
                 "original_filename": file.filename or stored_filename,
@@ -253,6 +284,161 @@ class StorageService:
             )
             raise
 
+    # ============================================================================
+    # Streaming uploads
+    # ============================================================================
+
+    def _stream_to_storage(
+        self,
+        supabase: Client,
+        bucket: str,
+        storage_path: str,
+        file: UploadFile,
+        content_type: str,
+    ) -> StreamedUpload:
+        """
+        Stream an uploaded file to storage without reading it into memory whole.
+
+        The size is checked before anything is sent, the leading bytes are sniffed
+        for magic bytes, and the SHA-256 is computed as chunks go out. A file that
+        fits in one chunk is sent with a plain upload; larger files use the
+        resumable endpoint, which resumes from the stored offset when a chunk fails.
+
+        Args:
+            supabase: Supabase client
+            bucket: Storage bucket name
+            storage_path: Object path within the bucket
+            file: FastAPI UploadFile object (its spooled temp file is read in chunks)
+            content_type: MIME type to store the object with
+
+        Returns:
+            StreamedUpload with the number of bytes sent and their SHA-256
+
+        Raises:
+            ValueError: If the file is too large or its content is rejected
+            Exception: If the upload fails
+        """
+        source = file.file
+        source.seek(0, 2)
+        size = source.tell()
+        source.seek(0)
+
+        if size > file_validation_service.MAX_FILE_SIZE:
+            raise ValueError(
+                f"File size ({size / (1024 * 1024):.2f}MB) exceeds "
+                f"{file_validation_service.MAX_FILE_SIZE // (1024 * 1024)}MB limit"
+            )
+
+        header = source.read(file_validation_service.SIGNATURE_SNIFF_SIZE)
+        signature_result = file_validation_service.validate_file_signature(header, content_type)
+        if not signature_result.success:
+            raise ValueError(signature_result.error_message)
+        source.seek(0)
+
+        if size <= UPLOAD_CHUNK_SIZE:
+            contents = source.read()
+            sha256 = hashlib.sha256(contents).hexdigest()
+            result = supabase.storage.from_(bucket).upload(
+                path=storage_path,
+                file=contents,
+                file_options={"content-type": content_type},
+            )
+
+            # The supabase-py client raises on HTTP/storage network error, but check for errors in resp too
+            if isinstance(result, dict) and result.get("error"):
+                raise Exception(f"Supabase upload error: {result['error']}")
+        else:
+            sha256 = self._resumable_upload(bucket, storage_path, source, size, content_type)
+
+        return StreamedUpload(size=size, sha256=sha256)
+
+    def _resumable_upload(
+        self,
+        bucket: str,
+        storage_path: str,
+        source: BinaryIO,
+        size: int,
+        content_type: str,
+    ) -> str:
+        """
+        Upload a file in UPLOAD_CHUNK_SIZE chunks through Supabase's TUS endpoint.
+
+        After a failed chunk the stored offset is asked for (HEAD) and sending
+        resumes from there, up to RESUMABLE_UPLOAD_RETRIES consecutive failures.
+
+        Returns:
+            SHA-256 hex digest of the file (each byte hashed once, even when resent)
+        """
+        digest = hashlib.sha256()
+        service_key = settings.SUPABASE_SERVICE_ROLE_KEY
+        metadata = ",".join(
+            f"{name} {base64.b64encode(value.encode()).decode()}"
+            for name, value in (
+                ("bucketName", bucket),
+                ("objectName", storage_path),
+                ("contentType", content_type),
+            )
+        )
+        endpoint = f"{settings.SUPABASE_URL.rstrip('/')}{RESUMABLE_UPLOAD_PATH}"
+
+        with httpx.Client(
+            headers={
+                "Authorization": f"Bearer {service_key}",
+                "apikey": service_key,
+                "Tus-Resumable": "1.0.0",
+            },
+            timeout=RESUMABLE_UPLOAD_TIMEOUT,
+        ) as client:
+            created = client.post(
+                endpoint,
+                headers={"Upload-Length": str(size), "Upload-Metadata": metadata},
+            )
+            created.raise_for_status()
+            upload_url = urljoin(endpoint, created.headers["Location"])
+
+            offset = 0
+            hashed = 0
+            failures = 0
+            while offset < size:
+                source.seek(offset)
+                chunk = source.read(UPLOAD_CHUNK_SIZE)
+                if hashed < offset + len(chunk):
+                    digest.update(chunk[hashed - offset :])
+                    hashed = offset + len(chunk)
+
+                try:
+                    offset = self._send_chunk(client, upload_url, offset, chunk)
+                    failures = 0
+                except httpx.HTTPError as e:
+                    failures += 1
+                    if failures > RESUMABLE_UPLOAD_RETRIES:
+                        raise
+                    logger.warning(
+                        f"Chunk at offset {offset} of {storage_path} failed ({e}), resuming"
+                    )
+                    status_response = client.head(upload_url)
+                    status_response.raise_for_status()
+                    offset = int(status_response.headers["Upload-Offset"])
+
+                # Release this chunk before the next one is read
+                del chunk
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _send_chunk(client: httpx.Client, upload_url: str, offset: int, chunk: bytes) -> int:
+        """PATCH one chunk to a resumable upload and return the new stored offset."""
+        response = client.patch(
+            upload_url,
+            content=chunk,
+            headers={
+                "Upload-Offset": str(offset),
+                "Content-Type": "application/offset+octet-stream",
+            },
+        )
+        response.raise_for_status()
+        return int(response.headers["Upload-Offset"])
+
     # ============================================================================
     # Story 4.5: Backend File Upload Service (Epic 4.0)
     # New methods for indicator-level MOV file uploads
@@ -322,7 +508,7 @@ class StorageService:
         This method handles the complete file upload workflow:
         1. Generate unique filename
         2. Construct storage path
-        3. Upload file to Supabase Storage
+        3. Stream file to Supabase Storage (chunked, never read whole)
         4. Create MOVFile database record
         5. Handle errors and rollback on failure
 
@@ -386,26 +572,19 @@ class StorageService:
         # Get storage path
         storage_path = self._get_storage_path(assessment_id, indicator_id, unique_filename)
 
-        # Read file contents
-        file_contents = file.file.read()
-        file_size = len(file_contents)
         content_type = file.content_type or "application/octet-stream"
 
-        # Upload to Supabase Storage
+        # Stream to Supabase Storage
         try:
-            result = supabase.storage.from_(self.MOV_FILES_BUCKET).upload(
-                path=storage_path,
-                file=file_contents,
-                file_options={"content-type": content_type},
+            upload = self._stream_to_storage(
+                supabase, self.MOV_FILES_BUCKET, storage_path, file, content_type
             )
-
-            # Check for errors in response
-            if isinstance(result, dict) and result.get("error"):
-                raise Exception(f"Supabase upload error: {result['error']}")
+            file_size = upload.size
 
             logger.info(
                 f"Successfully uploaded MOV file {unique_filename} for "
-                f"assessment {assessment_id}, indicator {indicator_id} to path {storage_path}"
+                f"assessment {assessment_id}, indicator {indicator_id} to path {storage_path} "
+                f"({upload.size} bytes, sha256 {upload.sha256})"
             )
 
         except Exception as e:
@@ -821,6 +1000,7 @@ class StorageService:
                 f"Successfully soft deleted MOVFile {file_id} by user {user_id}. "
                 f"Storage deletion: {'success' if deletion_success else 'failed'}"
             )
+            self._invalidate_signed_url(mov_file.file_url)
 
             # After deleting the file, recalculate is_completed for the response
             # This ensures progress tracking updates immediately
@@ -958,6 +1138,8 @@ class StorageService:
             mov_file.file_size = len(rotated_bytes)
             db.commit()
             db.refresh(mov_file)
+            # New URL for the rotated object, so viewers do not reuse a cached copy
+            self._invalidate_signed_url(mov_file.file_url)
 
             logger.info(
                 f"Successfully rotated image {file_id} by {degrees} degrees. "
@@ -994,12 +1176,110 @@ class StorageService:
     # Signed URL Generation for Secure File Access
     # ============================================================================
 
+    def _storage_path_from_url(self, file_url: str) -> str:
+        """
+        Extract the storage path from a MOV file URL.
+
+        URL format: https://[project].supabase.co/storage/v1/object/public/mov-files/{path}
+
+        Raises:
+            ValueError: If the URL does not point into the MOV files bucket
+        """
+        if f"/{self.MOV_FILES_BUCKET}/" not in file_url:
+            logger.error(f"Error extracting storage path from URL {file_url}")
+            raise ValueError(f"Invalid file URL format: {file_url}")
+        encoded_path = file_url.split(f"/{self.MOV_FILES_BUCKET}/", 1)[1]
+        # Decode path, remove query params, and strip leading slashes
+        return unquote(encoded_path).split("?")[0].lstrip("/")
+
+    def _invalidate_signed_url(self, file_url: str) -> None:
+        """Drop the cached signed URL of a file whose stored object changed or went away."""
+        try:
+            cache.delete(signed_url_cache_key(self._storage_path_from_url(file_url)))
+        except ValueError:
+            pass  # Never signed, so never cached
+
+    def get_signed_urls(
+        self, file_urls: Iterable[str], expires_in: int = 3600
+    ) -> dict[str, str | None]:
+        """
+        Generate signed URLs for many files with at most one storage round-trip.
+
+        Cached URLs that stay valid for at least SIGNED_URL_EXPIRY_MARGIN seconds (and
+        no longer than expires_in) are reused; the rest are signed together with the
+        storage bulk signing endpoint and cached until shortly before they expire.
+
+        Args:
+            file_urls: Public file URLs stored in the database
+            expires_in: URL expiration time in seconds (default: 3600 = 1 hour)
+
+        Returns:
+            dict mapping each file URL to its signed URL, or None if the file URL is
+            malformed or the object is missing from storage
+
+        Raises:
+            Exception: If the bulk signing request fails
+        """
+        paths: dict[str, str | None] = {}
+        for file_url in file_urls:
+            try:
+                paths[file_url] = self._storage_path_from_url(file_url)
+            except ValueError:
+                paths[file_url] = None
+
+        storage_paths = {path for path in paths.values() if path is not None}
+        now = time.time()
+        cached = cache.get_many(signed_url_cache_key(path) for path in storage_paths)
+        signed_by_path: dict[str, str | None] = {}
+        for path in storage_paths:
+            entry = cached.get(signed_url_cache_key(path))
+            if entry and SIGNED_URL_EXPIRY_MARGIN <= entry["expires_at"] - now <= expires_in:
+                signed_by_path[path] = entry["url"]
+
+        to_sign = sorted(storage_paths - signed_by_path.keys())
+        if to_sign:
+            try:
+                supabase = _get_supabase_client()
+                results = supabase.storage.from_(self.MOV_FILES_BUCKET).create_signed_urls(
+                    to_sign, expires_in
+                )
+            except Exception as e:
+                logger.error(f"Failed to generate {len(to_sign)} signed URLs: {str(e)}")
+                raise Exception(f"Failed to generate signed URLs: {str(e)}")
+
+            fresh: dict[str, dict[str, Any]] = {}
+            for item in results:
+                signed_path = item.get("path")
+                signed_url = item.get("signedURL") or item.get("signedUrl")
+                if item.get("error") or not signed_url or not signed_path:
+                    logger.warning(
+                        f"File not found in storage: {signed_path}. Error: {item.get('error')}"
+                    )
+                    continue
+                signed_by_path[signed_path] = signed_url
+                fresh[signed_url_cache_key(signed_path)] = {
+                    "url": signed_url,
+                    "expires_at": now + expires_in,
+                }
+
+            if fresh and expires_in > SIGNED_URL_EXPIRY_MARGIN:
+                cache.set_many(fresh, ttl=expires_in - SIGNED_URL_EXPIRY_MARGIN)
+
+            logger.debug(
+                f"Signed {len(fresh)}/{len(to_sign)} MOV files "
+                f"({len(signed_by_path) - len(fresh)} from cache), expires in {expires_in}s"
+            )
+
+        return {
+            file_url: signed_by_path.get(path) if path is not None else None
+            for file_url, path in paths.items()
+        }
+
     def get_signed_url(self, file_url: str, expires_in: int = 3600) -> str:
         """
         Generate a signed URL for secure, time-limited access to a file.
 
-        This method extracts the storage path from a file URL and generates
-        a signed URL that expires after the specified duration.
+        Single-file form of get_signed_urls (shares its cache).
 
         Args:
             file_url: The public file URL stored in the database
@@ -1010,85 +1290,68 @@ class StorageService:
 
         Raises:
             ValueError: If the storage path cannot be extracted from the URL
+            FileNotFoundError: If the file is missing from storage
             Exception: If signed URL generation fails
         """
-        # Extract storage path from file_url
-        # URL format: https://[project].supabase.co/storage/v1/object/public/mov-files/{path}
-        storage_path = None
-        try:
-            # Try to extract path after bucket name
-            if f"/{self.MOV_FILES_BUCKET}/" in file_url:
-                encoded_path = file_url.split(f"/{self.MOV_FILES_BUCKET}/")[1]
-                # Decode path, remove query params, and strip leading slashes
-                storage_path = unquote(encoded_path).split("?")[0].lstrip("/")
-            else:
-                raise ValueError(f"Could not extract storage path from URL: {file_url}")
-        except Exception as e:
-            logger.error(f"Error extracting storage path from URL {file_url}: {str(e)}")
-            raise ValueError(f"Invalid file URL format: {file_url}")
+        storage_path = self._storage_path_from_url(file_url)
+        signed_url = self.get_signed_urls([file_url], expires_in)[file_url]
+        if signed_url is None:
+            raise FileNotFoundError(f"File not found in storage: {storage_path}")
+        return signed_url
 
-        # Get Supabase client and generate signed URL
-        try:
-            supabase = _get_supabase_client()
+    def _check_file_access(self, db: Session, user: User, mov_files: list[MOVFile]) -> None:
+        """
+        Verify a user may view every given MOV file.
 
-            # DEBUG LOGGING for file viewing issue
-            logger.info(f"[SIGNED_URL_DEBUG] URL: {file_url}")
-            logger.info(f"[SIGNED_URL_DEBUG] Extracted Storage Path: {storage_path}")
+        Looks up the files' assessments and indicators in one query each,
+        however many files are checked.
 
-            result = supabase.storage.from_(self.MOV_FILES_BUCKET).create_signed_url(
-                path=storage_path,
-                expires_in=expires_in,
-            )
+        Raises:
+            HTTPException 403: If any file is outside the user's access
+        """
+        from app.db.models.governance_area import Indicator
 
-            # Check for error response from Supabase
-            if isinstance(result, dict):
-                # Handle error responses
-                if "error" in result:
-                    error_msg = result.get("error", "Unknown error")
-                    error_str = str(error_msg).lower()
-                    if "not found" in error_str or "object not found" in error_str:
-                        logger.warning(
-                            f"File not found in storage: {storage_path}. "
-                            f"The physical file may have been deleted."
-                        )
-                        raise FileNotFoundError(f"File not found in storage: {storage_path}")
-                    raise Exception(f"Supabase error: {error_msg}")
-
-                # Extract signed URL from successful response
-                if "signedURL" in result:
-                    signed_url = result["signedURL"]
-                elif "signedUrl" in result:
-                    signed_url = result["signedUrl"]
-                else:
-                    # Unexpected response format
-                    logger.warning(f"Unexpected response format from create_signed_url: {result}")
-                    raise Exception("Failed to extract signed URL from response")
-            elif hasattr(result, "signed_url"):
-                signed_url = result.signed_url
-            else:
-                # Handle different response formats from supabase-py
-                signed_url = str(result)
+        # KATUPARAN_CENTER_USER should not access individual MOV files
+        # They only have read-only access to aggregated analytics data
+        if user.role == UserRole.KATUPARAN_CENTER_USER:
+            raise HTTPException(
+                status_code=403,
+                detail="Katuparan Center users do not have access to individual MOV files",
+            )
 
-            # Validate the signed URL is not empty or an error message
-            if not signed_url or signed_url.startswith("Error"):
-                raise Exception(f"Invalid signed URL received: {signed_url}")
+        # BLGU users can only access files from their own barangay's assessments
+        # Assessment doesn't have barangay_id directly - it's linked via blgu_user_id
+        if user.role == UserRole.BLGU_USER:
+            assessment_ids = {mov_file.assessment_id for mov_file in mov_files}
+            barangay_ids = {
+                barangay_id
+                for (barangay_id,) in db.query(User.barangay_id)
+                .join(Assessment, Assessment.blgu_user_id == User.id)
+                .filter(Assessment.id.in_(assessment_ids))
+                .all()
+            }
+            if barangay_ids - {user.barangay_id}:
+                raise HTTPException(
+                    status_code=403, detail="You don't have permission to access this file"
+                )
 
-            logger.debug(f"Generated signed URL for {storage_path}, expires in {expires_in}s")
-            return signed_url
+        # ASSESSORs can only access files within their assigned governance area
+        # After workflow restructuring: ASSESSORs are area-specific, VALIDATORs are system-wide
+        if user.role == UserRole.ASSESSOR and user.assessor_area_id:
+            indicator_ids = {mov_file.indicator_id for mov_file in mov_files}
+            area_ids = {
+                area_id
+                for (area_id,) in db.query(Indicator.governance_area_id)
+                .filter(Indicator.id.in_(indicator_ids))
+                .all()
+            }
+            if area_ids - {user.assessor_area_id}:
+                raise HTTPException(
+                    status_code=403,
+                    detail="You can only access files within your assigned governance area",
+                )
 
-        except FileNotFoundError:
-            # Re-raise FileNotFoundError to be handled by caller
-            raise
-        except Exception as e:
-            error_str = str(e).lower()
-            # Check if error indicates file not found
-            if "not found" in error_str or "object not found" in error_str or "404" in error_str:
-                logger.warning(f"File not found in storage: {storage_path}. Error: {str(e)}")
-                raise FileNotFoundError(f"File not found in storage: {storage_path}")
-            logger.error(f"Failed to generate signed URL for {storage_path}: {str(e)}")
-            # Log the exception type and args to understand "illegal path" source
-            logger.error(f"[SIGNED_URL_DEBUG] Exception Type: {type(e).__name__}, Args: {e.args}")
-            raise Exception(f"Failed to generate signed URL: {str(e)}")
+        # VALIDATOR and MLGOO_DILG have access to all files (no additional restrictions)
 
     def get_signed_url_for_file(
         self, db: Session, file_id: int, user_id: int, expires_in: int = 3600
@@ -1113,9 +1376,6 @@ class StorageService:
             HTTPException 403: If user doesn't have permission
             Exception: If signed URL generation fails
         """
-        from app.db.models.assessment import Assessment
-        from app.db.models.user import User
-
         # Load the MOV file
         mov_file = db.query(MOVFile).filter(MOVFile.id == file_id).first()
 
@@ -1131,43 +1391,7 @@ class StorageService:
         if not user:
             raise HTTPException(status_code=403, detail="User not found")
 
-        # Permission check based on user role
-        from app.db.enums import UserRole
-        from app.db.models.governance_area import Indicator
-
-        # KATUPARAN_CENTER_USER should not access individual MOV files
-        # They only have read-only access to aggregated analytics data
-        if user.role == UserRole.KATUPARAN_CENTER_USER:
-            raise HTTPException(
-                status_code=403,
-                detail="Katuparan Center users do not have access to individual MOV files",
-            )
-
-        # BLGU users can only access files from their own barangay's assessments
-        if user.role == UserRole.BLGU_USER:
-            assessment = (
-                db.query(Assessment).filter(Assessment.id == mov_file.assessment_id).first()
-            )
-            if assessment:
-                # Get the barangay_id through the assessment's blgu_user
-                # Assessment doesn't have barangay_id directly - it's linked via blgu_user_id
-                blgu_user = db.query(User).filter(User.id == assessment.blgu_user_id).first()
-                if blgu_user and blgu_user.barangay_id != user.barangay_id:
-                    raise HTTPException(
-                        status_code=403, detail="You don't have permission to access this file"
-                    )
-
-        # ASSESSORs can only access files within their assigned governance area
-        # After workflow restructuring: ASSESSORs are area-specific, VALIDATORs are system-wide
-        if user.role == UserRole.ASSESSOR and user.assessor_area_id:
-            indicator = db.query(Indicator).filter(Indicator.id == mov_file.indicator_id).first()
-            if indicator and indicator.governance_area_id != user.assessor_area_id:
-                raise HTTPException(
-                    status_code=403,
-                    detail="You can only access files within your assigned governance area",
-                )
-
-        # VALIDATOR and MLGOO_DILG have access to all files (no additional restrictions)
+        self._check_file_access(db, user, [mov_file])
 
         # Generate and return signed URL
         try:
@@ -1184,6 +1408,48 @@ class StorageService:
                 "Please re-upload the file.",
             )
 
+    def get_signed_urls_for_files(
+        self, db: Session, file_ids: list[int], user_id: int, expires_in: int = 3600
+    ) -> dict[int, str | None]:
+        """
+        Generate signed URLs for many MOV files with permission checking.
+
+        Batch form of get_signed_url_for_file for MOV lists: a fixed number of
+        database queries and at most one storage round-trip, whatever the number
+        of files.
+
+        Args:
+            db: Database session
+            file_ids: IDs of the MOV files
+            user_id: ID of the requesting user
+            expires_in: URL expiration time in seconds (default: 3600 = 1 hour)
+
+        Returns:
+            dict mapping each requested file ID to its signed URL, or None if the
+            file does not exist, has been deleted or is missing from storage
+
+        Raises:
+            HTTPException 403: If the user may not view one of the files
+            Exception: If signed URL generation fails
+        """
+        user = db.query(User).filter(User.id == user_id).first()
+
+        if not user:
+            raise HTTPException(status_code=403, detail="User not found")
+
+        mov_files = (
+            db.query(MOVFile)
+            .filter(MOVFile.id.in_(set(file_ids)), MOVFile.deleted_at.is_(None))
+            .all()
+        )
+        self._check_file_access(db, user, mov_files)
+
+        signed_urls = self.get_signed_urls(
+            (mov_file.file_url for mov_file in mov_files), expires_in
+        )
+        urls_by_id = {mov_file.id: signed_urls[mov_file.file_url] for mov_file in mov_files}
+        return {file_id: urls_by_id.get(file_id) for file_id in file_ids}
+
 
 # Create a singleton instance
 storage_service = StorageService()
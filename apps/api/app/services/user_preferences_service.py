@@ -5,6 +5,7 @@ from collections.abc import Callable
 
 from sqlalchemy.orm import Session
 
+from app.core.principal_cache import principal_cache
 from app.db.models.user import User
 from app.schemas.user_preferences import (
     TourCompletedState,
@@ -96,6 +97,7 @@ class UserPreferencesService:
         """
         user.preferences = prefs
         db.commit()
+        principal_cache.invalidate_user(user.id)
         db.refresh(user)
         return self._parse_preferences(user.preferences)
 
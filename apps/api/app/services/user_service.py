@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 from supabase import Client, create_client
 
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
 from app.core.security import get_password_hash, verify_password
 from app.db.enums import UserRole
 from app.db.models.barangay import Barangay
@@ -348,6 +349,7 @@ class UserService:
             setattr(db_user, field, value)
 
         db.commit()
+        principal_cache.invalidate_user(user_id)
         db.refresh(db_user)
         return db_user
 
@@ -427,6 +429,7 @@ class UserService:
             setattr(db_user, field, value)
 
         db.commit()
+        principal_cache.invalidate_user(user_id)
         db.refresh(db_user)
         return db_user
 
@@ -438,6 +441,7 @@ class UserService:
 
         setattr(db_user, "is_active", False)
         db.commit()
+        principal_cache.invalidate_user(user_id)
         db.refresh(db_user)
         return db_user
 
@@ -449,6 +453,7 @@ class UserService:
 
         setattr(db_user, "is_active", True)
         db.commit()
+        principal_cache.invalidate_user(user_id)
         db.refresh(db_user)
         return db_user
 
@@ -500,6 +505,7 @@ class UserService:
         setattr(db_user, "hashed_password", get_password_hash(new_password))
         setattr(db_user, "must_change_password", False)
         db.commit()
+        principal_cache.invalidate_user(user_id)
         return True
 
     def reset_password(self, db: Session, user_id: int, new_password: str) -> User | None:
@@ -540,6 +546,7 @@ class UserService:
         setattr(db_user, "hashed_password", get_password_hash(new_password))
         setattr(db_user, "must_change_password", True)
         db.commit()
+        principal_cache.invalidate_user(user_id)
         db.refresh(db_user)
         return db_user
 
@@ -778,6 +785,7 @@ class UserService:
         user.logo_url = logo_url
         user.logo_uploaded_at = datetime.now(UTC)
         db.commit()
+        principal_cache.invalidate_user(user_id)
         db.refresh(user)
 
         return user
@@ -846,6 +854,7 @@ class UserService:
         user.logo_url = None
         user.logo_uploaded_at = None
         db.commit()
+        principal_cache.invalidate_user(user_id)
         db.refresh(user)
 
         return user
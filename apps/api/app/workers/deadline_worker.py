@@ -11,18 +11,20 @@
 
 import logging
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 from celery.exceptions import MaxRetriesExceededError
-from sqlalchemy import and_
+from sqlalchemy import update
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from app.core.celery_app import celery_app
 from app.db.base import SessionLocal
 from app.db.enums import AssessmentStatus, NotificationType
 from app.db.models import Assessment, User
+from app.db.models.barangay import Barangay
 from app.db.models.system import AssessmentYear
+from app.schemas.notification import NotificationCreate
 from app.services.assessment_lock_service import assessment_lock_service
 from app.services.notification_service import notification_service
 
@@ -34,8 +36,27 @@ MAX_RETRIES = 3
 RETRY_BACKOFF = 60  # Initial backoff in seconds
 RETRY_BACKOFF_MAX = 300  # Maximum backoff in seconds
 
-# Batch processing configuration
-BATCH_SIZE = 100
+
+class ReminderTier(NamedTuple):
+    """A Phase 1 deadline reminder and the Assessment column recording it was sent."""
+
+    days: int
+    sent_at_column: str
+    notification_type: NotificationType
+    summary_key: str
+
+
+REMINDER_TIERS = (
+    ReminderTier(
+        7, "phase1_reminder_7d_sent_at", NotificationType.DEADLINE_REMINDER_7_DAYS, "7_days"
+    ),
+    ReminderTier(
+        3, "phase1_reminder_3d_sent_at", NotificationType.DEADLINE_REMINDER_3_DAYS, "3_days"
+    ),
+    ReminderTier(
+        1, "phase1_reminder_1d_sent_at", NotificationType.DEADLINE_REMINDER_1_DAY, "1_day"
+    ),
+)
 
 
 # ==================== PROCESS DEADLINE REMINDERS ====================
@@ -55,8 +76,9 @@ def process_deadline_reminders(self: Any) -> dict[str, Any]:
     Daily task to process and send Phase 1 deadline reminders.
 
     Runs via Celery Beat (daily at 8 AM Philippine time).
-    Checks all DRAFT assessments for the active year and sends
-    appropriate reminders (7d/3d/1d) if not already sent.
+    Sends each DRAFT assessment of the active year the reminders (7d/3d/1d)
+    that are due and not already sent. Reminder emails are handed to the
+    batched notifications.send_notification_emails queue.
 
     Returns:
         dict: Summary of reminders sent
@@ -108,75 +130,48 @@ def process_deadline_reminders(self: Any) -> dict[str, Any]:
                 "reminders_sent": 0,
             }
 
-        # Query DRAFT assessments for the active year
-        draft_assessments = (
-            db.query(Assessment)
-            .options(joinedload(Assessment.blgu_user).joinedload(User.barangay))
-            .filter(
-                and_(
+        # PERFORMANCE: One UPDATE ... RETURNING per due tier claims the DRAFT assessments
+        # still missing that reminder and stamps its *_sent_at column. Catch-up reminders
+        # fall out naturally: every tier at or above days_remaining is due.
+        sent_at = now.replace(tzinfo=None)
+        claimed: list[tuple[ReminderTier, int, int]] = []
+        for tier in REMINDER_TIERS:
+            if days_remaining > tier.days:
+                continue
+            sent_at_column = getattr(Assessment, tier.sent_at_column)
+            rows = db.execute(
+                update(Assessment)
+                .where(
                     Assessment.assessment_year == active_year.year,
                     Assessment.status == AssessmentStatus.DRAFT,
                     Assessment.auto_submitted_at.is_(None),
+                    sent_at_column.is_(None),
                 )
-            )
-            .all()
+                .values({tier.sent_at_column: sent_at})
+                .returning(Assessment.id, Assessment.blgu_user_id)
+                .execution_options(synchronize_session=False)
+            ).all()
+            claimed.extend((tier, *row) for row in rows)
+
+        barangay_names = _get_barangay_names(db, {assessment_id for _, assessment_id, _ in claimed})
+        notification_service.create_notifications(
+            db,
+            [
+                _build_deadline_reminder(
+                    tier, assessment_id, blgu_user_id, barangay_names.get(assessment_id)
+                )
+                for tier, assessment_id, blgu_user_id in claimed
+            ],
         )
 
-        logger.info("Found %d DRAFT assessments to check for reminders", len(draft_assessments))
+        # Reminders and their *_sent_at stamps commit together, so a retried run
+        # finds nothing left to claim and never notifies twice. The commit hands
+        # the reminder emails to the batched email queue.
+        db.commit()
 
-        reminders_sent = {
-            "7_days": 0,
-            "3_days": 0,
-            "1_day": 0,
-        }
-
-        # Process assessments in batches
-        for i in range(0, len(draft_assessments), BATCH_SIZE):
-            batch = draft_assessments[i : i + BATCH_SIZE]
-
-            for assessment in batch:
-                try:
-                    # Send catch-up reminders if user missed earlier ones
-                    # Using separate if statements to ensure users get all applicable reminders
-
-                    # Check and send 7-day reminder (if in 7-day window or missed earlier)
-                    if days_remaining <= 7 and assessment.phase1_reminder_7d_sent_at is None:
-                        _send_deadline_reminder(
-                            db, assessment, 7, NotificationType.DEADLINE_REMINDER_7_DAYS
-                        )
-                        assessment.phase1_reminder_7d_sent_at = now
-                        db.flush()  # Flush immediately to prevent duplicate on retry
-                        reminders_sent["7_days"] += 1
-
-                    # Check and send 3-day reminder (if in 3-day window or missed earlier)
-                    if days_remaining <= 3 and assessment.phase1_reminder_3d_sent_at is None:
-                        _send_deadline_reminder(
-                            db, assessment, 3, NotificationType.DEADLINE_REMINDER_3_DAYS
-                        )
-                        assessment.phase1_reminder_3d_sent_at = now
-                        db.flush()
-                        reminders_sent["3_days"] += 1
-
-                    # Check and send 1-day reminder (if in 1-day window or missed earlier)
-                    if days_remaining <= 1 and assessment.phase1_reminder_1d_sent_at is None:
-                        _send_deadline_reminder(
-                            db, assessment, 1, NotificationType.DEADLINE_REMINDER_1_DAY
-                        )
-                        assessment.phase1_reminder_1d_sent_at = now
-                        db.flush()
-                        reminders_sent["1_day"] += 1
-
-                except Exception as e:
-                    logger.error(
-                        "Failed to send reminder for assessment %s: %s",
-                        assessment.id,
-                        str(e),
-                    )
-                    # Continue with next assessment, don't fail entire batch
-                    continue
-
-            # Commit per batch
-            db.commit()
+        reminders_sent = {tier.summary_key: 0 for tier in REMINDER_TIERS}
+        for tier, _, _ in claimed:
+            reminders_sent[tier.summary_key] += 1
 
         total_sent = sum(reminders_sent.values())
         logger.info(
@@ -222,45 +217,43 @@ def process_deadline_reminders(self: Any) -> dict[str, Any]:
         db.close()
 
 
-def _send_deadline_reminder(
-    db: Session,
-    assessment: Assessment,
-    days_remaining: int,
-    notification_type: NotificationType,
-) -> None:
+def _get_barangay_names(db: Session, assessment_ids: set[int]) -> dict[int, str]:
+    """Map assessment IDs to their BLGU's barangay name in one query."""
+    if not assessment_ids:
+        return {}
+    return dict(
+        db.query(Assessment.id, Barangay.name)
+        .join(User, Assessment.blgu_user_id == User.id)
+        .join(Barangay, User.barangay_id == Barangay.id)
+        .filter(Assessment.id.in_(assessment_ids))
+        .all()
+    )
+
+
+def _build_deadline_reminder(
+    tier: ReminderTier,
+    assessment_id: int,
+    blgu_user_id: int,
+    barangay_name: str | None,
+) -> NotificationCreate:
     """
-    Helper function to send a deadline reminder notification.
+    Helper function to build a deadline reminder notification.
 
     Args:
-        db: Database session
-        assessment: Assessment to send reminder for
-        days_remaining: Number of days until deadline
-        notification_type: Type of notification to send
+        tier: Reminder tier being sent
+        assessment_id: Assessment the reminder is for
+        blgu_user_id: BLGU user receiving the reminder
+        barangay_name: Barangay of the assessment, if known
     """
-    if not assessment.blgu_user_id:
-        logger.warning("Assessment %s has no BLGU user. Skipping reminder.", assessment.id)
-        return
-
-    barangay_name = "Unknown Barangay"
-    if assessment.blgu_user and assessment.blgu_user.barangay:
-        barangay_name = assessment.blgu_user.barangay.name
-
-    day_word = "day" if days_remaining == 1 else "days"
-
-    notification_service.notify_blgu_user(
-        db=db,
-        notification_type=notification_type,
-        title=f"Deadline Reminder: {days_remaining} {day_word} remaining",
-        message=f"Your SGLGB assessment for {barangay_name} must be submitted within {days_remaining} {day_word}. Please complete and submit your assessment before the deadline.",
-        blgu_user_id=assessment.blgu_user_id,
-        assessment_id=assessment.id,
-    )
-
-    logger.info(
-        "Sent %d-day reminder for assessment %s (%s)",
-        days_remaining,
-        assessment.id,
-        barangay_name,
+    barangay_name = barangay_name or "Unknown Barangay"
+    day_word = "day" if tier.days == 1 else "days"
+
+    return NotificationCreate(
+        recipient_id=blgu_user_id,
+        notification_type=tier.notification_type,
+        title=f"Deadline Reminder: {tier.days} {day_word} remaining",
+        message=f"Your SGLGB assessment for {barangay_name} must be submitted within {tier.days} {day_word}. Please complete and submit your assessment before the deadline.",
+        assessment_id=assessment_id,
     )
 
 
@@ -272,7 +272,7 @@ def _generate_rework_summary_logic(
         try:
             from app.core.cache import cache
 
-            deleted = cache.delete_pattern("dashboard_kpis:*")
+            deleted = cache.invalidate_assessment_year(assessment.assessment_year)
             if deleted > 0:
                 logger.info(
                     "♻️ Dashboard cache invalidated (%d keys) after rework summary for assessment %s",
@@ -501,7 +501,7 @@ def _generate_calibration_summary_logic(
         try:
             from app.core.cache import cache
 
-            deleted = cache.delete_pattern("dashboard_kpis:*")
+            deleted = cache.invalidate_assessment_year(assessment.assessment_year)
             if deleted > 0:
                 logger.info(
                     "♻️ Dashboard cache invalidated (%d keys) after calibration summary for assessment %s area %s",
@@ -30,6 +30,9 @@ MAX_RETRIES = 3
 RETRY_BACKOFF = 60  # Initial backoff in seconds
 RETRY_BACKOFF_MAX = 300  # Maximum backoff in seconds
 
+# Notifications emailed per send_notification_emails task
+EMAIL_BATCH_SIZE = 100
+
 
 class PermanentTaskError(Exception):
     """Exception for errors that should NOT trigger a retry (e.g., resource not found)."""
@@ -1538,3 +1541,97 @@ def send_deadline_expired_notification(self: Any, assessment_id: int) -> dict[st
 
     finally:
         db.close()
+
+
+# ==================== BATCHED NOTIFICATION EMAILS ====================
+
+
+@celery_app.task(
+    bind=True,
+    name="notifications.send_notification_emails",
+    autoretry_for=(OperationalError, SQLAlchemyError, ConnectionError, TimeoutError),
+    retry_backoff=RETRY_BACKOFF,
+    retry_backoff_max=RETRY_BACKOFF_MAX,
+    max_retries=MAX_RETRIES,
+    retry_jitter=True,
+)
+def send_notification_emails(self: Any, notification_ids: list[int]) -> dict[str, Any]:
+    """
+    Email queue: sends the emails of committed notifications as one SMTP batch.
+
+    Notifications queue their emails when the creating session commits (see
+    NotificationService._queue_emails_after_commit), in EMAIL_BATCH_SIZE batches.
+    The batch goes over the worker's pooled SMTP connection and email_sent_at is
+    recorded here. Notifications already emailed are skipped, so retries never
+    send duplicates.
+
+    Args:
+        notification_ids: IDs of the notifications to email
+
+    Returns:
+        dict: Number of emails sent
+
+    Retry Policy:
+        - Emails that failed because the SMTP server was unavailable are retried
+          with the batch (up to 3 times, exponential backoff); emails already sent
+          are recorded before the retry
+    """
+    db: Session = SessionLocal()
+
+    try:
+        result = notification_service.send_notification_emails(db, notification_ids)
+        db.commit()
+
+        logger.info(
+            "Notification email batch: %d of %d notification(s) emailed, %d to retry",
+            result["sent"],
+            len(notification_ids),
+            result["retryable"],
+        )
+
+        if result["retryable"]:
+            raise ConnectionError(
+                f"SMTP server unavailable for {result['retryable']} notification email(s)"
+            )
+
+        return {
+            "success": True,
+            "notifications": len(notification_ids),
+            "emails_sent": result["sent"],
+        }
+
+    except (OperationalError, SQLAlchemyError, ConnectionError, TimeoutError) as e:
+        logger.warning(
+            "Transient error sending notification emails (attempt %d/%d): %s",
+            self.request.retries + 1,
+            MAX_RETRIES + 1,
+            str(e),
+        )
+        db.rollback()
+        raise
+
+    except MaxRetriesExceededError:
+        logger.error("Max retries exceeded for notification email batch")
+        return {"success": False, "error": "Max retries exceeded"}
+
+    except Exception as e:
+        logger.error("Unexpected error sending notification emails: %s", str(e), exc_info=True)
+        db.rollback()
+        return {"success": False, "error": str(e)}
+
+    finally:
+        db.close()
+
+
+def queue_notification_emails(notification_ids: list[int]) -> int:
+    """
+    Enqueue emails for committed notifications, EMAIL_BATCH_SIZE per task.
+
+    Returns:
+        Number of batches queued
+    """
+    batches = 0
+    for i in range(0, len(notification_ids), EMAIL_BATCH_SIZE):
+        send_notification_emails.delay(notification_ids[i : i + EMAIL_BATCH_SIZE])
+        batches += 1
+    return batches
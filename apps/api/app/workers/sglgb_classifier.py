@@ -0,0 +1,259 @@
+# 🏷️ SGLGB Classifier Worker
+# Background tasks for bulk re-classification of assessments (3+1 rule)
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.celery_app import celery_app
+from app.db.base import SessionLocal
+from app.db.enums import AssessmentStatus
+from app.db.models import Assessment
+from app.services.analytics_rollup_service import analytics_rollup_service
+from app.services.intelligence_service import intelligence_service
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Retry configuration constants
+MAX_RETRIES = 3
+RETRY_BACKOFF = 60  # Initial backoff in seconds
+RETRY_BACKOFF_MAX = 300  # Maximum backoff in seconds
+
+# Number of assessments loaded, evaluated and updated per round-trip
+BATCH_SIZE = 200
+
+# Assessments whose stored SGLGB results must follow indicator/override changes
+RECLASSIFIABLE_STATUSES = [
+    AssessmentStatus.COMPLETED,
+    AssessmentStatus.AWAITING_MLGOO_APPROVAL,
+]
+
+
+def _reclassify_year_logic(
+    year: int,
+    batch_size: int = BATCH_SIZE,
+    db: Session | None = None,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Core logic for re-classifying every finalized assessment of a year.
+
+    The indicator tree is loaded once for the whole run. Each batch then costs
+    one query for the assessments, one for their responses, at most one for
+    BBI results, and a single bulk UPDATE for the rows whose results changed.
+
+    Args:
+        year: Assessment year to re-classify
+        batch_size: Number of assessments processed per batch
+        db: Optional database session (for testing)
+        progress_callback: Optional callable receiving progress metadata after each batch
+
+    Returns:
+        dict: Result with processed/changed counts, elapsed time and throughput
+    """
+    needs_cleanup = False
+    if db is None:
+        db = SessionLocal()
+        needs_cleanup = True
+
+    started = time.perf_counter()
+    processed = 0
+    changed = 0
+
+    try:
+        assessment_ids = [
+            row[0]
+            for row in db.query(Assessment.id)
+            .filter(
+                Assessment.assessment_year == year,
+                Assessment.status.in_(RECLASSIFIABLE_STATUSES),
+            )
+            .order_by(Assessment.id)
+            .all()
+        ]
+        total = len(assessment_ids)
+
+        logger.info("Starting SGLGB re-classification for year %s: %d assessments", year, total)
+
+        tree = intelligence_service.load_area_indicator_tree(db)
+
+        for i in range(0, total, batch_size):
+            batch_ids = assessment_ids[i : i + batch_size]
+
+            current = {
+                row.id: (row.final_compliance_status, row.area_results)
+                for row in db.query(
+                    Assessment.id,
+                    Assessment.final_compliance_status,
+                    Assessment.area_results,
+                ).filter(Assessment.id.in_(batch_ids))
+            }
+            inputs = intelligence_service.load_classification_inputs(db, batch_ids, tree)
+
+            now = datetime.now(UTC)
+            updates: list[dict[str, Any]] = []
+            for assessment_id in batch_ids:
+                statuses, bbi_ratings = inputs[assessment_id]
+                area_results = intelligence_service.evaluate_area_results(
+                    tree, statuses, bbi_ratings
+                )
+                compliance_status = intelligence_service.apply_three_plus_one_rule(area_results)
+
+                # Skip the write when nothing changed to keep the UPDATE set minimal
+                if current.get(assessment_id) == (compliance_status, area_results):
+                    continue
+
+                updates.append(
+                    {
+                        "id": assessment_id,
+                        "final_compliance_status": compliance_status,
+                        "area_results": area_results,
+                        "updated_at": now,
+                    }
+                )
+
+            if updates:
+                db.bulk_update_mappings(Assessment, updates)
+                # Bulk updates bypass the unit of work, so refresh rollups explicitly
+                analytics_rollup_service.refresh_assessments(
+                    db, [update["id"] for update in updates]
+                )
+            db.commit()
+
+            processed += len(batch_ids)
+            changed += len(updates)
+            elapsed = time.perf_counter() - started
+            progress = {
+                "year": year,
+                "processed": processed,
+                "total": total,
+                "changed": changed,
+                "elapsed_seconds": round(elapsed, 3),
+                "assessments_per_second": round(processed / elapsed, 2) if elapsed else None,
+            }
+            logger.info(
+                "Re-classified %d/%d assessments for year %s (%d changed, %.1f/s)",
+                processed,
+                total,
+                year,
+                changed,
+                progress["assessments_per_second"] or 0.0,
+            )
+            if progress_callback is not None:
+                progress_callback(progress)
+
+        elapsed = time.perf_counter() - started
+        return {
+            "success": True,
+            "year": year,
+            "total": total,
+            "processed": processed,
+            "changed": changed,
+            "elapsed_seconds": round(elapsed, 3),
+            "assessments_per_second": round(processed / elapsed, 2) if elapsed else None,
+        }
+
+    except Exception:
+        db.rollback()
+        raise
+
+    finally:
+        if needs_cleanup:
+            db.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="classification.reclassify_assessment_year",
+    autoretry_for=(OperationalError, SQLAlchemyError, ConnectionError, TimeoutError),
+    retry_backoff=RETRY_BACKOFF,
+    retry_backoff_max=RETRY_BACKOFF_MAX,
+    max_retries=MAX_RETRIES,
+    retry_jitter=True,
+)
+def reclassify_assessment_year(
+    self: Any, year: int, batch_size: int = BATCH_SIZE
+) -> dict[str, Any]:
+    """
+    Re-run the SGLGB 3+1 classification for all finalized assessments of a year.
+
+    Triggered after an indicator definition or an MLGOO override changes the
+    inputs of many assessments at once. Progress (processed/total/changed and
+    throughput) is published as the PROGRESS task state after every batch.
+
+    Batches are idempotent: re-running the task after a retry simply
+    re-evaluates the remaining (or already updated) assessments.
+
+    Args:
+        year: Assessment year to re-classify
+        batch_size: Number of assessments processed per batch
+
+    Returns:
+        dict: Result of the re-classification run
+    """
+
+    def report_progress(progress: dict[str, Any]) -> None:
+        self.update_state(state="PROGRESS", meta=progress)
+
+    return _reclassify_year_logic(year, batch_size=batch_size, progress_callback=report_progress)
+
+
+def _rebuild_analytics_rollups_logic(year: int, db: Session | None = None) -> dict[str, Any]:
+    """
+    Core logic for rebuilding the analytics rollups of an assessment year.
+
+    Args:
+        year: Assessment year to rebuild
+        db: Optional database session (for testing)
+
+    Returns:
+        dict: Result with the number of assessments aggregated
+    """
+    needs_cleanup = False
+    if db is None:
+        db = SessionLocal()
+        needs_cleanup = True
+
+    try:
+        assessments = analytics_rollup_service.rebuild_year(db, year)
+        db.commit()
+        return {"success": True, "year": year, "assessments": assessments}
+
+    except Exception:
+        db.rollback()
+        raise
+
+    finally:
+        if needs_cleanup:
+            db.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="classification.rebuild_analytics_rollups",
+    autoretry_for=(OperationalError, SQLAlchemyError, ConnectionError, TimeoutError),
+    retry_backoff=RETRY_BACKOFF,
+    retry_backoff_max=RETRY_BACKOFF_MAX,
+    max_retries=MAX_RETRIES,
+    retry_jitter=True,
+)
+def rebuild_analytics_rollups(self: Any, year: int) -> dict[str, Any]:
+    """
+    Rebuild the per-year analytics rollups from assessments and responses.
+
+    Rollups are normally maintained incrementally; run this once per year after
+    the rollup tables are created, or to reconcile after raw SQL/bulk deletes.
+
+    Args:
+        year: Assessment year to rebuild
+
+    Returns:
+        dict: Result of the rebuild
+    """
+    return _rebuild_analytics_rollups_logic(year)
@@ -8,7 +8,7 @@ Usage:
     celery -A app.core.celery_app worker --loglevel=info
 
     # Start a worker for specific queues
-    celery -A app.core.celery_app worker --loglevel=info --queues=notifications,classification
+    celery -A app.core.celery_app worker --loglevel=info --queues=notifications,email,classification
 
     # Start a worker with concurrency
     celery -A app.core.celery_app worker --loglevel=info --concurrency=4
@@ -4,6 +4,7 @@
 import logging
 from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import PlainTextResponse
@@ -16,6 +17,7 @@ from app.core.config import settings
 from app.core.exception_handlers import register_exception_handlers
 from app.middleware import (
     CacheHeadersMiddleware,
+    CompressionMiddleware,
     MetricsMiddleware,
     RateLimitMiddleware,
     RequestLoggingMiddleware,
@@ -43,6 +45,10 @@ async def lifespan(app: FastAPI):
 
     Set FAIL_FAST=False in .env only if you need to bypass startup checks temporarily.
     """
+    # PERFORMANCE: Bound the threadpool that runs sync dependencies and offloaded
+    # endpoints (see app.api.routing.OffloadedRoute)
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
+
     # Startup checks
     if settings.FAIL_FAST:
         # Strict mode: Let exceptions crash the app
@@ -59,6 +65,10 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    from app.db.base import async_engine
+
+    if async_engine is not None:
+        await async_engine.dispose()
     startup_service.log_shutdown()
 
 
@@ -95,10 +105,14 @@ app.add_middleware(MetricsMiddleware)
 # 3. Rate limiting
 app.add_middleware(RateLimitMiddleware)
 
-# 4. Cache headers (PERFORMANCE: adds HTTP cache headers to responses)
+# 4. Response compression (PERFORMANCE: gzips JSON/text; runs inside cache headers
+#    so ETags are computed per encoding)
+app.add_middleware(CompressionMiddleware)
+
+# 5. Cache headers (PERFORMANCE: adds HTTP cache headers to responses)
 app.add_middleware(CacheHeadersMiddleware)
 
-# 5. Security headers (innermost - adds headers to all responses)
+# 6. Security headers (innermost - adds headers to all responses)
 app.add_middleware(SecurityHeadersMiddleware)
 
 
@@ -455,3 +455,49 @@ def test_parent_override_fail_causes_area_failure_even_if_leaf_passes(db_session
 
     assert result["area_results"]["Financial Administration and Sustainability"] == "Failed"
     assert result["final_compliance_status"] == ComplianceStatus.FAILED.value
+
+
+def test_classification_query_count_is_constant(test_data):
+    """
+    Classification loads the indicator tree, responses and BBI results once.
+
+    Regression guard: the previous implementation re-evaluated each area up to twice
+    and issued several queries per area, so finalization slowed down under load.
+    """
+    from sqlalchemy import event
+
+    db_session = test_data["db_session"]
+    assessment = test_data["assessment"]
+
+    for response_id, indicator in enumerate(db_session.query(Indicator).all(), start=1):
+        db_session.add(
+            AssessmentResponse(
+                id=response_id,
+                assessment_id=assessment.id,
+                indicator_id=indicator.id,
+                response_data={},
+                is_completed=True,
+                validation_status=ValidationStatus.PASS,
+            )
+        )
+    db_session.commit()
+    assessment_id = assessment.id
+
+    statements: list[str] = []
+
+    def count_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", count_selects)
+    try:
+        result = intelligence_service.classify_assessment(db_session, assessment_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_selects)
+
+    assert result["final_compliance_status"] == ComplianceStatus.PASSED.value
+    assert set(result["area_results"].values()) == {"Passed"}
+    # Assessment lookup + indicator tree + responses + BBI results + post-commit refresh,
+    # plus the analytics rollup refresh on commit (ledger, assessments, responses, area names)
+    assert len(statements) <= 9, statements
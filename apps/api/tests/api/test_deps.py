@@ -3,13 +3,16 @@ Tests for FastAPI dependency functions (app/api/deps.py)
 """
 
 import uuid
+from unittest.mock import patch
 
 import pytest
 from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_external_user
+from app.api.deps import get_current_external_user, get_current_user_async
+from app.core.security import create_access_token
 from app.db.enums import UserRole
 from app.db.models.user import User
 
@@ -254,3 +257,43 @@ def test_katuparan_center_user_role_exists():
     """Test that KATUPARAN_CENTER_USER role exists in UserRole enum"""
     assert hasattr(UserRole, "KATUPARAN_CENTER_USER")
     assert UserRole.KATUPARAN_CENTER_USER.value == "KATUPARAN_CENTER_USER"
+
+
+# ====================================================================
+# get_current_user_async Tests
+# ====================================================================
+
+
+def _bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_async_loads_user(blgu_user: User, async_db_session):
+    """Test that the async dependency loads the token's user via AsyncSession"""
+    token = create_access_token(blgu_user.id)
+    with patch("app.api.deps.is_token_blacklisted", return_value=False):
+        user = await get_current_user_async(credentials=_bearer(token), db=async_db_session)
+
+    assert user.id == blgu_user.id
+    assert user.email == blgu_user.email
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_async_rejects_invalid_and_revoked_tokens(
+    blgu_user: User, async_db_session
+):
+    """Test that invalid, revoked and unknown-user tokens return 401"""
+    db = async_db_session
+    with patch("app.api.deps.is_token_blacklisted", return_value=False):
+        for token in ("not-a-jwt", create_access_token(blgu_user.id + 1000)):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user_async(credentials=_bearer(token), db=db)
+            assert exc_info.value.status_code == 401
+
+    with patch("app.api.deps.is_token_blacklisted", return_value=True):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_async(
+                credentials=_bearer(create_access_token(blgu_user.id)), db=db
+            )
+    assert exc_info.value.detail == "Token has been revoked"
@@ -0,0 +1,144 @@
+"""
+Tests for the orjson response class and precompressed cached responses (app/api/responses.py)
+"""
+
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from app.api.responses import FastJSONResponse, cached_json_response
+from app.db.enums import AssessmentStatus
+from app.middleware.compression import gzip_compress, gzip_decompress
+
+
+class Item(BaseModel):
+    item_id: int = Field(alias="itemId")
+    created_at: datetime
+
+
+def _payload() -> dict[str, Any]:
+    return {
+        "status": AssessmentStatus.DRAFT,
+        "submitted_at": datetime(2025, 3, 1, 8, 30, 15, 123456),
+        "validated_at": datetime(2025, 3, 2, tzinfo=UTC),
+        "area_status": {1: "approved", 2: "draft"},
+        "score": Decimal("87.5"),
+        "reference": uuid4(),
+        "tags": ("a", "b"),
+        "nested": [{"value": None, "flag": True}],
+    }
+
+
+def test_render_matches_jsonable_encoder():
+    """orjson output decodes to what FastAPI's default encoder would produce"""
+    payload = _payload()
+
+    rendered = FastJSONResponse(payload).body
+
+    # Round-trip the expected value too: JSON object keys are strings (area_status)
+    assert json.loads(rendered) == json.loads(json.dumps(jsonable_encoder(payload)))
+
+
+def test_render_pydantic_model_by_alias():
+    item = Item(itemId=1, created_at=datetime(2025, 1, 1))
+
+    rendered = FastJSONResponse({"items": [item]}).body
+
+    assert json.loads(rendered) == {"items": [{"itemId": 1, "created_at": "2025-01-01T00:00:00"}]}
+
+
+def test_endpoint_response_skips_response_model_validation():
+    """A returned FastJSONResponse is sent as is; the model only documents the route"""
+    app = FastAPI()
+
+    @app.get("/item", response_model=Item, response_class=FastJSONResponse)
+    def get_item():
+        return FastJSONResponse({"itemId": 1, "created_at": datetime(2025, 1, 1), "extra": 1})
+
+    client = TestClient(app)
+    response = client.get("/item")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["extra"] == 1
+    assert (
+        "application/json" in app.openapi()["paths"]["/item"]["get"]["responses"]["200"]["content"]
+    )
+
+
+class TestCachedJsonResponse:
+    """Precompressed bodies served from the cache"""
+
+    AREAS = [{"id": i, "name": f"Area {i}", "code": f"GA{i}"} for i in range(100)]
+
+    @staticmethod
+    def _request(accept_encoding: str = "gzip") -> MagicMock:
+        request = MagicMock()
+        request.headers = {"accept-encoding": accept_encoding}
+        return request
+
+    def test_miss_renders_compresses_and_stores(self):
+        load = MagicMock(return_value=self.AREAS)
+        with patch("app.api.responses.cache") as mock_cache:
+            mock_cache.get_rendered.return_value = None
+            mock_cache.rendered_source.return_value = "digest"
+
+            response = cached_json_response(self._request(), "lookup:areas", load)
+
+        # The body is stored against the value version identified before loading
+        mock_cache.rendered_source.assert_called_once_with("lookup:areas")
+        stored_key, stored_body, source = mock_cache.set_rendered.call_args.args
+        assert (stored_key, source) == ("lookup:areas", "digest")
+        assert response.body == stored_body
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip_decompress(response.body)) == self.AREAS
+
+    def test_hit_skips_load(self):
+        compressed = gzip_compress(json.dumps(self.AREAS).encode())
+        load = MagicMock()
+        with patch("app.api.responses.cache") as mock_cache:
+            mock_cache.get_rendered.return_value = compressed
+
+            response = cached_json_response(self._request(), "lookup:areas", load)
+
+        load.assert_not_called()
+        assert response.body == compressed
+        assert response.headers["Vary"] == "Accept-Encoding"
+
+    def test_identity_clients_get_plain_json(self):
+        compressed = gzip_compress(json.dumps(self.AREAS).encode())
+        with patch("app.api.responses.cache") as mock_cache:
+            mock_cache.get_rendered.return_value = compressed
+
+            response = cached_json_response(self._request("identity"), "lookup:areas", MagicMock())
+
+        assert "Content-Encoding" not in response.headers
+        assert json.loads(response.body) == self.AREAS
+
+    def test_body_of_uncached_value_is_not_stored(self):
+        """A value computed by load() itself may already be replaced when it is stored"""
+        with patch("app.api.responses.cache") as mock_cache:
+            mock_cache.get_rendered.return_value = None
+            mock_cache.rendered_source.return_value = None
+
+            response = cached_json_response(self._request(), "lookup:areas", lambda: self.AREAS)
+
+        mock_cache.set_rendered.assert_not_called()
+        assert json.loads(gzip_decompress(response.body)) == self.AREAS
+
+    def test_small_payload_is_not_stored(self):
+        with patch("app.api.responses.cache") as mock_cache:
+            mock_cache.get_rendered.return_value = None
+
+            response = cached_json_response(self._request(), "lookup:areas", lambda: [])
+
+        mock_cache.set_rendered.assert_not_called()
+        assert "Content-Encoding" not in response.headers
+        assert json.loads(response.body) == []
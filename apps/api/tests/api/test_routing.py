@@ -0,0 +1,105 @@
+"""
+Tests for the threadpool-offloading route class (app/api/routing.py)
+"""
+
+import importlib
+import inspect
+import pkgutil
+import threading
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+import app.api.v1
+from app.api.routing import OffloadedRoute, is_native_async, native_async
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def get_prefix() -> str:
+    return "item"
+
+
+@pytest.fixture
+def offload_client():
+    router = APIRouter(route_class=OffloadedRoute)
+
+    @router.get("/thread")
+    async def offloaded_thread():
+        return {"thread": threading.get_ident()}
+
+    @router.get("/native-thread")
+    @native_async
+    async def native_thread():
+        return {"thread": threading.get_ident()}
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int, suffix: str = "", prefix: str = Depends(get_prefix)) -> Item:
+        """Fetch an item."""
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="Item not found")
+        return Item(id=item_id, name=f"{prefix}-{item_id}{suffix}")
+
+    @router.get("/sync")
+    def sync_endpoint():
+        return {"ok": True}
+
+    test_app = FastAPI()
+    test_app.include_router(router, prefix="/api")
+    return TestClient(test_app), router
+
+
+def test_async_endpoint_runs_in_worker_thread(offload_client):
+    """Unmarked async endpoints run off the event loop thread"""
+    client, _ = offload_client
+
+    loop_thread = client.get("/api/native-thread").json()["thread"]
+    worker_thread = client.get("/api/thread").json()["thread"]
+
+    assert worker_thread != loop_thread
+
+
+def test_offloaded_endpoint_keeps_signature_and_errors(offload_client):
+    """Parameters, dependencies, return-annotation models and HTTP errors still work"""
+    client, router = offload_client
+
+    response = client.get("/api/items/3", params={"suffix": "x"})
+    assert response.status_code == 200
+    assert response.json() == {"id": 3, "name": "item-3x"}
+
+    assert client.get("/api/items/abc").status_code == 422
+    missing = client.get("/api/items/0")
+    assert missing.status_code == 404
+    assert missing.json()["detail"] == "Item not found"
+
+    route = next(r for r in router.routes if r.path == "/items/{item_id}")
+    assert route.response_model is Item
+    assert route.endpoint.__name__ == "get_item"
+    assert route.endpoint.__doc__ == "Fetch an item."
+
+
+def test_sync_and_native_endpoints_are_not_wrapped(offload_client):
+    """Sync endpoints and @native_async endpoints are registered unchanged"""
+    _, router = offload_client
+    endpoints = {route.path: route.endpoint for route in router.routes}
+
+    assert endpoints["/sync"].__name__ == "sync_endpoint"
+    assert not hasattr(endpoints["/sync"], "__sinag_offloaded__")
+    assert inspect.iscoroutinefunction(endpoints["/native-thread"])
+    assert is_native_async(endpoints["/native-thread"])
+
+
+def test_no_v1_endpoint_blocks_the_event_loop():
+    """Every v1 async endpoint is either offloaded or explicitly marked native async"""
+    for module_info in pkgutil.iter_modules(app.api.v1.__path__):
+        module = importlib.import_module(f"app.api.v1.{module_info.name}")
+        for route in module.router.routes:
+            endpoint = route.endpoint
+            assert not inspect.iscoroutinefunction(endpoint) or is_native_async(endpoint), (
+                f"{module_info.name}: {route.path} runs blocking code on the event loop"
+            )
@@ -717,3 +717,34 @@ def test_get_form_schema_excludes_calculation_schema(
     assert "calculation_schema" not in data
     # Also check it's not nested in form_schema
     assert "calculation_schema" not in data["form_schema"]
+
+
+def test_list_indicators_conditional_get(
+    client: TestClient,
+    db_session: Session,
+    admin_user: User,
+    test_indicator: Indicator,
+    governance_area: GovernanceArea,
+):
+    """Unchanged indicator lists are revalidated with a 304"""
+    _override_admin_and_db(client, admin_user, db_session)
+
+    response = client.get("/api/v1/indicators")
+    etag = response.headers["ETag"]
+
+    not_modified = client.get("/api/v1/indicators", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    db_session.add(
+        Indicator(
+            name=f"New Indicator {uuid.uuid4().hex[:8]}",
+            governance_area_id=governance_area.id,
+            version=1,
+        )
+    )
+    db_session.commit()
+
+    changed = client.get("/api/v1/indicators", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
@@ -29,8 +29,8 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 def clear_user_overrides(client):
     """Clear user-related dependency overrides after each test"""
     yield
-    if deps.get_current_active_user in client.app.dependency_overrides:
-        del client.app.dependency_overrides[deps.get_current_active_user]
+    for dependency in (deps.get_current_active_user, deps.get_current_active_user_async):
+        client.app.dependency_overrides.pop(dependency, None)
 
 
 @pytest.fixture
@@ -121,6 +121,9 @@ def _override_user_and_db(client, user: User, db_session: Session):
             pass
 
     client.app.dependency_overrides[deps.get_current_active_user] = _override_current_active_user
+    client.app.dependency_overrides[deps.get_current_active_user_async] = (
+        _override_current_active_user
+    )
     client.app.dependency_overrides[deps.get_db] = _override_get_db
 
 
@@ -22,6 +22,12 @@ from pathlib import Path
 # which skips all external connection checks (PostgreSQL, Redis, Gemini, Supabase)
 os.environ["TESTING"] = "true"
 os.environ["SKIP_STARTUP_SEEDING"] = "true"
+# User IDs are reused across tests, so resolved tokens must not outlive a test
+os.environ["PRINCIPAL_CACHE_TTL_SECONDS"] = "0"
+# Rate limits are counted in process so RateLimitMiddleware.clear_rate_limits() resets them
+os.environ["RATE_LIMIT_REDIS_ENABLED"] = "false"
+# Notification counts are read from Postgres so they always match the test database
+os.environ["NOTIFICATION_PUSH_ENABLED"] = "false"
 
 # Add the parent directory to Python path so we can import main and app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -92,13 +98,16 @@ import app.core.security
 app.core.security.pwd_context = _fast_pwd_context
 
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 # Ensure all ORM models are registered on Base.metadata before creating tables
 from app.db import models  # noqa: F401
-from app.db.base import Base, get_db
+from app.db.base import Base, get_async_db, get_db
 from main import app
 
 # Test database URL (use SQLite for simplicity in tests)
@@ -118,6 +127,23 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine on the same database for endpoints on the async database path.
+# NullPool: each TestClient runs its own event loop, so connections can't be reused.
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def override_get_async_db():
+    """
+    Override async database dependency for testing.
+    Sees everything the test's session has committed.
+    """
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 # Global variable to hold the current test's session for dependency override
 _test_session: Session | None = None
 
@@ -224,6 +250,17 @@ def db_session(db_engine):
         connection.close()
 
 
+@pytest_asyncio.fixture
+async def async_db_session(db_session):
+    """
+    Async database session for code on the async database path.
+
+    Depends on db_session so tables are cleaned first; it sees committed data only.
+    """
+    async with TestingAsyncSessionLocal() as session:
+        yield session
+
+
 @pytest.fixture(scope="function")
 def client(db_engine):
     """
@@ -232,6 +269,7 @@ def client(db_engine):
     Function-scoped to ensure each test gets a fresh client state.
     """
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     # Don't clear overrides here - they're needed for the whole session
@@ -308,9 +346,18 @@ def mock_assessment(db_session, mock_blgu_user):
 
     from app.db.enums import AssessmentStatus, ComplianceStatus
     from app.db.models.assessment import Assessment
-
+    from app.db.models.system import AssessmentYear
+
+    db_session.add(
+        AssessmentYear(
+            year=2024,
+            assessment_period_start=datetime(2024, 1, 1),
+            assessment_period_end=datetime(2024, 10, 31),
+        )
+    )
     assessment = Assessment(
         blgu_user_id=mock_blgu_user.id,
+        assessment_year=2024,
         status=AssessmentStatus.VALIDATED,
         final_compliance_status=ComplianceStatus.FAILED,
         area_results={
@@ -2,6 +2,7 @@
 Tests for Redis caching functionality (app/core/cache.py)
 """
 
+import json
 import time
 from threading import Thread
 from unittest.mock import MagicMock, patch
@@ -10,17 +11,26 @@ import pytest
 from redis.exceptions import RedisError
 
 from app.core.cache import (
+    _ENTRY_MARKER,
+    _MISSING,
+    CACHE_INVALIDATION_CHANNEL,
     CACHE_TTL_DASHBOARD,
     CACHE_TTL_EXTERNAL_ANALYTICS,
     CACHE_TTL_LOOKUP,
     CACHE_TTL_SHORT,
     CacheMetrics,
+    CachePolicy,
+    LocalCache,
     RedisCache,
+    assessment_year_tag,
     cache,
     cache_query_result,
+    cache_tag,
     cached,
+    get_cache_policy,
     get_cache_stats,
     invalidate_cache_pattern,
+    invalidate_cache_tags,
 )
 
 
@@ -477,6 +487,490 @@ class TestDeletePattern:
             assert deleted == 0
 
 
+class TestLocalCache:
+    """Test the in-process L1 tier"""
+
+    def test_set_and_get(self):
+        """Test values round-trip and missing keys return the sentinel"""
+        local = LocalCache()
+        local.set("lookup:areas", [{"id": 1}], ttl=60)
+
+        assert local.get("lookup:areas") == [{"id": 1}]
+        assert local.get("lookup:missing") is _MISSING
+
+    def test_cached_none_is_distinguishable_from_miss(self):
+        """Test a cached None is returned instead of the miss sentinel"""
+        local = LocalCache()
+        local.set("lookup:none", None, ttl=60)
+
+        assert local.get("lookup:none") is None
+
+    def test_entries_expire(self):
+        """Test entries are dropped once their TTL elapses"""
+        local = LocalCache()
+        local.set("lookup:short", 1, ttl=0.05)
+        time.sleep(0.1)
+
+        assert local.get("lookup:short") is _MISSING
+        assert len(local) == 0
+
+    def test_lru_eviction_is_per_prefix(self):
+        """Test a full partition evicts its least recently used entry only"""
+        local = LocalCache(default_max_entries=10, max_entries_by_prefix={"big": 2})
+        local.set("lookup:areas", "areas", ttl=60)
+        local.set("big:1", 1, ttl=60)
+        local.set("big:2", 2, ttl=60)
+        local.get("big:1")  # big:2 becomes least recently used
+        local.set("big:3", 3, ttl=60)
+
+        assert local.get("big:2") is _MISSING
+        assert local.get("big:1") == 1
+        assert local.get("big:3") == 3
+        assert local.get("lookup:areas") == "areas"
+
+    def test_delete_pattern(self):
+        """Test glob patterns evict only matching keys"""
+        local = LocalCache()
+        local.set("dashboard_kpis:2024", 1, ttl=60)
+        local.set("dashboard_kpis:2025", 2, ttl=60)
+        local.set("lookup:areas", 3, ttl=60)
+
+        assert local.delete_pattern("dashboard_kpis:*") == 2
+        assert local.delete_pattern("*:areas") == 1
+        assert len(local) == 0
+
+
+class TestTwoTierCache:
+    """Test L1 + Redis L2 behaviour with a mocked Redis client"""
+
+    @pytest.fixture
+    def two_tier(self):
+        with patch("app.core.cache.redis.Redis") as mock_redis:
+            mock_client = MagicMock()
+            mock_client.ping.return_value = True
+            mock_redis.return_value = mock_client
+            with patch("app.core.cache.settings") as mock_settings:
+                mock_settings.REDIS_CACHE_URL = "redis://localhost:6380/0"
+                mock_settings.CACHE_L1_ENABLED = True
+                test_cache = RedisCache()
+        return test_cache, mock_client
+
+    def test_l2_hit_populates_l1(self, two_tier):
+        """Test the second lookup is served from process memory"""
+        test_cache, mock_client = two_tier
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [json.dumps({"areas": [1, 2]}), 30_000]
+
+        assert test_cache.get("lookup:governance_areas") == {"areas": [1, 2]}
+        assert test_cache.get("lookup:governance_areas") == {"areas": [1, 2]}
+
+        assert pipeline.execute.call_count == 1
+        metrics = test_cache.get_metrics()
+        assert (metrics["l1_hits"], metrics["l1_misses"]) == (1, 1)
+        assert (metrics["l2_hits"], metrics["l2_misses"]) == (1, 0)
+        assert metrics["l1_hit_rate"] == 50.0
+        assert metrics["l2_hit_rate"] == 100.0
+
+    def test_l2_miss_is_counted(self, two_tier):
+        """Test misses in both tiers are reported separately"""
+        test_cache, mock_client = two_tier
+        mock_client.pipeline.return_value.execute.return_value = [None, -2]
+
+        assert test_cache.get("lookup:missing") is None
+
+        metrics = test_cache.get_metrics()
+        assert (metrics["l1_misses"], metrics["l2_misses"]) == (1, 1)
+
+    def test_set_writes_through_and_broadcasts(self, two_tier):
+        """Test set stores the decoded value in L1 and tells other replicas to evict"""
+        test_cache, mock_client = two_tier
+
+        assert test_cache.set("lookup:pair", {"values": (1, 2)}, ttl=3600) is True
+
+        pipeline = mock_client.pipeline.return_value
+        pipeline.setex.assert_called_once()
+        # The previous value's rendered response is dropped in the same round-trip
+        pipeline.delete.assert_called_once_with("lookup:pair:rendered")
+        pipeline.execute.assert_called_once()
+        # L1 holds the JSON round-tripped value, exactly what Redis would return
+        assert test_cache.get("lookup:pair") == {"values": [1, 2]}
+        channel, payload = mock_client.publish.call_args.args
+        assert channel == CACHE_INVALIDATION_CHANNEL
+        assert json.loads(payload)["keys"] == ["lookup:pair"]
+
+    def test_delete_evicts_l1_and_broadcasts(self, two_tier):
+        """Test delete and delete_pattern evict locally and publish the invalidation"""
+        test_cache, mock_client = two_tier
+        mock_client.scan.return_value = (0, ["dashboard_kpis:2025"])
+        mock_client.delete.return_value = 1
+        test_cache.set("lookup:areas", [1], ttl=60)
+        test_cache.set("dashboard_kpis:2025", {"kpi": 1}, ttl=60)
+
+        test_cache.delete("lookup:areas")
+        test_cache.delete_pattern("dashboard_kpis:*")
+
+        assert test_cache._l1.get("lookup:areas") is _MISSING
+        assert test_cache._l1.get("dashboard_kpis:2025") is _MISSING
+        payloads = [json.loads(call.args[1]) for call in mock_client.publish.call_args_list]
+        assert payloads[-2]["keys"] == ["lookup:areas"]
+        assert payloads[-1]["patterns"] == ["dashboard_kpis:*"]
+
+    def test_invalidation_from_other_replica_evicts_l1(self, two_tier):
+        """Test pub/sub messages from another replica evict local entries"""
+        test_cache, _ = two_tier
+        test_cache.set("lookup:areas", [1], ttl=60)
+        test_cache.set("dashboard_kpis:2025", {"kpi": 1}, ttl=60)
+
+        message = {
+            "origin": "other-replica",
+            "keys": ["lookup:areas"],
+            "patterns": ["dashboard_kpis:*"],
+        }
+        test_cache._handle_invalidation({"data": json.dumps(message)})
+
+        assert len(test_cache._l1) == 0
+
+    def test_own_invalidation_is_ignored(self, two_tier):
+        """Test a replica does not evict the value it just wrote"""
+        test_cache, _ = two_tier
+        test_cache.set("lookup:areas", [1], ttl=60)
+
+        message = {"origin": test_cache._instance_id, "keys": ["lookup:areas"], "patterns": []}
+        test_cache._handle_invalidation({"data": json.dumps(message)})
+
+        assert test_cache._l1.get("lookup:areas") == [1]
+
+    def test_subscriber_error_clears_l1(self, two_tier):
+        """Test L1 is dropped when invalidation messages may have been missed"""
+        test_cache, _ = two_tier
+        test_cache.set("lookup:areas", [1], ttl=60)
+
+        with patch("app.core.cache.time.sleep"):
+            test_cache._handle_subscriber_error(RedisError("connection lost"), None, None)
+
+        assert len(test_cache._l1) == 0
+
+    def test_subscriber_started_once(self, two_tier):
+        """Test the pub/sub listener thread is started lazily and only once"""
+        test_cache, mock_client = two_tier
+        mock_client.pubsub.assert_not_called()
+
+        test_cache.set("lookup:a", 1, ttl=60)
+        test_cache.set("lookup:b", 2, ttl=60)
+
+        assert mock_client.pubsub.return_value.run_in_thread.call_count == 1
+
+
+class TestTagInvalidation:
+    """Test tag-based invalidation with a mocked Redis client"""
+
+    @pytest.fixture
+    def tagged_cache(self):
+        with patch("app.core.cache.redis.Redis") as mock_redis:
+            mock_client = MagicMock()
+            mock_client.ping.return_value = True
+            mock_redis.return_value = mock_client
+            with patch("app.core.cache.settings") as mock_settings:
+                mock_settings.REDIS_CACHE_URL = "redis://localhost:6380/0"
+                mock_settings.CACHE_L1_ENABLED = True
+                test_cache = RedisCache()
+        return test_cache, mock_client
+
+    def test_tag_helpers(self):
+        """Test tag naming helpers"""
+        assert cache_tag("barangay_id", 12) == "barangay_id:12"
+        assert assessment_year_tag(2025) == "assessment_year:2025"
+        assert assessment_year_tag(None) == "assessment_year:all"
+
+    def test_set_registers_key_in_tag_sets(self, tagged_cache):
+        """Test set adds the key to each tag set in one pipelined round-trip"""
+        test_cache, mock_client = tagged_cache
+        pipeline = mock_client.pipeline.return_value
+
+        test_cache.set("bbi:year_2025", {"x": 1}, ttl=900, tags=["assessment_year:2025"])
+
+        pipeline.setex.assert_called_once()
+        pipeline.sadd.assert_called_once_with("cache_tag:assessment_year:2025", "bbi:year_2025")
+        pipeline.expire.assert_any_call("cache_tag:assessment_year:2025", 900, nx=True)
+        pipeline.expire.assert_any_call("cache_tag:assessment_year:2025", 900, gt=True)
+        pipeline.execute.assert_called_once()
+        mock_client.setex.assert_not_called()
+
+    def test_invalidate_tags_deletes_only_tagged_keys(self, tagged_cache):
+        """Test invalidation deletes exactly the tagged keys without SCAN"""
+        test_cache, mock_client = tagged_cache
+        test_cache.set("bbi:year_2025", 1, ttl=60, tags=["assessment_year:2025"])
+        test_cache.set("bbi:year_2024", 2, ttl=60, tags=["assessment_year:2024"])
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [{"bbi:year_2025", "external_dashboard:abc"}, 1]
+        mock_client.delete.return_value = 2
+
+        deleted = test_cache.invalidate_tags("assessment_year:2025")
+
+        assert deleted == 2
+        pipeline.smembers.assert_called_once_with("cache_tag:assessment_year:2025")
+        # Earlier pipeline deletes are set() dropping the keys' rendered bodies
+        pipeline.delete.assert_called_with("cache_tag:assessment_year:2025")
+        mock_client.delete.assert_called_once_with("bbi:year_2025", "external_dashboard:abc")
+        mock_client.scan.assert_not_called()
+        # L1 copies of the tagged keys are evicted and other replicas are told to do the same
+        assert test_cache._l1.get("bbi:year_2025") is _MISSING
+        assert test_cache._l1.get("bbi:year_2024") == 2
+        payload = json.loads(mock_client.publish.call_args.args[1])
+        assert payload["keys"] == ["bbi:year_2025", "external_dashboard:abc"]
+
+    def test_invalidate_tags_drops_rendered_bodies(self, tagged_cache):
+        """Test precompressed bodies of invalidated keys are unlinked with them"""
+        test_cache, mock_client = tagged_cache
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [{"lookup:governance_areas"}, 1]
+        mock_client.delete.return_value = 1
+
+        test_cache.invalidate_tags("lookup")
+
+        mock_client.unlink.assert_called_once_with("lookup:governance_areas:rendered")
+
+    def test_invalidate_tags_without_members(self, tagged_cache):
+        """Test invalidating an unused tag issues no key deletes"""
+        test_cache, mock_client = tagged_cache
+        mock_client.pipeline.return_value.execute.return_value = [set(), 0]
+
+        assert test_cache.invalidate_tags("assessment_year:2030") == 0
+        mock_client.delete.assert_not_called()
+
+    def test_invalidate_tags_handles_redis_error(self, tagged_cache):
+        """Test tag invalidation fails gracefully"""
+        test_cache, mock_client = tagged_cache
+        mock_client.pipeline.return_value.execute.side_effect = RedisError("down")
+
+        assert test_cache.invalidate_tags("assessment_year:2025") == 0
+
+    def test_invalidate_assessment_year_includes_all_years_entries(self, tagged_cache):
+        """Test a year invalidation also drops all-years entries"""
+        test_cache, _ = tagged_cache
+        with patch.object(test_cache, "invalidate_tags", return_value=3) as invalidate:
+            assert test_cache.invalidate_assessment_year(2025) == 3
+
+        invalidate.assert_called_once_with("assessment_year:2025", "assessment_year:all")
+
+    def test_unavailable_cache_ignores_tags(self):
+        """Test tag operations are no-ops without Redis"""
+        test_cache = RedisCache()
+        test_cache._is_available = False
+        test_cache._client = None
+
+        assert test_cache.set("k", 1, tags=["t"]) is False
+        assert test_cache.invalidate_tags("t") == 0
+
+
+def _entry(value, fresh_for: float, delta: float = 0.5) -> dict:
+    """Build a value as stored by get_or_compute, fresh for fresh_for more seconds."""
+    return {
+        _ENTRY_MARKER: 1,
+        "value": value,
+        "fresh_until": time.time() + fresh_for,
+        "delta": delta,
+    }
+
+
+class TestStampedeProtection:
+    """Test single-flight, stale-while-revalidate and early expiration in get_or_compute"""
+
+    POLICY = CachePolicy(single_flight=True, stale_ttl=300, lock_wait=0.2)
+
+    @pytest.fixture
+    def protected_cache(self):
+        with patch("app.core.cache.redis.Redis") as mock_redis:
+            mock_client = MagicMock()
+            mock_client.ping.return_value = True
+            mock_redis.return_value = mock_client
+            with patch("app.core.cache.settings") as mock_settings:
+                mock_settings.REDIS_CACHE_URL = "redis://localhost:6380/0"
+                mock_settings.CACHE_L1_ENABLED = False
+                test_cache = RedisCache()
+        return test_cache, mock_client
+
+    def test_policy_lookup_by_prefix(self):
+        """Test policies are configured per key prefix"""
+        assert get_cache_policy("external_dashboard:abc123").single_flight is True
+        assert get_cache_policy("lookup:governance_areas").enabled is False
+
+    def test_fresh_value_is_returned(self, protected_cache):
+        """Test fresh values are served without computing or locking"""
+        test_cache, mock_client = protected_cache
+        compute = MagicMock()
+        with patch.object(test_cache, "get", return_value=_entry({"x": 1}, fresh_for=60)):
+            assert test_cache.get_or_compute("k:1", compute, ttl=60, policy=self.POLICY) == {"x": 1}
+
+        compute.assert_not_called()
+        mock_client.set.assert_not_called()
+
+    def test_miss_computes_once_under_lock(self, protected_cache):
+        """Test the lock holder computes, stores the value with a stale window, and unlocks"""
+        test_cache, mock_client = protected_cache
+        mock_client.set.return_value = True
+        with (
+            patch.object(test_cache, "get", return_value=None),
+            patch.object(test_cache, "set") as cache_set,
+        ):
+            value = test_cache.get_or_compute(
+                "k:1", lambda: {"x": 2}, ttl=60, tags=["t"], policy=self.POLICY
+            )
+
+        assert value == {"x": 2}
+        lock_args = mock_client.set.call_args
+        assert lock_args.args[0] == "lock:k:1"
+        assert lock_args.kwargs == {"nx": True, "ex": self.POLICY.lock_ttl}
+        key, entry = cache_set.call_args.args
+        assert key == "k:1"
+        assert entry["value"] == {"x": 2}
+        assert cache_set.call_args.kwargs == {"ttl": 360, "tags": ["t"]}
+        mock_client.eval.assert_called_once()
+        assert test_cache.get_metrics()["prefixes"]["k"]["recomputations"] == 1
+
+    def test_miss_waits_for_lock_holder(self, protected_cache):
+        """Test concurrent misses wait for the worker holding the lock"""
+        test_cache, mock_client = protected_cache
+        mock_client.set.return_value = None  # Lock held elsewhere
+        compute = MagicMock()
+        with patch.object(test_cache, "get", side_effect=[None, None, _entry("done", 60)]):
+            value = test_cache.get_or_compute("k:1", compute, ttl=60, policy=self.POLICY)
+
+        assert value == "done"
+        compute.assert_not_called()
+        assert test_cache.get_metrics()["prefixes"]["k"]["lock_waits"] == 1
+
+    def test_wait_timeout_computes(self, protected_cache):
+        """Test a waiting worker computes itself if the lock holder takes too long"""
+        test_cache, mock_client = protected_cache
+        mock_client.set.return_value = None
+        with (
+            patch.object(test_cache, "get", return_value=None),
+            patch.object(test_cache, "set"),
+        ):
+            value = test_cache.get_or_compute("k:1", lambda: "mine", ttl=60, policy=self.POLICY)
+
+        assert value == "mine"
+        assert test_cache.get_metrics()["prefixes"]["k"]["lock_timeouts"] == 1
+        mock_client.eval.assert_not_called()  # Never held the lock
+
+    def test_stale_value_served_while_other_worker_refreshes(self, protected_cache):
+        """Test expired values are served while the lock holder recomputes"""
+        test_cache, mock_client = protected_cache
+        mock_client.set.return_value = None
+        compute = MagicMock()
+        with patch.object(test_cache, "get", return_value=_entry("old", fresh_for=-10)):
+            value = test_cache.get_or_compute("k:1", compute, ttl=60, policy=self.POLICY)
+
+        assert value == "old"
+        compute.assert_not_called()
+        assert test_cache.get_metrics()["prefixes"]["k"]["stale_hits"] == 1
+
+    def test_stale_value_refreshed_by_lock_holder(self, protected_cache):
+        """Test the worker that takes the lock refreshes an expired value"""
+        test_cache, mock_client = protected_cache
+        mock_client.set.return_value = True
+        with (
+            patch.object(test_cache, "get", return_value=_entry("old", fresh_for=-10)),
+            patch.object(test_cache, "set") as cache_set,
+        ):
+            value = test_cache.get_or_compute("k:1", lambda: "new", ttl=60, policy=self.POLICY)
+
+        assert value == "new"
+        assert cache_set.call_args.args[1]["value"] == "new"
+
+    def test_probabilistic_early_expiration(self, protected_cache):
+        """Test values close to expiry are refreshed early by one worker"""
+        test_cache, mock_client = protected_cache
+        mock_client.set.return_value = True
+        policy = CachePolicy(early_expiration_beta=1.0)
+        # Slow value (5s to compute) 1s from expiry: refreshed early for most draws
+        with (
+            patch.object(test_cache, "get", return_value=_entry("old", fresh_for=1, delta=5)),
+            patch.object(test_cache, "set"),
+            patch("app.core.cache.random.random", return_value=0.5),
+        ):
+            value = test_cache.get_or_compute("k:1", lambda: "new", ttl=60, policy=policy)
+
+        assert value == "new"
+        assert test_cache.get_metrics()["prefixes"]["k"]["early_refreshes"] == 1
+
+    def test_no_early_expiration_far_from_expiry(self, protected_cache):
+        """Test values far from expiry are not refreshed early"""
+        test_cache, _ = protected_cache
+        policy = CachePolicy(early_expiration_beta=1.0)
+        with (
+            patch.object(test_cache, "get", return_value=_entry("old", fresh_for=600, delta=1)),
+            patch("app.core.cache.random.random", return_value=0.5),
+        ):
+            value = test_cache.get_or_compute("k:1", MagicMock(), ttl=600, policy=policy)
+
+        assert value == "old"
+
+    def test_lock_released_when_compute_fails(self, protected_cache):
+        """Test the lock is released if computation raises"""
+        test_cache, mock_client = protected_cache
+        mock_client.set.return_value = True
+
+        def failing():
+            raise ValueError("insufficient data")
+
+        with patch.object(test_cache, "get", return_value=None), pytest.raises(ValueError):
+            test_cache.get_or_compute("k:1", failing, ttl=60, policy=self.POLICY)
+
+        mock_client.eval.assert_called_once()
+
+    def test_unavailable_cache_computes(self):
+        """Test get_or_compute falls back to computing without Redis"""
+        test_cache = RedisCache()
+        test_cache._is_available = False
+
+        assert test_cache.get_or_compute("k:1", lambda: 5, ttl=60) == 5
+
+
+class TestPayloadEncoding:
+    """Test binary payloads and per-prefix payload metrics"""
+
+    @pytest.fixture
+    def codec_cache(self):
+        with patch("app.core.cache.redis.Redis") as mock_redis:
+            mock_client = MagicMock()
+            mock_client.ping.return_value = True
+            mock_redis.return_value = mock_client
+            with patch("app.core.cache.settings") as mock_settings:
+                mock_settings.REDIS_CACHE_URL = "redis://localhost:6380/0"
+                mock_settings.CACHE_L1_ENABLED = False
+                test_cache = RedisCache()
+        return test_cache, mock_client
+
+    def test_large_value_stored_compressed(self, codec_cache):
+        """Test large values are stored as compressed binary and sizes are reported"""
+        test_cache, mock_client = codec_cache
+        value = {"rows": [{"indicator": f"Indicator {i}", "pass_rate": 50.0} for i in range(200)]}
+
+        assert test_cache.set("external_dashboard:abc", value, ttl=60) is True
+
+        key, ttl, payload = mock_client.pipeline.return_value.setex.call_args.args
+        assert isinstance(payload, bytes)
+        assert len(payload) < len(json.dumps(value))
+        metrics = test_cache.get_metrics()["prefixes"]["external_dashboard"]
+        assert metrics["writes"] == 1
+        assert metrics["compression_ratio"] > 2
+
+        mock_client.get.return_value = payload
+        assert test_cache.get("external_dashboard:abc") == value
+        metrics = test_cache.get_metrics()["prefixes"]["external_dashboard"]
+        assert metrics["decodes"] == 1
+        assert metrics["total_decoded_bytes"] == len(payload)
+
+    def test_corrupt_payload_is_a_miss(self, codec_cache):
+        """Test undecodable payloads are treated as cache misses"""
+        test_cache, mock_client = codec_cache
+        mock_client.get.return_value = b"\x07unknown format"
+
+        assert test_cache.get("lookup:areas") is None
+
+
 class TestCachedDecorator:
     """Test @cached decorator functionality"""
 
@@ -604,6 +1098,42 @@ class TestCachedDecorator:
         assert my_function.__name__ == "my_function"
         assert my_function.__doc__ == "This is my function"
 
+    @patch("app.core.cache.cache")
+    def test_cached_decorator_tags(self, mock_cache):
+        """Test decorator stores entries with tags built from the call arguments"""
+        mock_cache.is_available = True
+        mock_cache.get.return_value = None
+        mock_cache._generate_cache_key.return_value = "test:key"
+
+        @cached(prefix="test", ttl=300, tags=lambda year: [assessment_year_tag(year)])
+        def get_year_data(year):
+            return {"year": year}
+
+        get_year_data(year=2025)
+
+        mock_cache.set.assert_called_once_with(
+            "test:key", {"year": 2025}, ttl=300, tags=["assessment_year:2025"]
+        )
+
+    @patch("app.core.cache.cache")
+    def test_cached_decorator_with_policy_uses_get_or_compute(self, mock_cache):
+        """Test decorators with stampede protection delegate to get_or_compute"""
+        mock_cache.is_available = True
+        mock_cache._generate_cache_key.return_value = "test:key"
+        mock_cache.get_or_compute.return_value = {"cached": "result"}
+        policy = CachePolicy(single_flight=True)
+
+        @cached(prefix="test", ttl=300, policy=policy)
+        def expensive_function(param1):
+            return {"computed": "value"}
+
+        assert expensive_function(param1="value") == {"cached": "result"}
+        call = mock_cache.get_or_compute.call_args
+        assert call.args[0] == "test:key"
+        assert call.kwargs["policy"] is policy
+        assert call.args[1]() == {"computed": "value"}
+        mock_cache.get.assert_not_called()
+
 
 class TestCacheQueryResultDecorator:
     """Test @cache_query_result decorator functionality"""
@@ -638,6 +1168,14 @@ class TestModuleFunctions:
         assert deleted == 5
         mock_cache.delete_pattern.assert_called_once_with("dashboard:*")
 
+    @patch("app.core.cache.cache")
+    def test_invalidate_cache_tags(self, mock_cache):
+        """Test invalidate_cache_tags delegates to cache"""
+        mock_cache.invalidate_tags.return_value = 2
+
+        assert invalidate_cache_tags("assessment_year:2025") == 2
+        mock_cache.invalidate_tags.assert_called_once_with("assessment_year:2025")
+
     @patch("app.core.cache.cache")
     def test_get_cache_stats_when_available(self, mock_cache):
         """Test get_cache_stats returns metrics when cache available"""
@@ -680,3 +1218,137 @@ class TestCacheTTLConstants:
         assert 0 < CACHE_TTL_SHORT < CACHE_TTL_DASHBOARD
         assert CACHE_TTL_DASHBOARD <= CACHE_TTL_LOOKUP
         assert CACHE_TTL_EXTERNAL_ANALYTICS >= CACHE_TTL_DASHBOARD
+
+
+class TestRenderedResponses:
+    """Test precompressed response bodies stored next to cached values"""
+
+    @pytest.fixture
+    def rendered_cache(self):
+        with patch("app.core.cache.redis.Redis") as mock_redis:
+            mock_client = MagicMock()
+            mock_client.ping.return_value = True
+            mock_redis.return_value = mock_client
+            with patch("app.core.cache.settings") as mock_settings:
+                mock_settings.REDIS_CACHE_URL = "redis://localhost:6380/0"
+                mock_settings.CACHE_L1_ENABLED = True
+                test_cache = RedisCache()
+        return test_cache, mock_client
+
+    def test_set_rendered_checks_source_value(self, rendered_cache):
+        """The body is stored by one script that compares the value's digest first"""
+        test_cache, mock_client = rendered_cache
+        mock_client.eval.return_value = 1
+
+        assert test_cache.set_rendered("lookup:governance_areas", b"gz", "digest") is True
+        args = mock_client.eval.call_args.args
+        assert args[1:] == (
+            2,
+            "lookup:governance_areas",
+            "lookup:governance_areas:rendered",
+            "digest",
+            b"gz",
+            0,
+        )
+        mock_client.set.assert_not_called()
+
+    def test_set_rendered_expires_before_stale_window(self, rendered_cache):
+        """Stale-while-revalidate prefixes keep refreshing: the body dies with freshness"""
+        test_cache, mock_client = rendered_cache
+        mock_client.eval.return_value = 1
+
+        test_cache.set_rendered("external_dashboard:abc", b"gz", "digest")
+
+        stale_ms = get_cache_policy("external_dashboard").stale_ttl * 1000
+        assert mock_client.eval.call_args.args[-1] == stale_ms
+
+    def test_set_rendered_skips_changed_value(self, rendered_cache):
+        test_cache, mock_client = rendered_cache
+        mock_client.eval.return_value = 0
+
+        assert test_cache.set_rendered("lookup:governance_areas", b"gz", "old") is False
+
+    def test_rendered_source_evicts_l1_copy(self, rendered_cache):
+        """The value loaded next comes from Redis, i.e. the version identified here"""
+        test_cache, mock_client = rendered_cache
+        test_cache._l1.set("lookup:governance_areas", ["stale"], ttl=60)
+        mock_client.eval.return_value = b"digest"
+
+        assert test_cache.rendered_source("lookup:governance_areas") == "digest"
+        assert test_cache._l1.get("lookup:governance_areas") is _MISSING
+
+        mock_client.eval.return_value = None
+        assert test_cache.rendered_source("lookup:governance_areas") is None
+
+    def test_get_rendered_reads_redis_only(self, rendered_cache):
+        test_cache, mock_client = rendered_cache
+        mock_client.get.return_value = b"gz"
+
+        assert test_cache.get_rendered("lookup:governance_areas") == b"gz"
+        mock_client.get.assert_called_once_with("lookup:governance_areas:rendered")
+
+    def test_rendered_errors_are_misses(self, rendered_cache):
+        test_cache, mock_client = rendered_cache
+        mock_client.get.side_effect = RedisError("down")
+        mock_client.eval.side_effect = RedisError("down")
+
+        assert test_cache.get_rendered("lookup:governance_areas") is None
+        assert test_cache.rendered_source("lookup:governance_areas") is None
+        assert test_cache.set_rendered("lookup:governance_areas", b"gz", "digest") is False
+
+    def test_delete_drops_rendered_body(self, rendered_cache):
+        test_cache, mock_client = rendered_cache
+
+        test_cache.delete("lookup:governance_areas")
+
+        mock_client.delete.assert_called_once_with(
+            "lookup:governance_areas", "lookup:governance_areas:rendered"
+        )
+
+
+class TestBatchOperations:
+    """Test multi-key reads and writes with a mocked Redis client"""
+
+    @pytest.fixture
+    def batch_cache(self):
+        with patch("app.core.cache.redis.Redis") as mock_redis:
+            mock_client = MagicMock()
+            mock_client.ping.return_value = True
+            mock_redis.return_value = mock_client
+            with patch("app.core.cache.settings") as mock_settings:
+                mock_settings.REDIS_CACHE_URL = "redis://localhost:6380/0"
+                mock_settings.CACHE_L1_ENABLED = True
+                test_cache = RedisCache()
+        return test_cache, mock_client
+
+    def test_get_many_uses_l1_then_one_mget(self, batch_cache):
+        from app.core import cache_codec
+
+        test_cache, mock_client = batch_cache
+        test_cache._l1.set("url:a", "from-l1", ttl=30)
+        mock_client.mget.return_value = [cache_codec.pack(cache_codec.dumps("from-l2")), None]
+
+        found = test_cache.get_many(["url:a", "url:b", "url:c", "url:b"])
+
+        assert found == {"url:a": "from-l1", "url:b": "from-l2"}
+        mock_client.mget.assert_called_once_with(["url:b", "url:c"])
+
+    def test_get_many_handles_redis_error(self, batch_cache):
+        test_cache, mock_client = batch_cache
+        mock_client.mget.side_effect = RedisError("down")
+
+        assert test_cache.get_many(["url:a"]) == {}
+
+    def test_set_many_pipelines_all_keys(self, batch_cache):
+        test_cache, mock_client = batch_cache
+        pipeline = mock_client.pipeline.return_value
+
+        assert test_cache.set_many({"url:a": {"url": "a"}, "url:b": {"url": "b"}}, ttl=3300)
+
+        assert pipeline.setex.call_count == 2
+        assert pipeline.setex.call_args_list[0].args[:2] == ("url:a", 3300)
+        pipeline.delete.assert_any_call("url:b:rendered")
+        pipeline.execute.assert_called_once()
+        assert test_cache._l1.get("url:b") == {"url": "b"}
+        payload = json.loads(mock_client.publish.call_args.args[1])
+        assert payload["keys"] == ["url:a", "url:b"]
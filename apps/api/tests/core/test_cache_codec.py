@@ -0,0 +1,94 @@
+"""
+Tests for the cache value codec (app/core/cache_codec.py)
+"""
+
+import json
+
+import pytest
+
+from app.core.cache_codec import (
+    COMPRESSION_THRESHOLD_BYTES,
+    FORMAT_JSON,
+    FORMAT_JSON_ZLIB,
+    CacheCodecError,
+    decode,
+    encode,
+)
+
+
+def _dashboard_payload(areas: int = 6, indicators: int = 40) -> dict:
+    """A payload shaped like a cached external dashboard."""
+    return {
+        "overall_compliance": {"total_barangays": 25, "passed_count": 18, "pass_percentage": 72.0},
+        "governance_area_performance": {
+            "areas": [
+                {
+                    "area_name": f"Governance Area {a}",
+                    "passed_count": 10 + a,
+                    "failed_count": 15 - a,
+                    "indicators": [
+                        {
+                            "indicator_id": i,
+                            "indicator_name": f"Indicator {a}.{i}",
+                            "pass_rate": 64.0,
+                        }
+                        for i in range(indicators)
+                    ],
+                }
+                for a in range(areas)
+            ]
+        },
+        "ai_insights": None,
+    }
+
+
+class TestCacheCodec:
+    """Test encoding formats and backwards compatibility"""
+
+    def test_small_values_are_not_compressed(self):
+        """Test small payloads use the plain JSON format"""
+        payload = encode({"id": 1, "name": "Core"})
+
+        assert payload[0] == FORMAT_JSON
+        assert decode(payload) == {"id": 1, "name": "Core"}
+
+    def test_large_values_are_compressed(self):
+        """Test payloads above the threshold are compressed and round-trip"""
+        value = _dashboard_payload()
+        raw_size = len(json.dumps(value))
+        assert raw_size > COMPRESSION_THRESHOLD_BYTES
+
+        payload = encode(value)
+
+        assert payload[0] == FORMAT_JSON_ZLIB
+        assert len(payload) * 4 < raw_size
+        assert decode(payload) == value
+
+    def test_values_match_json_module_semantics(self):
+        """Test decoded values look exactly like a json round-trip"""
+        value = {"tuple": (1, 2), "nested": {3: "int key"}, "none": None, "float": 1.5}
+
+        assert decode(encode(value)) == json.loads(json.dumps(value))
+
+    def test_legacy_json_entries_are_readable(self):
+        """Test plain JSON written before the codec (str or bytes) still decodes"""
+        assert decode('{"legacy": true}') == {"legacy": True}
+        assert decode(b"[1, 2, 3]") == [1, 2, 3]
+        assert decode(b"null") is None
+
+    def test_unknown_format_is_rejected(self):
+        """Test payloads from a newer, unknown format raise instead of returning garbage"""
+        with pytest.raises(CacheCodecError):
+            decode(b"\x07whatever")
+
+    def test_corrupt_payload_is_rejected(self):
+        """Test corrupt payloads raise CacheCodecError (a ValueError)"""
+        with pytest.raises(CacheCodecError):
+            decode(bytes((FORMAT_JSON_ZLIB,)) + b"not zlib")
+        with pytest.raises(ValueError):
+            decode(b"")
+
+    def test_unserializable_value_raises_type_error(self):
+        """Test unsupported values raise TypeError like json.dumps"""
+        with pytest.raises(TypeError):
+            encode({"value": object()})
@@ -0,0 +1,59 @@
+"""
+Tests for ETag helpers (app/core/etag.py)
+"""
+
+from datetime import datetime
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.core.etag import conditional_get, etag_matches, make_etag
+
+
+class TestEtagMatches:
+    def test_exact_and_listed_tags(self):
+        assert etag_matches('"a"', '"a"')
+        assert etag_matches('"x", "a"', '"a"')
+        assert not etag_matches('"b"', '"a"')
+        assert not etag_matches(None, '"a"')
+
+    def test_weak_comparison_and_wildcard(self):
+        assert etag_matches('W/"a"', '"a"')
+        assert etag_matches("*", '"a"')
+
+
+def test_make_etag_follows_version():
+    stamp = (3, datetime(2025, 1, 1, 8, 30))
+
+    assert make_etag(*stamp) == make_etag(3, datetime(2025, 1, 1, 8, 30))
+    assert make_etag(*stamp) != make_etag(4, datetime(2025, 1, 1, 8, 30))
+
+
+def test_conditional_get_skips_work_for_current_clients():
+    app = FastAPI()
+    version = {"value": 1}
+    loads = []
+
+    @app.get("/items")
+    def list_items(request: Request, response: Response):
+        not_modified = conditional_get(request, response, version["value"])
+        if not_modified:
+            return not_modified
+        loads.append(1)
+        return [1, 2, 3]
+
+    client = TestClient(app)
+    first = client.get("/items")
+    etag = first.headers["ETag"]
+
+    unchanged = client.get("/items", headers={"If-None-Match": etag})
+    filtered = client.get("/items?page=2", headers={"If-None-Match": etag})
+    version["value"] = 2
+    changed = client.get("/items", headers={"If-None-Match": etag})
+
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert filtered.status_code == 200
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(loads) == 3
@@ -0,0 +1,122 @@
+"""
+Tests for the shared metrics registry (app/core/metrics.py)
+"""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.metrics import TimedQueuePool, generate_metrics
+from app.middleware.metrics import MetricsMiddleware
+
+ROUTE = "/api/v1/items/{item_id}"
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def query_engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(query_engine):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get(ROUTE)
+    def get_item(item_id: int, queries: int = 1):
+        with query_engine.connect() as connection:
+            for _ in range(queries):
+                connection.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    return TestClient(app)
+
+
+def test_http_metrics_use_route_template(client):
+    """Requests for different IDs share one route label"""
+    labels = {"method": "GET", "route": ROUTE}
+    before = _sample("sinag_http_request_duration_seconds_count", labels)
+
+    client.get("/api/v1/items/1")
+    client.get("/api/v1/items/2")
+
+    assert _sample("sinag_http_request_duration_seconds_count", labels) == before + 2
+    assert _sample("sinag_http_requests_total", {**labels, "status": "200"}) >= 2
+
+
+def test_sql_statements_counted_per_request(client):
+    """Statements run in a threadpool endpoint are attributed to the request"""
+    labels = {"route": ROUTE}
+    count_before = _sample("sinag_db_queries_per_request_count", labels)
+    sum_before = _sample("sinag_db_queries_per_request_sum", labels)
+    selects_before = _sample("sinag_db_query_duration_seconds_count", {"operation": "SELECT"})
+
+    client.get("/api/v1/items/1", params={"queries": 3})
+
+    assert _sample("sinag_db_queries_per_request_count", labels) == count_before + 1
+    assert _sample("sinag_db_queries_per_request_sum", labels) == sum_before + 3
+    assert _sample("sinag_db_query_duration_seconds_count", {"operation": "SELECT"}) >= (
+        selects_before + 3
+    )
+
+
+def test_request_over_query_budget_is_flagged(client, caplog):
+    """A request running more statements than the threshold is counted and logged"""
+    labels = {"method": "GET", "route": ROUTE}
+    before = _sample("sinag_db_query_budget_exceeded_total", labels)
+    caplog.set_level(logging.WARNING)
+
+    with patch("app.core.metrics.settings.SQL_QUERY_COUNT_WARNING_THRESHOLD", 2):
+        client.get("/api/v1/items/1", params={"queries": 2})
+        client.get("/api/v1/items/1", params={"queries": 5})
+
+    assert _sample("sinag_db_query_budget_exceeded_total", labels) == before + 1
+    assert any(f"GET {ROUTE} ran 5 SQL statements" in r.message for r in caplog.records)
+
+
+def test_failed_statements_do_not_skew_query_timing(query_engine):
+    selects = {"operation": "SELECT"}
+    before = _sample("sinag_db_query_duration_seconds_count", selects)
+
+    with query_engine.connect() as connection:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing_table"))
+        connection.execute(text("SELECT 1"))
+        info = dict(connection.info)
+
+    # Only the successful statement is timed, and no per-connection state is left behind
+    assert _sample("sinag_db_query_duration_seconds_count", selects) == before + 1
+    assert "query_start_time" not in info
+
+
+def test_pool_wait_time_recorded(tmp_path):
+    before = _sample("sinag_db_pool_wait_seconds_count", {})
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    engine.dispose()
+
+    assert _sample("sinag_db_pool_wait_seconds_count", {}) == before + 1
+
+
+def test_registry_includes_cache_metrics():
+    output = generate_metrics().decode()
+
+    assert "sinag_cache_lookups_total" in output
+    assert "sinag_cache_tier_lookups_total" in output
+    assert "sinag_active_requests" in output
+    assert "sinag_uptime_seconds" in output
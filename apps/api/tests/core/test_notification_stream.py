@@ -0,0 +1,122 @@
+"""
+Tests for notification push events and Redis-held counts (app/core/notification_stream.py)
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import settings
+from app.core.notification_stream import (
+    NotificationStream,
+    format_sse,
+    notification_channel,
+    notification_counts_key,
+)
+
+
+def test_format_sse():
+    assert format_sse("read", {"unread_count": 0}) == 'event: read\ndata: {"unread_count":0}\n\n'
+
+
+class TestDisabledStream:
+    def test_calls_are_noops(self):
+        stream = NotificationStream(enabled=False)
+
+        with patch.object(stream, "_get_client") as get_client:
+            stream.publish_created({1: [10]})
+            stream.publish_read(1, 1)
+
+        get_client.assert_not_called()
+        assert asyncio.run(stream.get_counts_async(1)) is None
+
+
+class TestMockedRedis:
+    def test_get_counts_async_miss_returns_none(self):
+        stream = NotificationStream(enabled=True)
+        client = MagicMock()
+        client.hmget = AsyncMock(return_value=[None, None])
+
+        with patch.object(stream, "_get_async_client", return_value=client):
+            assert asyncio.run(stream.get_counts_async(5)) is None
+        client.hmget.assert_awaited_once_with(notification_counts_key(5), "unread", "total")
+
+    def test_redis_errors_back_off(self):
+        stream = NotificationStream(enabled=True)
+        client = MagicMock()
+        client.hmget = AsyncMock(side_effect=RedisConnectionError("down"))
+
+        with patch.object(stream, "_get_async_client", return_value=client):
+            assert asyncio.run(stream.get_counts_async(5)) is None
+            assert asyncio.run(stream.get_counts_async(5)) is None
+
+        # Redis is not retried on every request during an outage
+        assert client.hmget.await_count == 1
+        assert not stream.enabled
+
+
+@pytest.fixture
+def redis_stream():
+    redis_url = settings.CELERY_BROKER_URL
+    try:
+        client = redis.from_url(redis_url, socket_connect_timeout=0.5)
+        client.ping()
+    except (redis.RedisError, OSError):
+        pytest.skip("Redis is not reachable")
+
+    # A user ID no real data uses, so parallel runs do not collide
+    user_id = -(uuid.uuid4().int % 10**9) - 1
+    yield NotificationStream(redis_url=redis_url, enabled=True), user_id
+    client.delete(notification_counts_key(user_id))
+
+
+class TestRedisStream:
+    def test_counts_follow_created_and_read(self, redis_stream):
+        stream, user_id = redis_stream
+
+        # Nothing is counted until the counts are seeded from Postgres
+        stream.publish_created({user_id: [1]})
+        assert asyncio.run(stream.get_counts_async(user_id)) is None
+
+        asyncio.run(stream.seed_counts_async(user_id, 2, 5))
+        stream.publish_created({user_id: [6, 7]})
+        assert asyncio.run(stream.get_counts_async(user_id)) == (4, 7)
+
+        stream.publish_read(user_id, 3)
+        assert asyncio.run(stream.get_counts_async(user_id)) == (1, 7)
+
+        stream.publish_read(user_id, 0, all_read=True)
+        assert asyncio.run(stream.get_counts_async(user_id)) == (0, 7)
+
+    def test_seed_does_not_overwrite_live_counts(self, redis_stream):
+        stream, user_id = redis_stream
+
+        asyncio.run(stream.seed_counts_async(user_id, 1, 1))
+        asyncio.run(stream.seed_counts_async(user_id, 9, 9))
+
+        assert asyncio.run(stream.get_counts_async(user_id)) == (1, 1)
+
+    def test_subscriber_receives_created_event(self, redis_stream):
+        stream, user_id = redis_stream
+
+        async def receive_one():
+            events = stream.subscribe(user_id)
+            receiver = asyncio.ensure_future(events.__anext__())
+            publisher = redis.from_url(settings.CELERY_BROKER_URL)
+            # Wait until the subscription is live (subscribe is asynchronous)
+            for _ in range(50):
+                await asyncio.sleep(0.05)
+                if publisher.pubsub_numsub(notification_channel(user_id))[0][1]:
+                    break
+            await asyncio.to_thread(stream.publish_created, {user_id: [42]})
+            event = await asyncio.wait_for(receiver, timeout=5)
+            await events.aclose()
+            return event
+
+        event = asyncio.run(receive_one())
+
+        assert event == {"type": "created", "notification_ids": [42]}
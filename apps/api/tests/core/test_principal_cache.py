@@ -0,0 +1,184 @@
+"""
+Tests for the authenticated principal cache (app/core/principal_cache.py)
+"""
+
+import json
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user
+from app.core.principal_cache import (
+    REVOKED_PRINCIPAL,
+    Principal,
+    PrincipalCache,
+    hash_token,
+)
+from app.core.security import create_access_token
+from app.db.enums import UserRole
+from app.db.models.user import User
+
+
+@pytest.fixture
+def principal_cache():
+    """An enabled cache that neither subscribes to nor publishes on Redis"""
+    cache = PrincipalCache(ttl=30, max_entries=3)
+    with (
+        patch.object(cache, "_ensure_subscriber", return_value=True),
+        patch.object(cache, "_broadcast_invalidation") as broadcast,
+    ):
+        cache.broadcast = broadcast
+        yield cache
+
+
+@pytest.fixture
+def user(db_session: Session) -> User:
+    user = User(
+        email=f"principal_{uuid.uuid4().hex[:8]}@sulop.gov.ph",
+        name="Principal User",
+        hashed_password="test$hash",
+        role=UserRole.MLGOO_DILG,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def _principal(user_id: int, exp: float | None = None) -> Principal:
+    claims = {"sub": str(user_id)} if exp is None else {"sub": str(user_id), "exp": exp}
+    return Principal(user_id=user_id, claims=claims)
+
+
+class TestPrincipalCache:
+    def test_set_and_get(self, principal_cache):
+        principal = _principal(1)
+        principal_cache.set("token-a", principal, principal_cache.version)
+
+        assert principal_cache.get("token-a") is principal
+        assert principal_cache.get("token-b") is None
+
+    def test_entry_expires_with_token(self, principal_cache):
+        """Entries never outlive the token's exp claim"""
+        principal_cache.set("expired", _principal(1, exp=time.time() - 1), 0)
+        principal_cache.set("expiring", _principal(2, exp=time.time() + 0.05), 0)
+
+        assert principal_cache.get("expired") is None
+        assert principal_cache.get("expiring") is not None
+        time.sleep(0.1)
+        assert principal_cache.get("expiring") is None
+
+    def test_set_dropped_after_concurrent_invalidation(self, principal_cache):
+        """A principal resolved before an invalidation is not cached"""
+        version = principal_cache.version
+        principal_cache.invalidate_user(1)
+        principal_cache.set("token-a", _principal(1), version)
+
+        assert principal_cache.get("token-a") is None
+
+    def test_invalidate_user_evicts_all_tokens(self, principal_cache):
+        principal_cache.set("token-a", _principal(1), 0)
+        principal_cache.set("token-b", _principal(1), 0)
+        principal_cache.set("token-c", _principal(2), 0)
+
+        principal_cache.invalidate_user(1)
+
+        assert principal_cache.get("token-a") is None
+        assert principal_cache.get("token-b") is None
+        assert principal_cache.get("token-c") is not None
+        principal_cache.broadcast.assert_called_with(user_ids=[1])
+
+    def test_invalidate_token(self, principal_cache):
+        principal_cache.set("token-a", _principal(1), 0)
+
+        principal_cache.invalidate_token("token-a")
+
+        assert principal_cache.get("token-a") is None
+        principal_cache.broadcast.assert_called_with(token_hashes=[hash_token("token-a")])
+
+    def test_least_recently_used_evicted(self, principal_cache):
+        for index in range(3):
+            principal_cache.set(f"token-{index}", _principal(index), 0)
+        principal_cache.get("token-0")
+        principal_cache.set("token-3", _principal(3), 0)
+
+        assert len(principal_cache) == 3
+        assert principal_cache.get("token-1") is None
+        assert principal_cache.get("token-0") is not None
+
+    def test_remote_invalidation_message(self, principal_cache):
+        """Invalidations from other processes evict; our own echoes are ignored"""
+        principal_cache.set("token-a", _principal(1), 0)
+        principal_cache.set("token-b", _principal(2), 0)
+
+        principal_cache._handle_invalidation(
+            {"data": json.dumps({"origin": principal_cache._instance_id, "users": [1]})}
+        )
+        assert principal_cache.get("token-a") is not None
+
+        principal_cache._handle_invalidation(
+            {"data": json.dumps({"origin": "other", "users": [1], "tokens": []})}
+        )
+        principal_cache._handle_invalidation({"data": "not json"})
+        assert principal_cache.get("token-a") is None
+        assert principal_cache.get("token-b") is not None
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = PrincipalCache(ttl=0)
+        cache.set("token-a", _principal(1), cache.version)
+
+        assert cache.get("token-a") is None
+
+
+class TestPrincipalSnapshot:
+    def test_build_user_attaches_without_query(self, db_session: Session, user: User):
+        """A rebuilt user merges into a session with its snapshot values"""
+        principal = Principal.for_user(user, {"sub": str(user.id)})
+        db_session.expunge_all()
+
+        rebuilt = db_session.merge(principal.build_user(), load=False)
+
+        assert rebuilt.id == user.id
+        assert rebuilt.email == user.email
+        assert rebuilt.role == UserRole.MLGOO_DILG
+        assert rebuilt.is_active is True
+        assert rebuilt.barangay is None
+
+
+class TestGetCurrentUserCaching:
+    def test_hit_skips_blacklist_and_decode(self, principal_cache, db_session, user):
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=create_access_token(user.id)
+        )
+        with (
+            patch("app.api.deps.principal_cache", principal_cache),
+            patch("app.api.deps.is_token_blacklisted", return_value=False) as blacklisted,
+        ):
+            first = get_current_user(credentials=credentials, db=db_session)
+            with patch("app.api.deps.verify_token") as verify:
+                second = get_current_user(credentials=credentials, db=db_session)
+
+        assert first.id == second.id == user.id
+        assert blacklisted.call_count == 1
+        verify.assert_not_called()
+
+    def test_revoked_verdict_is_cached(self, principal_cache, db_session, user):
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=create_access_token(user.id)
+        )
+        with (
+            patch("app.api.deps.principal_cache", principal_cache),
+            patch("app.api.deps.is_token_blacklisted", return_value=True) as blacklisted,
+        ):
+            for _ in range(2):
+                with pytest.raises(Exception) as exc_info:
+                    get_current_user(credentials=credentials, db=db_session)
+                assert exc_info.value.detail == "Token has been revoked"
+
+        assert blacklisted.call_count == 1
+        assert principal_cache.get(credentials.credentials) is REVOKED_PRINCIPAL
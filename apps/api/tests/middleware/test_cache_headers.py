@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.testclient import TestClient
 
 from app.middleware.cache_headers import CacheHeadersMiddleware
@@ -421,3 +422,78 @@ class TestCacheRulesConfiguration:
             rule = middleware._get_cache_rule(endpoint)
             assert rule is not None
             assert rule.get("cache") is False
+
+
+class TestETags:
+    """Test ETag generation and If-None-Match handling"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(CacheHeadersMiddleware)
+
+        @app.get("/api/v1/lookups/roles")
+        def roles():
+            return ["admin", "assessor"]
+
+        @app.get("/api/v1/auth/session")
+        def session():
+            return {"token": "secret"}
+
+        @app.get("/api/v1/indicators/tagged")
+        def tagged():
+            return JSONResponse({"tagged": True}, headers={"ETag": '"v1"'})
+
+        @app.get("/api/v1/assessments/export")
+        def export():
+            async def chunks():
+                yield b"a,b\n"
+                yield b"1,2\n"
+
+            return StreamingResponse(chunks(), media_type="text/csv")
+
+        return TestClient(app)
+
+    def test_body_hash_etag_added(self, client):
+        response = client.get("/api/v1/lookups/roles")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+        assert client.get("/api/v1/lookups/roles").headers["ETag"] == response.headers["ETag"]
+
+    def test_matching_if_none_match_returns_304(self, client):
+        etag = client.get("/api/v1/lookups/roles").headers["ETag"]
+
+        response = client.get("/api/v1/lookups/roles", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert "max-age=3600" in response.headers["Cache-Control"]
+        assert "content-type" not in response.headers
+
+    def test_stale_if_none_match_returns_body(self, client):
+        response = client.get("/api/v1/lookups/roles", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json() == ["admin", "assessor"]
+
+    def test_no_etag_for_no_store_responses(self, client):
+        response = client.get("/api/v1/auth/session")
+
+        assert "ETag" not in response.headers
+
+    def test_endpoint_etag_is_kept_and_validated(self, client):
+        response = client.get("/api/v1/indicators/tagged")
+        assert response.headers["ETag"] == '"v1"'
+
+        response = client.get("/api/v1/indicators/tagged", headers={"If-None-Match": '"v1"'})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_streamed_response_is_not_tagged(self, client):
+        response = client.get("/api/v1/assessments/export", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert response.content == b"a,b\n1,2\n"
+        assert "ETag" not in response.headers
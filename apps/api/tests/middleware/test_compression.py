@@ -0,0 +1,153 @@
+"""
+Tests for the response compression middleware (app/middleware/compression.py)
+"""
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware, accepts_gzip, gzip_compress
+
+LARGE_PAYLOAD = {"indicators": [{"id": i, "name": f"Indicator {i}"} for i in range(200)]}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/large")
+    def large():
+        return LARGE_PAYLOAD
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/image")
+    def image():
+        return Response(b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+    @app.get("/precompressed")
+    def precompressed():
+        return Response(
+            gzip_compress(b'{"cached": true}' * 100),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    return TestClient(app)
+
+
+class TestAcceptsGzip:
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("gzip, deflate, br", True),
+            ("br;q=1.0, gzip;q=0.8", True),
+            ("gzip;q=0", False),
+            ("*", True),
+            ("*;q=0", False),
+            ("identity", False),
+            ("", False),
+        ],
+    )
+    def test_negotiation(self, header, expected):
+        assert accepts_gzip(header) is expected
+
+
+class TestCompressionMiddleware:
+    def test_large_json_is_gzipped(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert int(response.headers["Content-Length"]) < len(response.content)
+        assert response.json() == LARGE_PAYLOAD
+
+    def test_identity_when_gzip_not_accepted(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "Content-Encoding" not in response.headers
+        assert response.json() == LARGE_PAYLOAD
+
+    def test_small_bodies_and_binary_types_are_not_compressed(self, client):
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        image = client.get("/image", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in small.headers
+        assert "Content-Encoding" not in image.headers
+
+    def test_precompressed_response_passes_through(self, client):
+        response = client.get("/precompressed", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.content == b'{"cached": true}' * 100
+
+    def test_output_is_deterministic(self):
+        """No timestamp in the gzip header, so ETags of compressed bodies are stable"""
+        body = b"x" * 4096
+
+        assert gzip_compress(body) == gzip_compress(body)
+        assert gzip.decompress(gzip_compress(body)) == body
+
+
+def test_streamed_body_is_compressed_chunk_by_chunk():
+    """Each compressed chunk is flushed and decodable before the next is produced"""
+    first_chunk_sent = asyncio.Event()
+    response_complete = asyncio.Event()
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/export")
+    async def export():
+        async def body():
+            yield b"first," * 10
+            await first_chunk_sent.wait()
+            yield b"second"
+
+        return StreamingResponse(body(), media_type="text/csv")
+
+    messages: list[dict] = []
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    decoded: list[bytes] = []
+
+    async def receive():
+        # The client stays connected until the whole response has been sent
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body":
+            decoded.append(decompressor.decompress(message.get("body", b"")))
+            first_chunk_sent.set()
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/export",
+        "raw_path": b"/export",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"accept-encoding", b"gzip")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+    asyncio.run(asyncio.wait_for(app(scope, receive, send), timeout=5))
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert decoded[0] == b"first," * 10
+    assert b"".join(decoded) == b"first," * 10 + b"second"
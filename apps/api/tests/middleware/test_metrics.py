@@ -312,67 +312,8 @@ class TestNumericIDPattern:
         assert NUMERIC_ID_PATTERN.search("123") is None
 
 
-class TestGetPrometheusMetrics:
-    """Test Prometheus metrics output generation"""
-
-    def test_prometheus_metrics_format(self):
-        """Test Prometheus output follows correct format"""
-        collector = MetricsCollector()
-        collector.record_request("GET", "/api/v1/users", 200, 25.0)
-        collector.record_request("POST", "/api/v1/users", 201, 50.0)
-
-        output = collector.get_prometheus_metrics()
-
-        # Should contain HELP and TYPE declarations
-        assert "# HELP sinag_uptime_seconds" in output
-        assert "# TYPE sinag_uptime_seconds gauge" in output
-        assert "# HELP sinag_active_requests" in output
-        assert "# TYPE sinag_active_requests gauge" in output
-        assert "# HELP sinag_http_requests_total" in output
-        assert "# TYPE sinag_http_requests_total counter" in output
-
-    def test_prometheus_metrics_includes_request_counts(self):
-        """Test metrics include request counts per endpoint"""
-        collector = MetricsCollector()
-        collector.record_request("GET", "/api/v1/users", 200, 10.0)
-        collector.record_request("GET", "/api/v1/users", 200, 15.0)
-        collector.record_request("POST", "/api/v1/users", 201, 20.0)
-
-        output = collector.get_prometheus_metrics()
-
-        assert 'sinag_http_requests_total{method="GET",endpoint="/api/v1/users"} 2' in output
-        assert 'sinag_http_requests_total{method="POST",endpoint="/api/v1/users"} 1' in output
-
-    def test_prometheus_metrics_includes_error_counts(self):
-        """Test metrics include error counts"""
-        collector = MetricsCollector()
-        collector.record_request("GET", "/api/v1/data", 500, 100.0)
-        collector.record_request("POST", "/api/v1/login", 401, 10.0)
-
-        output = collector.get_prometheus_metrics()
-
-        assert 'sinag_http_errors_total{method="GET",endpoint="/api/v1/data"} 1' in output
-        assert 'sinag_http_errors_total{method="POST",endpoint="/api/v1/login"} 1' in output
-
-    def test_prometheus_metrics_histogram_buckets(self):
-        """Test latency histogram includes cumulative buckets"""
-        collector = MetricsCollector()
-        collector.record_request("GET", "/api/v1/test", 200, 5.0)
-        collector.record_request("GET", "/api/v1/test", 200, 75.0)
-        collector.record_request("GET", "/api/v1/test", 200, 500.0)
-
-        output = collector.get_prometheus_metrics()
-
-        # Should have histogram buckets
-        assert "sinag_http_request_duration_ms_bucket" in output
-        assert 'le="5"' in output
-        assert 'le="100"' in output
-        assert 'le="500"' in output
-        assert 'le="+Inf"' in output
-
-        # Should have histogram sum and count
-        assert "sinag_http_request_duration_ms_sum" in output
-        assert "sinag_http_request_duration_ms_count" in output
+class TestGetSummary:
+    """Test JSON summary generation"""
 
     def test_get_summary_includes_all_metrics(self):
         """Test get_summary returns comprehensive metrics dict"""
@@ -516,15 +457,12 @@ class TestMetricsMiddleware:
 class TestModuleFunctions:
     """Test module-level convenience functions"""
 
-    def test_get_prometheus_metrics_delegates_to_collector(self):
-        """Test get_prometheus_metrics uses global collector"""
-        with patch("app.middleware.metrics.metrics_collector") as mock_collector:
-            mock_collector.get_prometheus_metrics.return_value = "prometheus output"
-
+    def test_get_prometheus_metrics_renders_shared_registry(self):
+        """Test get_prometheus_metrics renders the shared registry"""
+        with patch("app.middleware.metrics.generate_metrics", return_value=b"prometheus output"):
             result = get_prometheus_metrics()
 
-            assert result == "prometheus output"
-            mock_collector.get_prometheus_metrics.assert_called_once()
+        assert result == "prometheus output"
 
     def test_get_metrics_summary_delegates_to_collector(self):
         """Test get_metrics_summary uses global collector"""
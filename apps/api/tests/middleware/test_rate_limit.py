@@ -0,0 +1,176 @@
+"""
+Tests for rate limit stores and RateLimitMiddleware (app/middleware/rate_limit.py)
+"""
+
+import asyncio
+import multiprocessing
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import redis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import settings
+from app.middleware.rate_limit import LocalRateLimitStore, RedisRateLimitStore
+from app.middleware.security import RateLimitMiddleware
+
+
+class TestLocalRateLimitStore:
+    def test_allows_up_to_limit_then_blocks(self):
+        store = LocalRateLimitStore()
+        results = [store.hit("default:1.2.3.4", 3, 60, now=120.0) for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert [r.remaining for r in results[:3]] == [2, 1, 0]
+        assert results[0].reset_after == 60
+        assert results[3].retry_after > 0
+
+    def test_previous_window_is_weighted(self):
+        """Half-way into a window, half of the previous window's requests still count"""
+        store = LocalRateLimitStore()
+        for _ in range(4):
+            store.hit("key", 4, 60, now=60.0)
+
+        result = store.hit("key", 4, 60, now=150.0)
+        assert result.allowed
+        assert result.remaining == 1  # 4 * 0.5 + 1 counted
+        assert store.hit("key", 4, 60, now=150.0).allowed  # 4 * 0.5 + 2 = 4
+        assert not store.hit("key", 4, 60, now=150.0).allowed
+
+        # Two windows later nothing of the old window counts
+        assert store.hit("key", 4, 60, now=250.0).remaining == 3
+
+    def test_retry_after_is_when_a_request_fits_again(self):
+        store = LocalRateLimitStore()
+        for _ in range(2):
+            store.hit("key", 2, 60, now=0.0)
+
+        blocked = store.hit("key", 2, 60, now=30.0)
+        assert not blocked.allowed
+        assert store.hit("key", 2, 60, now=30.0 + blocked.retry_after).allowed
+
+    def test_store_is_bounded(self):
+        store = LocalRateLimitStore(max_keys=2)
+        for index in range(5):
+            store.hit(f"default:10.0.0.{index}", 10, 60, now=0.0)
+
+        assert len(store) == 2
+
+
+class TestRedisRateLimitStore:
+    def test_uses_script_result(self):
+        store = RedisRateLimitStore(fallback=LocalRateLimitStore(), enabled=True)
+        script = AsyncMock(return_value=[1, 3, 0])
+
+        with patch.object(store, "_get_script", return_value=script):
+            result = asyncio.run(store.hit("default:1.2.3.4", 10, 60))
+
+        assert result.allowed
+        assert result.remaining == 7
+        keys = script.call_args.kwargs["keys"]
+        assert keys[0].startswith("ratelimit:default:1.2.3.4:")
+
+    def test_falls_back_when_redis_is_down(self):
+        fallback = LocalRateLimitStore()
+        store = RedisRateLimitStore(fallback=fallback, enabled=True)
+        script = AsyncMock(side_effect=RedisConnectionError("down"))
+
+        with patch.object(store, "_get_script", return_value=script):
+            first = asyncio.run(store.hit("key", 1, 60))
+            second = asyncio.run(store.hit("key", 1, 60))
+
+        assert first.allowed
+        assert not second.allowed
+        # Redis is not retried on every request during an outage
+        assert script.call_count == 1
+        assert len(fallback) == 1
+
+
+class TestRateLimitMiddleware:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(RateLimitMiddleware)
+
+        @app.get("/api/v1/users/{user_id}")
+        def get_user(user_id: int):
+            return {"id": user_id}
+
+        return TestClient(app)
+
+    def test_standard_headers(self, client):
+        first = client.get("/api/v1/users/1")
+        second = client.get("/api/v1/users/2")
+
+        assert first.headers["X-RateLimit-Limit"] == "30"
+        assert int(first.headers["X-RateLimit-Reset"]) > 0
+        # Different IDs in the path share the /api/v1/users limit
+        assert int(second.headers["X-RateLimit-Remaining"]) < int(
+            first.headers["X-RateLimit-Remaining"]
+        )
+
+    def test_limit_exceeded(self, client):
+        responses = [client.get(f"/api/v1/users/{index}") for index in range(31)]
+
+        assert all(r.status_code == 200 for r in responses[:30])
+        limited = responses[30]
+        assert limited.status_code == 429
+        assert limited.headers["X-RateLimit-Remaining"] == "0"
+        assert int(limited.headers["Retry-After"]) == limited.json()["retry_after"]
+
+
+# ====================================================================
+# Multi-worker load test (needs a reachable Redis)
+# ====================================================================
+
+WORKERS = 4
+REQUESTS_PER_WORKER = 15
+LOGIN_LIMIT = 20
+
+
+def _worker_allowed_requests(redis_url: str, client_ip: str) -> int:
+    """Run one 'uvicorn worker' with its own middleware and count allowed requests."""
+    app = FastAPI()
+
+    @app.post("/api/v1/auth/login")
+    def login():
+        return {"ok": True}
+
+    middleware = RateLimitMiddleware(app)
+    middleware.rate_limit_store = RedisRateLimitStore(
+        fallback=LocalRateLimitStore(), redis_url=redis_url, enabled=True
+    )
+
+    async def run() -> int:
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(
+                    client.post("/api/v1/auth/login", headers={"X-Forwarded-For": client_ip})
+                    for _ in range(REQUESTS_PER_WORKER)
+                )
+            )
+        return sum(response.status_code == 200 for response in responses)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.integration
+def test_limit_is_shared_across_workers():
+    """Concurrent workers together allow exactly the configured limit"""
+    redis_url = settings.CELERY_BROKER_URL
+    try:
+        redis.from_url(redis_url, socket_connect_timeout=0.5).ping()
+    except Exception:
+        pytest.skip("Redis is not reachable")
+
+    client_ip = f"load-test-{uuid.uuid4().hex}"
+    with multiprocessing.get_context("spawn").Pool(WORKERS) as pool:
+        allowed = pool.starmap(_worker_allowed_requests, [(redis_url, client_ip)] * WORKERS)
+
+    assert WORKERS * REQUESTS_PER_WORKER > LOGIN_LIMIT
+    assert sum(allowed) == LOGIN_LIMIT
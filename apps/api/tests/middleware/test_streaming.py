@@ -0,0 +1,99 @@
+"""
+Tests that the middleware stack passes streamed response bodies through unbuffered
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.middleware import (
+    CacheHeadersMiddleware,
+    CompressionMiddleware,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+
+def _build_app(first_chunk_sent: asyncio.Event) -> FastAPI:
+    app = FastAPI()
+    # Same order as main.py
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(CompressionMiddleware)
+    app.add_middleware(CacheHeadersMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware)
+
+    @app.get("/api/v1/gar/export")
+    async def export():
+        async def body():
+            yield b"first,"
+            # Only continues once the client has received the first chunk
+            await first_chunk_sent.wait()
+            yield b"second"
+
+        return StreamingResponse(body(), media_type="text/csv")
+
+    return app
+
+
+def _http_scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
+
+async def _stream(path: str) -> list[dict]:
+    first_chunk_sent = asyncio.Event()
+    response_complete = asyncio.Event()
+    app = _build_app(first_chunk_sent)
+    messages: list[dict] = []
+
+    async def receive():
+        # The client stays connected until the whole response has been sent
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body":
+            if message.get("body") == b"first,":
+                first_chunk_sent.set()
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    # A buffering middleware would wait for the whole body before sending the first chunk
+    await asyncio.wait_for(app(_http_scope(path), receive, send), timeout=5)
+    return messages
+
+
+def test_streamed_body_is_not_buffered():
+    """Each chunk reaches the client before the next one is produced"""
+    RateLimitMiddleware.clear_rate_limits()
+    messages = asyncio.run(_stream("/api/v1/gar/export"))
+
+    start = messages[0]
+    bodies = [m.get("body", b"") for m in messages[1:]]
+    assert start["type"] == "http.response.start"
+    assert bodies[:2] == [b"first,", b"second"]
+
+    headers = {name.decode().lower(): value.decode() for name, value in start["headers"]}
+    assert headers["x-content-type-options"] == "nosniff"
+    assert "x-request-id" in headers
+    assert "x-process-time" in headers
+    assert headers["x-ratelimit-limit"] == "100"
+    assert headers["cache-control"] == "no-cache"
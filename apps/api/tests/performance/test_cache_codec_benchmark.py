@@ -0,0 +1,61 @@
+"""
+Benchmark of the cache value codec against plain JSON.
+
+Encodes an external-dashboard-shaped payload (6 governance areas x 150
+indicators) both ways and compares the stored size and the decode time.
+"""
+
+import json
+import time
+
+from app.core.cache_codec import decode, encode
+
+ROUNDS = 50
+
+
+def _dashboard_payload(areas: int = 6, indicators: int = 150) -> dict:
+    return {
+        "overall_compliance": {"total_barangays": 25, "passed_count": 18, "pass_percentage": 72.0},
+        "governance_area_performance": {
+            "areas": [
+                {
+                    "area_name": f"Governance Area {a}",
+                    "passed_count": 10 + a,
+                    "failed_count": 15 - a,
+                    "indicators": [
+                        {
+                            "indicator_id": i,
+                            "indicator_name": f"Indicator {a}.{i}",
+                            "pass_rate": 64.0,
+                        }
+                        for i in range(indicators)
+                    ],
+                }
+                for a in range(areas)
+            ]
+        },
+        "ai_insights": None,
+    }
+
+
+def _decode_ms(payload, loads) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        loads(payload)
+    return (time.perf_counter() - started) * 1000 / ROUNDS
+
+
+def test_codec_payloads_are_smaller_than_json():
+    """Codec payloads are smaller than plain json and decode to the same value"""
+    value = _dashboard_payload()
+    json_payload = json.dumps(value)
+    codec_payload = encode(value)
+
+    json_ms = _decode_ms(json_payload, json.loads)
+    codec_ms = _decode_ms(codec_payload, decode)
+    print(
+        f"\njson: {len(json_payload)} bytes, {json_ms:.3f} ms/decode; "
+        f"codec: {len(codec_payload)} bytes, {codec_ms:.3f} ms/decode"
+    )
+    assert len(codec_payload) < len(json_payload)
+    assert decode(codec_payload) == json.loads(json_payload)
@@ -0,0 +1,207 @@
+"""
+Micro-benchmark for the shared calculation rule engine.
+
+Builds a calculation schema for every hard-coded SGLGB indicator definition
+(app/indicators/definitions) from its checklist items and validation rule,
+then evaluates each schema against synthetic responses:
+
+- per-call: Pydantic parsing + compilation on every evaluation (the old cost model)
+- compiled: one cached compilation, evaluated via the batch API
+
+It also checks that CalculationEngineService and IntelligenceService agree on
+every synthetic response now that both use the same engine.
+"""
+
+import random
+import time
+from typing import Any
+
+import pytest
+
+from app.db.enums import ValidationStatus
+from app.indicators.definitions import ALL_INDICATORS
+from app.schemas.calculation_schema import CalculationSchema
+from app.services.calculation_engine_service import CalculationEngineService
+from app.services.calculation_rule_engine import compile_calculation_schema
+from app.services.intelligence_service import intelligence_service
+
+RESPONSES_PER_INDICATOR = 200
+SKIPPED_ITEM_TYPES = {"info_text", "section_header"}
+
+
+def _item_rule(item) -> dict[str, Any] | None:
+    """Translate a checklist item into a calculation rule."""
+    if item.item_type in SKIPPED_ITEM_TYPES or not item.required or item.is_profiling_only:
+        return None
+    if item.item_type == "document_count":
+        return {
+            "rule_type": "COUNT_THRESHOLD",
+            "field_id": item.id,
+            "operator": ">=",
+            "threshold": 1,
+        }
+    if item.item_type == "calculation_field":
+        return {
+            "rule_type": "PERCENTAGE_THRESHOLD",
+            "field_id": item.id,
+            "operator": ">=",
+            "threshold": 50.0,
+        }
+    if item.item_type == "date_input":
+        return {
+            "rule_type": "MATCH_VALUE",
+            "field_id": item.id,
+            "operator": "!=",
+            "expected_value": "",
+        }
+    if item.item_type == "assessment_field":
+        return {
+            "rule_type": "MATCH_VALUE",
+            "field_id": item.id,
+            "operator": "==",
+            "expected_value": "yes",
+        }
+    return {
+        "rule_type": "MATCH_VALUE",
+        "field_id": item.id,
+        "operator": "==",
+        "expected_value": True,
+    }
+
+
+def _combine(rule_type: str, rules: list[dict[str, Any]]) -> dict[str, Any] | None:
+    rules = [rule for rule in rules if rule]
+    if not rules:
+        return None
+    if len(rules) == 1:
+        return rules[0]
+    return {"rule_type": rule_type, "conditions": rules}
+
+
+def _leaf_rule(sub_indicator) -> dict[str, Any] | None:
+    """Translate a leaf sub-indicator's validation rule into a calculation rule."""
+    shared: list[dict[str, Any]] = []
+    options: dict[str, list[dict[str, Any]]] = {}
+    for item in sub_indicator.checklist_items:
+        rule = _item_rule(item)
+        if rule is None:
+            continue
+        if item.option_group:
+            options.setdefault(item.option_group, []).append(rule)
+        else:
+            shared.append(rule)
+
+    if sub_indicator.validation_rule == "ANY_ITEM_REQUIRED":
+        return _combine("OR_ANY", shared + [r for group in options.values() for r in group])
+
+    option_rule = _combine("OR_ANY", [_combine("AND_ALL", group) for group in options.values()])
+    return _combine("AND_ALL", shared + [option_rule])
+
+
+def _leaves(node) -> list:
+    if not node.children:
+        return [node]
+    return [leaf for child in node.children for leaf in _leaves(child)]
+
+
+def _schema_for(definition) -> dict[str, Any] | None:
+    rules = [rule for leaf in _leaves(definition) if (rule := _leaf_rule(leaf))]
+    if definition.is_bbi:
+        rules.append(
+            {"rule_type": "BBI_FUNCTIONALITY_CHECK", "bbi_id": 1, "expected_status": "Functional"}
+        )
+    if not rules:
+        return None
+    return {
+        "condition_groups": [{"operator": "AND", "rules": rules}],
+        "output_status_on_pass": "PASS",
+        "output_status_on_fail": "FAIL",
+    }
+
+
+def _field_rules(rule: dict[str, Any]) -> list[dict[str, Any]]:
+    if "conditions" in rule:
+        return [leaf for child in rule["conditions"] for leaf in _field_rules(child)]
+    return [rule]
+
+
+def _synthetic_response(schema: dict[str, Any], rng: random.Random) -> dict[str, Any]:
+    """Build a complete response where each field passes with 90% probability."""
+    data: dict[str, Any] = {}
+    for group in schema["condition_groups"]:
+        for rule in group["rules"]:
+            for leaf in _field_rules(rule):
+                passing = rng.random() < 0.9
+                rule_type = leaf["rule_type"]
+                if rule_type == "BBI_FUNCTIONALITY_CHECK":
+                    data["bbi_1_status"] = "Functional" if passing else "Non-Functional"
+                elif rule_type == "COUNT_THRESHOLD":
+                    checked = rng.randint(1, 4) if passing else 0
+                    data[leaf["field_id"]] = [f"option_{i}" for i in range(checked)]
+                elif rule_type == "PERCENTAGE_THRESHOLD":
+                    data[leaf["field_id"]] = rng.uniform(50, 100) if passing else rng.uniform(0, 49)
+                elif leaf["operator"] == "!=":
+                    data[leaf["field_id"]] = "2025-01-15" if passing else ""
+                else:
+                    expected = leaf["expected_value"]
+                    data[leaf["field_id"]] = (
+                        expected if passing else ("no" if isinstance(expected, str) else False)
+                    )
+    return data
+
+
+@pytest.fixture(scope="module")
+def indicator_workload():
+    rng = random.Random(2025)
+    workload = []
+    for definition in ALL_INDICATORS:
+        schema = _schema_for(definition)
+        if schema is None:
+            continue
+        responses = [_synthetic_response(schema, rng) for _ in range(RESPONSES_PER_INDICATOR)]
+        workload.append((definition.code, schema, responses))
+    return workload
+
+
+def test_all_indicator_definitions_compile(indicator_workload):
+    """Every derived schema is valid and compiles (indicators without required items are skipped)."""
+    assert indicator_workload
+    for code, schema, _ in indicator_workload:
+        assert compile_calculation_schema(CalculationSchema(**schema)) is not None, code
+
+
+def test_services_agree_on_synthetic_responses(indicator_workload):
+    """CalculationEngineService and IntelligenceService return identical results."""
+    engine = CalculationEngineService()
+    for code, schema, responses in indicator_workload:
+        schema_obj = CalculationSchema(**schema)
+        for response in responses:
+            passed = intelligence_service.evaluate_calculation_schema(schema_obj, response)
+            expected = ValidationStatus.PASS if passed else ValidationStatus.FAIL
+            assert engine.execute_calculation(schema, response) == expected, code
+
+
+def test_compiled_engine_benchmark(indicator_workload):
+    """Compiled evaluation is much cheaper than parsing the schema per call."""
+    evaluations = sum(len(responses) for _, _, responses in indicator_workload)
+
+    started = time.perf_counter()
+    for _, schema, responses in indicator_workload:
+        for response in responses:
+            compile_calculation_schema(CalculationSchema(**schema)).execute(response)
+    per_call_seconds = time.perf_counter() - started
+
+    engine = CalculationEngineService()
+    started = time.perf_counter()
+    for index, (_, schema, responses) in enumerate(indicator_workload):
+        for response in responses:
+            engine.execute_calculation(schema, response, indicator_id=index)
+    compiled_seconds = time.perf_counter() - started
+
+    print(
+        f"\n{len(indicator_workload)} indicators x {RESPONSES_PER_INDICATOR} responses "
+        f"({evaluations} evaluations): per-call parse {per_call_seconds * 1000:.1f} ms, "
+        f"compiled {compiled_seconds * 1000:.1f} ms "
+        f"({per_call_seconds / max(compiled_seconds, 1e-9):.1f}x)"
+    )
+    assert compiled_seconds < per_call_seconds
@@ -0,0 +1,104 @@
+"""
+Benchmark of EmailService throughput against a local SMTP server (aiosmtpd).
+
+Sends the same batch of notification emails twice: once over the pooled
+connection (EmailService.send_emails) and once with a fresh SMTP session per
+email, as the previous send_email did. Runs plain SMTP on localhost, so the
+per-session cost measured here excludes the TLS handshake that production
+also pays, making the speedup a lower bound.
+"""
+
+import smtplib
+import socket
+import time
+
+import pytest
+
+from app.services.email_service import EmailService, OutgoingEmail
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+aiosmtpd_smtp = pytest.importorskip("aiosmtpd.smtp")
+
+EMAIL_COUNT = 200
+
+
+class _CountingHandler:
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 Message accepted for delivery"
+
+
+class _LocalEmailService(EmailService):
+    """EmailService connecting to the local stand-in without TLS."""
+
+    def _connect(self) -> smtplib.SMTP:
+        return smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = _CountingHandler()
+    controller = aiosmtpd_controller.Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=_free_port(),
+        authenticator=lambda server, session, envelope, mechanism, auth_data: (
+            aiosmtpd_smtp.AuthResult(success=True)
+        ),
+        auth_require_tls=False,
+    )
+    controller.start()
+    try:
+        yield controller, handler
+    finally:
+        controller.stop()
+
+
+def _service(controller) -> _LocalEmailService:
+    service = _LocalEmailService()
+    service.smtp_host = controller.hostname
+    service.smtp_port = controller.port
+    service.smtp_user = "user"
+    service.smtp_password = "secret"
+    service.from_email = "noreply@sinag.test"
+    return service
+
+
+def test_pooled_smtp_throughput(smtp_server):
+    controller, handler = smtp_server
+    emails = [
+        OutgoingEmail(f"blgu{i}@sinag.test", "Deadline Reminder", "<p>Submit</p>", "Submit")
+        for i in range(EMAIL_COUNT)
+    ]
+
+    per_email = _service(controller)
+    start = time.perf_counter()
+    for email in emails:
+        assert per_email.send_emails([email])[0]["success"]
+        per_email.close()
+    per_email_seconds = time.perf_counter() - start
+
+    pooled = _service(controller)
+    start = time.perf_counter()
+    results = pooled.send_emails(emails)
+    pooled_seconds = time.perf_counter() - start
+    pooled.close()
+
+    assert all(result["success"] for result in results)
+    assert handler.received == 2 * EMAIL_COUNT
+
+    print(
+        f"\n{EMAIL_COUNT} emails: per-email sessions {per_email_seconds:.2f}s "
+        f"({EMAIL_COUNT / per_email_seconds:.0f}/s), pooled {pooled_seconds:.2f}s "
+        f"({EMAIL_COUNT / pooled_seconds:.0f}/s)"
+    )
+    assert pooled_seconds < per_email_seconds
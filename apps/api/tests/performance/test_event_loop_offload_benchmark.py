@@ -0,0 +1,109 @@
+"""
+Concurrency benchmark for async endpoints that run synchronous database queries.
+
+Serves the same two endpoints twice, once with FastAPI's default route class and
+once with OffloadedRoute:
+
+- /query: an `async def` handler that blocks for SLOW_QUERY_SECONDS, standing in
+  for a synchronous SQLAlchemy query
+- /ping: a cheap handler
+
+A mixed load of slow and fast requests arriving at a fixed rate is sent through
+an in-process ASGI client. With the default route class the slow handlers run on
+the event loop and every ping queues behind them; with OffloadedRoute they run in
+the threadpool.
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+
+from app.api.routing import OffloadedRoute
+
+SLOW_QUERY_SECONDS = 0.02
+SLOW_REQUESTS = 20
+FAST_REQUESTS = 100
+ARRIVAL_INTERVAL_SECONDS = 0.002
+
+
+def _build_app(route_class: type[APIRoute]) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/query")
+    async def query():
+        time.sleep(SLOW_QUERY_SECONDS)  # Blocking call, like Session.query(...).all()
+        return {"rows": 1}
+
+    @router.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def _fast_request_latencies(app: FastAPI) -> list[float]:
+    """
+    Send an open-loop mixed load and return the latency of every ping.
+
+    Latency is measured from each request's scheduled arrival time, so time spent
+    waiting for a blocked event loop before the request is even sent is counted.
+    """
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def timed_ping(scheduled_at: float):
+            response = await client.get("/ping")
+            latencies.append(time.perf_counter() - scheduled_at)
+            assert response.status_code == 200
+
+        async def slow_query():
+            response = await client.get("/query")
+            assert response.status_code == 200
+
+        tasks = []
+        started = time.perf_counter()
+        for index in range(FAST_REQUESTS):
+            scheduled_at = started + index * ARRIVAL_INTERVAL_SECONDS
+            await asyncio.sleep(max(0.0, scheduled_at - time.perf_counter()))
+            if index % (FAST_REQUESTS // SLOW_REQUESTS) == 0:
+                tasks.append(asyncio.create_task(slow_query()))
+            tasks.append(asyncio.create_task(timed_ping(scheduled_at)))
+        await asyncio.gather(*tasks)
+
+    return latencies
+
+
+def _p99(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=100)[98]
+
+
+# Timing-based: with a single CPU the threadpool competes with the event loop for that
+# CPU, so the ratio is noise. tests/api/test_routing.py checks the offloading itself.
+@pytest.mark.slow
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="needs at least 2 CPUs")
+def test_offloading_keeps_fast_requests_fast_under_mixed_load():
+    """Fast requests no longer wait for blocking handlers on the event loop."""
+    blocking = asyncio.run(_fast_request_latencies(_build_app(APIRoute)))
+    offloaded = asyncio.run(_fast_request_latencies(_build_app(OffloadedRoute)))
+
+    blocking_p99 = _p99(blocking)
+    offloaded_p99 = _p99(offloaded)
+    print(
+        f"\n{SLOW_REQUESTS} x {SLOW_QUERY_SECONDS * 1000:.0f} ms blocking queries + "
+        f"{FAST_REQUESTS} pings: p99 ping latency on the event loop "
+        f"{blocking_p99 * 1000:.1f} ms, offloaded {offloaded_p99 * 1000:.1f} ms "
+        f"({blocking_p99 / max(offloaded_p99, 1e-9):.1f}x)"
+    )
+    # On the event loop, the slowest ping waits for (nearly) every blocking query
+    assert blocking_p99 >= SLOW_QUERY_SECONDS * SLOW_REQUESTS / 2
+    assert offloaded_p99 < blocking_p99 / 2
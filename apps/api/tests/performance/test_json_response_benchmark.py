@@ -0,0 +1,142 @@
+"""
+Benchmark of JSON rendering for a full-assessment payload.
+
+Compares FastAPI's default path for a dict returned from a route with
+response_model=dict[str, Any] (response_model validation, jsonable_encoder,
+then JSONResponse's stdlib json.dumps) with returning a FastJSONResponse
+(a single orjson encode).
+
+The payload mirrors get_assessment_for_blgu_with_full_data: 6 governance areas
+x 25 indicators, each with a form schema, response data, MOVs and comments.
+"""
+
+import asyncio
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.responses import FastJSONResponse
+from app.db.enums import AssessmentStatus
+
+ROUNDS = 20
+
+
+def _full_assessment_payload() -> dict[str, Any]:
+    created = datetime(2025, 1, 15, 8, 0, 0)
+    areas = []
+    for area_id in range(1, 7):
+        indicators = []
+        for index in range(25):
+            indicator_id = area_id * 100 + index
+            indicators.append(
+                {
+                    "id": indicator_id,
+                    "name": f"{area_id}.{index} Indicator with a reasonably long descriptive name",
+                    "description": "Compliance with the requirement " * 6,
+                    "form_schema": {
+                        "fields": [
+                            {
+                                "field_id": f"field_{field}",
+                                "field_type": "checkbox_group",
+                                "label": f"Requirement {field}",
+                                "required": field % 2 == 0,
+                                "options": [
+                                    {"value": f"opt_{option}", "label": f"Option {option}"}
+                                    for option in range(4)
+                                ],
+                            }
+                            for field in range(6)
+                        ]
+                    },
+                    "response": {
+                        "id": indicator_id * 10,
+                        "is_completed": index % 3 != 0,
+                        "requires_rework": index % 7 == 0,
+                        "response_data": {f"field_{field}": [True, False] for field in range(6)},
+                        "updated_at": created + timedelta(minutes=indicator_id),
+                        "movs": [
+                            {
+                                "id": indicator_id * 100 + mov,
+                                "file_name": f"evidence-{indicator_id}-{mov}.pdf",
+                                "file_size": 524_288 + mov,
+                                "content_type": "application/pdf",
+                                "uploaded_at": created + timedelta(hours=mov),
+                            }
+                            for mov in range(3)
+                        ],
+                        "feedback_comments": [
+                            {
+                                "id": indicator_id,
+                                "comment": "Please attach the signed copy of the ordinance.",
+                                "created_at": created,
+                                "assessor": {"id": 7, "name": "Area Assessor"},
+                            }
+                        ],
+                    },
+                }
+            )
+        areas.append(
+            {"id": area_id, "name": f"Governance Area {area_id}", "indicators": indicators}
+        )
+
+    return {
+        "assessment": {
+            "id": 42,
+            "status": AssessmentStatus.SUBMITTED,
+            "created_at": created,
+            "submitted_at": created + timedelta(days=20),
+            "area_submission_status": {
+                str(area_id): {"status": "submitted"} for area_id in range(1, 7)
+            },
+        },
+        "governance_areas": areas,
+    }
+
+
+def _default_render(loop: asyncio.AbstractEventLoop, field, payload: dict[str, Any]) -> bytes:
+    """What FastAPI does with a dict returned from a response_model route."""
+    content = loop.run_until_complete(serialize_response(field=field, response_content=payload))
+    return JSONResponse(content).body
+
+
+def _measure(render) -> tuple[float, int]:
+    """Return (mean ms per render, peak bytes allocated during one render)."""
+    render()  # Warm up
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        render()
+    elapsed_ms = (time.perf_counter() - started) / ROUNDS * 1000
+
+    tracemalloc.start()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak
+
+
+def test_fast_json_response_beats_default_serialization():
+    payload = _full_assessment_payload()
+    field = create_model_field(
+        name="Response_get_my_assessment", type_=dict[str, Any], mode="serialization"
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        default_ms, default_peak = _measure(lambda: _default_render(loop, field, payload))
+        fast_ms, fast_peak = _measure(lambda: FastJSONResponse(payload).body)
+    finally:
+        loop.close()
+
+    size_kib = len(FastJSONResponse(payload).body) / 1024
+    print(
+        f"\nFull-assessment payload ({size_kib:.0f} KiB): "
+        f"default {default_ms:.2f} ms / {default_peak / 1024:.0f} KiB peak, "
+        f"FastJSONResponse {fast_ms:.2f} ms / {fast_peak / 1024:.0f} KiB peak "
+        f"({default_ms / fast_ms:.1f}x faster)"
+    )
+    assert fast_ms < default_ms
+    assert fast_peak < default_peak
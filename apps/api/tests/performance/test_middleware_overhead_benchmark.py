@@ -0,0 +1,100 @@
+"""
+Micro-benchmark of per-request middleware overhead.
+
+Sends the same request through:
+
+- bare: the endpoint with no middleware
+- base_http: five pass-through BaseHTTPMiddleware layers (the old stack's cost model)
+- pure_asgi: the application's five pure-ASGI middleware (same order as main.py)
+
+Requests are driven straight through the ASGI interface so only middleware and
+routing cost is measured.
+"""
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware import (
+    CacheHeadersMiddleware,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+REQUESTS = 2000
+
+
+class PassThroughMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def _build_app(middleware: list[type]) -> FastAPI:
+    app = FastAPI()
+    for middleware_class in middleware:
+        app.add_middleware(middleware_class)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return app
+
+
+async def _per_request_us(app: FastAPI) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/health",
+        "raw_path": b"/health",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(50):  # Warm up routing and middleware stack construction
+        await app(dict(scope), receive, send)
+
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / REQUESTS * 1_000_000
+
+
+def test_pure_asgi_stack_is_cheaper_than_base_http_layers():
+    """Five pure-ASGI layers cost less than five empty BaseHTTPMiddleware layers."""
+    pure_stack = [
+        RequestLoggingMiddleware,
+        MetricsMiddleware,
+        RateLimitMiddleware,
+        CacheHeadersMiddleware,
+        SecurityHeadersMiddleware,
+    ]
+    RateLimitMiddleware.clear_rate_limits()
+
+    bare = asyncio.run(_per_request_us(_build_app([])))
+    base_http = asyncio.run(_per_request_us(_build_app([PassThroughMiddleware] * 5)))
+    pure_asgi = asyncio.run(_per_request_us(_build_app(pure_stack)))
+
+    print(
+        f"\nPer-request time over {REQUESTS} requests: bare {bare:.0f} us, "
+        f"5 x BaseHTTPMiddleware (no-op) {base_http:.0f} us, "
+        f"pure ASGI stack {pure_asgi:.0f} us "
+        f"(middleware overhead {base_http - bare:.0f} us -> {pure_asgi - bare:.0f} us)"
+    )
+    assert pure_asgi < base_http
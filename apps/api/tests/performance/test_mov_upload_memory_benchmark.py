@@ -0,0 +1,94 @@
+"""
+Benchmark of peak memory while streaming a MOV upload to storage.
+
+A 45MB PDF (near the 50MB limit) is uploaded from a spooled temp file through
+StorageService._stream_to_storage with the resumable endpoint stubbed out.
+Peak traced memory must stay around one UPLOAD_CHUNK_SIZE chunk, rather than
+the whole file that the previous read-everything path held.
+"""
+
+import hashlib
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import MagicMock, patch
+
+import httpx
+from fastapi import UploadFile
+
+from app.services.storage_service import UPLOAD_CHUNK_SIZE, StorageService
+
+FILE_SIZE = 45 * 1024 * 1024
+
+
+class _CountingTusClient:
+    """Resumable endpoint stub that hashes what it receives without keeping it."""
+
+    def __init__(self, *args, **kwargs):
+        self.received = 0
+        self.digest = hashlib.sha256()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def post(self, url, headers):
+        return httpx.Response(
+            201,
+            headers={"Location": f"{url}/upload-id"},
+            request=httpx.Request("POST", url),
+        )
+
+    def patch(self, url, content, headers):
+        assert int(headers["Upload-Offset"]) == self.received
+        self.received += len(content)
+        self.digest.update(content)
+        return httpx.Response(
+            204,
+            headers={"Upload-Offset": str(self.received)},
+            request=httpx.Request("PATCH", url),
+        )
+
+
+def _large_pdf_upload() -> tuple[UploadFile, str]:
+    """A 45MB PDF in a disk-backed spooled file, as Starlette hands it to endpoints."""
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    digest = hashlib.sha256()
+    block = b"%PDF-1.4\n" + b"0" * (1024 * 1024 - 9)
+    for _ in range(FILE_SIZE // len(block)):
+        spooled.write(block)
+        digest.update(block)
+    spooled.seek(0)
+    upload = UploadFile(
+        filename="large-document.pdf",
+        file=spooled,
+        headers={"content-type": "application/pdf"},
+    )
+    return upload, digest.hexdigest()
+
+
+def test_streamed_upload_peak_memory_is_bounded():
+    upload, expected_sha256 = _large_pdf_upload()
+    tus_client = _CountingTusClient()
+
+    with patch("app.services.storage_service.httpx.Client", return_value=tus_client):
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = StorageService()._stream_to_storage(
+            MagicMock(), "mov-files", "1/1/large-document.pdf", upload, "application/pdf"
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(
+        f"\nStreamed {FILE_SIZE / (1024 * 1024):.0f} MiB upload: {elapsed_ms:.0f} ms, "
+        f"{peak / (1024 * 1024):.1f} MiB peak "
+        f"(chunk size {UPLOAD_CHUNK_SIZE / (1024 * 1024):.0f} MiB)"
+    )
+    assert result.size == FILE_SIZE == tus_client.received
+    assert result.sha256 == expected_sha256 == tus_client.digest.hexdigest()
+    # One chunk in flight at a time
+    assert peak < UPLOAD_CHUNK_SIZE + 1024 * 1024
@@ -7,8 +7,15 @@ from datetime import UTC, datetime
 from unittest.mock import patch
 
 import pytest
-
-from app.db.enums import AreaType, ComplianceStatus, UserRole
+from sqlalchemy import event
+
+from app.db.enums import (
+    AreaType,
+    AssessmentStatus,
+    ComplianceStatus,
+    UserRole,
+    ValidationStatus,
+)
 from app.db.models import (
     Assessment,
     AssessmentResponse,
@@ -228,6 +235,123 @@ def test_calculate_area_breakdown_no_areas(db_session):
     assert result == []
 
 
+def _create_completed_assessment(db_session, index, year, statuses, compliance, status=None):
+    """Create a BLGU user with an assessment and one response per (indicator, status)."""
+    barangay = Barangay(name=f"Aggregate Barangay {index}")
+    db_session.add(barangay)
+    db_session.flush()
+    user = User(
+        email=f"aggregate{index}@test.com",
+        name=f"Aggregate User {index}",
+        hashed_password="hashed",
+        role=UserRole.BLGU_USER,
+        barangay_id=barangay.id,
+    )
+    db_session.add(user)
+    db_session.flush()
+    assessment = Assessment(
+        blgu_user_id=user.id,
+        assessment_year=year,
+        status=status or AssessmentStatus.COMPLETED,
+        final_compliance_status=compliance,
+    )
+    db_session.add(assessment)
+    db_session.flush()
+    for indicator, validation_status in statuses:
+        db_session.add(
+            AssessmentResponse(
+                assessment_id=assessment.id,
+                indicator_id=indicator.id,
+                is_completed=True,
+                response_data={},
+                validation_status=validation_status,
+            )
+        )
+    db_session.flush()
+    return assessment
+
+
+def test_area_breakdown_and_compliance_aggregate_in_sql(db_session, governance_areas, indicators):
+    """Area breakdown and overall compliance return exact counts with a constant number of queries"""
+    db_session.add(
+        AssessmentYear(
+            year=2025,
+            assessment_period_start=datetime(2025, 1, 1),
+            assessment_period_end=datetime(2025, 12, 31),
+            is_active=True,
+            is_published=True,
+        )
+    )
+    db_session.flush()
+    area1, area2 = indicators[0:3], indicators[3:6]
+
+    # Passes area 1 and area 2 (CONDITIONAL counts as met)
+    _create_completed_assessment(
+        db_session,
+        1,
+        2025,
+        [(ind, ValidationStatus.PASS) for ind in area1]
+        + [(area2[0], ValidationStatus.CONDITIONAL)],
+        ComplianceStatus.PASSED,
+    )
+    # Fails area 1, passes area 2
+    _create_completed_assessment(
+        db_session,
+        2,
+        2025,
+        [(area1[0], ValidationStatus.FAIL), (area1[1], ValidationStatus.PASS)]
+        + [(ind, ValidationStatus.PASS) for ind in area2],
+        ComplianceStatus.FAILED,
+    )
+    # No validated indicators yet: skipped in the breakdown
+    _create_completed_assessment(
+        db_session, 3, 2025, [(ind, None) for ind in area1], ComplianceStatus.PASSED
+    )
+    # Not completed: ignored everywhere
+    _create_completed_assessment(
+        db_session,
+        4,
+        2025,
+        [(ind, ValidationStatus.FAIL) for ind in area1],
+        None,
+        status=AssessmentStatus.SUBMITTED,
+    )
+    db_session.commit()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        breakdown = analytics_service._calculate_area_breakdown(db_session, 2025)
+        compliance = analytics_service._calculate_overall_compliance(db_session, 2025)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    by_name = {area.area_name: area for area in breakdown}
+    assert (
+        by_name["Financial Administration"].passed,
+        by_name["Financial Administration"].failed,
+    ) == (1, 1)
+    assert by_name["Financial Administration"].percentage == 50.0
+    assert (by_name["Disaster Preparedness"].passed, by_name["Disaster Preparedness"].failed) == (
+        2,
+        0,
+    )
+    assert (by_name["Social Protection"].passed, by_name["Social Protection"].failed) == (0, 0)
+
+    assert compliance.total_barangays == 3
+    assert compliance.passed == 2
+    assert compliance.failed == 1
+    assert compliance.pass_percentage == 66.67
+
+    # Areas + aggregated breakdown, then a single aggregate for compliance
+    assert len(statements) == 3
+
+
 def test_calculate_top_failed_indicators(
     db_session, governance_areas, indicators, barangays_with_assessments
 ):
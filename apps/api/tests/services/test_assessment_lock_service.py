@@ -2,8 +2,9 @@ from datetime import UTC, datetime, timedelta
 
 import pytest
 
-from app.db.enums import AssessmentStatus, UserRole
+from app.db.enums import AssessmentStatus, NotificationType, UserRole
 from app.db.models.assessment import Assessment
+from app.db.models.notification import Notification
 from app.db.models.system import AssessmentYear
 from app.db.models.user import User
 from app.services.assessment_lock_service import assessment_lock_service
@@ -106,6 +107,45 @@ def test_process_expired_grace_period_relocks_without_changing_status(
     assert assessment.mlgoo_recalibration_count == 1
 
 
+def test_process_expired_locks_only_flips_due_assessments_and_notifies_in_batch(
+    db_session, mock_blgu_user, mlgoo_user, active_assessment_year
+):
+    now = datetime.now(UTC)
+    reopened = Assessment(
+        blgu_user_id=mock_blgu_user.id,
+        assessment_year=active_assessment_year.year,
+        status=AssessmentStatus.REWORK,
+        is_locked_for_deadline=False,
+        grace_period_expires_at=now + timedelta(days=1),
+    )
+    db_session.add(reopened)
+    db_session.commit()
+
+    first = assessment_lock_service.process_expired_assessment_locks(db_session, now=now)
+    db_session.refresh(reopened)
+
+    # Still inside its grace period: untouched, nobody notified
+    assert first == {"deadline_locked": 0, "grace_relocked": 0}
+    assert reopened.is_locked_for_deadline is False
+    assert db_session.query(Notification).count() == 0
+
+    later = now + timedelta(days=2)
+    second = assessment_lock_service.process_expired_assessment_locks(db_session, now=later)
+    db_session.refresh(reopened)
+
+    assert second == {"deadline_locked": 0, "grace_relocked": 1}
+    assert reopened.locked_at == reopened.grace_period_expires_at
+    notifications = db_session.query(Notification).all()
+    assert {n.recipient_id for n in notifications} == {mock_blgu_user.id, mlgoo_user.id}
+    assert all(n.notification_type == NotificationType.ASSESSMENT_LOCKED for n in notifications)
+    assert all(n.assessment_id == reopened.id for n in notifications)
+
+    # Already locked: a repeat sweep changes nothing
+    third = assessment_lock_service.process_expired_assessment_locks(db_session, now=later)
+    assert third == {"deadline_locked": 0, "grace_relocked": 0}
+    assert db_session.query(Notification).count() == len(notifications)
+
+
 def test_unlock_assessment_uses_year_default_grace_period(
     db_session, mock_blgu_user, mlgoo_user, active_assessment_year
 ):
@@ -8,6 +8,10 @@ Tests the calculation schema evaluation and remark generation functionality:
 - Integration with assessment workflow
 """
 
+from unittest.mock import patch
+
+import pytest
+
 from app.db.models.governance_area import Indicator
 from app.schemas.calculation_schema import (
     AndAllRule,
@@ -19,6 +23,7 @@ from app.schemas.calculation_schema import (
     OrAnyRule,
     PercentageThresholdRule,
 )
+from app.services.calculation_engine_service import calculation_engine_service
 from app.services.intelligence_service import intelligence_service
 
 
@@ -137,6 +142,19 @@ class TestRuleTypeEvaluation:
         result = intelligence_service.evaluate_rule(rule, assessment_data)
         assert result is False
 
+    @pytest.mark.parametrize("field_value", [{"doc1": True, "doc2": True}, 2])
+    def test_count_threshold_rule_rejects_non_list(self, field_value):
+        """Test COUNT_THRESHOLD rule raises for values that are not checkbox lists."""
+        rule = CountThresholdRule(
+            rule_type="COUNT_THRESHOLD",
+            field_id="required_documents",
+            operator=">=",
+            threshold=1,
+        )
+        assessment_data = {"required_documents": field_value}
+        with pytest.raises(ValueError, match="expected list"):
+            intelligence_service.evaluate_rule(rule, assessment_data)
+
     def test_and_all_rule_all_conditions_true(self):
         """Test AND_ALL rule when all conditions are true."""
         rule = AndAllRule(
@@ -360,6 +378,39 @@ class TestNestedConditionGroups:
         result = intelligence_service.evaluate_calculation_schema(schema, assessment_data)
         assert result is True
 
+    def test_schema_evaluation_reuses_compiled_schema(self):
+        """Test evaluating the same schema again skips validation and compilation."""
+        schema = CalculationSchema(
+            condition_groups=[
+                ConditionGroup(
+                    operator="AND",
+                    rules=[
+                        PercentageThresholdRule(
+                            rule_type="PERCENTAGE_THRESHOLD",
+                            field_id="completion_rate",
+                            operator=">=",
+                            threshold=75.0,
+                        )
+                    ],
+                )
+            ],
+            output_status_on_pass="PASS",
+            output_status_on_fail="FAIL",
+        )
+        calculation_engine_service.clear_compiled_schemas()
+
+        with patch(
+            "app.services.calculation_engine_service.CalculationSchema",
+            wraps=CalculationSchema,
+        ) as schema_cls:
+            results = [
+                intelligence_service.evaluate_calculation_schema(schema, {"completion_rate": rate})
+                for rate in (80.0, 50.0)
+            ]
+
+        assert results == [True, False]
+        assert schema_cls.call_count == 1
+
 
 class TestRemarkGeneration:
     """Test suite for remark generation."""
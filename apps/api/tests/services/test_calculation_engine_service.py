@@ -11,8 +11,16 @@ Covers:
 - Error handling for invalid schemas and missing data
 """
 
+import copy
+from unittest.mock import patch
+
+import pytest
+
 from app.db.enums import ValidationStatus
+from app.schemas.calculation_schema import CalculationSchema
 from app.services.calculation_engine_service import (
+    CalculationEngineError,
+    CalculationEngineService,
     calculation_engine_service,
 )
 
@@ -524,3 +532,68 @@ class TestCalculationEngineService:
         result = calculation_engine_service.execute_calculation(calculation_schema, response_data)
 
         assert result == ValidationStatus.PASS
+
+
+class TestCompiledCalculationSchemas:
+    """Test suite for compiled schema caching and the batch API"""
+
+    SCHEMA = {
+        "condition_groups": [
+            {
+                "operator": "AND",
+                "rules": [
+                    {
+                        "rule_type": "PERCENTAGE_THRESHOLD",
+                        "field_id": "completion_rate",
+                        "operator": ">=",
+                        "threshold": 75.0,
+                    }
+                ],
+            }
+        ],
+        "output_status_on_pass": "PASS",
+        "output_status_on_fail": "FAIL",
+    }
+
+    def setup_method(self):
+        self.engine = CalculationEngineService()
+
+    def test_schema_is_compiled_once_per_indicator(self):
+        """Repeated evaluations reuse the compiled schema instead of re-validating it"""
+        with patch(
+            "app.services.calculation_engine_service.CalculationSchema",
+            wraps=CalculationSchema,
+        ) as schema_cls:
+            for rate in (80.0, 50.0, 90.0):
+                self.engine.execute_calculation(
+                    self.SCHEMA, {"completion_rate": rate}, indicator_id=7
+                )
+
+        assert schema_cls.call_count == 1
+
+    def test_invalidate_indicator_evicts_compiled_schema(self):
+        """Editing an indicator forces recompilation from the new schema"""
+        first = self.engine.compile_schema(self.SCHEMA, indicator_id=7)
+        assert self.engine.compile_schema(self.SCHEMA, indicator_id=7) is first
+
+        assert self.engine.invalidate_indicator(7) == 1
+        assert self.engine.compile_schema(self.SCHEMA, indicator_id=7) is not first
+
+    def test_changed_schema_gets_new_compiled_plan(self):
+        """A different schema for the same indicator is keyed by its hash"""
+        edited = copy.deepcopy(self.SCHEMA)
+        edited["condition_groups"][0]["rules"][0]["threshold"] = 90.0
+
+        assert (
+            self.engine.execute_calculation(self.SCHEMA, {"completion_rate": 80}, indicator_id=7)
+            == ValidationStatus.PASS
+        )
+        assert (
+            self.engine.execute_calculation(edited, {"completion_rate": 80}, indicator_id=7)
+            == ValidationStatus.FAIL
+        )
+
+    def test_invalid_schema_raises_engine_error(self):
+        """Compilation errors surface as CalculationEngineError"""
+        with pytest.raises(CalculationEngineError):
+            self.engine.compile_schema({"condition_groups": []}, indicator_id=7)
@@ -0,0 +1,110 @@
+"""
+Tests for the pooled SMTP delivery in EmailService (app/services/email_service.py)
+"""
+
+import smtplib
+from unittest.mock import patch
+
+import pytest
+
+from app.services.email_service import SMTP_IDLE_TIMEOUT, EmailService, OutgoingEmail
+
+
+class _FakeSMTP:
+    """smtplib.SMTP stand-in that records sessions and can drop after N messages."""
+
+    instances: list["_FakeSMTP"] = []
+    drop_after: int | None = None
+    refuse_connections = False
+
+    def __init__(self, host, port, timeout=None):
+        if _FakeSMTP.refuse_connections:
+            raise ConnectionRefusedError("connection refused")
+        self.sent: list[str] = []
+        self.closed = False
+        _FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def sendmail(self, from_addr, to_addr, message):
+        if _FakeSMTP.drop_after is not None and len(self.sent) >= _FakeSMTP.drop_after:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append(to_addr)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def email_service():
+    _FakeSMTP.instances = []
+    _FakeSMTP.drop_after = None
+    _FakeSMTP.refuse_connections = False
+    service = EmailService()
+    service.smtp_host = "smtp.test"
+    service.smtp_port = 587
+    service.smtp_user = "user"
+    service.smtp_password = "secret"
+    service.smtp_tls = True
+    service.from_email = "noreply@test"
+    with patch("app.services.email_service.smtplib.SMTP", _FakeSMTP):
+        yield service
+    service.close()
+
+
+def _emails(count: int) -> list[OutgoingEmail]:
+    return [OutgoingEmail(f"user{i}@test", "Subject", "<p>Body</p>", "Body") for i in range(count)]
+
+
+def test_send_emails_reuses_one_connection_across_batches(email_service):
+    first = email_service.send_emails(_emails(3))
+    second = email_service.send_emails(_emails(2))
+    single = email_service.send_email("solo@test", "Subject", "<p>Body</p>")
+
+    assert all(result["success"] for result in first + second + [single])
+    assert len(_FakeSMTP.instances) == 1
+    assert len(_FakeSMTP.instances[0].sent) == 6
+
+
+def test_send_emails_reopens_idle_connection(email_service):
+    email_service.send_emails(_emails(1))
+    email_service._connection_used_at -= SMTP_IDLE_TIMEOUT + 1
+
+    email_service.send_emails(_emails(1))
+
+    assert len(_FakeSMTP.instances) == 2
+    assert _FakeSMTP.instances[0].closed is True
+
+
+def test_send_emails_reconnects_once_when_connection_drops(email_service):
+    _FakeSMTP.drop_after = 2
+
+    results = email_service.send_emails(_emails(4))
+
+    assert [result["success"] for result in results] == [True, True, True, True]
+    assert [len(server.sent) for server in _FakeSMTP.instances] == [2, 2]
+
+
+def test_send_emails_marks_batch_retryable_when_server_unavailable(email_service):
+    _FakeSMTP.refuse_connections = True
+
+    results = email_service.send_emails(_emails(3))
+
+    assert all(result["success"] is False for result in results)
+    assert all(result["retryable"] is True for result in results)
+
+
+def test_send_emails_skips_when_not_configured(email_service):
+    email_service.smtp_host = None
+
+    results = email_service.send_emails(_emails(2))
+
+    assert results == [{"success": False, "error": "SMTP not configured", "skipped": True}] * 2
+    assert _FakeSMTP.instances == []
@@ -151,6 +151,32 @@ class TestFileValidationService:
         assert "suspicious or executable" in result.error_message.lower()
         assert result.error_code == "SUSPICIOUS_CONTENT"
 
+    def test_magic_bytes_must_match_declared_type(self, service):
+        """Test that a PNG declared (and named) as a PDF is rejected."""
+        file_data = io.BytesIO(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+        upload_file = UploadFile(
+            filename="fake.pdf",
+            file=file_data,
+            headers={"content-type": "application/pdf"},
+        )
+
+        result = service.validate_file_content(upload_file)
+
+        assert result.success is False
+        assert "does not match declared type" in result.error_message
+        assert result.error_code == "CONTENT_TYPE_MISMATCH"
+
+    def test_validate_file_signature_on_first_chunk(self, service):
+        """Test the signature check used on the first chunk of streamed uploads."""
+        assert service.validate_file_signature(b"%PDF-1.7\n", "application/pdf").success
+        assert service.validate_file_signature(b"\xff\xd8\xff\xe0", "image/jpeg").success
+        # Types without a known signature are only checked for executables
+        assert service.validate_file_signature(b"some data", "application/octet-stream").success
+        assert (
+            service.validate_file_signature(b"#!/bin/sh", "application/octet-stream").error_code
+            == "SUSPICIOUS_CONTENT"
+        )
+
     def test_zip_signature_is_rejected(self, service):
         """Test that ZIP signature is rejected (DOCX/XLSX no longer allowed)."""
         # ZIP archives with PK signature should now be rejected
@@ -2,6 +2,9 @@
 Tests for notification service layer (app/services/notification_service.py)
 """
 
+from datetime import datetime
+from unittest.mock import patch
+
 import pytest
 from sqlalchemy.orm import Session
 
@@ -10,7 +13,10 @@ from app.db.enums import AreaType, AssessmentStatus, NotificationType, UserRole
 from app.db.models.assessment import Assessment
 from app.db.models.barangay import Barangay
 from app.db.models.governance_area import GovernanceArea
+from app.db.models.notification import Notification
+from app.db.models.system import AssessmentYear
 from app.db.models.user import User
+from app.schemas.notification import NotificationCreate
 from app.services.notification_service import notification_service
 
 # ====================================================================
@@ -95,8 +101,17 @@ def validator_user(db_session: Session, governance_area: GovernanceArea):
 @pytest.fixture
 def assessment(db_session: Session, blgu_user: User):
     """Create an assessment for testing"""
+    db_session.add(
+        AssessmentYear(
+            year=2025,
+            assessment_period_start=datetime(2025, 1, 1),
+            assessment_period_end=datetime(2025, 10, 31),
+            is_active=True,
+        )
+    )
     assessment = Assessment(
         blgu_user_id=blgu_user.id,
+        assessment_year=2025,
         status=AssessmentStatus.SUBMITTED,
     )
     db_session.add(assessment)
@@ -165,6 +180,112 @@ def test_create_notification_without_assessment(db_session: Session, blgu_user:
     assert notification.assessment_id is None
 
 
+def test_create_notifications_inserts_in_order(
+    db_session: Session, blgu_user: User, assessor_user: User, assessment: Assessment
+):
+    """Test creating several notifications in one call returns them in input order"""
+    notifications = notification_service.create_notifications(
+        db_session,
+        [
+            NotificationCreate(
+                recipient_id=blgu_user.id,
+                notification_type=NotificationType.ASSESSMENT_LOCKED,
+                title="Locked",
+                message="Your assessment is locked",
+                assessment_id=assessment.id,
+            ),
+            NotificationCreate(
+                recipient_id=assessor_user.id,
+                notification_type=NotificationType.NEW_SUBMISSION,
+                title="New Submission",
+                message="A new assessment has been submitted",
+            ),
+        ],
+    )
+
+    assert len(notifications) == 2
+    first, second = notifications
+    assert first.id is not None
+    assert db_session.get(Notification, first.id) is first
+    assert first.recipient_id == blgu_user.id
+    assert first.assessment_id == assessment.id
+    assert first.is_read is False
+    assert second.recipient_id == assessor_user.id
+    assert second.notification_type == NotificationType.NEW_SUBMISSION
+
+
+def test_create_notifications_empty(db_session: Session):
+    """Test creating no notifications is a no-op"""
+    assert notification_service.create_notifications(db_session, []) == []
+
+
+def test_create_notifications_bulk_queues_emails_once_on_commit(
+    db_session: Session, blgu_user: User, assessor_user: User, assessment: Assessment
+):
+    """Test a bulk fan-out queues all its emails as one batch when the session commits"""
+    with (
+        patch("app.services.notification_service.email_service") as mock_email,
+        patch("app.workers.notifications.queue_notification_emails") as mock_queue,
+    ):
+        mock_email.is_configured.return_value = True
+        notifications = notification_service.create_notifications_bulk(
+            db=db_session,
+            recipient_ids=[blgu_user.id, assessor_user.id],
+            notification_type=NotificationType.NEW_SUBMISSION,
+            title="New Submission",
+            message="A new assessment has been submitted",
+            assessment_id=assessment.id,
+        )
+        mock_queue.assert_not_called()
+        db_session.commit()
+
+    assert [n.recipient_id for n in notifications] == [blgu_user.id, assessor_user.id]
+    assert all(n.assessment_id == assessment.id for n in notifications)
+    mock_queue.assert_called_once_with([n.id for n in notifications])
+    mock_email.send_emails.assert_not_called()
+
+
+def test_created_notifications_are_pushed_on_commit(
+    db_session: Session, blgu_user: User, assessor_user: User
+):
+    """Test new notifications are pushed to their recipients only once committed"""
+    with patch("app.services.notification_service.notification_stream") as mock_stream:
+        notifications = notification_service.create_notifications_bulk(
+            db=db_session,
+            recipient_ids=[blgu_user.id, assessor_user.id, blgu_user.id],
+            notification_type=NotificationType.NEW_SUBMISSION,
+            title="New Submission",
+            message="A new assessment has been submitted",
+            send_email=False,
+        )
+        mock_stream.publish_created.assert_not_called()
+        db_session.commit()
+
+    mock_stream.publish_created.assert_called_once_with(
+        {
+            blgu_user.id: [notifications[0].id, notifications[2].id],
+            assessor_user.id: [notifications[1].id],
+        }
+    )
+
+
+def test_rolled_back_notifications_are_not_pushed(db_session: Session, blgu_user: User):
+    """Test notifications discarded by a rollback are never pushed"""
+    with patch("app.services.notification_service.notification_stream") as mock_stream:
+        notification_service.create_notification(
+            db=db_session,
+            recipient_id=blgu_user.id,
+            notification_type=NotificationType.NEW_SUBMISSION,
+            title="New Submission",
+            message="A new assessment has been submitted",
+            send_email=False,
+        )
+        db_session.rollback()
+        db_session.commit()
+
+    mock_stream.publish_created.assert_not_called()
+
+
 # ====================================================================
 # Notify Assessors Tests
 # ====================================================================
@@ -531,6 +652,14 @@ def test_mark_all_as_read(db_session: Session, blgu_user: User):
     assert unread_count == 0
 
 
+def test_mark_all_as_read_publishes_read_event(db_session: Session, blgu_user: User):
+    """Test marking all as read resets the pushed unread count"""
+    with patch("app.services.notification_service.notification_stream") as mock_stream:
+        notification_service.mark_all_as_read(db=db_session, user_id=blgu_user.id)
+
+    mock_stream.publish_read.assert_called_once_with(blgu_user.id, 0, all_read=True)
+
+
 # ====================================================================
 # Count Tests
 # ====================================================================
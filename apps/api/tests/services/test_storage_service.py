@@ -7,13 +7,18 @@ Tests file upload functionality for MOV files including:
 - File upload to Supabase Storage
 - Database record creation
 - Transaction rollback on errors
+- Chunked streaming and resumable uploads
+- Batched, cached signed URLs
 """
 
+import hashlib
 import io
+import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 from uuid import UUID
 
+import httpx
 import pytest
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
@@ -27,7 +32,14 @@ from app.db.models.assessment import (
 )
 from app.db.models.governance_area import GovernanceArea, Indicator
 from app.db.models.system import AssessmentYear
-from app.services.storage_service import StorageService
+from app.services.file_validation_service import file_validation_service
+from app.services.storage_service import (
+    RESUMABLE_UPLOAD_RETRIES,
+    SIGNED_URL_EXPIRY_MARGIN,
+    UPLOAD_CHUNK_SIZE,
+    StorageService,
+    signed_url_cache_key,
+)
 
 
 class TestStorageServiceFilenameGeneration:
@@ -937,3 +949,305 @@ class TestStorageServiceSingleton:
         from app.services.storage_service import storage_service
 
         assert storage_service.MOV_FILES_BUCKET == "mov-files"
+
+
+class _FlakyTusClient:
+    """Resumable endpoint stub that keeps what it receives and can drop a chunk."""
+
+    def __init__(self, fail_patches: int = 0):
+        self.stored = bytearray()
+        self.fail_patches = fail_patches
+        self.patch_offsets: list[int] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def post(self, url, headers):
+        self.upload_length = int(headers["Upload-Length"])
+        return httpx.Response(
+            201, headers={"Location": "/upload/abc"}, request=httpx.Request("POST", url)
+        )
+
+    def patch(self, url, content, headers):
+        offset = int(headers["Upload-Offset"])
+        self.patch_offsets.append(offset)
+        assert offset == len(self.stored)
+        if self.fail_patches:
+            # Half the chunk reaches storage before the connection drops
+            self.fail_patches -= 1
+            self.stored += content[: len(content) // 2]
+            raise httpx.ReadTimeout("timed out", request=httpx.Request("PATCH", url))
+        self.stored += content
+        return httpx.Response(
+            204,
+            headers={"Upload-Offset": str(len(self.stored))},
+            request=httpx.Request("PATCH", url),
+        )
+
+    def head(self, url):
+        return httpx.Response(
+            200,
+            headers={"Upload-Offset": str(len(self.stored))},
+            request=httpx.Request("HEAD", url),
+        )
+
+
+class TestStorageServiceStreamingUpload:
+    """Test chunked streaming of uploads to storage."""
+
+    @pytest.fixture
+    def service(self):
+        return StorageService()
+
+    @staticmethod
+    def _upload(content: bytes, content_type: str = "application/pdf") -> UploadFile:
+        return UploadFile(
+            filename="doc.pdf", file=io.BytesIO(content), headers={"content-type": content_type}
+        )
+
+    def test_small_file_uses_single_upload(self, service):
+        content = b"%PDF-1.4\n%small"
+        supabase = MagicMock()
+
+        result = service._stream_to_storage(
+            supabase, "mov-files", "1/1/doc.pdf", self._upload(content), "application/pdf"
+        )
+
+        assert result.size == len(content)
+        assert result.sha256 == hashlib.sha256(content).hexdigest()
+        supabase.storage.from_.return_value.upload.assert_called_once_with(
+            path="1/1/doc.pdf", file=content, file_options={"content-type": "application/pdf"}
+        )
+
+    def test_large_file_resumes_after_failed_chunk(self, service):
+        content = b"%PDF-1.4\n" + bytes(range(256)) * (UPLOAD_CHUNK_SIZE // 128)
+        tus_client = _FlakyTusClient(fail_patches=1)
+        supabase = MagicMock()
+
+        with patch("app.services.storage_service.httpx.Client", return_value=tus_client):
+            result = service._stream_to_storage(
+                supabase, "mov-files", "1/1/doc.pdf", self._upload(content), "application/pdf"
+            )
+
+        assert bytes(tus_client.stored) == content
+        assert tus_client.upload_length == len(content)
+        # The failed first chunk is resent from the offset storage reported
+        assert tus_client.patch_offsets[:2] == [0, UPLOAD_CHUNK_SIZE // 2]
+        assert result.size == len(content)
+        assert result.sha256 == hashlib.sha256(content).hexdigest()
+        supabase.storage.from_.return_value.upload.assert_not_called()
+
+    def test_large_file_gives_up_after_retries(self, service):
+        content = b"%PDF-1.4\n" + b"0" * (UPLOAD_CHUNK_SIZE * 2)
+        tus_client = _FlakyTusClient(fail_patches=RESUMABLE_UPLOAD_RETRIES + 1)
+
+        with patch("app.services.storage_service.httpx.Client", return_value=tus_client):
+            with pytest.raises(httpx.ReadTimeout):
+                service._stream_to_storage(
+                    MagicMock(),
+                    "mov-files",
+                    "1/1/doc.pdf",
+                    self._upload(content),
+                    "application/pdf",
+                )
+
+    def test_rejects_mismatched_magic_bytes(self, service):
+        supabase = MagicMock()
+
+        with pytest.raises(ValueError, match="does not match declared type"):
+            service._stream_to_storage(
+                supabase,
+                "mov-files",
+                "1/1/doc.pdf",
+                self._upload(b"\x89PNG\r\n\x1a\n" + b"\x00" * 64),
+                "application/pdf",
+            )
+        supabase.storage.from_.return_value.upload.assert_not_called()
+
+    def test_rejects_oversized_file_before_reading(self, service):
+        upload = self._upload(b"%PDF-1.4\n")
+        upload.file.seek(file_validation_service.MAX_FILE_SIZE)
+        upload.file.write(b"0")
+        supabase = MagicMock()
+
+        with pytest.raises(ValueError, match="exceeds"):
+            service._stream_to_storage(
+                supabase, "mov-files", "1/1/doc.pdf", upload, "application/pdf"
+            )
+        supabase.storage.from_.return_value.upload.assert_not_called()
+
+
+class TestStorageServiceSignedUrls:
+    """Test batched, cached signed URL generation."""
+
+    FILE_URL = "https://storage.supabase.co/storage/v1/object/public/mov-files/{path}"
+
+    @pytest.fixture
+    def service(self):
+        return StorageService()
+
+    @pytest.fixture
+    def mock_supabase_client(self):
+        mock_client = MagicMock()
+        mock_client.storage.from_.return_value.create_signed_urls.side_effect = lambda paths, _: [
+            {"path": path, "signedURL": f"https://signed/{path}?token=t", "error": None}
+            for path in paths
+        ]
+        return mock_client
+
+    def test_signs_uncached_paths_in_one_call(self, service, mock_supabase_client):
+        urls = [self.FILE_URL.format(path=f"1/{i}/file%20{i}.pdf") for i in range(3)]
+
+        with (
+            patch(
+                "app.services.storage_service._get_supabase_client",
+                return_value=mock_supabase_client,
+            ),
+            patch("app.services.storage_service.cache") as mock_cache,
+        ):
+            mock_cache.get_many.return_value = {}
+            signed = service.get_signed_urls(urls, expires_in=3600)
+
+        bucket = mock_supabase_client.storage.from_.return_value
+        bucket.create_signed_urls.assert_called_once_with(
+            ["1/0/file 0.pdf", "1/1/file 1.pdf", "1/2/file 2.pdf"], 3600
+        )
+        assert signed[urls[1]] == "https://signed/1/1/file 1.pdf?token=t"
+        cached_values = mock_cache.set_many.call_args.args[0]
+        assert set(cached_values) == {signed_url_cache_key(f"1/{i}/file {i}.pdf") for i in range(3)}
+        assert mock_cache.set_many.call_args.kwargs["ttl"] == 3600 - SIGNED_URL_EXPIRY_MARGIN
+
+    def test_reuses_cached_urls_with_enough_validity_left(self, service, mock_supabase_client):
+        fresh_url = self.FILE_URL.format(path="1/1/fresh.pdf")
+        stale_url = self.FILE_URL.format(path="1/1/stale.pdf")
+        now = time.time()
+
+        with (
+            patch(
+                "app.services.storage_service._get_supabase_client",
+                return_value=mock_supabase_client,
+            ),
+            patch("app.services.storage_service.cache") as mock_cache,
+        ):
+            mock_cache.get_many.return_value = {
+                signed_url_cache_key("1/1/fresh.pdf"): {"url": "cached", "expires_at": now + 3000},
+                signed_url_cache_key("1/1/stale.pdf"): {"url": "old", "expires_at": now + 60},
+            }
+            signed = service.get_signed_urls([fresh_url, stale_url], expires_in=3600)
+
+        assert signed[fresh_url] == "cached"
+        assert signed[stale_url] == "https://signed/1/1/stale.pdf?token=t"
+        mock_supabase_client.storage.from_.return_value.create_signed_urls.assert_called_once_with(
+            ["1/1/stale.pdf"], 3600
+        )
+
+    def test_fully_cached_list_makes_no_storage_call(self, service, mock_supabase_client):
+        url = self.FILE_URL.format(path="1/1/a.pdf")
+
+        with (
+            patch(
+                "app.services.storage_service._get_supabase_client",
+                return_value=mock_supabase_client,
+            ) as get_client,
+            patch("app.services.storage_service.cache") as mock_cache,
+        ):
+            mock_cache.get_many.return_value = {
+                signed_url_cache_key("1/1/a.pdf"): {
+                    "url": "cached",
+                    "expires_at": time.time() + 3000,
+                }
+            }
+            assert service.get_signed_urls([url]) == {url: "cached"}
+
+        get_client.assert_not_called()
+
+    def test_missing_objects_and_bad_urls_map_to_none(self, service, mock_supabase_client):
+        mock_supabase_client.storage.from_.return_value.create_signed_urls.side_effect = None
+        mock_supabase_client.storage.from_.return_value.create_signed_urls.return_value = [
+            {"path": "1/1/gone.pdf", "signedURL": None, "error": "Object not found"}
+        ]
+        gone_url = self.FILE_URL.format(path="1/1/gone.pdf")
+
+        with (
+            patch(
+                "app.services.storage_service._get_supabase_client",
+                return_value=mock_supabase_client,
+            ),
+            patch("app.services.storage_service.cache") as mock_cache,
+        ):
+            mock_cache.get_many.return_value = {}
+            signed = service.get_signed_urls([gone_url, "https://elsewhere/x.pdf"])
+
+            assert signed == {gone_url: None, "https://elsewhere/x.pdf": None}
+            mock_cache.set_many.assert_not_called()
+            with pytest.raises(FileNotFoundError):
+                service.get_signed_url(gone_url)
+
+    def test_batch_for_files_checks_access_once_and_skips_deleted(
+        self, service, mock_supabase_client, db_session, mock_assessment, mock_blgu_user
+    ):
+        governance_area = GovernanceArea(name="Test Area", code="TA", area_type=AreaType.CORE)
+        db_session.add(governance_area)
+        db_session.flush()
+        indicator = Indicator(
+            name="Test Indicator", governance_area_id=governance_area.id, form_schema={}
+        )
+        db_session.add(indicator)
+        db_session.flush()
+        files = [
+            MOVFile(
+                assessment_id=mock_assessment.id,
+                indicator_id=indicator.id,
+                uploaded_by=mock_blgu_user.id,
+                file_name=f"{name}.pdf",
+                file_url=self.FILE_URL.format(path=f"1/1/{name}.pdf"),
+                file_type="application/pdf",
+                file_size=1024,
+                deleted_at=datetime.utcnow() if name == "deleted" else None,
+            )
+            for name in ("a", "b", "deleted")
+        ]
+        db_session.add_all(files)
+        db_session.commit()
+
+        with (
+            patch(
+                "app.services.storage_service._get_supabase_client",
+                return_value=mock_supabase_client,
+            ),
+            patch("app.services.storage_service.cache") as mock_cache,
+        ):
+            mock_cache.get_many.return_value = {}
+            signed = service.get_signed_urls_for_files(
+                db_session, [files[0].id, files[1].id, files[2].id, 999999], mock_blgu_user.id
+            )
+
+        assert signed == {
+            files[0].id: "https://signed/1/1/a.pdf?token=t",
+            files[1].id: "https://signed/1/1/b.pdf?token=t",
+            files[2].id: None,
+            999999: None,
+        }
+        mock_supabase_client.storage.from_.return_value.create_signed_urls.assert_called_once()
+
+    def test_katuparan_users_cannot_sign_files(self, service, db_session, mock_blgu_user):
+        from fastapi import HTTPException
+
+        from app.db.enums import UserRole
+
+        mock_blgu_user.role = UserRole.KATUPARAN_CENTER_USER
+        db_session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_signed_urls_for_files(db_session, [1], mock_blgu_user.id)
+        assert exc_info.value.status_code == 403
+
+    def test_invalidate_signed_url(self, service):
+        with patch("app.services.storage_service.cache") as mock_cache:
+            service._invalidate_signed_url(self.FILE_URL.format(path="1/1/a%20b.pdf"))
+            service._invalidate_signed_url("https://elsewhere/x.pdf")
+
+        mock_cache.delete.assert_called_once_with(signed_url_cache_key("1/1/a b.pdf"))
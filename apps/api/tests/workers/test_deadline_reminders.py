@@ -0,0 +1,112 @@
+"""
+Tests for the daily deadline reminder worker (app/workers/deadline_worker.py)
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.db.enums import AssessmentStatus, NotificationType
+from app.db.models.assessment import Assessment
+from app.db.models.notification import Notification
+from app.db.models.system import AssessmentYear
+from app.workers.deadline_worker import process_deadline_reminders
+
+# ====================================================================
+# Test Fixtures
+# ====================================================================
+
+
+@pytest.fixture
+def active_year(db_session: Session):
+    """Create an active assessment year whose phase 1 deadline is 2.5 days away"""
+    now = datetime.now(UTC)
+    year = AssessmentYear(
+        year=2026,
+        assessment_period_start=now - timedelta(days=90),
+        assessment_period_end=now + timedelta(days=90),
+        phase1_deadline=now + timedelta(days=2, hours=12),
+        is_active=True,
+        is_published=True,
+    )
+    db_session.add(year)
+    db_session.commit()
+    db_session.refresh(year)
+    return year
+
+
+@pytest.fixture
+def draft_assessment(db_session: Session, mock_blgu_user, active_year):
+    """Create a DRAFT assessment that already received its 7-day reminder"""
+    assessment = Assessment(
+        blgu_user_id=mock_blgu_user.id,
+        assessment_year=active_year.year,
+        status=AssessmentStatus.DRAFT,
+        phase1_reminder_7d_sent_at=datetime.utcnow() - timedelta(days=5),
+    )
+    db_session.add(assessment)
+    db_session.commit()
+    db_session.refresh(assessment)
+    return assessment
+
+
+def _run_reminders(db_session: Session):
+    with (
+        patch("app.workers.deadline_worker.SessionLocal", return_value=db_session),
+        patch("app.services.notification_service.email_service") as mock_email,
+        patch("app.workers.notifications.queue_notification_emails") as mock_queue,
+    ):
+        mock_email.is_configured.return_value = True
+        result = process_deadline_reminders()
+    return result, mock_queue
+
+
+# ====================================================================
+# Process Deadline Reminders Tests
+# ====================================================================
+
+
+def test_process_deadline_reminders_sends_due_tier_and_queues_emails(
+    db_session: Session, draft_assessment: Assessment, mock_blgu_user
+):
+    """Test only the due, unsent tier is sent and its email queued on commit"""
+    # The worker closes the (shared) session, detaching the fixture instances
+    assessment_id = draft_assessment.id
+    blgu_user_id = mock_blgu_user.id
+
+    result, mock_queue = _run_reminders(db_session)
+
+    assert result["success"] is True
+    assert result["breakdown"] == {"7_days": 0, "3_days": 1, "1_day": 0}
+
+    notifications = (
+        db_session.query(Notification).filter(Notification.assessment_id == assessment_id).all()
+    )
+    assert len(notifications) == 1
+    assert notifications[0].notification_type == NotificationType.DEADLINE_REMINDER_3_DAYS
+    assert notifications[0].recipient_id == blgu_user_id
+    assert notifications[0].email_sent is False
+    mock_queue.assert_called_once_with([notifications[0].id])
+
+    assessment = db_session.get(Assessment, assessment_id)
+    assert assessment.phase1_reminder_3d_sent_at is not None
+    assert assessment.phase1_reminder_1d_sent_at is None
+
+
+def test_process_deadline_reminders_is_idempotent(
+    db_session: Session, draft_assessment: Assessment
+):
+    """Test a repeated run (e.g. a Celery retry) sends nothing new"""
+    assessment_id = draft_assessment.id
+
+    _run_reminders(db_session)
+    result, mock_queue = _run_reminders(db_session)
+
+    assert result["reminders_sent"] == 0
+    mock_queue.assert_not_called()
+    assert (
+        db_session.query(Notification).filter(Notification.assessment_id == assessment_id).count()
+        == 1
+    )
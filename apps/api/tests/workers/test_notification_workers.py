@@ -425,6 +425,67 @@ def test_send_calibration_resubmission_notification_assessment_not_found(
     assert result["success"] is False
 
 
+# ====================================================================
+# Batched Notification Email Tests
+# ====================================================================
+
+
+def test_send_notification_emails_skips_already_emailed(db_session: Session, blgu_user: User):
+    """Test the email queue only emails notifications not yet emailed (safe to retry)"""
+    from app.workers.notifications import send_notification_emails
+
+    pending = Notification(
+        recipient_id=blgu_user.id,
+        notification_type=NotificationType.DEADLINE_REMINDER_7_DAYS,
+        title="Reminder",
+        message="Submit your assessment",
+        email_sent=False,
+    )
+    emailed = Notification(
+        recipient_id=blgu_user.id,
+        notification_type=NotificationType.DEADLINE_REMINDER_3_DAYS,
+        title="Reminder",
+        message="Submit your assessment",
+        email_sent=True,
+    )
+    db_session.add_all([pending, emailed])
+    db_session.commit()
+    # The task closes the (shared) session, detaching these instances
+    notification_ids = [pending.id, emailed.id]
+    blgu_email = blgu_user.email
+
+    with (
+        patch("app.workers.notifications.SessionLocal", return_value=db_session),
+        patch("app.services.notification_service.email_service") as mock_email,
+    ):
+        mock_email.is_configured.return_value = True
+        mock_email.build_notification_email.return_value = ("Subject", "<p>Body</p>", "Body")
+        mock_email.send_emails.side_effect = lambda emails: [{"success": True} for _ in emails]
+
+        first = send_notification_emails(notification_ids)
+        second = send_notification_emails(notification_ids)
+
+    assert first["emails_sent"] == 1
+    assert second["emails_sent"] == 0
+    mock_email.send_emails.assert_called_once()
+    assert [email.to_email for email in mock_email.send_emails.call_args.args[0]] == [blgu_email]
+    pending = db_session.get(Notification, notification_ids[0])
+    assert pending.email_sent is True
+    assert pending.email_sent_at is not None
+
+
+def test_notification_emails_use_email_queue():
+    """Test email batches are routed apart from the in-app notification tasks"""
+    from app.core.celery_app import celery_app
+
+    router = celery_app.amqp.router
+
+    assert router.route({}, "notifications.send_notification_emails")["queue"].name == "email"
+    assert router.route({}, "notifications.send_rework_notification")["queue"].name == (
+        "notifications"
+    )
+
+
 # ====================================================================
 # Error Handling Tests
 # ====================================================================
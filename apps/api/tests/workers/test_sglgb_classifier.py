@@ -0,0 +1,191 @@
+"""
+Tests for the bulk SGLGB re-classification Celery task.
+
+Tests verify:
+- All finalized assessments of a year are re-classified
+- Assessments of other years or in other statuses are untouched
+- Query count per batch does not grow with the batch size
+- Progress is reported after every batch
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.db.enums import AreaType, AssessmentStatus, ComplianceStatus, ValidationStatus
+from app.db.models.assessment import Assessment, AssessmentResponse
+from app.db.models.barangay import Barangay
+from app.db.models.governance_area import GovernanceArea, Indicator
+from app.db.models.system import AssessmentYear
+from app.db.models.user import User
+from app.workers.sglgb_classifier import _reclassify_year_logic
+
+AREA_DEFS = [
+    ("Financial Administration and Sustainability", "FI", AreaType.CORE),
+    ("Disaster Preparedness", "DI", AreaType.CORE),
+    ("Safety, Peace and Order", "SA", AreaType.CORE),
+    ("Social Protection and Sensitivity", "SO", AreaType.ESSENTIAL),
+    ("Business-Friendliness and Competitiveness", "BU", AreaType.ESSENTIAL),
+    ("Environmental Management", "EN", AreaType.ESSENTIAL),
+]
+
+
+@pytest.fixture
+def year_data(db_session):
+    """Create two assessment years, six areas with one indicator each and five BLGU users."""
+    for year in (2025, 2026):
+        db_session.add(
+            AssessmentYear(
+                year=year,
+                assessment_period_start=datetime(year, 1, 1),
+                assessment_period_end=datetime(year, 12, 31),
+                is_active=year == 2026,
+                is_published=True,
+            )
+        )
+
+    indicators: list[Indicator] = []
+    for index, (name, code, area_type) in enumerate(AREA_DEFS, start=1):
+        area = GovernanceArea(name=name, code=code, area_type=area_type)
+        db_session.add(area)
+        db_session.flush()
+        indicator = Indicator(
+            name=f"Indicator {index}",
+            description="Test indicator",
+            indicator_code=f"{index}.1",
+            form_schema={"type": "object"},
+            governance_area_id=area.id,
+            is_bbi=False,
+        )
+        db_session.add(indicator)
+        indicators.append(indicator)
+
+    users: list[User] = []
+    for index in range(5):
+        barangay = Barangay(name=f"Reclassify Barangay {index}")
+        db_session.add(barangay)
+        db_session.flush()
+        user = User(
+            email=f"reclassify{index}@example.com",
+            name=f"BLGU {index}",
+            hashed_password="hashed",
+            role="BLGU_USER",
+            barangay_id=barangay.id,
+        )
+        db_session.add(user)
+        users.append(user)
+
+    db_session.flush()
+    return {"indicators": indicators, "users": users}
+
+
+def _create_assessment(db_session, user, indicators, status, year, failed_indicator_ids=()):
+    assessment = Assessment(
+        status=status,
+        blgu_user_id=user.id,
+        assessment_year=year,
+        rework_count=0,
+        final_compliance_status=ComplianceStatus.FAILED,
+        area_results={},
+    )
+    db_session.add(assessment)
+    db_session.flush()
+    for indicator in indicators:
+        db_session.add(
+            AssessmentResponse(
+                assessment_id=assessment.id,
+                indicator_id=indicator.id,
+                response_data={},
+                is_completed=True,
+                validation_status=(
+                    ValidationStatus.FAIL
+                    if indicator.id in failed_indicator_ids
+                    else ValidationStatus.PASS
+                ),
+            )
+        )
+    return assessment
+
+
+def test_reclassifies_finalized_assessments_of_year(db_session, year_data):
+    """Finalized assessments of the year are re-classified with the 3+1 rule."""
+    indicators = year_data["indicators"]
+    users = year_data["users"]
+
+    passing = _create_assessment(db_session, users[0], indicators, AssessmentStatus.COMPLETED, 2026)
+    core_failed = _create_assessment(
+        db_session,
+        users[1],
+        indicators,
+        AssessmentStatus.AWAITING_MLGOO_APPROVAL,
+        2026,
+        failed_indicator_ids={indicators[0].id},
+    )
+    draft = _create_assessment(db_session, users[2], indicators, AssessmentStatus.DRAFT, 2026)
+    other_year = _create_assessment(
+        db_session, users[3], indicators, AssessmentStatus.COMPLETED, 2025
+    )
+    db_session.commit()
+
+    result = _reclassify_year_logic(2026, db=db_session)
+
+    assert result["success"] is True
+    assert result["total"] == 2
+    assert result["processed"] == 2
+    assert result["changed"] == 2
+
+    db_session.expire_all()
+    assert passing.final_compliance_status == ComplianceStatus.PASSED
+    assert set(passing.area_results.values()) == {"Passed"}
+    assert core_failed.final_compliance_status == ComplianceStatus.FAILED
+    assert core_failed.area_results["Financial Administration and Sustainability"] == "Failed"
+    assert draft.area_results == {}
+    assert other_year.area_results == {}
+
+
+def test_rerun_is_idempotent(db_session, year_data):
+    """A second run finds nothing to change."""
+    _create_assessment(
+        db_session,
+        year_data["users"][0],
+        year_data["indicators"],
+        AssessmentStatus.COMPLETED,
+        2026,
+    )
+    db_session.commit()
+
+    assert _reclassify_year_logic(2026, db=db_session)["changed"] == 1
+    assert _reclassify_year_logic(2026, db=db_session)["changed"] == 0
+
+
+def test_query_count_per_batch_is_constant(db_session, year_data):
+    """Each batch issues a fixed number of statements regardless of its size."""
+    for user in year_data["users"]:
+        _create_assessment(
+            db_session, user, year_data["indicators"], AssessmentStatus.COMPLETED, 2026
+        )
+    db_session.commit()
+
+    statements: list[str] = []
+
+    def count_statements(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE")):
+            statements.append(statement)
+
+    progress: list[dict] = []
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", count_statements)
+    try:
+        result = _reclassify_year_logic(
+            2026, batch_size=5, db=db_session, progress_callback=progress.append
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statements)
+
+    assert result["processed"] == 5
+    assert len(progress) == 1
+    assert progress[0]["processed"] == progress[0]["total"] == 5
+    # IDs + indicator tree + batch rows + responses + BBI results + one bulk UPDATE,
+    # plus the analytics rollup refresh (ledger, assessments, responses, area names)
+    assert len(statements) <= 10, statements
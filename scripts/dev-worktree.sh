@@ -141,7 +141,7 @@ start_all() {
         -c "blue,green,yellow" \
         "cd apps/api && uv run uvicorn main:app --reload --host 0.0.0.0 --port ${API_PORT}" \
         "cd apps/web && PORT=${WEB_PORT} pnpm exec next dev --turbopack" \
-        "cd apps/api && uv run celery -A app.core.celery_app worker --loglevel=info --queues=notifications,classification"
+        "cd apps/api && uv run celery -A app.core.celery_app worker --loglevel=info --queues=notifications,email,classification"
 }
 
 # Start API only